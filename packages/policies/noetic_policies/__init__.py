@@ -0,0 +1,3 @@
+"""Policy specification, parsing, and validation for the Noetic ecosystem."""
+
+__version__ = "0.1.0"
@@ -0,0 +1,437 @@
+"""Compiled binary policy artifacts, loaded by memory-mapping."""
+
+import contextlib
+import json
+import math
+import mmap
+import os
+import struct
+import tempfile
+from dataclasses import asdict
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from noetic_policies import __version__
+from noetic_policies.cel_evaluator import CELEvaluator, CELSyntaxError, CompiledExpression
+from noetic_policies.cel_evaluator.bytecode import Assembler, disassemble
+from noetic_policies.cel_evaluator.cache import ProgramCache
+from noetic_policies.cel_evaluator.compiler import compile_node
+from noetic_policies.models import (
+    TRUSTED,
+    GraphAnalysisResult,
+    ValidationError,
+    ValidationResult,
+)
+from noetic_policies.models.policy import Policy
+from noetic_policies.validator.compiled_graph import CompiledStateGraph
+from noetic_policies.validator.csr_graph import CSRGraph
+from noetic_policies.validator.distance_oracle import DistanceOracle
+from noetic_policies.validator.graph_analyzer import GraphAnalyzer
+
+__all__ = ["ArtifactError", "CompiledPolicy", "FORMAT_VERSION", "compile_policy"]
+
+MAGIC = b"NOETICPA"
+# Bumped on any change to the layout or section contents
+FORMAT_VERSION = 1
+# Magic, format version, header length
+_PREAMBLE = struct.Struct("<8sII")
+# Sections start on cache-line boundaries so arrays are aligned in the mapping
+_ALIGN = 64
+
+
+class ArtifactError(Exception):
+    """Raised when a file is not a compiled policy or has an unsupported format."""
+
+    pass
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGN) * _ALIGN
+
+
+class _StringTable:
+    """Interned strings, stored as one UTF-8 blob with int64 offsets."""
+
+    def __init__(self) -> None:
+        self.ids: dict[str, int] = {}
+
+    def intern(self, text: str) -> int:
+        sid = self.ids.get(text)
+        if sid is None:
+            sid = self.ids[text] = len(self.ids)
+        return sid
+
+    def arrays(self) -> tuple[np.ndarray, np.ndarray]:
+        encoded = [text.encode() for text in self.ids]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+        return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+def _expressions(policy: Policy) -> list[CompiledExpression]:
+    """Compile every expression of a policy, as the validator and checkers look them up."""
+    evaluator = CELEvaluator(mode=policy.cel_mode)
+    sources: list[str] = [c.expr for c in policy.constraints]
+    sources.extend(invariant.expr for invariant in policy.invariants)
+    effects: list[str] = []
+    for state in policy.state_graph.states:
+        sources.extend(state.preconditions)
+        for transition in state.transitions:
+            sources.extend(transition.preconditions)
+            effects.extend(transition.effects)
+            if transition.cost_expr is not None:
+                sources.append(transition.cost_expr)
+    for goal in policy.goal_states:
+        sources.extend(goal.conditions)
+        sources.extend(condition.expr for condition in goal.progress_conditions)
+
+    compiled: dict[str, CompiledExpression] = {}
+    for source in sources:
+        if source not in compiled:
+            try:
+                compiled[source] = evaluator.compile(source)
+            except CELSyntaxError:
+                continue
+    for effect in effects:
+        try:
+            _, rhs = evaluator.compile_effect(effect)
+        except CELSyntaxError:
+            continue
+        compiled.setdefault(rhs.source, rhs)
+    return list(compiled.values())
+
+
+def _analysis_json(result: GraphAnalysisResult) -> dict[str, Any]:
+    """GraphAnalysisResult as JSON-compatible data (the condensation is not stored)."""
+    return {
+        "unreachable_states": sorted(result.unreachable_states),
+        "deadlock_sccs": [sorted(scc) for scc in result.deadlock_sccs],
+        "goal_reachable": result.goal_reachable,
+        "cycles": result.cycles,
+        "goal_costs": result.goal_costs,
+        "goal_min_steps": result.goal_min_steps,
+        "temporally_infeasible_goals": result.temporally_infeasible_goals,
+        "cost_predecessors": result.cost_predecessors,
+        "step_predecessors": result.step_predecessors,
+    }
+
+
+def compile_policy(
+    policy: Policy,
+    path: str | os.PathLike[str],
+    validation: ValidationResult | None = None,
+    analyzer: GraphAnalyzer | None = None,
+) -> int:
+    """
+    Write a policy and its precomputed tables to a compiled artifact.
+
+    The artifact holds an interned string table, the state graph in CSR
+    form, the policy's expressions as bytecode, the graph analysis, the
+    distance-to-goal tables and, if given, the validation result. It is
+    written to a temporary file and renamed, so readers never see a
+    partial artifact.
+
+    Args:
+        policy: Policy to compile
+        path: Output file
+        validation: Validation result to store with the artifact
+        analyzer: Graph analyzer for the precomputed tables
+
+    Returns:
+        Size of the artifact in bytes
+    """
+    analyzer = analyzer if analyzer is not None else GraphAnalyzer()
+    graph = policy.state_graph
+    compiled = analyzer.compile(graph)
+    csr = compiled.csr
+    goal_names = [goal.name for goal in policy.goal_states]
+    analysis = analyzer.analyze(compiled, graph.initial, policy.goal_states, policy.temporal_bounds)
+    oracle = analyzer.distance_oracle(compiled, goal_names)
+
+    strings = _StringTable()
+    node_names = np.array([strings.intern(name) for name in csr.names], dtype=np.int32)
+    assembler = Assembler(strings.intern)
+    expressions = []
+    for expression in _expressions(policy):
+        assert expression.ast is not None
+        start, end = assembler.assemble(expression.ast)
+        expressions.append((strings.intern(expression.source), start, end))
+    string_offsets, string_blob = strings.arrays()
+
+    def encode(data: Any) -> np.ndarray:
+        return np.frombuffer(json.dumps(data).encode(), dtype=np.uint8)
+
+    sections: dict[str, np.ndarray] = {
+        "string_offsets": string_offsets,
+        "string_blob": string_blob,
+        "node_names": node_names,
+        "indptr": csr.indptr,
+        "indices": csr.indices,
+        "cost": csr.cost,
+        "goal_costs": oracle.costs,
+        "goal_steps": oracle.steps,
+        "goal_next": oracle.next_state,
+        "code": np.array(assembler.code, dtype=np.int32).reshape(-1, 3),
+        "expressions": np.array(expressions, dtype=np.int32).reshape(-1, 3),
+        "constants": encode(assembler.constants),
+        "policy": np.frombuffer(policy.model_dump_json().encode(), dtype=np.uint8),
+        "analysis": encode(_analysis_json(analysis)),
+        "validation": encode(asdict(validation) if validation is not None else None),
+    }
+    layout: dict[str, list[Any]] = {}
+    offset = 0
+    for name, array in sections.items():
+        layout[name] = [offset, array.dtype.str, list(array.shape)]
+        offset = _aligned(offset + array.nbytes)
+
+    header = json.dumps(
+        {
+            "package_version": __version__,
+            "fingerprint": policy.fingerprint(),
+            "graph_key": compiled.key,
+            "name": policy.name,
+            "cel_mode": policy.cel_mode,
+            "initial": graph.initial,
+            "num_states": csr.num_states,
+            "goals": list(oracle.goals),
+            "sections": layout,
+        }
+    ).encode()
+    base = _aligned(_PREAMBLE.size + len(header))
+
+    path = Path(path)
+    fd, temporary = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(_PREAMBLE.pack(MAGIC, FORMAT_VERSION, len(header)))
+            file.write(header)
+            for name, array in sections.items():
+                file.seek(base + layout[name][0])
+                file.write(np.ascontiguousarray(array).tobytes())
+            file.truncate(base + offset)
+        os.replace(temporary, path)
+    except BaseException:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+    return base + offset
+
+
+class CompiledPolicy:
+    """
+    A compiled policy artifact, memory-mapped read-only.
+
+    Opening reads only the fixed-size header. Arrays (CSR graph, distance
+    tables, bytecode) are zero-copy views of the mapping, so processes
+    that open the same artifact, or inherit it across fork(), share its
+    pages. Everything else (the Policy model, expressions, names) is
+    decoded on first use.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]):
+        """
+        Open a compiled artifact.
+
+        Args:
+            path: Artifact written by compile_policy()
+
+        Raises:
+            ArtifactError: If the file is not an artifact of this format version
+            OSError: If the file cannot be read
+        """
+        with open(path, "rb") as file:
+            try:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:  # empty file
+                raise ArtifactError(f"Not a compiled policy: {path}") from e
+        if len(self._map) < _PREAMBLE.size:
+            raise ArtifactError(f"Not a compiled policy: {path}")
+        magic, version, header_size = _PREAMBLE.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ArtifactError(f"Not a compiled policy: {path}")
+        if version != FORMAT_VERSION:
+            raise ArtifactError(
+                f"Unsupported artifact format {version} (expected {FORMAT_VERSION}); recompile"
+            )
+        self.path = Path(path)
+        self.header: dict[str, Any] = json.loads(
+            self._map[_PREAMBLE.size : _PREAMBLE.size + header_size]
+        )
+        self._base = _aligned(_PREAMBLE.size + header_size)
+        self._compiled: dict[str, CompiledExpression] = {}
+
+    def __enter__(self) -> "CompiledPolicy":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the artifact once no array views of it remain."""
+        # Arrays handed out still reference the mapping; it then closes with them
+        with contextlib.suppress(BufferError):
+            self._map.close()
+
+    def array(self, name: str) -> np.ndarray:
+        """
+        Return a read-only view of a section.
+
+        Args:
+            name: Section name
+
+        Returns:
+            Array backed by the mapping
+        """
+        offset, dtype, shape = self.header["sections"][name]
+        count = math.prod(shape)
+        array = np.frombuffer(self._map, dtype=dtype, count=count, offset=self._base + offset)
+        return array.reshape(shape)
+
+    def _json(self, name: str) -> Any:
+        return json.loads(self.array(name).tobytes())
+
+    @property
+    def fingerprint(self) -> str:
+        """Policy.fingerprint() of the compiled policy."""
+        return self.header["fingerprint"]
+
+    @property
+    def graph_key(self) -> str:
+        """graph_key() of the compiled state graph."""
+        return self.header["graph_key"]
+
+    @property
+    def package_version(self) -> str:
+        """Version of noetic-policies that wrote the artifact."""
+        return self.header["package_version"]
+
+    @cached_property
+    def _string_offsets(self) -> list[int]:
+        return self.array("string_offsets").tolist()
+
+    @cached_property
+    def _string_blob(self) -> memoryview:
+        return memoryview(self.array("string_blob"))
+
+    def string(self, sid: int) -> str:
+        """Return the string with a string table id."""
+        offsets = self._string_offsets
+        return str(self._string_blob[offsets[sid] : offsets[sid + 1]], "utf-8")
+
+    @cached_property
+    def names(self) -> list[str]:
+        """Graph node names by interned node id."""
+        return [self.string(sid) for sid in self.array("node_names").tolist()]
+
+    @cached_property
+    def compiled_graph(self) -> CompiledStateGraph:
+        """The state graph in CSR form, for GraphAnalyzer and route caches."""
+        names = self.names
+        csr = CSRGraph(
+            names,
+            self.header["num_states"],
+            self.array("indptr"),
+            self.array("indices"),
+            self.array("cost"),
+        )
+        return CompiledStateGraph(
+            key=self.graph_key,
+            initial=self.header["initial"],
+            states=tuple(names[: csr.num_states]),
+            csr=csr,
+        )
+
+    @cached_property
+    def oracle(self) -> DistanceOracle:
+        """Distances from every state to the nearest goal."""
+        return DistanceOracle(
+            self.graph_key,
+            self.names,
+            tuple(self.header["goals"]),
+            self.array("goal_costs"),
+            self.array("goal_steps"),
+            self.array("goal_next"),
+        )
+
+    @cached_property
+    def analysis(self) -> GraphAnalysisResult:
+        """Graph analysis from the initial state (without the condensation)."""
+        data = self._json("analysis")
+        data["unreachable_states"] = set(data["unreachable_states"])
+        data["deadlock_sccs"] = [set(scc) for scc in data["deadlock_sccs"]]
+        return GraphAnalysisResult(**data)
+
+    @cached_property
+    def validation(self) -> ValidationResult | None:
+        """Validation result stored at compile time, if any."""
+        data = self._json("validation")
+        if data is None:
+            return None
+        data["errors"] = [ValidationError(**error) for error in data["errors"]]
+        data["warnings"] = [ValidationError(**warning) for warning in data["warnings"]]
+        return ValidationResult(**data)
+
+    @cached_property
+    def policy(self) -> Policy:
+        """The Policy model, loaded from its stored JSON without repeating consistency checks."""
+        return Policy.model_validate_json(self.array("policy").tobytes(), context=TRUSTED)
+
+    @cached_property
+    def _expression_index(self) -> dict[str, tuple[int, int]]:
+        return {
+            self.string(sid): (start, end) for sid, start, end in self.array("expressions").tolist()
+        }
+
+    @cached_property
+    def _constants(self) -> list[list[Any]]:
+        return self._json("constants")
+
+    def expression_sources(self) -> list[str]:
+        """Return the sources of all stored expressions."""
+        return list(self._expression_index)
+
+    def expression(self, source: str) -> CompiledExpression:
+        """
+        Return a stored expression, rebuilt from bytecode without parsing.
+
+        Args:
+            source: Expression source as written in the policy
+
+        Returns:
+            CompiledExpression in the policy's CEL mode
+
+        Raises:
+            KeyError: If the expression is not stored in the artifact
+        """
+        compiled = self._compiled.get(source)
+        if compiled is None:
+            start, end = self._expression_index[source]
+            code = self.array("code")[start:end].tolist()
+            ast = disassemble(code, self.string, self._constants)
+            compiled = CompiledExpression(
+                source=source, mode=self.header["cel_mode"], program=compile_node(ast), ast=ast
+            )
+            self._compiled[source] = compiled
+        return compiled
+
+    def preload(self, cache: ProgramCache | None = None) -> int:
+        """
+        Insert every stored expression into a CEL program cache.
+
+        Validators and checkers compiling this policy's expressions then
+        hit the cache instead of parsing them.
+
+        Args:
+            cache: Program cache (defaults to the process-wide shared cache)
+
+        Returns:
+            Number of expressions inserted
+        """
+        if cache is None:
+            cache = CELEvaluator(mode=self.header["cel_mode"]).cache
+        sources = self.expression_sources()
+        for source in sources:
+            cache.put(self.expression(source))
+        return len(sources)
@@ -1,24 +1,41 @@
 """CEL (Common Expression Language) evaluator for constraint expressions."""
 
+import re
+from collections.abc import Mapping
 from typing import Any
 
-# Note: celpy will be imported when actually implementing CEL evaluation
-# For now, we provide a minimal implementation structure
-
-__all__ = ["CELEvaluator", "CELMode", "CELSyntaxError", "CELEvaluationError"]
-
-
-# Custom exceptions
-class CELSyntaxError(Exception):
-    """Raised when a CEL expression has invalid syntax."""
-
-    pass
-
-
-class CELEvaluationError(Exception):
-    """Raised when CEL expression evaluation fails."""
-
-    pass
+import numpy as np
+
+from noetic_policies.cel_evaluator.cache import CacheInfo, ProgramCache
+from noetic_policies.cel_evaluator.compiler import CompiledExpression, compile_node
+from noetic_policies.cel_evaluator.constraint_set import ConjunctStats, ConstraintSet
+from noetic_policies.cel_evaluator.errors import CELEvaluationError, CELSyntaxError
+from noetic_policies.cel_evaluator.incremental import (
+    DependencyIndex,
+    ExpressionSite,
+    IncrementalChecker,
+)
+from noetic_policies.cel_evaluator.parser import Binary, Call, Node, Unary, parse, walk
+from noetic_policies.cel_evaluator.vectorized import columns_from_states
+
+__all__ = [
+    "CELEvaluator",
+    "CELMode",
+    "CELSyntaxError",
+    "CELEvaluationError",
+    "CompiledExpression",
+    "ProgramCache",
+    "CacheInfo",
+    "columns_from_states",
+    "ConstraintSet",
+    "ConjunctStats",
+    "DependencyIndex",
+    "ExpressionSite",
+    "IncrementalChecker",
+]
+
+# Programs are shared by every evaluator in the process; keys include the mode
+_DEFAULT_CACHE = ProgramCache()
 
 
 # T026: CEL mode configuration
@@ -80,6 +97,30 @@ class CELMode:
     }
 
 
+# Effects assign an expression to a state variable: "count = count + 1"
+_EFFECT_RE = re.compile(r"^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=(?!=)(.*)$", re.DOTALL)
+
+# Operators and functions permitted in safe mode. Structural nodes (literals,
+# variables, field selection, indexing, conditionals) are always allowed.
+_SAFE_ALLOWLIST = frozenset(CELMode.SAFE_OPERATIONS)
+
+
+def _check_safe_mode(ast: Node) -> None:
+    """Reject any operator or function outside the safe-mode allowlist."""
+    for node in walk(ast):
+        if isinstance(node, Call):
+            name = node.function
+        elif isinstance(node, (Binary, Unary)):
+            name = node.op
+        else:
+            continue
+        if name not in _SAFE_ALLOWLIST:
+            raise CELSyntaxError(
+                f"Operation '{name}' not allowed in safe mode. "
+                f"Use 'full' or 'extended' mode to enable."
+            )
+
+
 # T022-T024: CELEvaluator class
 class CELEvaluator:
     """
@@ -88,16 +129,68 @@ class CELEvaluator:
     Provides deterministic constraint evaluation with configurable restriction modes.
     """
 
-    def __init__(self, mode: str = CELMode.SAFE):
+    def __init__(self, mode: str = CELMode.SAFE, cache: ProgramCache | None = None):
         """
         Initialize CEL evaluator.
 
         Args:
             mode: Evaluation mode - "safe" (default), "full", or "extended"
+            cache: Program cache (defaults to the process-wide shared cache)
         """
         self.mode = mode
         if mode not in {CELMode.SAFE, CELMode.FULL, CELMode.EXTENDED}:
             raise ValueError(f"Invalid CEL mode: {mode}")
+        self.cache = cache if cache is not None else _DEFAULT_CACHE
+
+    def compile(self, expr: str) -> CompiledExpression:
+        """
+        Validate and compile a CEL expression, reusing a cached program if available.
+
+        Args:
+            expr: CEL expression string
+
+        Returns:
+            CompiledExpression executable against any number of contexts
+
+        Raises:
+            CELSyntaxError: If expression syntax is invalid
+        """
+        compiled = self.cache.get(expr, self.mode)
+        if compiled is None:
+            if not expr or not expr.strip():
+                raise CELSyntaxError("Empty expression")
+            ast = parse(expr)
+            if self.mode == CELMode.SAFE:
+                _check_safe_mode(ast)
+            compiled = CompiledExpression(
+                source=expr, mode=self.mode, program=compile_node(ast), ast=ast
+            )
+            self.cache.put(compiled)
+        return compiled
+
+    def compile_effect(self, effect: str) -> tuple[str, CompiledExpression]:
+        """
+        Compile a transition effect of the form "<variable> = <expression>".
+
+        Args:
+            effect: Effect string from Transition.effects
+
+        Returns:
+            Tuple of (assigned variable, compiled right-hand side)
+
+        Raises:
+            CELSyntaxError: If the effect is not an assignment or its expression is invalid
+        """
+        match = _EFFECT_RE.match(effect)
+        if match is None:
+            raise CELSyntaxError(
+                f"Invalid effect '{effect}': expected the form '<variable> = <expression>'"
+            )
+        return match.group(1), self.compile(match.group(2).strip())
+
+    def cache_info(self) -> CacheInfo:
+        """Return program cache hit/miss counters for sizing the cache."""
+        return self.cache.info()
 
     def evaluate(self, expr: str, context: dict[str, Any]) -> Any:
         """
@@ -114,37 +207,34 @@ class CELEvaluator:
             CELSyntaxError: If expression syntax is invalid
             CELEvaluationError: If evaluation fails
         """
-        # T023: Implement evaluate() method
-        # For MVP: Basic expression evaluation
-        # This is a placeholder - full CEL implementation will use celpy library
-
-        try:
-            # Validate syntax first
-            self.validate_syntax(expr)
-
-            # Simple evaluation for basic expressions
-            # In full implementation, this will use celpy
-            # For now, we support basic comparisons and logic
-
-            # Strip whitespace
-            expr = expr.strip()
-
-            # Handle boolean literals
-            if expr == "true":
-                return True
-            if expr == "false":
-                return False
-
-            # For MVP, we'll need to implement full celpy integration
-            # This is a minimal stub to allow testing of the structure
-            raise NotImplementedError(
-                "Full CEL evaluation requires celpy integration - to be implemented"
-            )
+        # T023: Compile once (cached), then execute against the context
+        return self.compile(expr).evaluate(context)
+
+    def evaluate_batch(
+        self,
+        expr: str,
+        columns: Mapping[str, np.ndarray],
+        state_schema: Mapping[str, str] | None = None,
+    ) -> np.ndarray:
+        """
+        Evaluate CEL expression over a population of states stored column-wise.
+
+        Arithmetic, comparison and logical nodes run as NumPy ufuncs over whole
+        columns; unsupported nodes fall back to per-row evaluation.
+
+        Args:
+            expr: CEL expression string
+            columns: Equal-length arrays, one per variable (see columns_from_states)
+            state_schema: Policy.state_schema, used to decode enum code columns
 
-        except SyntaxError as e:
-            raise CELSyntaxError(f"Invalid CEL syntax: {e}") from e
-        except Exception as e:
-            raise CELEvaluationError(f"CEL evaluation failed: {e}") from e
+        Returns:
+            Array with one result per row
+
+        Raises:
+            CELSyntaxError: If expression syntax is invalid
+            CELEvaluationError: If evaluation fails for any row
+        """
+        return self.compile(expr).evaluate_batch(columns, state_schema)
 
     def validate_syntax(self, expr: str) -> bool:
         """
@@ -159,31 +249,9 @@ class CELEvaluator:
         Raises:
             CELSyntaxError: If expression is malformed with details
         """
-        # T024: Implement validate_syntax() method
-        if not expr or not expr.strip():
-            raise CELSyntaxError("Empty expression")
-
-        # Check for unsafe operations in safe mode
-        if self.mode == CELMode.SAFE:
-            for unsafe_op in CELMode.UNSAFE_OPERATIONS:
-                if unsafe_op in expr:
-                    raise CELSyntaxError(
-                        f"Operation '{unsafe_op}' not allowed in safe mode. "
-                        f"Use 'full' or 'extended' mode to enable."
-                    )
-
-        # Basic syntax checks
-        # Full implementation will use celpy parser
-        # For MVP, check balanced parentheses
-        if expr.count("(") != expr.count(")"):
-            raise CELSyntaxError("Unbalanced parentheses")
-
-        if expr.count("[") != expr.count("]"):
-            raise CELSyntaxError("Unbalanced brackets")
-
-        if expr.count("{") != expr.count("}"):
-            raise CELSyntaxError("Unbalanced braces")
-
+        # T024: Parsing (and the safe-mode walk) happen once per (expr, mode);
+        # the resulting program is cached for evaluation
+        self.compile(expr)
         return True
 
     def check_numeric_type(self, expr: str) -> bool:
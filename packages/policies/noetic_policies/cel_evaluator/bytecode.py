@@ -0,0 +1,196 @@
+"""Flat postfix encoding of CEL syntax trees, for storing compiled expressions."""
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from noetic_policies.cel_evaluator.parser import (
+    Binary,
+    Call,
+    Ident,
+    Index,
+    ListExpr,
+    Literal,
+    MapExpr,
+    Node,
+    Select,
+    Ternary,
+    Unary,
+)
+
+__all__ = ["Assembler", "disassemble"]
+
+# Opcodes; every instruction is an (opcode, a, b) triple of integers
+LITERAL = 0  # a: constant id
+IDENT = 1  # a: name string id
+SELECT = 2  # a: field string id; pops operand
+INDEX = 3  # pops operand, index
+CALL = 4  # a: function string id, b: argument count; pops arguments
+METHOD = 5  # a: method string id, b: argument count; pops target, arguments
+UNARY = 6  # a: operator string id; pops operand
+BINARY = 7  # a: operator string id; pops left, right
+TERNARY = 8  # pops cond, then, otherwise
+LIST = 9  # b: item count; pops items
+MAP = 10  # b: entry count; pops key, value per entry
+
+
+class Assembler:
+    """
+    Encodes syntax trees as postfix instructions sharing one code array.
+
+    Names, operators and fields are stored as ids from the caller's string
+    table; literal values go to a constant table shared by all expressions.
+    Source positions are not kept.
+    """
+
+    def __init__(self, intern: Callable[[str], int]):
+        """
+        Initialize assembler.
+
+        Args:
+            intern: Returns the string table id of a string, adding it if new
+        """
+        self.intern = intern
+        self.code: list[tuple[int, int, int]] = []
+        self.constants: list[tuple[str, Any]] = []
+        self._constant_ids: dict[tuple[str, type, Any], int] = {}
+
+    def assemble(self, node: Node) -> tuple[int, int]:
+        """
+        Append the instructions of a syntax tree.
+
+        Args:
+            node: Root of the expression tree
+
+        Returns:
+            (start, end) range of the expression's instructions in code
+        """
+        start = len(self.code)
+        self._emit(node)
+        return start, len(self.code)
+
+    def _constant(self, kind: str, value: Any) -> int:
+        # The type is part of the key so that 1, 1.0 and True stay distinct
+        key = (kind, type(value), value)
+        constant = self._constant_ids.get(key)
+        if constant is None:
+            constant = self._constant_ids[key] = len(self.constants)
+            self.constants.append((kind, value))
+        return constant
+
+    def _emit(self, node: Node) -> None:
+        code, intern = self.code, self.intern
+        if isinstance(node, Literal):
+            code.append((LITERAL, self._constant(node.kind, node.value), 0))
+        elif isinstance(node, Ident):
+            code.append((IDENT, intern(node.name), 0))
+        elif isinstance(node, Select):
+            self._emit(node.operand)
+            code.append((SELECT, intern(node.field), 0))
+        elif isinstance(node, Index):
+            self._emit(node.operand)
+            self._emit(node.index)
+            code.append((INDEX, 0, 0))
+        elif isinstance(node, Call):
+            if node.target is not None:
+                self._emit(node.target)
+            for arg in node.args:
+                self._emit(arg)
+            opcode = CALL if node.target is None else METHOD
+            code.append((opcode, intern(node.function), len(node.args)))
+        elif isinstance(node, Unary):
+            self._emit(node.operand)
+            code.append((UNARY, intern(node.op), 0))
+        elif isinstance(node, Binary):
+            # Operator chains nest to the left: walk the left spine without recursing
+            spine: list[Binary] = []
+            while isinstance(node, Binary):
+                spine.append(node)
+                node = node.left
+            self._emit(node)
+            for binary in reversed(spine):
+                self._emit(binary.right)
+                code.append((BINARY, intern(binary.op), 0))
+        elif isinstance(node, Ternary):
+            self._emit(node.cond)
+            self._emit(node.then)
+            self._emit(node.otherwise)
+            code.append((TERNARY, 0, 0))
+        elif isinstance(node, ListExpr):
+            for item in node.items:
+                self._emit(item)
+            code.append((LIST, 0, len(node.items)))
+        elif isinstance(node, MapExpr):
+            for key, value in node.entries:
+                self._emit(key)
+                self._emit(value)
+            code.append((MAP, 0, len(node.entries)))
+        else:
+            raise TypeError(f"Unsupported CEL node: {type(node).__name__}")
+
+
+def disassemble(
+    code: Sequence[Sequence[int]],
+    string: Callable[[int], str],
+    constants: Sequence[Sequence[Any]],
+) -> Node:
+    """
+    Rebuild the syntax tree of one expression from its instructions.
+
+    Args:
+        code: The expression's (opcode, a, b) instructions
+        string: Returns the string with a string table id
+        constants: (kind, value) pairs by constant id
+
+    Returns:
+        Root of the expression tree
+
+    Raises:
+        ValueError: If the instructions do not encode exactly one expression
+    """
+    stack: list[Node] = []
+
+    def pop(count: int) -> list[Node]:
+        if count > len(stack):
+            raise ValueError("Malformed expression code: stack underflow")
+        if count == 0:
+            return []
+        popped = stack[-count:]
+        del stack[-count:]
+        return popped
+
+    for opcode, a, b in code:
+        if opcode == LITERAL:
+            kind, value = constants[a]
+            stack.append(Literal(kind, value))
+        elif opcode == IDENT:
+            stack.append(Ident(string(a)))
+        elif opcode == SELECT:
+            (operand,) = pop(1)
+            stack.append(Select(operand, string(a)))
+        elif opcode == INDEX:
+            operand, index = pop(2)
+            stack.append(Index(operand, index))
+        elif opcode == CALL:
+            stack.append(Call(string(a), tuple(pop(b))))
+        elif opcode == METHOD:
+            target, *args = pop(b + 1)
+            stack.append(Call(string(a), tuple(args), target))
+        elif opcode == UNARY:
+            (operand,) = pop(1)
+            stack.append(Unary(string(a), operand))
+        elif opcode == BINARY:
+            left, right = pop(2)
+            stack.append(Binary(string(a), left, right))
+        elif opcode == TERNARY:
+            cond, then, otherwise = pop(3)
+            stack.append(Ternary(cond, then, otherwise))
+        elif opcode == LIST:
+            stack.append(ListExpr(tuple(pop(b))))
+        elif opcode == MAP:
+            flat = pop(2 * b)
+            stack.append(MapExpr(tuple(zip(flat[::2], flat[1::2], strict=True))))
+        else:
+            raise ValueError(f"Malformed expression code: unknown opcode {opcode}")
+    if len(stack) != 1:
+        raise ValueError("Malformed expression code: expected one expression")
+    return stack[0]
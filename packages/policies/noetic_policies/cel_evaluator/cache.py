@@ -0,0 +1,78 @@
+"""Bounded LRU cache of compiled CEL programs."""
+
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+from noetic_policies.cel_evaluator.compiler import CompiledExpression
+
+__all__ = ["ProgramCache", "CacheInfo"]
+
+
+class CacheInfo(NamedTuple):
+    """Program cache statistics (mirrors functools.lru_cache)."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ProgramCache:
+    """
+    Thread-safe LRU cache of compiled expressions keyed by (expr, cel_mode).
+
+    Hit/miss counters are exposed through info() so the cache can be sized
+    against the working set of constraint strings.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initialize program cache.
+
+        Args:
+            maxsize: Maximum number of compiled programs retained
+        """
+        if maxsize < 1:
+            raise ValueError(f"Program cache size must be positive: {maxsize}")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[str, str], CompiledExpression] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, expr: str, mode: str) -> CompiledExpression | None:
+        """Return the cached program for (expr, mode), counting the hit or miss."""
+        key = (expr, mode)
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return compiled
+
+    def put(self, compiled: CompiledExpression) -> None:
+        """Insert a compiled program, evicting the least recently used entry if full."""
+        key = (compiled.source, compiled.mode)
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached programs and reset counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return hit/miss counters and current occupancy."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,368 @@
+"""Compilation of CEL expressions into reusable executable programs."""
+
+import operator
+import re
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+from noetic_policies.cel_evaluator.errors import CELEvaluationError
+from noetic_policies.cel_evaluator.parser import (
+    Binary,
+    Call,
+    Ident,
+    Index,
+    ListExpr,
+    Literal,
+    MapExpr,
+    Node,
+    Select,
+    Ternary,
+    Unary,
+    flatten,
+    flatten_chain,
+    parse,
+    walk,
+)
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from noetic_policies.cel_evaluator.vectorized import VectorizedProgram
+
+__all__ = [
+    "CompiledExpression",
+    "Program",
+    "compile_node",
+    "compile_program",
+    "Memoizer",
+    "FUNCTIONS",
+    "METHODS",
+    "OPERATORS",
+]
+
+# A compiled program maps a variable context to the expression result
+Program = Callable[[Mapping[str, Any]], Any]
+
+
+# Runtime helpers
+
+
+def _is_int(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _divide(a: Any, b: Any) -> Any:
+    if b == 0:
+        raise CELEvaluationError("Division by zero")
+    if _is_int(a) and _is_int(b):
+        # CEL integer division truncates toward zero
+        quotient = abs(a) // abs(b)
+        return quotient if (a < 0) == (b < 0) else -quotient
+    return a / b
+
+
+def _modulo(a: Any, b: Any) -> Any:
+    if b == 0:
+        raise CELEvaluationError("Modulus by zero")
+    if _is_int(a) and _is_int(b):
+        # CEL remainder takes the sign of the dividend
+        remainder = abs(a) % abs(b)
+        return remainder if a >= 0 else -remainder
+    raise CELEvaluationError("Modulus requires integer operands")
+
+
+def _to_string(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        if value in {"true", "True", "TRUE", "t", "1"}:
+            return True
+        if value in {"false", "False", "FALSE", "f", "0"}:
+            return False
+        raise CELEvaluationError(f"Cannot convert {value!r} to bool")
+    return bool(value)
+
+
+def _matches(text: str, pattern: str) -> bool:
+    return re.search(pattern, text) is not None
+
+
+# Global functions callable as f(x)
+FUNCTIONS: dict[str, Callable[..., Any]] = {
+    "size": len,
+    "int": int,
+    "double": float,
+    "string": _to_string,
+    "bool": _to_bool,
+}
+
+# Receiver-style functions callable as x.f(y)
+METHODS: dict[str, Callable[..., Any]] = {
+    "contains": lambda target, arg: arg in target,
+    "startsWith": lambda target, arg: target.startswith(arg),
+    "endsWith": lambda target, arg: target.endswith(arg),
+    "matches": _matches,
+    "size": len,
+}
+
+# Binary operators other than the short-circuiting "&&" and "||"
+OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": _divide,
+    "%": _modulo,
+    "in": lambda a, b: a in b,
+}
+
+# Program builders
+
+
+def _constant(value: Any) -> Program:
+    return lambda ctx: value
+
+
+def _identifier(name: str) -> Program:
+    def run(ctx: Mapping[str, Any]) -> Any:
+        try:
+            return ctx[name]
+        except KeyError:
+            raise CELEvaluationError(f"Undefined variable '{name}'") from None
+
+    return run
+
+
+def _binary(op: str, left: Program, right: Program) -> Program:
+    fn = OPERATORS[op]
+    return lambda ctx: fn(left(ctx), right(ctx))
+
+
+def _chain(operands: list[Program], ops: list[str]) -> Program:
+    first = operands[0]
+    rest = [(OPERATORS[op], operand) for op, operand in zip(ops, operands[1:], strict=True)]
+
+    def run(ctx: Mapping[str, Any]) -> Any:
+        value = first(ctx)
+        for fn, operand in rest:
+            value = fn(value, operand(ctx))
+        return value
+
+    return run
+
+
+def _all(operands: list[Program]) -> Program:
+    return lambda ctx: all(operand(ctx) for operand in operands)
+
+
+def _any(operands: list[Program]) -> Program:
+    return lambda ctx: any(operand(ctx) for operand in operands)
+
+
+def _ternary(cond: Program, then: Program, otherwise: Program) -> Program:
+    return lambda ctx: then(ctx) if cond(ctx) else otherwise(ctx)
+
+
+def _select(target: Program, name: str) -> Program:
+    def run(ctx: Mapping[str, Any]) -> Any:
+        value = target(ctx)
+        if not isinstance(value, Mapping):
+            raise CELEvaluationError(f"Cannot select field '{name}' from {type(value).__name__}")
+        try:
+            return value[name]
+        except KeyError:
+            raise CELEvaluationError(f"No such key: '{name}'") from None
+
+    return run
+
+
+def _index(target: Program, key: Program) -> Program:
+    def run(ctx: Mapping[str, Any]) -> Any:
+        try:
+            return target(ctx)[key(ctx)]
+        except (KeyError, IndexError, TypeError) as e:
+            raise CELEvaluationError(f"Invalid index: {e}") from None
+
+    return run
+
+
+def _call(fn: Callable[..., Any], args: list[Program]) -> Program:
+    def run(ctx: Mapping[str, Any]) -> Any:
+        return fn(*(arg(ctx) for arg in args))
+
+    return run
+
+
+def _list(items: list[Program]) -> Program:
+    return lambda ctx: [item(ctx) for item in items]
+
+
+def _map(entries: list[tuple[Program, Program]]) -> Program:
+    return lambda ctx: {key(ctx): value(ctx) for key, value in entries}
+
+
+def _unknown_function(name: str) -> Program:
+    def run(ctx: Mapping[str, Any]) -> Any:
+        raise CELEvaluationError(f"Unknown function '{name}'")
+
+    return run
+
+
+# Hook applied to every compiled subexpression (e.g. to share results between programs)
+Memoizer = Callable[[Node, Program], Program]
+
+
+def compile_node(node: Node, memoize: Memoizer | None = None) -> Program:
+    """
+    Compile an AST node into an executable program.
+
+    Args:
+        node: Root of the expression tree
+        memoize: Optional hook wrapping the program of every subexpression
+
+    Returns:
+        Program callable taking the variable context
+    """
+    program = _compile(node, memoize)
+    return memoize(node, program) if memoize is not None else program
+
+
+def _compile(node: Node, memoize: Memoizer | None) -> Program:
+    def sub(child: Node) -> Program:
+        return compile_node(child, memoize)
+
+    if isinstance(node, Literal):
+        return _constant(node.value)
+    if isinstance(node, Ident):
+        return _identifier(node.name)
+    if isinstance(node, Binary):
+        if node.op == "&&":
+            return _all([sub(n) for n in flatten(node, "&&")])
+        if node.op == "||":
+            return _any([sub(n) for n in flatten(node, "||")])
+        # Fold chains such as "a + b + c" in a loop; compiling and running them
+        # recursively would overflow the stack on chains of a few hundred terms
+        operands, ops = flatten_chain(node)
+        if len(ops) > 1:
+            return _chain([sub(n) for n in operands], ops)
+        return _binary(node.op, sub(node.left), sub(node.right))
+    if isinstance(node, Unary):
+        operand = sub(node.operand)
+        if node.op == "!":
+            return lambda ctx: not operand(ctx)
+        return lambda ctx: -operand(ctx)
+    if isinstance(node, Ternary):
+        return _ternary(sub(node.cond), sub(node.then), sub(node.otherwise))
+    if isinstance(node, Call):
+        args = [sub(arg) for arg in node.args]
+        if node.target is not None:
+            method = METHODS.get(node.function)
+            if method is None:
+                return _unknown_function(node.function)
+            return _call(method, [sub(node.target), *args])
+        fn = FUNCTIONS.get(node.function)
+        if fn is None:
+            return _unknown_function(node.function)
+        return _call(fn, args)
+    if isinstance(node, Select):
+        return _select(sub(node.operand), node.field)
+    if isinstance(node, Index):
+        return _index(sub(node.operand), sub(node.index))
+    if isinstance(node, ListExpr):
+        return _list([sub(item) for item in node.items])
+    if isinstance(node, MapExpr):
+        return _map([(sub(k), sub(v)) for k, v in node.entries])
+    raise TypeError(f"Unsupported CEL node: {type(node).__name__}")
+
+
+def compile_program(expr: str) -> Program:
+    """
+    Parse and compile a CEL expression into an executable program.
+
+    Args:
+        expr: CEL expression string
+
+    Returns:
+        Program callable taking the variable context
+
+    Raises:
+        CELSyntaxError: If the expression cannot be parsed
+    """
+    return compile_node(parse(expr))
+
+
+@dataclass(frozen=True)
+class CompiledExpression:
+    """A CEL expression validated and compiled once, executable against many contexts."""
+
+    source: str
+    mode: str
+    program: Program = field(repr=False, compare=False)
+    ast: Node | None = field(default=None, repr=False, compare=False)
+
+    def evaluate(self, context: Mapping[str, Any]) -> Any:
+        """
+        Execute the compiled program against a variable context.
+
+        Args:
+            context: Variable context dictionary
+
+        Returns:
+            Expression result
+
+        Raises:
+            CELEvaluationError: If evaluation fails
+        """
+        try:
+            return self.program(context)
+        except CELEvaluationError:
+            raise
+        except Exception as e:
+            raise CELEvaluationError(f"CEL evaluation failed: {e}") from e
+
+    @cached_property
+    def variables(self) -> frozenset[str]:
+        """Names of the context variables this expression reads."""
+        if self.ast is None:
+            return frozenset()
+        return frozenset(node.name for node in walk(self.ast) if isinstance(node, Ident))
+
+    @cached_property
+    def vectorized(self) -> "VectorizedProgram":
+        """NumPy lowering of this expression, built on first batch evaluation."""
+        # Import here to avoid circular dependency (vectorized builds on this module)
+        from noetic_policies.cel_evaluator.vectorized import VectorizedProgram
+
+        assert self.ast is not None
+        return VectorizedProgram(self.ast)
+
+    def evaluate_batch(
+        self,
+        columns: Mapping[str, "np.ndarray"],
+        state_schema: Mapping[str, str] | None = None,
+    ) -> "np.ndarray":
+        """
+        Evaluate against many states at once, stored column-wise.
+
+        Args:
+            columns: Equal-length arrays, one per variable
+            state_schema: Policy.state_schema, used to decode enum code columns
+
+        Returns:
+            Array with one result per row
+
+        Raises:
+            CELEvaluationError: If evaluation fails for any row
+        """
+        return self.vectorized.run(columns, state_schema)
@@ -0,0 +1,323 @@
+"""Fused checking of a policy's constraint or invariant set."""
+
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass, fields
+from typing import Any
+
+from noetic_policies.cel_evaluator.compiler import Program, compile_node
+from noetic_policies.cel_evaluator.errors import CELEvaluationError
+from noetic_policies.cel_evaluator.parser import Ident, Literal, Node, children, flatten, walk
+from noetic_policies.models import Invariant
+from noetic_policies.models.constraint import Constraint
+
+__all__ = ["ConstraintSet", "ConjunctStats"]
+
+_UNSET: Any = object()
+
+# Cost estimate per AST node until a conjunct has been timed
+_NODE_COST_NS = 50.0
+
+
+class _Frame(Mapping[str, Any]):
+    """Variable context plus the per-check table of shared subexpression results."""
+
+    __slots__ = ("context", "memo")
+
+    def __init__(self, context: Mapping[str, Any], slots: int):
+        self.context = context
+        self.memo = [_UNSET] * slots
+
+    def __getitem__(self, name: str) -> Any:
+        return self.context[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.context)
+
+    def __len__(self) -> int:
+        return len(self.context)
+
+
+def _evaluation_error(name: str, error: Exception) -> CELEvaluationError:
+    """Wrap a non-CEL exception like CompiledExpression.evaluate() does, naming the constraint."""
+    return CELEvaluationError(f"CEL evaluation failed for '{name}': {error}")
+
+
+class _SharedSubexpressions:
+    """Memoizer assigning one result slot per distinct (structurally equal) subexpression."""
+
+    def __init__(self) -> None:
+        self.programs: dict[int, Program] = {}
+        # Structure ids: equal subtrees get equal ids. Node equality and hashing
+        # recurse, which overflows the stack on long operator chains.
+        self._structures: dict[tuple[Any, ...], int] = {}
+        self._ids: dict[int, int] = {}
+        self._nodes: list[Node] = []  # Keeps the id() keys of _ids alive
+
+    @property
+    def slots(self) -> int:
+        return len(self.programs)
+
+    def _structure(self, root: Node) -> int:
+        """Return the structure id of a subtree, numbering unseen subtrees bottom-up."""
+        ids = self._ids
+        stack = [root]
+        while stack:
+            node = stack[-1]
+            if id(node) in ids:
+                stack.pop()
+                continue
+            pending = [child for child in children(node) if id(child) not in ids]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            key = (
+                type(node),
+                *(self._key(getattr(node, f.name)) for f in fields(node) if f.compare),
+            )
+            ids[id(node)] = self._structures.setdefault(key, len(self._structures))
+            self._nodes.append(node)
+        return ids[id(root)]
+
+    def _key(self, value: Any) -> Any:
+        if isinstance(value, Node):
+            return self._ids[id(value)]
+        if isinstance(value, tuple):
+            return tuple(self._key(item) for item in value)
+        return value
+
+    def __call__(self, node: Node, program: Program) -> Program:
+        if isinstance(node, (Literal, Ident)):
+            return program
+        structure = self._structure(node)
+        shared = self.programs.get(structure)
+        if shared is not None:
+            return shared
+        slot = len(self.programs)
+
+        def run(frame: Any) -> Any:
+            memo = frame.memo
+            value = memo[slot]
+            if value is _UNSET:
+                value = memo[slot] = program(frame)
+            return value
+
+        self.programs[structure] = run
+        return run
+
+
+@dataclass
+class ConjunctStats:
+    """Runtime statistics for one conjunct of a constraint set."""
+
+    name: str
+    expr: str
+    severity: str
+    evaluations: int = 0
+    failures: int = 0
+    timed_evaluations: int = 0
+    total_ns: int = 0
+
+    @property
+    def failure_rate(self) -> float:
+        """Smoothed probability that this conjunct fails when evaluated."""
+        return (self.failures + 1) / (self.evaluations + 2)
+
+
+@dataclass
+class _Conjunct:
+    name: str
+    program: Program
+    stats: ConjunctStats
+    size: int
+
+    @property
+    def cost_ns(self) -> float:
+        if self.stats.timed_evaluations:
+            return self.stats.total_ns / self.stats.timed_evaluations
+        return self.size * _NODE_COST_NS
+
+
+@dataclass
+class _Constraint:
+    name: str
+    conjuncts: list[_Conjunct]
+
+    @property
+    def cost_ns(self) -> float:
+        # Later conjuncts only run when the earlier ones hold
+        cost, reached = 0.0, 1.0
+        for conjunct in self.conjuncts:
+            cost += reached * conjunct.cost_ns
+            reached *= 1.0 - conjunct.stats.failure_rate
+        return cost
+
+    @property
+    def failure_rate(self) -> float:
+        failures = sum(c.stats.failures for c in self.conjuncts)
+        return (failures + 1) / (self.conjuncts[0].stats.evaluations + 2)
+
+
+class ConstraintSet:
+    """
+    All constraints (or invariants) of a policy compiled into one fused checker.
+
+    Identical subexpressions across constraints are evaluated at most once per
+    check. Top-level "&&" operands become separate conjuncts with their own
+    failure and timing statistics, collected while checking. Constraints are
+    ordered so that cheap, frequently failing ones run first; the conjuncts of
+    a constraint keep their source order, so a guard such as "size(items) > 0"
+    still protects the operands after it. Warnings are never evaluated by
+    check(), only by check_all().
+    """
+
+    def __init__(
+        self,
+        entries: Sequence[tuple[str, str, str]],
+        mode: str = "safe",
+        reorder_interval: int = 1024,
+        timing_interval: int = 16,
+    ):
+        """
+        Initialize constraint set.
+
+        Args:
+            entries: (name, expr, severity) per constraint; severity is "error" or "warning"
+            mode: CEL evaluation mode
+            reorder_interval: Checks between re-ordering constraints by measured selectivity
+            timing_interval: Time one check out of every N to estimate conjunct cost
+        """
+        # Import here to avoid circular dependency (the package imports this module)
+        from noetic_policies.cel_evaluator import CELEvaluator
+
+        evaluator = CELEvaluator(mode=mode)
+        self.names = [name for name, _, _ in entries]
+        self.reorder_interval = reorder_interval
+        self.timing_interval = timing_interval
+        self._shared = _SharedSubexpressions()
+        self._conjuncts: list[_Conjunct] = []
+        self._constraints: list[_Constraint] = []
+        for name, expr, severity in entries:
+            ast = evaluator.compile(expr).ast
+            assert ast is not None
+            conjuncts = []
+            for operand in flatten(ast, "&&"):
+                program = compile_node(operand, self._shared)
+                stats = ConjunctStats(name=name, expr=expr, severity=severity)
+                size = sum(1 for _ in walk(operand))
+                conjuncts.append(_Conjunct(name, program, stats, size))
+            self._conjuncts.extend(conjuncts)
+            if severity == "error":
+                self._constraints.append(_Constraint(name, conjuncts))
+        self._blocking: list[_Conjunct] = []
+        self._checks = 0
+        self._reorder()
+
+    @classmethod
+    def from_constraints(
+        cls, constraints: Sequence[Constraint], mode: str = "safe", **kwargs: Any
+    ) -> "ConstraintSet":
+        """Build a checker for Policy.constraints, honoring each constraint's severity."""
+        return cls([(c.name, c.expr, c.severity) for c in constraints], mode, **kwargs)
+
+    @classmethod
+    def from_invariants(
+        cls, invariants: Sequence[Invariant], mode: str = "safe", **kwargs: Any
+    ) -> "ConstraintSet":
+        """Build a checker for Policy.invariants (all blocking; unnamed ones are numbered)."""
+        entries = [
+            (inv.name or f"invariant[{i}]", inv.expr, "error") for i, inv in enumerate(invariants)
+        ]
+        return cls(entries, mode, **kwargs)
+
+    @property
+    def order(self) -> list[str]:
+        """Current evaluation order of the blocking conjuncts (constraint names)."""
+        return [c.name for c in self._blocking]
+
+    def stats(self) -> list[ConjunctStats]:
+        """Return runtime statistics per conjunct, in declaration order."""
+        return [c.stats for c in self._conjuncts]
+
+    def check(self, context: Mapping[str, Any]) -> str | None:
+        """
+        Return the name of the first failing error-severity constraint.
+
+        Evaluation stops at the first failure; warnings are not evaluated.
+
+        Args:
+            context: Variable context dictionary
+
+        Returns:
+            Failing constraint name, or None if every blocking constraint holds
+
+        Raises:
+            CELEvaluationError: If a constraint cannot be evaluated
+        """
+        self._checks += 1
+        if self._checks % self.reorder_interval == 0:
+            self._reorder()
+        frame = _Frame(context, self._shared.slots)
+        timed = self._checks % self.timing_interval == 1 or self.timing_interval == 1
+
+        # Statistics are updated only after a conjunct evaluates successfully
+        conjunct = None
+        try:
+            for conjunct in self._blocking:
+                stats = conjunct.stats
+                if timed:
+                    start = time.perf_counter_ns()
+                    holds = conjunct.program(frame) is True
+                    stats.total_ns += time.perf_counter_ns() - start
+                    stats.timed_evaluations += 1
+                else:
+                    holds = conjunct.program(frame) is True
+                stats.evaluations += 1
+                if not holds:
+                    stats.failures += 1
+                    return conjunct.name
+        except CELEvaluationError:
+            raise
+        except Exception as e:
+            assert conjunct is not None
+            raise _evaluation_error(conjunct.name, e) from e
+        return None
+
+    def check_all(self, context: Mapping[str, Any], include_warnings: bool = True) -> list[str]:
+        """
+        Return the names of every failing constraint, in declaration order.
+
+        Args:
+            context: Variable context dictionary
+            include_warnings: Also evaluate warning-severity constraints
+
+        Returns:
+            Names of failing constraints (each listed once)
+
+        Raises:
+            CELEvaluationError: If a constraint cannot be evaluated
+        """
+        frame = _Frame(context, self._shared.slots)
+        failing: list[str] = []
+        for conjunct in self._conjuncts:
+            if conjunct.stats.severity != "error" and not include_warnings:
+                continue
+            if failing and failing[-1] == conjunct.name:
+                continue
+            try:
+                holds = conjunct.program(frame) is True
+            except CELEvaluationError:
+                raise
+            except Exception as e:
+                raise _evaluation_error(conjunct.name, e) from e
+            conjunct.stats.evaluations += 1
+            if not holds:
+                conjunct.stats.failures += 1
+                failing.append(conjunct.name)
+        return failing
+
+    def _reorder(self) -> None:
+        """Sort blocking constraints by expected cost per failure detected (ascending)."""
+        self._constraints.sort(key=lambda c: c.cost_ns / c.failure_rate)
+        self._blocking = [conjunct for c in self._constraints for conjunct in c.conjuncts]
@@ -0,0 +1,13 @@
+"""CEL evaluator exceptions."""
+
+
+class CELSyntaxError(Exception):
+    """Raised when a CEL expression has invalid syntax."""
+
+    pass
+
+
+class CELEvaluationError(Exception):
+    """Raised when CEL expression evaluation fails."""
+
+    pass
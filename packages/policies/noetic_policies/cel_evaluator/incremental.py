@@ -0,0 +1,244 @@
+"""State-variable dependency index and incremental re-evaluation of policy expressions."""
+
+from collections import ChainMap
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from noetic_policies.cel_evaluator.compiler import CompiledExpression
+from noetic_policies.cel_evaluator.errors import CELEvaluationError, CELSyntaxError
+from noetic_policies.models.policy import Policy
+
+if TYPE_CHECKING:
+    from noetic_policies.cel_evaluator import CELEvaluator
+
+__all__ = ["ExpressionSite", "DependencyIndex", "IncrementalChecker"]
+
+# Site kinds that evaluate to a truth value for a concrete state
+PREDICATE_KINDS = ("constraint", "invariant", "precondition", "goal_condition")
+
+
+@dataclass(frozen=True)
+class ExpressionSite:
+    """Where an expression occurs in a policy."""
+
+    kind: str  # "constraint", "invariant", "precondition", "effect" or "goal_condition"
+    owner: str  # constraint/invariant/goal name, state name, or "state->target" transition
+    index: int  # position within the owner's list
+    expr: str
+    target: str | None = None  # variable assigned by an effect
+
+
+class DependencyIndex:
+    """
+    Maps each state variable to the policy expressions that read it.
+
+    Every constraint, invariant, precondition, effect and goal condition is
+    compiled once. Preconditions and goal conditions may refer to constraints
+    by name; such references depend on the referenced constraint's variables.
+    Building the index is linear in the total size of the policy's expressions.
+    """
+
+    def __init__(self, policy: Policy):
+        """
+        Initialize dependency index.
+
+        Args:
+            policy: Policy whose expressions are indexed
+        """
+        # Import here to avoid circular dependency (the package imports this module)
+        from noetic_policies.cel_evaluator import CELEvaluator
+
+        self.policy = policy
+        self.schema_vars = frozenset(policy.state_schema)
+        self.sites: list[ExpressionSite] = []
+        self.compiled: dict[ExpressionSite, CompiledExpression] = {}
+        self.references: dict[ExpressionSite, frozenset[str]] = {}
+        self.variables: dict[ExpressionSite, frozenset[str]] = {}
+        self.errors: dict[ExpressionSite, str] = {}
+        self._readers: dict[str, list[ExpressionSite]] = {}
+
+        evaluator = CELEvaluator(mode=policy.cel_mode)
+        constraint_vars: dict[str, frozenset[str]] = {}
+
+        for i, constraint in enumerate(policy.constraints):
+            site = ExpressionSite("constraint", constraint.name, i, constraint.expr)
+            self._add(site, evaluator)
+            constraint_vars[constraint.name] = self.references.get(site, frozenset())
+        self.constraint_names = frozenset(constraint_vars)
+
+        for i, invariant in enumerate(policy.invariants):
+            owner = invariant.name or f"invariant[{i}]"
+            self._add(ExpressionSite("invariant", owner, i, invariant.expr), evaluator)
+
+        for state in policy.state_graph.states:
+            for i, expr in enumerate(state.preconditions):
+                self._add(ExpressionSite("precondition", state.name, i, expr), evaluator)
+            for transition in state.transitions:
+                owner = f"{state.name}->{transition.to}"
+                for i, expr in enumerate(transition.preconditions):
+                    self._add(ExpressionSite("precondition", owner, i, expr), evaluator)
+                for i, effect in enumerate(transition.effects):
+                    self._add_effect(owner, i, effect, evaluator)
+
+        for goal in policy.goal_states:
+            for i, expr in enumerate(goal.conditions):
+                self._add(ExpressionSite("goal_condition", goal.name, i, expr), evaluator)
+
+        # Expand references to constraints into the variables they read
+        for site in self.sites:
+            refs = self.references.get(site, frozenset())
+            expanded = set(refs)
+            if site.kind != "constraint":
+                for ref in refs & self.constraint_names:
+                    if ref not in self.schema_vars:
+                        expanded.discard(ref)
+                        expanded |= constraint_vars[ref]
+            self.variables[site] = frozenset(expanded)
+            for var in expanded:
+                self._readers.setdefault(var, []).append(site)
+        # Policy order of each site, so affected() sorts only what it returns
+        self._positions = {site: i for i, site in enumerate(self.sites)}
+
+    def _add(self, site: ExpressionSite, evaluator: "CELEvaluator") -> None:
+        self.sites.append(site)
+        try:
+            compiled = evaluator.compile(site.expr)
+        except CELSyntaxError as e:
+            self.errors[site] = str(e)
+            return
+        self.compiled[site] = compiled
+        self.references[site] = compiled.variables
+
+    def _add_effect(self, owner: str, index: int, effect: str, evaluator: "CELEvaluator") -> None:
+        try:
+            target, compiled = evaluator.compile_effect(effect)
+        except CELSyntaxError as e:
+            site = ExpressionSite("effect", owner, index, effect)
+            self.sites.append(site)
+            self.errors[site] = str(e)
+            return
+        site = ExpressionSite("effect", owner, index, effect, target=target)
+        self.sites.append(site)
+        self.compiled[site] = compiled
+        self.references[site] = compiled.variables | {target}
+
+    def readers(self, var: str) -> list[ExpressionSite]:
+        """Return the expressions that read a state variable."""
+        return self._readers.get(var, [])
+
+    def affected(
+        self, changed_vars: Iterable[str], kinds: Iterable[str] | None = None
+    ) -> list[ExpressionSite]:
+        """
+        Return the expressions depending on any of the changed variables.
+
+        Args:
+            changed_vars: Names of state variables that changed
+            kinds: Restrict to these site kinds (default: all)
+
+        Returns:
+            Affected sites, each once, in policy order
+        """
+        wanted = set(kinds) if kinds is not None else None
+        seen: set[ExpressionSite] = set()
+        for var in changed_vars:
+            for site in self._readers.get(var, ()):
+                if wanted is None or site.kind in wanted:
+                    seen.add(site)
+        return sorted(seen, key=self._positions.__getitem__)
+
+    def undefined_references(self) -> list[tuple[ExpressionSite, str]]:
+        """Return (site, name) for every referenced name missing from state_schema."""
+        undefined: list[tuple[ExpressionSite, str]] = []
+        for site in self.sites:
+            for name in sorted(self.references.get(site, ())):
+                if name in self.schema_vars:
+                    continue
+                if site.kind != "constraint" and name in self.constraint_names:
+                    continue
+                undefined.append((site, name))
+        return undefined
+
+
+class IncrementalChecker:
+    """
+    Keeps the truth value of every predicate in a policy for one concrete state.
+
+    After a state change, apply_delta() re-evaluates only the constraints,
+    invariants, preconditions and goal conditions that read a changed
+    variable; all other results stay cached.
+    """
+
+    def __init__(
+        self,
+        policy: Policy,
+        state: Mapping[str, Any],
+        index: DependencyIndex | None = None,
+    ):
+        """
+        Initialize incremental checker and evaluate every predicate once.
+
+        Args:
+            policy: Policy whose predicates are tracked
+            state: Initial concrete state (variable name -> value)
+            index: Prebuilt dependency index for the policy
+        """
+        self.index = index or DependencyIndex(policy)
+        self.state: dict[str, Any] = dict(state)
+        self.results: dict[ExpressionSite, bool] = {}
+        self.errors: dict[ExpressionSite, str] = {}
+        self._constraint_values: dict[str, bool] = {}
+        self._predicates = [
+            site
+            for site in self.index.sites
+            if site.kind in PREDICATE_KINDS and site in self.index.compiled
+        ]
+        self._evaluate(self._predicates)
+
+    def apply_delta(
+        self, changed_vars: Mapping[str, Any] | Iterable[str]
+    ) -> dict[ExpressionSite, bool]:
+        """
+        Re-evaluate the predicates affected by a state change.
+
+        Args:
+            changed_vars: New values by variable name, or the names of variables
+                already updated in self.state
+
+        Returns:
+            Results of the re-evaluated predicates
+        """
+        if isinstance(changed_vars, Mapping):
+            self.state.update(changed_vars)
+        affected = self.index.affected(changed_vars, PREDICATE_KINDS)
+        self._evaluate([site for site in affected if site in self.index.compiled])
+        return {site: self.results[site] for site in affected if site in self.results}
+
+    def violations(self) -> list[ExpressionSite]:
+        """Return failing error-severity constraints and invariants."""
+        severities = {c.name: c.severity for c in self.index.policy.constraints}
+        return [
+            site
+            for site, holds in self.results.items()
+            if not holds
+            and (
+                site.kind == "invariant"
+                or (site.kind == "constraint" and severities.get(site.owner) == "error")
+            )
+        ]
+
+    def _evaluate(self, sites: list[ExpressionSite]) -> None:
+        # Sites are in policy order, so constraints update before the
+        # preconditions and goal conditions that reference them by name
+        context = ChainMap(self.state, self._constraint_values)
+        for site in sites:
+            try:
+                holds = self.index.compiled[site].evaluate(context) is True
+                self.errors.pop(site, None)
+            except CELEvaluationError as e:
+                holds = False
+                self.errors[site] = str(e)
+            self.results[site] = holds
+            if site.kind == "constraint":
+                self._constraint_values[site.owner] = holds
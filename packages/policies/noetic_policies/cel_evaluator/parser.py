@@ -0,0 +1,523 @@
+"""CEL tokenizer and parser producing an abstract syntax tree."""
+
+import re
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field, fields, replace
+from typing import Any
+
+from noetic_policies.cel_evaluator.errors import CELSyntaxError
+
+__all__ = [
+    "Token",
+    "tokenize",
+    "parse",
+    "walk",
+    "children",
+    "flatten",
+    "flatten_chain",
+    "substitute",
+    "Node",
+    "Literal",
+    "Ident",
+    "Select",
+    "Index",
+    "Call",
+    "Unary",
+    "Binary",
+    "Ternary",
+    "ListExpr",
+    "MapExpr",
+]
+
+
+@dataclass(frozen=True)
+class Token:
+    """A lexical token of a CEL expression."""
+
+    kind: str  # "number", "string", "ident", "op" or "eof"
+    value: Any
+    pos: int
+
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<ws>\s+)
+    |(?P<number>(?:\d+\.\d*|\.\d+|\d+)(?:[eE][+-]?\d+)?[uU]?)
+    |(?P<string>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+    |(?P<ident>[A-Za-z_][A-Za-z0-9_]*)
+    |(?P<op>&&|\|\||==|!=|<=|>=|[<>!+\-*/%?:.,()\[\]{}])
+    """,
+    re.VERBOSE,
+)
+
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "\\": "\\", "'": "'", '"': '"', "0": "\0"}
+
+
+def _unescape(literal: str) -> str:
+    """Decode the escape sequences of a quoted string literal."""
+    body = literal[1:-1]
+    if "\\" not in body:
+        return body
+    return re.sub(r"\\(.)", lambda m: _ESCAPES.get(m.group(1), m.group(1)), body)
+
+
+def tokenize(expr: str) -> list[Token]:
+    """
+    Split a CEL expression into tokens.
+
+    Args:
+        expr: CEL expression string
+
+    Returns:
+        Token list terminated by an "eof" token
+
+    Raises:
+        CELSyntaxError: If the expression contains an unexpected character
+    """
+    tokens: list[Token] = []
+    pos = 0
+    end = len(expr)
+    while pos < end:
+        match = _TOKEN_RE.match(expr, pos)
+        if match is None:
+            raise CELSyntaxError(f"Unexpected character {expr[pos]!r} at position {pos}")
+        kind = match.lastgroup
+        text = match.group()
+        if kind == "number":
+            digits = text.rstrip("uU")
+            if any(c in digits for c in ".eE"):
+                tokens.append(Token("number", float(digits), pos))
+            else:
+                tokens.append(Token("number", int(digits), pos))
+        elif kind == "string":
+            tokens.append(Token("string", _unescape(text), pos))
+        elif kind == "ident":
+            tokens.append(Token("ident", text, pos))
+        elif kind == "op":
+            tokens.append(Token("op", text, pos))
+        pos = match.end()
+    tokens.append(Token("eof", None, end))
+    return tokens
+
+
+# AST nodes
+#
+# Nodes are immutable and compare structurally (source positions are ignored),
+# so identical subexpressions are equal and hashable.
+
+
+@dataclass(frozen=True)
+class Node:
+    """Base class for CEL AST nodes."""
+
+    pos: int = field(default=0, compare=False, kw_only=True)
+
+
+@dataclass(frozen=True)
+class Literal(Node):
+    """A constant: int, double, string, bool or null."""
+
+    kind: str  # "int", "double", "string", "bool" or "null"
+    value: Any
+
+
+@dataclass(frozen=True)
+class Ident(Node):
+    """A variable reference."""
+
+    name: str
+
+
+@dataclass(frozen=True)
+class Select(Node):
+    """Field selection: operand.field."""
+
+    operand: Node
+    field: str
+
+
+@dataclass(frozen=True)
+class Index(Node):
+    """Indexing: operand[index]."""
+
+    operand: Node
+    index: Node
+
+
+@dataclass(frozen=True)
+class Call(Node):
+    """Function call f(args) or receiver-style call target.f(args)."""
+
+    function: str
+    args: tuple[Node, ...]
+    target: Node | None = None
+
+
+@dataclass(frozen=True)
+class Unary(Node):
+    """Unary operator: "!" or "-"."""
+
+    op: str
+    operand: Node
+
+
+@dataclass(frozen=True)
+class Binary(Node):
+    """Binary operator, including the logical "&&" and "||"."""
+
+    op: str
+    left: Node
+    right: Node
+
+
+@dataclass(frozen=True)
+class Ternary(Node):
+    """Conditional: cond ? then : otherwise."""
+
+    cond: Node
+    then: Node
+    otherwise: Node
+
+
+@dataclass(frozen=True)
+class ListExpr(Node):
+    """List literal."""
+
+    items: tuple[Node, ...]
+
+
+@dataclass(frozen=True)
+class MapExpr(Node):
+    """Map literal."""
+
+    entries: tuple[tuple[Node, Node], ...]
+
+
+def children(node: Node) -> tuple[Node, ...]:
+    """Return the direct subexpressions of a node."""
+    if isinstance(node, Binary):
+        return (node.left, node.right)
+    if isinstance(node, Unary):
+        return (node.operand,)
+    if isinstance(node, Call):
+        return node.args if node.target is None else (node.target, *node.args)
+    if isinstance(node, Select):
+        return (node.operand,)
+    if isinstance(node, Index):
+        return (node.operand, node.index)
+    if isinstance(node, Ternary):
+        return (node.cond, node.then, node.otherwise)
+    if isinstance(node, ListExpr):
+        return node.items
+    if isinstance(node, MapExpr):
+        return tuple(part for entry in node.entries for part in entry)
+    return ()
+
+
+def walk(node: Node) -> Iterator[Node]:
+    """Iterate over every node of a tree in pre-order (iterative, linear time)."""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        stack.extend(reversed(children(current)))
+
+
+def flatten(node: Node, op: str) -> list[Node]:
+    """Collect the operands of a left-nested chain of one binary operator."""
+    operands: list[Node] = []
+    while isinstance(node, Binary) and node.op == op:
+        operands.append(node.right)
+        node = node.left
+    operands.append(node)
+    operands.reverse()
+    return operands
+
+
+def flatten_chain(node: Binary) -> tuple[list[Node], list[str]]:
+    """
+    Collect the operands and operators of a left-nested chain of equal-precedence operators.
+
+    "a - b + c" gives ([a, b, c], ["-", "+"]). The parser builds such chains
+    iteratively, so they can be far deeper than any recursion limit.
+    """
+    level = next(level for level in _LEVELS if node.op in level)
+    operands: list[Node] = []
+    ops: list[str] = []
+    current: Node = node
+    while isinstance(current, Binary) and current.op in level:
+        operands.append(current.right)
+        ops.append(current.op)
+        current = current.left
+    operands.append(current)
+    operands.reverse()
+    ops.reverse()
+    return operands, ops
+
+
+def substitute(node: Node, bindings: Mapping[str, Node]) -> Node:
+    """
+    Replace identifiers by expressions, returning a new tree.
+
+    Args:
+        node: Root of the expression tree
+        bindings: Identifier name -> expression to put in its place
+
+    Returns:
+        Tree with every bound identifier replaced (the input is unchanged)
+    """
+    if isinstance(node, Ident):
+        return bindings.get(node.name, node)
+
+    def rebuild(value: Any) -> Any:
+        if isinstance(value, Node):
+            return substitute(value, bindings)
+        if isinstance(value, tuple):
+            return tuple(rebuild(item) for item in value)
+        return value
+
+    changes = {f.name: rebuild(getattr(node, f.name)) for f in fields(node) if f.name != "pos"}
+    return replace(node, **changes)
+
+
+_RELATIONS = {"==", "!=", "<", "<=", ">", ">=", "in"}
+
+# Binary operators of equal precedence (each level parses into left-nested chains)
+_LEVELS = (
+    frozenset({"||"}),
+    frozenset({"&&"}),
+    frozenset(_RELATIONS),
+    frozenset({"+", "-"}),
+    frozenset({"*", "/", "%"}),
+)
+
+# Closing delimiters and the wording used when they are missing or stray
+_DELIMITERS = {")": "parentheses", "]": "brackets", "}": "braces"}
+
+# Deepest nesting of subexpressions and unary operators the recursive descent accepts
+_MAX_NESTING = 64
+
+
+class _Parser:
+    """Recursive-descent parser over a token list."""
+
+    def __init__(self, expr: str):
+        self.tokens = tokenize(expr)
+        self.index = 0
+        self.depth = 0
+
+    def parse(self) -> Node:
+        node = self._expression()
+        token = self._peek()
+        if token.kind != "eof":
+            raise self._unexpected(token)
+        return node
+
+    # Token helpers
+
+    def _peek(self) -> Token:
+        return self.tokens[self.index]
+
+    def _next(self) -> Token:
+        token = self.tokens[self.index]
+        self.index += 1
+        return token
+
+    def _accept(self, op: str) -> bool:
+        token = self.tokens[self.index]
+        if token.kind == "op" and token.value == op:
+            self.index += 1
+            return True
+        return False
+
+    def _expect(self, op: str) -> None:
+        if self._accept(op):
+            return
+        token = self._peek()
+        found = "end of expression" if token.kind == "eof" else repr(token.value)
+        if op in _DELIMITERS:
+            raise CELSyntaxError(
+                f"Unbalanced {_DELIMITERS[op]}: expected '{op}' but found {found} "
+                f"at position {token.pos}"
+            )
+        raise CELSyntaxError(f"Expected '{op}' but found {found} at position {token.pos}")
+
+    def _unexpected(self, token: Token) -> CELSyntaxError:
+        if token.kind == "eof":
+            return CELSyntaxError(f"Unexpected end of expression at position {token.pos}")
+        if token.kind == "op" and token.value in _DELIMITERS:
+            return CELSyntaxError(
+                f"Unbalanced {_DELIMITERS[token.value]}: unexpected '{token.value}' "
+                f"at position {token.pos}"
+            )
+        return CELSyntaxError(f"Unexpected token {token.value!r} at position {token.pos}")
+
+    def _descend(self) -> None:
+        self.depth += 1
+        if self.depth > _MAX_NESTING:
+            raise CELSyntaxError(
+                f"Expression nested more than {_MAX_NESTING} levels deep "
+                f"at position {self._peek().pos}"
+            )
+
+    # Grammar (lowest to highest precedence)
+
+    def _expression(self) -> Node:
+        self._descend()
+        node = self._or()
+        token = self._peek()
+        if self._accept("?"):
+            then = self._or()
+            self._expect(":")
+            node = Ternary(node, then, self._expression(), pos=token.pos)
+        self.depth -= 1
+        return node
+
+    def _or(self) -> Node:
+        left = self._and()
+        while True:
+            token = self._peek()
+            if not self._accept("||"):
+                return left
+            left = Binary("||", left, self._and(), pos=token.pos)
+
+    def _and(self) -> Node:
+        left = self._relation()
+        while True:
+            token = self._peek()
+            if not self._accept("&&"):
+                return left
+            left = Binary("&&", left, self._relation(), pos=token.pos)
+
+    def _relation(self) -> Node:
+        left = self._addition()
+        while True:
+            token = self._peek()
+            if (token.kind == "op" and token.value in _RELATIONS) or (
+                token.kind == "ident" and token.value == "in"
+            ):
+                self.index += 1
+                left = Binary(token.value, left, self._addition(), pos=token.pos)
+            else:
+                return left
+
+    def _addition(self) -> Node:
+        left = self._multiplication()
+        while True:
+            token = self._peek()
+            if token.kind == "op" and token.value in {"+", "-"}:
+                self.index += 1
+                left = Binary(token.value, left, self._multiplication(), pos=token.pos)
+            else:
+                return left
+
+    def _multiplication(self) -> Node:
+        left = self._unary()
+        while True:
+            token = self._peek()
+            if token.kind == "op" and token.value in {"*", "/", "%"}:
+                self.index += 1
+                left = Binary(token.value, left, self._unary(), pos=token.pos)
+            else:
+                return left
+
+    def _unary(self) -> Node:
+        token = self._peek()
+        if token.kind == "op" and token.value in {"!", "-"}:
+            self.index += 1
+            self._descend()
+            operand = self._unary()
+            self.depth -= 1
+            is_number = isinstance(operand, Literal) and operand.kind in {"int", "double"}
+            if token.value == "-" and is_number:
+                return Literal(operand.kind, -operand.value, pos=token.pos)
+            return Unary(token.value, operand, pos=token.pos)
+        return self._member()
+
+    def _member(self) -> Node:
+        node = self._primary()
+        while True:
+            token = self._peek()
+            if self._accept("."):
+                name = self._next()
+                if name.kind != "ident":
+                    raise CELSyntaxError(f"Expected field name after '.' at position {name.pos}")
+                if self._accept("("):
+                    args = self._arguments(")")
+                    node = Call(name.value, args, target=node, pos=name.pos)
+                else:
+                    node = Select(node, name.value, pos=name.pos)
+            elif self._accept("["):
+                index = self._expression()
+                self._expect("]")
+                node = Index(node, index, pos=token.pos)
+            else:
+                return node
+
+    def _arguments(self, close: str) -> tuple[Node, ...]:
+        args: list[Node] = []
+        if self._accept(close):
+            return ()
+        while True:
+            args.append(self._expression())
+            if self._accept(close):
+                return tuple(args)
+            if self._peek().kind == "eof":
+                self._expect(close)
+            self._expect(",")
+
+    def _primary(self) -> Node:
+        token = self._next()
+        if token.kind == "number":
+            kind = "double" if isinstance(token.value, float) else "int"
+            return Literal(kind, token.value, pos=token.pos)
+        if token.kind == "string":
+            return Literal("string", token.value, pos=token.pos)
+        if token.kind == "ident":
+            if token.value in {"true", "false"}:
+                return Literal("bool", token.value == "true", pos=token.pos)
+            if token.value == "null":
+                return Literal("null", None, pos=token.pos)
+            if self._accept("("):
+                return Call(token.value, self._arguments(")"), pos=token.pos)
+            return Ident(token.value, pos=token.pos)
+        if token.kind == "op":
+            if token.value == "(":
+                node = self._expression()
+                self._expect(")")
+                return node
+            if token.value == "[":
+                return ListExpr(self._arguments("]"), pos=token.pos)
+            if token.value == "{":
+                return self._map_literal(token)
+        raise self._unexpected(token)
+
+    def _map_literal(self, start: Token) -> Node:
+        entries: list[tuple[Node, Node]] = []
+        if self._accept("}"):
+            return MapExpr((), pos=start.pos)
+        while True:
+            key = self._expression()
+            self._expect(":")
+            entries.append((key, self._expression()))
+            if self._accept("}"):
+                return MapExpr(tuple(entries), pos=start.pos)
+            if self._peek().kind == "eof":
+                self._expect("}")
+            self._expect(",")
+
+
+def parse(expr: str) -> Node:
+    """
+    Parse a CEL expression into an AST.
+
+    Args:
+        expr: CEL expression string
+
+    Returns:
+        Root node of the expression tree
+
+    Raises:
+        CELSyntaxError: If the expression is malformed or nested too deeply
+    """
+    return _Parser(expr).parse()
@@ -0,0 +1,391 @@
+"""Vectorized evaluation of CEL expressions over columnar state arrays."""
+
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+
+from noetic_policies.cel_evaluator.compiler import OPERATORS, compile_node
+from noetic_policies.cel_evaluator.errors import CELEvaluationError
+from noetic_policies.cel_evaluator.parser import (
+    Binary,
+    Ident,
+    ListExpr,
+    Literal,
+    Node,
+    Ternary,
+    Unary,
+    flatten,
+)
+
+__all__ = [
+    "VectorizedProgram",
+    "column_dtype",
+    "columns_from_states",
+    "enum_values",
+    "lower",
+]
+
+
+def enum_values(field_type: str) -> list[str] | None:
+    """
+    Return the members of an "enum[a,b,...]" schema type, or None for other types.
+
+    Args:
+        field_type: state_schema type string
+
+    Returns:
+        Enum members in declaration order (their int codes are list indices)
+    """
+    if field_type.startswith("enum[") and field_type.endswith("]"):
+        return [v.strip() for v in field_type[5:-1].split(",") if v.strip()]
+    return None
+
+
+def column_dtype(field_type: str) -> np.dtype:
+    """Map a state_schema type to its column dtype (number, boolean, enum codes, objects)."""
+    if field_type == "number":
+        return np.dtype(np.float64)
+    if field_type == "boolean":
+        return np.dtype(np.bool_)
+    if enum_values(field_type) is not None:
+        return np.dtype(np.int32)
+    return np.dtype(object)
+
+
+def columns_from_states(
+    states: Sequence[Mapping[str, Any]], state_schema: Mapping[str, str]
+) -> dict[str, np.ndarray]:
+    """
+    Pack a population of concrete states into typed columns.
+
+    Args:
+        states: Concrete state valuations (one mapping per state)
+        state_schema: Policy.state_schema (variable name -> type)
+
+    Returns:
+        Column per schema variable: number -> float64, boolean -> bool,
+        enum -> int32 codes (-1 for values outside the enum), other -> object
+    """
+    columns: dict[str, np.ndarray] = {}
+    for name, field_type in state_schema.items():
+        members = enum_values(field_type)
+        if members is not None:
+            codes = {value: i for i, value in enumerate(members)}
+            columns[name] = np.fromiter(
+                (codes.get(state[name], -1) for state in states), dtype=np.int32, count=len(states)
+            )
+        else:
+            dtype = column_dtype(field_type)
+            if dtype.kind == "O":
+                column = np.empty(len(states), dtype=object)
+                column[:] = [state[name] for state in states]
+                columns[name] = column
+            else:
+                columns[name] = np.fromiter(
+                    (state[name] for state in states), dtype=dtype, count=len(states)
+                )
+    return columns
+
+
+class _Batch:
+    """Columns being evaluated, plus per-row state for fallbacks and errors."""
+
+    def __init__(self, columns: Mapping[str, np.ndarray], enums: Mapping[str, list[str]]):
+        self.columns = columns
+        self.enums = enums
+        self.size = len(next(iter(columns.values()))) if columns else 0
+        for name, column in columns.items():
+            if len(column) != self.size:
+                raise ValueError(f"Column '{name}' has {len(column)} rows, expected {self.size}")
+        # Rows whose vectorized result may differ from scalar evaluation
+        self.suspect = np.zeros(self.size, dtype=np.bool_)
+        self._decoded: dict[str, np.ndarray] = {}
+        self._rows: list[dict[str, Any]] | None = None
+
+    def column(self, name: str) -> np.ndarray:
+        try:
+            column = self.columns[name]
+        except KeyError:
+            raise CELEvaluationError(f"Undefined variable '{name}'") from None
+        members = self.enums.get(name)
+        if members is None:
+            return column
+        decoded = self._decoded.get(name)
+        if decoded is None:
+            table = np.array([*members, None], dtype=object)
+            decoded = table[np.where(column < 0, len(members), column)]
+            self._decoded[name] = decoded
+        return decoded
+
+    def row(self, index: int) -> dict[str, Any]:
+        return {name: _scalar(self.column(name)[index]) for name in self.columns}
+
+    def rows(self) -> list[dict[str, Any]]:
+        if self._rows is None:
+            self._rows = [self.row(i) for i in range(self.size)]
+        return self._rows
+
+    def flag(self, mask: Any) -> None:
+        self.suspect |= np.broadcast_to(mask, (self.size,))
+
+
+def _scalar(value: Any) -> Any:
+    return value.item() if isinstance(value, np.generic) else value
+
+
+# A kernel computes a node's value for every row: an array or a broadcastable scalar
+Kernel = Callable[[_Batch], Any]
+
+_UFUNCS: dict[str, Callable[[Any, Any], Any]] = {
+    "==": np.equal,
+    "!=": np.not_equal,
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "+": np.add,
+    "-": np.subtract,
+    "*": np.multiply,
+}
+
+
+def _is_array(value: Any) -> bool:
+    return isinstance(value, np.ndarray)
+
+
+def _is_integer(value: Any) -> bool:
+    if _is_array(value):
+        return value.dtype.kind in "iu"
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _constant(value: Any) -> Kernel:
+    return lambda batch: value
+
+
+def _column(name: str) -> Kernel:
+    return lambda batch: batch.column(name)
+
+
+def _ufunc(op: str, left: Kernel, right: Kernel) -> Kernel:
+    fn = _UFUNCS[op]
+
+    def run(batch: _Batch) -> Any:
+        a, b = left(batch), right(batch)
+        if (_is_array(a) and a.dtype == object) or (_is_array(b) and b.dtype == object):
+            # Elementwise Python semantics on object columns
+            return _objectwise(fn, a, b, batch.size)
+        return fn(a, b)
+
+    return run
+
+
+def _objectwise(fn: Callable[[Any, Any], Any], a: Any, b: Any, size: int) -> np.ndarray:
+    left = np.broadcast_to(a, (size,))
+    right = np.broadcast_to(b, (size,))
+    result = np.frompyfunc(lambda x, y: _scalar(fn(x, y)), 2, 1)(left, right)
+    return np.asarray(result.tolist())
+
+
+def _division(left: Kernel, right: Kernel) -> Kernel:
+    def run(batch: _Batch) -> Any:
+        a, b = left(batch), right(batch)
+        if not _is_array(a) and not _is_array(b):
+            return OPERATORS["/"](a, b)
+        zero = np.equal(b, 0)
+        if np.any(zero):
+            # Scalar evaluation raises here unless short-circuited; re-check per row
+            batch.flag(zero)
+            b = np.where(zero, 1, b)
+        if _is_integer(a) and _is_integer(b):
+            quotient = np.abs(a) // np.abs(b)
+            return np.where(np.equal(np.less(a, 0), np.less(b, 0)), quotient, -quotient)
+        return np.true_divide(a, b)
+
+    return run
+
+
+def _enum_compare(op: str, name: str, literal: str, fallback: Kernel) -> Kernel:
+    def run(batch: _Batch) -> Any:
+        members = batch.enums.get(name)
+        if members is None:
+            return fallback(batch)
+        codes = batch.columns[name]
+        if literal not in members:
+            return np.full(batch.size, op == "!=")
+        equal = codes == members.index(literal)
+        return equal if op == "==" else ~equal
+
+    return run
+
+
+def _membership(operand: Kernel, values: list[Any], name: str | None) -> Kernel:
+    def run(batch: _Batch) -> Any:
+        members = batch.enums.get(name) if name is not None else None
+        if members is not None:
+            codes = [members.index(v) for v in values if v in members]
+            return np.isin(batch.columns[name], codes)
+        value = operand(batch)
+        if not _is_array(value):
+            return value in values
+        if value.dtype == object:
+            return np.asarray([v in values for v in value.tolist()], dtype=np.bool_)
+        return np.isin(value, values)
+
+    return run
+
+
+def _all(operands: list[Kernel]) -> Kernel:
+    def run(batch: _Batch) -> Any:
+        return np.logical_and.reduce([np.asarray(op(batch), dtype=np.bool_) for op in operands])
+
+    return run
+
+
+def _any(operands: list[Kernel]) -> Kernel:
+    def run(batch: _Batch) -> Any:
+        return np.logical_or.reduce([np.asarray(op(batch), dtype=np.bool_) for op in operands])
+
+    return run
+
+
+def _ternary(cond: Kernel, then: Kernel, otherwise: Kernel) -> Kernel:
+    def run(batch: _Batch) -> Any:
+        return np.where(np.asarray(cond(batch), dtype=np.bool_), then(batch), otherwise(batch))
+
+    return run
+
+
+def _per_row(node: Node) -> Kernel:
+    """Evaluate an unsupported subtree row by row with the scalar program."""
+    program = compile_node(node)
+
+    def run(batch: _Batch) -> Any:
+        values: list[Any] = []
+        for i, row in enumerate(batch.rows()):
+            try:
+                values.append(program(row))
+            except Exception:
+                batch.suspect[i] = True
+                values.append(None)
+        if any(v is None for v in values):
+            result = np.empty(batch.size, dtype=object)
+            result[:] = values
+            return result
+        return np.asarray(values)
+
+    return run
+
+
+def _literal_values(node: Node) -> list[Any] | None:
+    if isinstance(node, ListExpr) and all(isinstance(i, Literal) for i in node.items):
+        return [item.value for item in node.items]  # type: ignore[attr-defined]
+    return None
+
+
+def lower(node: Node) -> Kernel:
+    """
+    Lower an AST to a NumPy kernel.
+
+    Arithmetic, comparison, logical and conditional nodes become ufuncs over
+    whole columns; any other subtree falls back to per-row scalar evaluation.
+
+    Args:
+        node: Root of the expression tree
+
+    Returns:
+        Kernel computing the expression for every row of a batch
+    """
+    if isinstance(node, Literal):
+        return _constant(node.value)
+    if isinstance(node, Ident):
+        return _column(node.name)
+    if isinstance(node, Unary):
+        operand = lower(node.operand)
+        if node.op == "!":
+            return lambda batch: np.logical_not(operand(batch))
+        return lambda batch: np.negative(operand(batch))
+    if isinstance(node, Ternary):
+        return _ternary(lower(node.cond), lower(node.then), lower(node.otherwise))
+    if isinstance(node, Binary):
+        if node.op == "&&":
+            return _all([lower(n) for n in flatten(node, "&&")])
+        if node.op == "||":
+            return _any([lower(n) for n in flatten(node, "||")])
+        if node.op in {"==", "!="}:
+            for var, lit in ((node.left, node.right), (node.right, node.left)):
+                if isinstance(var, Ident) and isinstance(lit, Literal) and lit.kind == "string":
+                    generic = _ufunc(node.op, lower(node.left), lower(node.right))
+                    return _enum_compare(node.op, var.name, lit.value, generic)
+        if node.op == "in":
+            values = _literal_values(node.right)
+            if values is not None:
+                name = node.left.name if isinstance(node.left, Ident) else None
+                return _membership(lower(node.left), values, name)
+            return _per_row(node)
+        if node.op == "/":
+            return _division(lower(node.left), lower(node.right))
+        if node.op in _UFUNCS:
+            return _ufunc(node.op, lower(node.left), lower(node.right))
+    return _per_row(node)
+
+
+class VectorizedProgram:
+    """A CEL expression lowered once to NumPy kernels for batch evaluation."""
+
+    def __init__(self, node: Node):
+        """
+        Initialize vectorized program.
+
+        Args:
+            node: Parsed expression (CompiledExpression.ast)
+        """
+        self.kernel = lower(node)
+        self.program = compile_node(node)
+
+    def run(
+        self,
+        columns: Mapping[str, np.ndarray],
+        state_schema: Mapping[str, str] | None = None,
+    ) -> np.ndarray:
+        """
+        Evaluate the expression for every row of the columns.
+
+        Args:
+            columns: Equal-length arrays, one per variable
+            state_schema: Schema used to decode enum code columns
+
+        Returns:
+            Array with one result per row
+
+        Raises:
+            CELEvaluationError: If evaluation fails for any row
+        """
+        enums: dict[str, list[str]] = {}
+        for name, field_type in (state_schema or {}).items():
+            members = enum_values(field_type)
+            if members is not None and name in columns:
+                enums[name] = members
+        batch = _Batch(columns, enums)
+
+        try:
+            with np.errstate(all="ignore"):
+                result = np.asarray(self.kernel(batch))
+        except Exception:
+            # Operand types NumPy cannot combine: evaluate every row exactly
+            result = np.zeros(batch.size, dtype=object)
+            batch.suspect[:] = True
+        if result.shape != (batch.size,):
+            result = np.array(np.broadcast_to(result, (batch.size,)))
+
+        # Rows that may have raised in scalar evaluation are re-run exactly
+        for index in np.flatnonzero(batch.suspect).tolist():
+            try:
+                value = self.program(batch.row(index))
+            except Exception as e:
+                raise CELEvaluationError(f"CEL evaluation failed for row {index}: {e}") from e
+            if result.dtype != object and not np.can_cast(type(value), result.dtype):
+                result = result.astype(object)
+            result[index] = value
+        return result
@@ -1,11 +1,20 @@
 """CLI interface for noetic-policies (T085-T091)."""
 
+import contextlib
+import os
 import sys
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from noetic_policies.validator import PolicyValidator
+from noetic_policies import __version__
 
-__all__ = ["main"]
+# The validator is imported by the commands that run it: with a daemon
+# running, single-file validation never loads it
+if TYPE_CHECKING:
+    from noetic_policies.models import ValidationResult
+
+__all__ = ["format_result", "main"]
 
 
 def main() -> None:
@@ -13,7 +22,9 @@ def main() -> None:
     if len(sys.argv) < 2:
         print("Usage: noetic-policies <command> [options]")
         print("\nCommands:")
-        print("  validate <file>       - Validate a policy file")
+        print("  validate <path>...    - Validate policy files, directories or globs")
+        print("  compile <file>        - Compile a policy into a binary artifact")
+        print("  serve                 - Run the validation daemon")
         print("  version              - Show version information")
         sys.exit(1)
 
@@ -21,6 +32,10 @@ def main() -> None:
 
     if command == "validate":
         handle_validate()
+    elif command == "compile":
+        handle_compile()
+    elif command == "serve":
+        handle_serve()
     elif command == "version":
         handle_version()
     else:
@@ -31,41 +46,249 @@ def main() -> None:
 def handle_validate() -> None:
     """Handle validate command."""
     if len(sys.argv) < 3:
-        print("Usage: noetic-policies validate <file> [--mode fast|thorough]")
+        print(
+            "Usage: noetic-policies validate <file-dir-or-glob>... "
+            "[--mode fast|thorough|thorough-plus] [--jobs N] [--no-daemon] [--watch [--poll]]"
+        )
+        sys.exit(1)
+
+    # Parse options; every other argument is a file, directory or glob
+    mode = "fast"
+    jobs: int | None = None
+    use_daemon = not os.environ.get("NOETIC_POLICIES_NO_DAEMON")
+    watch_backend: str | None = None
+    targets: list[str] = []
+    args = iter(sys.argv[2:])
+    for arg in args:
+        if arg == "--mode":
+            mode = next(args, mode)
+        elif arg == "--jobs":
+            value = next(args, "")
+            if not value.isdigit() or int(value) < 1:
+                print(f"--jobs must be a positive integer: {value}")
+                sys.exit(1)
+            jobs = int(value)
+        elif arg == "--no-daemon":
+            use_daemon = False
+        elif arg == "--watch":
+            watch_backend = watch_backend or "auto"
+        elif arg == "--poll":
+            watch_backend = "poll"
+        else:
+            targets.append(arg)
+
+    if watch_backend is not None:
+        handle_watch(targets, mode, watch_backend)
+        return
+
+    if len(targets) != 1 or jobs is not None or not Path(targets[0]).is_file():
+        handle_validate_many(targets, mode, jobs)
+        return
+    file_path = targets[0]
+
+    # A running daemon answers with a warm validator and cache
+    if use_daemon:
+        from noetic_policies.daemon import DaemonClient, DaemonError
+
+        try:
+            with DaemonClient(timeout=None) as client:
+                response = client.validate_file(file_path, mode=mode)
+        except DaemonError:
+            pass
+        else:
+            print(response["report"])
+            sys.exit(0 if response["result"]["is_valid"] else 1)
+
+    from noetic_policies.validator import PolicyValidator
+
+    result = PolicyValidator().validate_file(file_path, mode=mode)
+    print(format_result(result, mode))
+    sys.exit(0 if result.is_valid else 1)
+
+
+def format_result(result: "ValidationResult", mode: str) -> str:
+    """
+    Format a single-file validation result as the validate command prints it.
+
+    Args:
+        result: Validation result
+        mode: Validation mode
+
+    Returns:
+        Report text (without a trailing newline)
+    """
+    if result.is_valid:
+        lines = ["✓ Policy validation successful", ""]
+        for warning in result.warnings:
+            lines.extend([warning.format(), ""])
+        lines.append(f"Mode: {mode}")
+        lines.append(f"Duration: {result.metadata.get('duration_ms', 0):.2f}ms")
+    else:
+        lines = ["✗ Policy validation failed", ""]
+        for error in result.errors:
+            lines.extend([error.format(), ""])
+        lines.append(f"Mode: {mode}")
+        lines.append(f"Errors: {len(result.errors)}")
+    return "\n".join(lines)
+
+
+def handle_validate_many(targets: list[str], mode: str, jobs: int | None) -> None:
+    """Validate files, directories and globs in parallel and print a summary."""
+    from noetic_policies.validator import PolicyValidator
+    from noetic_policies.validator.batch import expand_paths
+
+    files = expand_paths(targets)
+    if not files:
+        print(f"No policy files found in: {' '.join(targets)}")
+        sys.exit(1)
+
+    jobs = jobs if jobs is not None else os.cpu_count() or 1
+    start = time.perf_counter()
+    results = []
+    for item in PolicyValidator().validate_many(files, mode=mode, jobs=jobs):
+        results.append(item)
+        status = "✓" if item.result.is_valid else "✗"
+        print(f"{status} {item.path} ({item.duration_ms:.2f}ms)")
+        for error in item.result.errors:
+            print(error.format())
+            print()
+    elapsed = time.perf_counter() - start
+
+    failed = [item for item in results if not item.result.is_valid]
+    warnings = sum(len(item.result.warnings) for item in results)
+    print(
+        f"\nValidated {len(results)} files in {elapsed:.2f}s: "
+        f"{len(results) - len(failed)} passed, {len(failed)} failed, {warnings} warnings"
+    )
+    print(f"Mode: {mode}, jobs: {jobs}")
+    slowest = sorted(results, key=lambda item: item.duration_ms, reverse=True)[:5]
+    print("Slowest:")
+    for item in slowest:
+        print(f"  {item.duration_ms:10.2f}ms  {item.path}")
+    sys.exit(1 if failed else 0)
+
+
+def handle_watch(targets: list[str], mode: str, backend: str) -> None:
+    """Validate files, then re-validate each one whenever it changes, until interrupted."""
+    from noetic_policies.validator.watch import PolicyWatcher
+
+    if not targets:
+        print("Usage: noetic-policies validate <file-dir-or-glob>... --watch [--poll]")
+        sys.exit(1)
+
+    with PolicyWatcher(targets, mode=mode, backend=backend) as watcher:
+        print(f"Watching {' '.join(targets)} ({watcher.backend}, mode: {mode}); Ctrl-C to stop")
+        seen: set[str] = set()
+        try:
+            for results in watcher.watch():
+                stamp = time.strftime("%H:%M:%S")
+                for item in results:
+                    # After the first validation, show what the edit made re-run
+                    rechecked = item.result.metadata.get("rechecked")
+                    detail = ""
+                    if item.path in seen and rechecked is not None:
+                        detail = f", rechecked: {', '.join(rechecked) or 'nothing'}"
+                    seen.add(item.path)
+                    print(f"\n[{stamp}] {item.path} ({item.duration_ms:.2f}ms{detail})")
+                    print(format_result(item.result, mode))
+                sys.stdout.flush()
+        except KeyboardInterrupt:
+            print("\nStopped watching")
+    sys.exit(0)
+
+
+def handle_compile() -> None:
+    """Handle compile command."""
+    if len(sys.argv) < 3:
+        print(
+            "Usage: noetic-policies compile <file> [-o <output>] "
+            "[--mode fast|thorough|thorough-plus]"
+        )
         sys.exit(1)
 
+    from noetic_policies.artifact import compile_policy
+    from noetic_policies.parser import PolicyParser
+    from noetic_policies.validator import PolicyValidator
+
     file_path = sys.argv[2]
 
-    # Parse mode option
-    mode = "fast"
+    # Parse options
+    mode = "thorough"
     if "--mode" in sys.argv:
         mode_index = sys.argv.index("--mode")
         if mode_index + 1 < len(sys.argv):
             mode = sys.argv[mode_index + 1]
+    output = Path(file_path).with_suffix(".npol")
+    if "-o" in sys.argv:
+        output_index = sys.argv.index("-o")
+        if output_index + 1 < len(sys.argv):
+            output = Path(sys.argv[output_index + 1])
 
-    # Validate policy
-    validator = PolicyValidator()
-    result = validator.validate_file(file_path, mode=mode)
-
-    # Output results
-    if result.is_valid:
-        print("✓ Policy validation successful\n")
-        print(f"Mode: {mode}")
-        print(f"Duration: {result.metadata.get('duration_ms', 0):.2f}ms")
-        sys.exit(0)
-    else:
+    # Only valid policies are compiled
+    result = PolicyValidator().validate_file(file_path, mode=mode)
+    if not result.is_valid:
         print("✗ Policy validation failed\n")
         for error in result.errors:
             print(error.format())
             print()
-        print(f"Mode: {mode}")
         print(f"Errors: {len(result.errors)}")
         sys.exit(1)
 
+    size = compile_policy(PolicyParser().parse_file(file_path), output, validation=result)
+    print(f"✓ Compiled {file_path} -> {output} ({size} bytes)")
+    sys.exit(0)
+
+
+def handle_serve() -> None:
+    """Handle serve command."""
+    from noetic_policies.daemon import DaemonClient, DaemonError
+
+    # Parse options
+    socket_path: str | None = None
+    cache_dir: str | None = None
+    args = iter(sys.argv[2:])
+    for arg in args:
+        if arg == "--socket":
+            socket_path = next(args, None)
+        elif arg == "--cache-dir":
+            cache_dir = next(args, None)
+        elif arg == "--stop":
+            try:
+                DaemonClient(socket_path).request("shutdown")
+            except DaemonError as e:
+                print(f"✗ {e}")
+                sys.exit(1)
+            print("✓ Validation daemon stopped")
+            sys.exit(0)
+        else:
+            print("Usage: noetic-policies serve [--socket <path>] [--cache-dir <dir>] [--stop]")
+            sys.exit(1)
+
+    import signal
+    import threading
+
+    from noetic_policies.daemon.server import ValidationDaemon
+    from noetic_policies.validator import PolicyValidator
+    from noetic_policies.validator.result_cache import ValidationCache
+
+    validator = PolicyValidator(cache=ValidationCache(directory=cache_dir))
+    try:
+        daemon = ValidationDaemon(socket_path, validator=validator)
+    except DaemonError as e:
+        print(f"✗ {e}")
+        sys.exit(1)
+
+    # shutdown() must not run in the thread that serves
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=daemon.shutdown).start())
+    print(f"Validation daemon listening on {daemon.path}")
+    with daemon, contextlib.suppress(KeyboardInterrupt):
+        daemon.serve_forever()
+    sys.exit(0)
+
 
 def handle_version() -> None:
     """Handle version command."""
-    print("Noetic Policies v0.1.0")
+    print(f"Noetic Policies v{__version__}")
     print("Policy Format Version: 1.0")
     sys.exit(0)
 
@@ -0,0 +1,12 @@
+"""Validation daemon keeping a warm validator behind a Unix socket."""
+
+# Only the client is imported here, so the CLI reaches a running daemon
+# without loading the validator; the server is noetic_policies.daemon.server
+from noetic_policies.daemon.client import (
+    DaemonClient,
+    DaemonError,
+    default_socket_path,
+    verify_socket,
+)
+
+__all__ = ["DaemonClient", "DaemonError", "default_socket_path", "verify_socket"]
@@ -0,0 +1,164 @@
+"""Client for the validation daemon (standard library only, so it imports quickly)."""
+
+import json
+import os
+import socket
+import stat
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from noetic_policies import __version__
+
+__all__ = ["DaemonClient", "DaemonError", "default_socket_path", "verify_socket"]
+
+
+class DaemonError(Exception):
+    """Raised when the daemon rejects a request or the connection fails."""
+
+    pass
+
+
+def default_socket_path() -> Path:
+    """
+    Return the daemon socket path for the current user.
+
+    NOETIC_POLICIES_SOCKET overrides it; otherwise the socket lives in
+    XDG_RUNTIME_DIR, or the temporary directory with the user id in its name.
+    """
+    override = os.environ.get("NOETIC_POLICIES_SOCKET")
+    if override:
+        return Path(override)
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return Path(runtime) / "noetic-policies.sock"
+    return Path(tempfile.gettempdir()) / f"noetic-policies-{os.getuid()}.sock"
+
+
+def verify_socket(path: str | os.PathLike[str]) -> None:
+    """
+    Check that a socket path is a socket owned by the current user.
+
+    The default path may sit in a shared temporary directory, where another
+    user could have created it first.
+
+    Args:
+        path: Socket path
+
+    Raises:
+        FileNotFoundError: If nothing exists at the path
+        DaemonError: If the path is not a socket or belongs to another user
+    """
+    info = os.lstat(path)
+    if not stat.S_ISSOCK(info.st_mode):
+        raise DaemonError(f"Refusing to use {path}: not a socket")
+    if info.st_uid != os.getuid():
+        raise DaemonError(f"Refusing to use {path}: owned by another user")
+
+
+class DaemonClient:
+    """
+    Connection to a running validation daemon.
+
+    The protocol is JSON lines over a Unix domain socket: each request is
+    one JSON object with a "method" (and optional "id", echoed back), each
+    response one object with "ok" and either "result" or "error". Requests
+    carry the client's package version; the daemon refuses mismatched
+    versions so an upgrade never gets results from old code.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None, timeout: float | None = 30.0):
+        """
+        Initialize client (connects lazily).
+
+        Args:
+            path: Socket path (defaults to default_socket_path())
+            timeout: Seconds to wait for a response (None waits indefinitely)
+        """
+        self.path = Path(path) if path is not None else default_socket_path()
+        self.timeout = timeout
+        self._socket: socket.socket | None = None
+        self._reader: Any = None
+        self._next_id = 0
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the connection."""
+        if self._socket is not None:
+            self._reader.close()
+            self._socket.close()
+            self._socket = None
+
+    def available(self) -> bool:
+        """Whether a compatible daemon answers on the socket."""
+        try:
+            self.request("ping")
+        except DaemonError:
+            return False
+        return True
+
+    def request(self, method: str, **params: Any) -> Any:
+        """
+        Send one request and wait for its response.
+
+        Args:
+            method: "ping", "validate", "validate_yaml", "stats" or "shutdown"
+            **params: Method parameters
+
+        Returns:
+            The response's result
+
+        Raises:
+            DaemonError: If the daemon is not running, the socket is not the
+                current user's, the connection fails or the daemon reports an error
+        """
+        try:
+            if self._socket is None:
+                verify_socket(self.path)
+                connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                try:
+                    connection.settimeout(self.timeout)
+                    connection.connect(str(self.path))
+                except OSError:
+                    connection.close()
+                    raise
+                self._socket = connection
+                self._reader = connection.makefile("rb")
+            self._next_id += 1
+            message = {"id": self._next_id, "method": method, "version": __version__, **params}
+            self._socket.sendall(json.dumps(message).encode() + b"\n")
+            line = self._reader.readline()
+        except OSError as e:
+            self.close()
+            raise DaemonError(f"Validation daemon unavailable at {self.path}: {e}") from e
+        if not line:
+            self.close()
+            raise DaemonError("Validation daemon closed the connection")
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise DaemonError(response.get("error", "Unknown daemon error"))
+        return response.get("result")
+
+    def validate_file(
+        self, file_path: str | os.PathLike[str], mode: str = "fast"
+    ) -> dict[str, Any]:
+        """
+        Validate a policy file in the daemon.
+
+        Args:
+            file_path: Policy file (made absolute, since the daemon has its
+                own working directory)
+            mode: Validation mode
+
+        Returns:
+            {"result": ValidationResult as a dict, "report": CLI report text}
+
+        Raises:
+            DaemonError: If the daemon is unavailable or fails
+        """
+        return self.request("validate", path=str(Path(file_path).absolute()), mode=mode)
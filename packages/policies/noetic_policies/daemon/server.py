@@ -0,0 +1,153 @@
+"""Validation daemon: a warm PolicyValidator serving requests on a Unix socket."""
+
+import contextlib
+import json
+import os
+import socketserver
+import threading
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from noetic_policies import __version__
+from noetic_policies.daemon.client import (
+    DaemonClient,
+    DaemonError,
+    default_socket_path,
+    verify_socket,
+)
+from noetic_policies.models import ValidationResult
+from noetic_policies.validator import PolicyValidator
+from noetic_policies.validator.result_cache import ValidationCache
+
+__all__ = ["ValidationDaemon"]
+
+_MODES = {"fast", "thorough", "thorough-plus"}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Serves the JSON-lines requests of one connection, in order."""
+
+    server: "ValidationDaemon"
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            request_id = None
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("Request must be a JSON object")
+                request_id = request.get("id")
+                response = {"id": request_id, "ok": True, "result": self.server.dispatch(request)}
+            except Exception as e:
+                response = {"id": request_id, "ok": False, "error": str(e)}
+            try:
+                self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+                self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                # The client went away; nothing to report to
+                return
+            if self.server.stopping.is_set():
+                # After answering, so the client sees the shutdown acknowledged;
+                # shutdown() waits for serve_forever(), which runs in another thread
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+class ValidationDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Keeps a PolicyValidator and its caches warm between CLI invocations.
+
+    Connections are served in threads; validations run one at a time (the
+    validator and its caches are shared). Unchanged files are answered
+    from the result cache without being parsed.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str] | None = None,
+        validator: PolicyValidator | None = None,
+    ):
+        """
+        Bind the daemon socket.
+
+        A socket file left by a daemon that is no longer running is replaced,
+        provided it is a socket owned by the current user.
+
+        Args:
+            path: Socket path (defaults to default_socket_path())
+            validator: Validator to serve (defaults to one with an in-memory cache)
+
+        Raises:
+            DaemonError: If another daemon already listens on the socket, or
+                the path is not a socket owned by the current user
+        """
+        self.path = Path(path) if path is not None else default_socket_path()
+        self.validator = validator or PolicyValidator(cache=ValidationCache())
+        self.stopping = threading.Event()
+        self._lock = threading.Lock()
+        if os.path.lexists(self.path):
+            verify_socket(self.path)
+            with DaemonClient(self.path, timeout=1.0) as client:
+                if client.available():
+                    raise DaemonError(f"A validation daemon is already running at {self.path}")
+            self.path.unlink()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Owner-only socket: requests may name any file the owner can read
+        previous = os.umask(0o177)
+        try:
+            super().__init__(str(self.path), _Handler)
+        finally:
+            os.umask(previous)
+
+    def dispatch(self, request: dict[str, Any]) -> Any:
+        """
+        Execute one request.
+
+        Args:
+            request: Decoded request object
+
+        Returns:
+            JSON-compatible result
+
+        Raises:
+            ValueError: If the request is malformed or from another package version
+        """
+        # Import here so that the daemon formats reports exactly like the CLI
+        from noetic_policies.cli import format_result
+
+        version = request.get("version")
+        if version is not None and version != __version__:
+            raise ValueError(f"Daemon runs noetic-policies {__version__}, client {version}")
+
+        method = request.get("method")
+        if method == "ping":
+            return {"version": __version__, "pid": os.getpid()}
+        if method == "stats":
+            cache = self.validator.cache
+            return cache.info()._asdict() if cache is not None else None
+        if method == "shutdown":
+            self.stopping.set()
+            return None
+        if method in ("validate", "validate_yaml"):
+            mode = request.get("mode", "fast")
+            if mode not in _MODES:
+                raise ValueError(f"Invalid mode: {mode}")
+            result: ValidationResult
+            with self._lock:
+                if method == "validate":
+                    result = self.validator.validate_file(str(request["path"]), mode=mode)
+                else:
+                    result = self.validator.validate_yaml(str(request["content"]), mode=mode)
+            return {"result": asdict(result), "report": format_result(result, mode)}
+        raise ValueError(f"Unknown method: {method}")
+
+    def server_close(self) -> None:
+        """Close the socket and remove its file."""
+        super().server_close()
+        with contextlib.suppress(OSError):
+            self.path.unlink()
@@ -1,14 +1,23 @@
 """Core data models for noetic-policies package."""
 
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator, model_validator
+
+if TYPE_CHECKING:
+    from noetic_policies.validator.condensation import Condensation
 
 __all__ = [
     "ValidationError",
     "ValidationResult",
     "GraphAnalysisResult",
+    "TraceStep",
+    "Counterexample",
+    "ModelCheckResult",
+    "BoundedCheckResult",
+    "Plan",
+    "FileValidationResult",
     "Invariant",
     "Transition",
     "ProgressCondition",
@@ -17,6 +26,16 @@ __all__ = [
 ]
 
 
+# Validation context for data this package already validated, e.g. model_dump()
+# output stored in a compiled artifact (PolicyParser.parse_dict(trusted=True))
+TRUSTED: dict[str, Any] = {"trusted": True}
+
+
+def is_trusted(info: ValidationInfo) -> bool:
+    """Whether model-level consistency checks can be skipped for this validation."""
+    return bool(info.context and info.context.get("trusted"))
+
+
 # T009: ValidationError dataclass
 @dataclass
 class ValidationError:
@@ -61,6 +80,15 @@ class ValidationResult:
     metadata: dict[str, Any]
 
 
+@dataclass
+class FileValidationResult:
+    """Validation result of one file from a batch, with its wall-clock time."""
+
+    path: str
+    result: ValidationResult
+    duration_ms: float  # Reading, parsing and validating the file
+
+
 # T011: GraphAnalysisResult dataclass
 @dataclass
 class GraphAnalysisResult:
@@ -73,6 +101,107 @@ class GraphAnalysisResult:
     goal_costs: dict[str, float] | None = None
     goal_min_steps: dict[str, int] | None = None
     temporally_infeasible_goals: list[str] | None = None
+    cost_predecessors: dict[str, str] | None = None
+    step_predecessors: dict[str, str] | None = None
+    condensation: "Condensation | None" = None  # SCC DAG, for reuse (e.g. topological bounds)
+
+    def shortest_path(self, goal: str, weighted: bool = True) -> list[str] | None:
+        """
+        Extract a shortest path to a goal from the predecessor tree.
+
+        Args:
+            goal: Goal state name
+            weighted: Minimum-cost path (True) or minimum-step path (False)
+
+        Returns:
+            State names from the initial state to goal, or None if goal was not reached
+        """
+        predecessors = self.cost_predecessors if weighted else self.step_predecessors
+        distances = self.goal_costs if weighted else self.goal_min_steps
+        if predecessors is None or distances is None or goal not in distances:
+            return None
+        path = [goal]
+        while path[-1] in predecessors:
+            path.append(predecessors[path[-1]])
+        path.reverse()
+        return path
+
+
+# Model checking results (thorough-plus mode)
+@dataclass
+class TraceStep:
+    """One concrete state on an execution trace."""
+
+    state: str
+    values: dict[str, Any]
+    transition: str | None = None  # "source->target" transition that led here
+
+    def format(self) -> str:
+        """Format as state{var=value, ...}."""
+        values = ", ".join(f"{name}={value!r}" for name, value in self.values.items())
+        return f"{self.state}{{{values}}}"
+
+
+@dataclass
+class Counterexample:
+    """A reachable concrete state violating a property, with the trace reaching it."""
+
+    kind: str  # "invariant", "deadlock" or "error"
+    message: str
+    trace: list[TraceStep]
+    name: str | None = None  # violated invariant
+
+    def format(self) -> str:
+        """Format the trace as a chain of concrete states."""
+        return " -> ".join(step.format() for step in self.trace)
+
+
+@dataclass
+class ModelCheckResult:
+    """Results from explicit-state exploration of concrete policy executions."""
+
+    states_explored: int
+    transitions_explored: int
+    max_depth: int
+    complete: bool  # False if a depth or state budget stopped exploration
+    counterexamples: list[Counterexample]
+    visited_bytes: int = 0  # memory used by the visited set and trace pointers
+    omission_probability: float = 0.0  # chance a reachable state was taken as visited
+    spilled_bytes: int = 0  # frontier bytes written to disk
+
+
+@dataclass
+class BoundedCheckResult:
+    """Whether a goal's conditions can hold within its step bound, with the shortest witness."""
+
+    goal: str
+    bound: int
+    feasible: bool | None  # None if a budget or evaluation error stopped the search
+    witness: list[TraceStep] | None  # shortest execution satisfying the goal
+    states_explored: int
+    message: str | None = None  # why the search was inconclusive
+
+    @property
+    def steps(self) -> int | None:
+        """Number of transitions in the witness."""
+        return None if self.witness is None else len(self.witness) - 1
+
+
+# Planning results
+@dataclass
+class Plan:
+    """A sequence of transitions from a concrete state to a satisfied goal."""
+
+    goal: str
+    cost: float
+    steps: list[TraceStep]  # starting state first
+    optimal: bool = False  # True once the search proved no cheaper plan exists
+    expanded: int = 0  # states expanded by the search so far
+
+    @property
+    def transitions(self) -> list[str]:
+        """Labels ("source->target") of the transitions taken."""
+        return [step.transition for step in self.steps[1:] if step.transition is not None]
 
 
 # T014: Invariant Pydantic model
@@ -1,13 +1,38 @@
 """Policy models."""
 
+import hashlib
+import json
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator, model_validator
 
-from noetic_policies.models import GoalState, Invariant, TemporalBounds
+from noetic_policies.models import GoalState, Invariant, TemporalBounds, is_trusted
 from noetic_policies.models.constraint import Constraint
 from noetic_policies.models.state_graph import StateGraph
 
+# Descriptions are documentation only and never part of a fingerprint
+_DESCRIPTIONS: dict[str, Any] = {
+    "description": True,
+    "constraints": {"__all__": {"description"}},
+    "invariants": {"__all__": {"description"}},
+    "temporal_bounds": {"description"},
+    "state_graph": {
+        "states": {"__all__": {"description": True, "transitions": {"__all__": {"description"}}}}
+    },
+    "goal_states": {
+        "__all__": {
+            "description": True,
+            "temporal_bounds": {"description"},
+            "progress_conditions": {"__all__": {"description"}},
+        }
+    },
+}
+
+
+def _canonical(value: Any) -> str:
+    """Serialize JSON-compatible data deterministically."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
 
 # T018: Policy Pydantic model
 class Policy(BaseModel):
@@ -25,11 +50,42 @@ class Policy(BaseModel):
     goal_states: list[GoalState] = Field(default_factory=list)
     temporal_bounds: TemporalBounds | None = None
 
+    def fingerprint(self) -> str:
+        """
+        Return a digest identifying the policy's semantics.
+
+        Descriptions are ignored, and so is the order of entries that are
+        sets or conjunctions: state_schema and metadata keys, constraints,
+        invariants, states, state and transition preconditions, goal
+        states, goal conditions and progress conditions. The order of
+        transitions (a repeated target keeps the last cost) and effects
+        (applied in sequence) is significant. Equal policies parsed from
+        differently formatted files share a fingerprint.
+
+        Returns:
+            Hex digest of the normalized policy content
+        """
+        data = self.model_dump(mode="json", exclude=_DESCRIPTIONS)
+        for key in ("constraints", "invariants"):
+            data[key].sort(key=_canonical)
+        for state in data["state_graph"]["states"]:
+            state["preconditions"].sort()
+            for transition in state["transitions"]:
+                transition["preconditions"].sort()
+        data["state_graph"]["states"].sort(key=lambda state: state["name"])
+        for goal in data["goal_states"]:
+            goal["conditions"].sort()
+            goal["progress_conditions"].sort(key=_canonical)
+        data["goal_states"].sort(key=_canonical)
+
+        digest = hashlib.blake2b(_canonical(data).encode(), digest_size=16)
+        return digest.hexdigest()
+
     @field_validator("goal_states")
     @classmethod
     def validate_goal_states_exist(cls, v: list[GoalState], info: any) -> list[GoalState]:
         """Ensure goal states exist in state graph."""
-        if v and info.data.get("state_graph"):
+        if v and info.data.get("state_graph") and not is_trusted(info):
             state_names = {s.name for s in info.data["state_graph"].states}
             goal_names = {g.name for g in v}
             invalid_goals = goal_names - state_names
@@ -38,9 +94,9 @@ class Policy(BaseModel):
         return v
 
     @model_validator(mode="after")
-    def validate_temporal_bounds_hierarchy(self) -> "Policy":
+    def validate_temporal_bounds_hierarchy(self, info: ValidationInfo) -> "Policy":
         """Goal-level temporal bounds must not exceed policy-level temporal bounds (FR-008h)."""
-        if self.temporal_bounds is None:
+        if self.temporal_bounds is None or is_trusted(info):
             return self
 
         for goal in self.goal_states:
@@ -74,8 +130,10 @@ class Policy(BaseModel):
 
     @field_validator("state_schema")
     @classmethod
-    def validate_state_schema_types(cls, v: dict[str, str]) -> dict[str, str]:
+    def validate_state_schema_types(cls, v: dict[str, str], info: ValidationInfo) -> dict[str, str]:
         """Validate that state schema types are valid."""
+        if is_trusted(info):
+            return v
         valid_types = {"number", "string", "boolean", "address"}
         for field_name, field_type in v.items():
             # Handle enum types: enum[value1,value2,...]
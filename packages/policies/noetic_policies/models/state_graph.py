@@ -1,8 +1,10 @@
 """State graph models."""
 
-from pydantic import BaseModel, Field, field_validator
+from collections import Counter
 
-from noetic_policies.models import Transition
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
+
+from noetic_policies.models import Transition, is_trusted
 
 
 # T016: State Pydantic model
@@ -24,11 +26,13 @@ class StateGraph(BaseModel):
 
     @field_validator("states")
     @classmethod
-    def validate_unique_state_names(cls, v: list[State]) -> list[State]:
+    def validate_unique_state_names(cls, v: list[State], info: ValidationInfo) -> list[State]:
         """Ensure state names are unique."""
+        if is_trusted(info):
+            return v
         names = [s.name for s in v]
         if len(names) != len(set(names)):
-            duplicates = {name for name in names if names.count(name) > 1}
+            duplicates = {name for name, count in Counter(names).items() if count > 1}
             raise ValueError(f"Duplicate state names: {duplicates}")
         return v
 
@@ -36,7 +40,7 @@ class StateGraph(BaseModel):
     @classmethod
     def validate_initial_exists(cls, v: str, info: any) -> str:
         """Ensure initial state exists in states list."""
-        if info.data.get("states"):
+        if info.data.get("states") and not is_trusted(info):
             state_names = {s.name for s in info.data["states"]}
             if v not in state_names:
                 raise ValueError(f"Initial state '{v}' not found in states")
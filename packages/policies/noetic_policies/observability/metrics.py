@@ -1,13 +1,15 @@
 """OpenTelemetry metrics configuration."""
 
 from opentelemetry import metrics
-from opentelemetry.sdk.metrics import MeterProvider
 
 
 # T021: Metrics module
 def get_meter(name: str = "noetic_policies") -> metrics.Meter:
     """
-    Get or create a meter for the noetic-policies package.
+    Get a meter for the noetic-policies package.
+
+    Like get_tracer(), this uses the meter provider the application
+    configures and records nothing without one.
 
     Args:
         name: Meter name (default: "noetic_policies")
@@ -15,14 +17,6 @@ def get_meter(name: str = "noetic_policies") -> metrics.Meter:
     Returns:
         OpenTelemetry meter instance
     """
-    # Get the global meter provider, or create a default one
-    provider = metrics.get_meter_provider()
-
-    # If no provider is set, create a basic one
-    if not isinstance(provider, MeterProvider):
-        provider = MeterProvider()
-        metrics.set_meter_provider(provider)
-
     return metrics.get_meter(name)
 
 
@@ -1,13 +1,17 @@
 """OpenTelemetry tracer configuration."""
 
 from opentelemetry import trace
-from opentelemetry.sdk.trace import TracerProvider
 
 
 # T019: Tracer module
 def get_tracer(name: str = "noetic_policies") -> trace.Tracer:
     """
-    Get or create a tracer for the noetic-policies package.
+    Get a tracer for the noetic-policies package.
+
+    Spans go to the tracer provider the application configures, even one
+    configured after this call; without one they are no-ops. The package
+    never installs a provider itself (the global provider can be set only
+    once), so the OpenTelemetry SDK is only loaded by applications using it.
 
     Args:
         name: Tracer name (default: "noetic_policies")
@@ -15,12 +19,4 @@ def get_tracer(name: str = "noetic_policies") -> trace.Tracer:
     Returns:
         OpenTelemetry tracer instance
     """
-    # Get the global tracer provider, or create a default one
-    provider = trace.get_tracer_provider()
-
-    # If no provider is set, create a basic one
-    if not isinstance(provider, TracerProvider):
-        provider = TracerProvider()
-        trace.set_tracer_provider(provider)
-
     return trace.get_tracer(name)
@@ -1,15 +1,21 @@
 """Policy parser for YAML files (T109-T113)."""
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 import yaml
 from pydantic import ValidationError as PydanticValidationError
 
+from noetic_policies.models import TRUSTED
 from noetic_policies.models.policy import Policy
 
 __all__ = ["PolicyParser", "PolicyParseError"]
 
+# libyaml-backed loader when PyYAML was built with it (5-10x faster); both
+# construct the same safe types and raise the same yaml.YAMLError subclasses
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class PolicyParseError(Exception):
     """Raised when policy parsing fails."""
@@ -28,12 +34,14 @@ class PolicyParser:
         """Initialize policy parser."""
         pass
 
-    def parse_yaml(self, content: str) -> Policy:
+    def parse_yaml(self, content: str, trusted: bool = False) -> Policy:
         """
         Parse YAML string into Policy object.
 
         Args:
             content: YAML policy specification
+            trusted: Skip consistency checks for pre-validated data; field
+                types are still checked (see parse_dict)
 
         Returns:
             Parsed and validated Policy object
@@ -43,23 +51,25 @@ class PolicyParser:
         """
         try:
             # Parse YAML
-            data = yaml.safe_load(content)
+            data = yaml.load(content, Loader=_Loader)
 
             if not isinstance(data, dict):
                 raise PolicyParseError("Policy must be a YAML dictionary")
 
             # Parse into Policy model
-            return self.parse_dict(data)
+            return self.parse_dict(data, trusted=trusted)
 
         except yaml.YAMLError as e:
             raise PolicyParseError(f"YAML syntax error: {e}") from e
 
-    def parse_file(self, file_path: Path | str) -> Policy:
+    def parse_file(self, file_path: Path | str, trusted: bool = False) -> Policy:
         """
         Parse policy file from filesystem.
 
         Args:
             file_path: Path to YAML policy file
+            trusted: Skip consistency checks for pre-validated data; field
+                types are still checked (see parse_dict)
 
         Returns:
             Parsed and validated Policy object
@@ -75,18 +85,75 @@ class PolicyParser:
 
         try:
             content = file_path.read_text()
-            return self.parse_yaml(content)
+            return self.parse_yaml(content, trusted=trusted)
         except Exception as e:
             if isinstance(e, (PolicyParseError, FileNotFoundError)):
                 raise
             raise PolicyParseError(f"Failed to parse {file_path}: {e}") from e
 
-    def parse_dict(self, data: dict[str, Any]) -> Policy:
+    def parse_stream(self, path: Path | str, trusted: bool = False) -> Iterator[Policy]:
+        """
+        Parse policies one at a time from a multi-document file or a directory.
+
+        Documents are read incrementally and each Policy is yielded before
+        the next document is loaded, so a bundle never has to fit in memory.
+        A directory yields the policies of its *.yaml and *.yml files
+        (recursively, in path order). Empty documents are skipped.
+
+        Args:
+            path: YAML file with documents separated by ---, or a directory
+            trusted: Skip consistency checks for pre-validated data; field
+                types are still checked (see parse_dict)
+
+        Yields:
+            Parsed and validated Policy objects
+
+        Raises:
+            FileNotFoundError: If path doesn't exist
+            PolicyParseError: If a document is malformed or fails validation
+                (the message names the file and document number)
+        """
+        path = Path(path)
+
+        if not path.exists():
+            raise FileNotFoundError(f"Policy file not found: {path}")
+
+        if path.is_dir():
+            files = sorted(p for p in path.rglob("*") if p.suffix in {".yaml", ".yml"})
+        else:
+            files = [path]
+
+        for file_path in files:
+            with file_path.open() as file:
+                try:
+                    documents = yaml.load_all(file, Loader=_Loader)
+                    for number, data in enumerate(documents, start=1):
+                        if data is None:
+                            continue
+                        if not isinstance(data, dict):
+                            raise PolicyParseError(
+                                f"{file_path} (document {number}): Policy must be a YAML dictionary"
+                            )
+                        try:
+                            policy = self.parse_dict(data, trusted=trusted)
+                        except PolicyParseError as e:
+                            raise PolicyParseError(f"{file_path} (document {number}): {e}") from e
+                        yield policy
+                except yaml.YAMLError as e:
+                    raise PolicyParseError(f"YAML syntax error in {file_path}: {e}") from e
+
+    def parse_dict(self, data: dict[str, Any], trusted: bool = False) -> Policy:
         """
         Parse policy from dictionary (already loaded YAML/JSON).
 
+        Trusted data skips the model-level consistency checks (unique state
+        names, initial and goal states exist, schema types, temporal bound
+        hierarchy); field types are still checked. Use it only for policies
+        this package wrote after validating them, such as model_dump() output.
+
         Args:
             data: Policy data as dictionary
+            trusted: Skip consistency checks for pre-validated data
 
         Returns:
             Parsed and validated Policy object
@@ -95,6 +162,8 @@ class PolicyParser:
             PolicyParseError: If validation fails
         """
         try:
+            if trusted:
+                return Policy.model_validate(data, context=TRUSTED)
             return Policy(**data)
         except PydanticValidationError as e:
             # Convert Pydantic errors to friendly messages
@@ -0,0 +1,291 @@
+"""Cost-optimal goal planning over concrete policy states (SC-011)."""
+
+import heapq
+import math
+import time
+from collections.abc import Generator, Iterator, Mapping
+from itertools import groupby
+from typing import Any
+
+from noetic_policies.cel_evaluator import CELEvaluationError, CompiledExpression
+from noetic_policies.models import GoalState, Plan, TraceStep
+from noetic_policies.models.policy import Policy
+from noetic_policies.planner.heuristic import GoalHeuristic
+from noetic_policies.validator.model_checker import ConcreteState, ModelChecker
+
+__all__ = ["GoalHeuristic", "Planner", "PlanningError"]
+
+
+class PlanningError(Exception):
+    """Raised when a planning request or a transition cost is invalid."""
+
+    pass
+
+
+class Planner:
+    """
+    Searches from a concrete state for the cheapest plan to the best goal.
+
+    Goals are ranked by priority, then reward (both higher first); the
+    planner pursues the best-ranked goals that are reachable, and among
+    goals of equal rank the cheapest plan wins. Transition costs are
+    cost_expr, evaluated on the state the transition leaves, or the static
+    cost. Successors follow the model checker's semantics: preconditions
+    gate transitions, effects apply in order, and states violating an
+    invariant are never entered.
+
+    The search is anytime weighted A*: states are expanded in order of
+    g + weight * guiding estimate (see GoalHeuristic), every plan cheaper
+    than the previous one is reported, and states whose admissible bound
+    cannot beat the best plan are pruned. When the open list empties the
+    last plan is proven optimal. With weight 1 and progress_scale 0 this is
+    plain A*, whose first plan is optimal.
+    """
+
+    def __init__(
+        self,
+        policy: Policy,
+        weight: float = 1.0,
+        progress_scale: float | None = None,
+        max_expansions: int = 1_000_000,
+    ):
+        """
+        Initialize planner and compile the policy.
+
+        Args:
+            policy: Policy to plan in
+            weight: Weight of the guiding estimate (>= 1; larger finds plans faster)
+            progress_scale: Cost of zero progress in the guiding estimate
+                (default: the admissible estimate of the start state; 0 ignores progress)
+            max_expansions: Budget of expanded states per search
+
+        Raises:
+            PlanningError: If weight is below 1
+            CELSyntaxError: If an expression cannot be compiled
+            ValueError: If an effect assigns an undefined variable
+        """
+        if weight < 1.0:
+            raise PlanningError(f"Heuristic weight must be at least 1, got {weight}")
+        self.policy = policy
+        self.weight = weight
+        self.progress_scale = progress_scale
+        self.max_expansions = max_expansions
+        self.checker = ModelChecker(policy)
+
+        # Static cost, or the compiled cost_expr, per transition id
+        self._costs: list[float | CompiledExpression] = []
+        for state in policy.state_graph.states:
+            for transition in state.transitions:
+                if transition.cost_expr is not None:
+                    self._costs.append(self.checker.compile_predicate(transition.cost_expr))
+                else:
+                    self._costs.append(transition.cost)
+
+    def goal_tiers(self) -> list[list[GoalState]]:
+        """Return goals grouped by equal (priority, reward), best first."""
+        rank = lambda goal: (goal.priority, goal.reward)  # noqa: E731
+        ordered = sorted(self.policy.goal_states, key=rank, reverse=True)
+        return [list(tier) for _, tier in groupby(ordered, key=rank)]
+
+    def plan(
+        self,
+        values: Mapping[str, Any] | None = None,
+        state: str | None = None,
+        time_limit: float | None = None,
+    ) -> Plan | None:
+        """
+        Find the best plan from a concrete state.
+
+        Args:
+            values: State variable values (missing ones as in initial_valuation)
+            state: Graph state name (default: the state graph's initial state)
+            time_limit: Seconds to search; the best plan found so far is returned
+
+        Returns:
+            Best plan found (optimal=True if proven), or None if no goal is reachable
+            within the limits
+
+        Raises:
+            PlanningError: If the start is invalid or a cost_expr yields no valid cost
+        """
+        search = self._search(values, state, time_limit)
+        best = None
+        while True:
+            try:
+                best = next(search)
+            except StopIteration as stop:
+                if best is not None:
+                    best.optimal = stop.value
+                return best
+
+    def iter_plans(
+        self,
+        values: Mapping[str, Any] | None = None,
+        state: str | None = None,
+        time_limit: float | None = None,
+    ) -> Iterator[Plan]:
+        """
+        Yield progressively cheaper plans from a concrete state (anytime mode).
+
+        Arguments are as for plan(). Iteration stops when the last plan is
+        proven optimal, the time limit passes, or the expansion budget is spent.
+        """
+        yield from self._search(values, state, time_limit)
+
+    def _start(self, values: Mapping[str, Any] | None, state: str | None) -> ConcreteState:
+        """Build the concrete start state."""
+        # Import here to avoid circular dependency
+        from noetic_policies.validator.model_checker import initial_valuation
+
+        checker = self.checker
+        name = state if state is not None else self.policy.state_graph.initial
+        if name not in checker.state_names:
+            raise PlanningError(f"Unknown state '{name}'")
+        try:
+            valuation = initial_valuation(self.policy, {**checker.initial_values, **(values or {})})
+        except ValueError as e:
+            raise PlanningError(str(e)) from e
+        start = (checker.state_names.index(name), tuple(valuation[v] for v in checker.variables))
+        if checker.violated_invariant(start[1]) is not None:
+            raise PlanningError("Start state violates an invariant")
+        return start
+
+    def _cost(self, transition_id: int, context: dict[str, Any]) -> float:
+        """Cost of taking a transition from a state."""
+        cost = self._costs[transition_id]
+        if not isinstance(cost, CompiledExpression):
+            return cost
+        label = self.checker.transitions[transition_id].label
+        try:
+            value = cost.evaluate(context)
+        except CELEvaluationError as e:
+            raise PlanningError(f"cost_expr of '{label}' failed: {e}") from e
+        if isinstance(value, bool) or not isinstance(value, int | float) or value < 0:
+            raise PlanningError(
+                f"cost_expr of '{label}' must be a non-negative number, got {value!r}"
+            )
+        return float(value)
+
+    def _search(
+        self, values: Mapping[str, Any] | None, state: str | None, time_limit: float | None
+    ) -> Generator[Plan, None, bool]:
+        """Search goal tiers in rank order; return whether the last plan is optimal."""
+        checker = self.checker
+        start = self._start(values, state)
+        deadline = None if time_limit is None else time.monotonic() + time_limit
+        lower_bounds = [0.0 if isinstance(c, CompiledExpression) else c for c in self._costs]
+        expanded = 0
+
+        for tier in self.goal_tiers():
+            goal_states = {checker.state_names.index(goal.name): goal for goal in tier}
+            heuristic = GoalHeuristic(checker, tier, lower_bounds)
+            admissible, _ = heuristic.estimates(start)
+            if admissible == math.inf:
+                continue
+            if self.progress_scale is None:
+                heuristic.progress_scale = admissible
+            else:
+                heuristic.progress_scale = self.progress_scale
+
+            def satisfied(s: ConcreteState, goals: dict[int, GoalState] = goal_states) -> bool:
+                return s[0] in goals and checker.goal_satisfied(s)
+
+            best: Plan | None = None
+            best_cost = math.inf
+            g: dict[ConcreteState, float] = {start: 0.0}
+            parent: dict[ConcreteState, tuple[ConcreteState, int]] = {}
+            # Admissible and guiding estimate per generated state
+            estimates: dict[ConcreteState, tuple[float, float]] = {}
+            reached: set[ConcreteState] = set()
+            try:
+                if satisfied(start):
+                    reached.add(start)
+            except CELEvaluationError:
+                pass
+            estimates[start] = (0.0, 0.0) if start in reached else heuristic.estimates(start)
+            guiding = estimates[start][1]
+            open_list = [(self.weight * guiding, 0.0, 0, start)]
+            pushed = 1
+            exhausted = True
+            while open_list:
+                _, cost, _, current = heapq.heappop(open_list)
+                if cost > g[current] or cost + estimates[current][0] >= best_cost:
+                    continue
+                if current in reached:
+                    best_cost = cost
+                    best = self._plan(goal_states[current[0]].name, current, cost, parent)
+                    best.expanded = expanded
+                    yield best
+                    continue
+
+                if expanded >= self.max_expansions or (
+                    deadline is not None and expanded % 64 == 0 and time.monotonic() > deadline
+                ):
+                    exhausted = False
+                    break
+                expanded += 1
+                try:
+                    successors = checker.successors(current)
+                except CELEvaluationError:
+                    continue
+                context = checker.context(current[1])
+                for transition_id, successor in successors:
+                    step_cost = cost + self._cost(transition_id, context)
+                    if step_cost >= g.get(successor, math.inf):
+                        continue
+                    if successor not in estimates:
+                        # States violating an invariant are never entered
+                        estimates[successor] = (math.inf, math.inf)
+                        try:
+                            if checker.violated_invariant(successor[1]) is not None:
+                                continue
+                            if satisfied(successor):
+                                reached.add(successor)
+                                estimates[successor] = (0.0, 0.0)
+                            else:
+                                estimates[successor] = heuristic.estimates(successor)
+                        except CELEvaluationError:
+                            continue
+                    admissible, guiding = estimates[successor]
+                    if step_cost + admissible >= best_cost:
+                        continue
+                    g[successor] = step_cost
+                    parent[successor] = (current, transition_id)
+                    heapq.heappush(
+                        open_list,
+                        (step_cost + self.weight * guiding, step_cost, pushed, successor),
+                    )
+                    pushed += 1
+
+            if best is not None:
+                return exhausted
+            if not exhausted:
+                return False
+        return False
+
+    def _plan(
+        self,
+        goal: str,
+        end: ConcreteState,
+        cost: float,
+        parent: dict[ConcreteState, tuple[ConcreteState, int]],
+    ) -> Plan:
+        """Rebuild the plan reaching end from the search's parent pointers."""
+        checker = self.checker
+        chain: list[tuple[ConcreteState, int | None]] = []
+        current = end
+        while current in parent:
+            previous, transition_id = parent[current]
+            chain.append((current, transition_id))
+            current = previous
+        chain.append((current, None))
+        chain.reverse()
+        steps = [
+            TraceStep(
+                checker.state_names[s[0]],
+                checker.context(s[1]),
+                None if transition_id is None else checker.transitions[transition_id].label,
+            )
+            for s, transition_id in chain
+        ]
+        return Plan(goal=goal, cost=cost, steps=steps)
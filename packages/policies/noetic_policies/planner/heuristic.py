@@ -0,0 +1,124 @@
+"""Heuristic estimates of the remaining cost to a set of goals."""
+
+import heapq
+import math
+from typing import Any
+
+from noetic_policies.cel_evaluator import CELEvaluationError, CompiledExpression
+from noetic_policies.models import GoalState
+from noetic_policies.validator.model_checker import ConcreteState, ModelChecker
+
+__all__ = ["GoalHeuristic"]
+
+
+class GoalHeuristic:
+    """
+    Estimates the cost from a concrete state to the nearest of a set of goals.
+
+    The admissible estimate is a graph bound: the cheapest path in the state
+    graph from the state's graph state to the goal, using each transition's
+    static cost (0 for transitions with a cost_expr) and ignoring
+    preconditions, and at least one cheapest transition since the goal is
+    not yet satisfied. It never overestimates.
+
+    The guiding estimate adds the goal's progress_conditions: each is
+    clamped to [0, 1] and averaged by weight into P, and the state is
+    estimated at no less than (1 - P) * progress_scale. This distinguishes
+    "almost there" from "far away" within the same graph state but may
+    overestimate, so it orders the search while the admissible estimate
+    decides what can be pruned.
+    """
+
+    def __init__(
+        self,
+        checker: ModelChecker,
+        goals: list[GoalState],
+        transition_costs: list[float],
+        progress_scale: float = 0.0,
+    ):
+        """
+        Initialize heuristic for a set of goals.
+
+        Args:
+            checker: Compiled model checker (graph states and transitions)
+            goals: Goals any of which ends the search
+            transition_costs: Lower bound of each transition's cost, by transition id
+            progress_scale: Cost attributed to no progress at all (0 ignores progress)
+        """
+        self.checker = checker
+        self.min_cost = min(transition_costs, default=0.0)
+        self.progress_scale = progress_scale
+
+        incoming: list[list[tuple[int, float]]] = [[] for _ in checker.state_names]
+        for transition in checker.transitions:
+            incoming[transition.target].append((transition.source, transition_costs[transition.id]))
+
+        self._goals: list[tuple[list[float], list[tuple[float, CompiledExpression]], float]] = []
+        for goal in goals:
+            progress = [
+                (condition.weight, checker.compile_predicate(condition.expr))
+                for condition in goal.progress_conditions
+            ]
+            total = sum(weight for weight, _ in progress)
+            bounds = self._reverse_costs(checker.state_names.index(goal.name), incoming)
+            self._goals.append((bounds, progress, total))
+
+    @staticmethod
+    def _reverse_costs(target: int, incoming: list[list[tuple[int, float]]]) -> list[float]:
+        """Cheapest cost from every graph state to target (Dijkstra on reversed edges)."""
+        costs = [math.inf] * len(incoming)
+        costs[target] = 0.0
+        heap = [(0.0, target)]
+        while heap:
+            d, v = heapq.heappop(heap)
+            if d > costs[v]:
+                continue
+            for u, c in incoming[v]:
+                if d + c < costs[u]:
+                    costs[u] = d + c
+                    heapq.heappush(heap, (d + c, u))
+        return costs
+
+    def progress(self, goal_index: int, context: dict[str, Any]) -> float:
+        """
+        Weighted progress toward a goal in [0, 1] (0 if the goal has no progress conditions).
+
+        Conditions that fail to evaluate count as no progress.
+        """
+        _, conditions, total = self._goals[goal_index]
+        if not conditions:
+            return 0.0
+        achieved = 0.0
+        for weight, condition in conditions:
+            try:
+                value = condition.evaluate(context)
+            except CELEvaluationError:
+                continue
+            if isinstance(value, bool) or not isinstance(value, int | float):
+                continue
+            achieved += weight * min(1.0, max(0.0, float(value)))
+        return achieved / total
+
+    def estimates(self, state: ConcreteState) -> tuple[float, float]:
+        """
+        Estimate the remaining cost from a state that satisfies none of the goals.
+
+        Args:
+            state: Concrete state
+
+        Returns:
+            (admissible, guiding) estimates; inf if no goal is reachable in the graph
+        """
+        context = self.checker.context(state[1])
+        admissible = guiding = math.inf
+        for index, (bounds, _, _) in enumerate(self._goals):
+            bound = bounds[state[0]]
+            if bound == math.inf:
+                continue
+            lower = max(bound, self.min_cost)
+            admissible = min(admissible, lower)
+            if self.progress_scale:
+                remaining = 1.0 - self.progress(index, context)
+                lower = max(lower, self.progress_scale * remaining)
+            guiding = min(guiding, lower)
+        return admissible, guiding
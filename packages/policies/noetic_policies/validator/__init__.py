@@ -1,17 +1,30 @@
 """Policy validator orchestration (T079-T084)."""
 
+import hashlib
+import os
 import time
-from typing import Any
-
-from opentelemetry import trace
-
-from noetic_policies.models import ValidationResult, ValidationError
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from noetic_policies.cel_evaluator import CELSyntaxError
+from noetic_policies.models import (
+    FileValidationResult,
+    GraphAnalysisResult,
+    ValidationError,
+    ValidationResult,
+)
 from noetic_policies.models.policy import Policy
 from noetic_policies.observability.logger import get_logger
-from noetic_policies.observability.tracer import get_tracer
+from noetic_policies.validator.bounded import BoundedGoalChecker, step_bound
 from noetic_policies.validator.graph_analyzer import GraphAnalyzer
+from noetic_policies.validator.model_checker import ModelChecker
+from noetic_policies.validator.result_cache import ValidationCache
 from noetic_policies.validator.schema_validator import SchemaValidator
 
+if TYPE_CHECKING:
+    from opentelemetry import trace
+
 __all__ = ["PolicyValidator"]
 
 
@@ -22,29 +35,72 @@ class PolicyValidator:
     Implements FR-016 (dual validation modes).
     """
 
-    def __init__(self, tracer: trace.Tracer | None = None):
+    def __init__(
+        self,
+        tracer: "trace.Tracer | None" = None,
+        graph_backend: str = "networkx",
+        max_states: int = 1_000_000,
+        max_depth: int | None = None,
+        workers: int = 1,
+        cache: ValidationCache | None = None,
+    ):
         """
         Initialize policy validator.
 
         Args:
             tracer: Optional OpenTelemetry tracer for observability
+            graph_backend: Graph analysis backend - "networkx" or "csr"
+            max_states: Concrete state budget for "thorough-plus" model checking
+            max_depth: Transition depth budget for "thorough-plus" model checking
+            workers: Number of processes for "thorough-plus" model checking
+            cache: Result cache; unchanged policies are then not validated again
         """
-        self.tracer = tracer or get_tracer()
+        if tracer is None:
+            # Import here so that importing the validator does not load OpenTelemetry
+            from noetic_policies.observability.tracer import get_tracer
+
+            tracer = get_tracer()
+        self.tracer = tracer
         self.logger = get_logger()
         self.schema_validator = SchemaValidator()
-        self.graph_analyzer = GraphAnalyzer()
+        self.graph_analyzer = GraphAnalyzer(backend=graph_backend)
+        self.max_states = max_states
+        self.max_depth = max_depth
+        self.workers = workers
+        self.cache = cache
 
     def validate(self, policy: Policy, mode: str = "fast") -> ValidationResult:
         """
         Validate a policy.
 
+        With a cache, the result is looked up by Policy.fingerprint() first
+        (metadata["cached"] is True on a hit) and stored after validation.
+
         Args:
             policy: Parsed policy object
-            mode: Validation mode - "fast" or "thorough"
+            mode: Validation mode - "fast", "thorough" or "thorough-plus"
 
         Returns:
             ValidationResult with errors, warnings, and metadata
         """
+        if self.cache is None:
+            return self._validate(policy, mode)
+
+        fingerprint = policy.fingerprint()
+        key = self.cache.key(fingerprint, self._settings(mode))
+        cached = self.cache.get(key)
+        if cached is not None:
+            cached.metadata["cached"] = True
+            return cached
+        result = self._validate(policy, mode)
+        result.metadata["fingerprint"] = fingerprint
+        self.cache.put(key, result)
+        return result
+
+    def _validate(self, policy: Policy, mode: str) -> ValidationResult:
+        """Run the validation checks for a mode."""
+        # The one-time NetworkX import is not part of any validation's duration_ms
+        self.graph_analyzer.load_backend()
         with self.tracer.start_as_current_span("policy.validate") as span:
             span.set_attribute("policy.name", policy.name or "unnamed")
             span.set_attribute("policy.version", policy.version)
@@ -57,6 +113,7 @@ class PolicyValidator:
             # Schema validation (both modes)
             with self.tracer.start_as_current_span("policy.validate.schema"):
                 errors.extend(self.schema_validator.validate(policy))
+            schema_valid = not errors
 
             # Graph analysis
             if mode == "fast":
@@ -65,17 +122,9 @@ class PolicyValidator:
                     unreachable = self.graph_analyzer.find_unreachable_states(
                         policy.state_graph, policy.state_graph.initial
                     )
-                    if unreachable:
-                        errors.append(
-                            ValidationError(
-                                code="E004",
-                                message=f"Unreachable states detected: {unreachable}",
-                                severity="error",
-                                fix_suggestion="Add transitions to make states reachable or remove them",
-                            )
-                        )
-
-            elif mode == "thorough":
+                    errors.extend(self._reachability_errors(unreachable))
+
+            elif mode in ("thorough", "thorough-plus"):
                 # Thorough mode: Complete analysis
                 with self.tracer.start_as_current_span("policy.validate.graph.thorough"):
                     result = self.graph_analyzer.analyze(
@@ -84,53 +133,16 @@ class PolicyValidator:
                         policy.goal_states,
                         policy.temporal_bounds,
                     )
+                    errors.extend(self._analysis_errors(policy, result))
 
-                    # Report unreachable states
-                    if result.unreachable_states:
-                        errors.append(
-                            ValidationError(
-                                code="E004",
-                                message=f"Unreachable states: {result.unreachable_states}",
-                                severity="error",
-                                fix_suggestion="Add transitions or remove unreachable states",
-                            )
-                        )
-
-                    # Report deadlocks
-                    if result.deadlock_sccs:
-                        for scc in result.deadlock_sccs:
-                            errors.append(
-                                ValidationError(
-                                    code="E005",
-                                    message=f"Deadlock detected in states: {scc}",
-                                    severity="error",
-                                    fix_suggestion="Add exit transition from the cycle",
-                                )
-                            )
-
-                    # Report unreachable goals
-                    if policy.goal_states and not result.goal_reachable:
-                        errors.append(
-                            ValidationError(
-                                code="E006",
-                                message="No goal states are reachable from initial state",
-                                severity="error",
-                                fix_suggestion="Add transitions to make goal states reachable",
-                            )
-                        )
-
-                    # Report temporally infeasible goals
-                    if result.temporally_infeasible_goals:
-                        for goal_name in result.temporally_infeasible_goals:
-                            min_steps = result.goal_min_steps.get(goal_name, 0)
-                            errors.append(
-                                ValidationError(
-                                    code="W002",
-                                    message=f"Goal '{goal_name}' is temporally infeasible: requires {min_steps} steps",
-                                    severity="warning",
-                                    fix_suggestion="Increase max_steps or reduce path length to goal",
-                                )
-                            )
+            # Thorough-plus mode: Explore concrete executions
+            if mode == "thorough-plus" and schema_valid:
+                with self.tracer.start_as_current_span("policy.validate.model_check") as check_span:
+                    model_errors, model_warnings = self._model_check(
+                        policy, check_span, set(result.temporally_infeasible_goals)
+                    )
+                    errors.extend(model_errors)
+                    warnings.extend(model_warnings)
 
             duration_ms = (time.perf_counter() - start_time) * 1000
             span.set_attribute("validation.duration_ms", duration_ms)
@@ -151,6 +163,74 @@ class PolicyValidator:
                 metadata=metadata,
             )
 
+    def _reachability_errors(self, unreachable: set[str]) -> list[ValidationError]:
+        """Convert the states found unreachable in fast mode into errors."""
+        if not unreachable:
+            return []
+        return [
+            ValidationError(
+                code="E004",
+                message=f"Unreachable states detected: {unreachable}",
+                severity="error",
+                fix_suggestion="Add transitions to make states reachable or remove them",
+            )
+        ]
+
+    def _analysis_errors(
+        self, policy: Policy, result: GraphAnalysisResult
+    ) -> list[ValidationError]:
+        """Convert the findings of a complete graph analysis into errors and warnings."""
+        errors: list[ValidationError] = []
+
+        # Report unreachable states
+        if result.unreachable_states:
+            errors.append(
+                ValidationError(
+                    code="E004",
+                    message=f"Unreachable states: {result.unreachable_states}",
+                    severity="error",
+                    fix_suggestion="Add transitions or remove unreachable states",
+                )
+            )
+
+        # Report deadlocks
+        if result.deadlock_sccs:
+            for scc in result.deadlock_sccs:
+                errors.append(
+                    ValidationError(
+                        code="E005",
+                        message=f"Deadlock detected in states: {scc}",
+                        severity="error",
+                        fix_suggestion="Add exit transition from the cycle",
+                    )
+                )
+
+        # Report unreachable goals
+        if policy.goal_states and not result.goal_reachable:
+            errors.append(
+                ValidationError(
+                    code="E006",
+                    message="No goal states are reachable from initial state",
+                    severity="error",
+                    fix_suggestion="Add transitions to make goal states reachable",
+                )
+            )
+
+        # Report temporally infeasible goals
+        if result.temporally_infeasible_goals:
+            for goal_name in result.temporally_infeasible_goals:
+                min_steps = (result.goal_min_steps or {}).get(goal_name, 0)
+                errors.append(
+                    ValidationError(
+                        code="W002",
+                        message=f"Goal '{goal_name}' is temporally infeasible: requires {min_steps} steps",
+                        severity="warning",
+                        fix_suggestion="Increase max_steps or reduce path length to goal",
+                    )
+                )
+
+        return errors
+
     def validate_yaml(self, content: str, mode: str = "fast") -> ValidationResult:
         """
         Parse and validate YAML in one step.
@@ -188,6 +268,10 @@ class PolicyValidator:
         """
         Parse and validate file in one step.
 
+        With a cache, a file whose text is unchanged is answered without
+        parsing it; a reformatted file with the same policy content still
+        hits by fingerprint.
+
         Args:
             file_path: Path to policy file
             mode: Validation mode
@@ -195,14 +279,24 @@ class PolicyValidator:
         Returns:
             ValidationResult
         """
-        from pathlib import Path
-
         from noetic_policies.parser import PolicyParser
 
         parser = PolicyParser()
         try:
-            policy = parser.parse_file(Path(file_path))
-            return self.validate(policy, mode)
+            if self.cache is None:
+                return self.validate(parser.parse_file(Path(file_path)), mode)
+
+            # Unchanged files hit the cache without being parsed
+            content = Path(file_path).read_text()
+            digest = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+            key = self.cache.key(f"source-{digest}", self._settings(mode))
+            cached = self.cache.get(key)
+            if cached is not None:
+                cached.metadata["cached"] = True
+                return cached
+            result = self.validate(parser.parse_yaml(content), mode)
+            self.cache.put(key, result)
+            return result
         except FileNotFoundError:
             return ValidationResult(
                 is_valid=False,
@@ -231,11 +325,141 @@ class PolicyValidator:
                 metadata={"mode": mode},
             )
 
+    def validate_many(
+        self,
+        paths: Iterable[str | os.PathLike[str]],
+        mode: str = "fast",
+        jobs: int | None = None,
+    ) -> Iterator[FileValidationResult]:
+        """
+        Validate many policy files, in a pool of worker processes.
+
+        Files are grouped into shards by size, largest first, so that a huge
+        policy starts early instead of serializing the end of the run.
+        Results are yielded as shards complete, not in input order. Workers
+        use this validator's settings; a cache is shared through its
+        directory (an in-memory-only cache is used only with jobs=1).
+        Stopping the iteration early cancels the shards not yet started.
+
+        Args:
+            paths: Policy files
+            mode: Validation mode
+            jobs: Number of worker processes (default: CPU count; 1 validates
+                in this process)
+
+        Returns:
+            Iterator of per-file results with their wall-clock times
+        """
+        # Import here to avoid circular dependency
+        from noetic_policies.validator.batch import validate_files
+
+        return validate_files(self, paths, mode, jobs if jobs is not None else os.cpu_count() or 1)
+
+    def _model_check(
+        self, policy: Policy, span: "trace.Span", infeasible_goals: set[str]
+    ) -> tuple[list[ValidationError], list[ValidationError]]:
+        """
+        Run explicit-state and bounded model checking and convert their findings.
+
+        Args:
+            policy: Policy that passed schema validation
+            span: Span to annotate with exploration statistics
+            infeasible_goals: Goals already reported as temporally infeasible
+
+        Returns:
+            (errors, warnings) from the model check
+        """
+        errors: list[ValidationError] = []
+        warnings: list[ValidationError] = []
+        try:
+            checker = ModelChecker(
+                policy, max_depth=self.max_depth, max_states=self.max_states, workers=self.workers
+            )
+        except (CELSyntaxError, ValueError) as e:
+            warnings.append(
+                ValidationError(
+                    code="W003",
+                    message=f"Model checking skipped: {e}",
+                    severity="warning",
+                    fix_suggestion="Fix the reported effect or initial value",
+                )
+            )
+            return errors, warnings
+
+        result = checker.check()
+        span.set_attribute("model_check.states", result.states_explored)
+        span.set_attribute("model_check.transitions", result.transitions_explored)
+        span.set_attribute("model_check.depth", result.max_depth)
+
+        codes = {"invariant": "E008", "deadlock": "E009", "error": "E014"}
+        suggestions = {
+            "invariant": "Strengthen transition preconditions or fix effects along the trace",
+            "deadlock": "Add a transition enabled in this valuation or make it a goal state",
+            "error": "Fix the expression so it evaluates for every reachable valuation",
+        }
+        for counterexample in result.counterexamples:
+            errors.append(
+                ValidationError(
+                    code=codes[counterexample.kind],
+                    message=f"{counterexample.message}: {counterexample.format()}",
+                    severity="error",
+                    fix_suggestion=suggestions[counterexample.kind],
+                )
+            )
+
+        if not result.complete and not result.counterexamples:
+            warnings.append(
+                ValidationError(
+                    code="W003",
+                    message=(
+                        f"Model checking stopped after {result.states_explored} states "
+                        f"at depth {result.max_depth}; results are incomplete"
+                    ),
+                    severity="warning",
+                    fix_suggestion="Increase max_states or max_depth",
+                )
+            )
+
+        # Goals with step bounds: can their conditions hold in time?
+        bounded = BoundedGoalChecker(checker)
+        for goal in policy.goal_states:
+            bound = step_bound(goal, policy.temporal_bounds)
+            if bound is None or goal.name in infeasible_goals:
+                continue
+            outcome = bounded.check(goal.name, bound)
+            span.set_attribute(f"model_check.goal.{goal.name}.states", outcome.states_explored)
+            if outcome.feasible is False:
+                warnings.append(
+                    ValidationError(
+                        code="W004",
+                        message=(
+                            f"Goal '{goal.name}' conditions cannot be satisfied "
+                            f"within {bound} steps"
+                        ),
+                        severity="warning",
+                        fix_suggestion="Increase max_steps or adjust effects to reach the goal",
+                    )
+                )
+            elif outcome.feasible is None:
+                warnings.append(
+                    ValidationError(
+                        code="W003",
+                        message=f"Bounded check of '{goal.name}' incomplete: {outcome.message}",
+                        severity="warning",
+                        fix_suggestion="Increase max_states",
+                    )
+                )
+        return errors, warnings
+
+    def _settings(self, mode: str) -> str:
+        """Describe the options that determine a result, for cache keys."""
+        return f"{mode}:{self.max_states}:{self.max_depth}"
+
     def _get_checks_performed(self, mode: str) -> list[str]:
         """Get list of checks performed in this mode."""
         checks = ["schema", "constraints", "basic_graph"]
 
-        if mode == "thorough":
+        if mode in ("thorough", "thorough-plus"):
             checks.extend(
                 [
                     "deadlock_detection",
@@ -244,5 +468,7 @@ class PolicyValidator:
                     "cost_analysis",
                 ]
             )
+        if mode == "thorough-plus":
+            checks.extend(["model_checking", "bounded_goal_checking"])
 
         return checks
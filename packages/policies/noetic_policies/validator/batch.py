@@ -0,0 +1,185 @@
+"""Validation of many policy files in a pool of worker processes."""
+
+import multiprocessing
+import os
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from noetic_policies.models import FileValidationResult, ValidationError, ValidationResult
+
+if TYPE_CHECKING:
+    from noetic_policies.validator import PolicyValidator
+
+__all__ = ["expand_paths", "shard_by_size", "validate_files"]
+
+# Shards per worker: enough for load balancing, few enough to amortize task overhead
+_SHARDS_PER_JOB = 4
+
+# The validator of a worker process, created by _init_worker()
+_validator: "PolicyValidator | None" = None
+
+
+def shard_by_size(paths: Iterable[str], jobs: int) -> list[list[str]]:
+    """
+    Group files into shards of similar total size, largest first.
+
+    Files at least as large as the target shard size get a shard of their
+    own; smaller files are grouped until a shard reaches the target. The
+    largest shards come first, so a huge policy starts immediately
+    instead of being picked up last and extending the run.
+
+    Args:
+        paths: Policy files (missing files count as empty)
+        jobs: Number of workers the shards are for
+
+    Returns:
+        Shards of paths, by decreasing total size
+    """
+    sizes: dict[str, int] = {}
+    for path in paths:
+        try:
+            sizes[path] = os.path.getsize(path)
+        except OSError:
+            sizes[path] = 0
+    ordered = sorted(sizes, key=lambda path: sizes[path], reverse=True)
+    target = max(sum(sizes.values()) // (max(jobs, 1) * _SHARDS_PER_JOB), 1)
+
+    shards: list[tuple[int, list[str]]] = []
+    current: list[str] = []
+    current_size = 0
+    for path in ordered:
+        current.append(path)
+        current_size += sizes[path]
+        if current_size >= target:
+            shards.append((current_size, current))
+            current, current_size = [], 0
+    if current:
+        shards.append((current_size, current))
+    shards.sort(key=lambda shard: shard[0], reverse=True)
+    return [shard for _, shard in shards]
+
+
+def _init_worker(options: dict[str, Any]) -> None:
+    """Create the worker's validator (once per process, not per file)."""
+    global _validator
+    # Import here to avoid circular dependency
+    from noetic_policies.validator import PolicyValidator
+    from noetic_policies.validator.result_cache import ValidationCache
+
+    directory = options["cache_directory"]
+    _validator = PolicyValidator(
+        graph_backend=options["graph_backend"],
+        max_states=options["max_states"],
+        max_depth=options["max_depth"],
+        cache=ValidationCache(directory=directory) if directory is not None else None,
+    )
+
+
+def _validate_one(validator: "PolicyValidator", path: str, mode: str) -> FileValidationResult:
+    start = time.perf_counter()
+    result = validator.validate_file(path, mode=mode)
+    return FileValidationResult(path, result, (time.perf_counter() - start) * 1000)
+
+
+def _validate_shard(paths: list[str], mode: str) -> list[FileValidationResult]:
+    assert _validator is not None
+    return [_validate_one(_validator, path, mode) for path in paths]
+
+
+def _failed(path: str, mode: str, error: BaseException) -> FileValidationResult:
+    """Result for a file whose worker died before reporting it."""
+    result = ValidationResult(
+        is_valid=False,
+        errors=[
+            ValidationError(
+                code="E100",
+                message=f"Validation worker failed: {error!r}",
+                severity="error",
+            )
+        ],
+        warnings=[],
+        metadata={"mode": mode},
+    )
+    return FileValidationResult(path, result, 0.0)
+
+
+def validate_files(
+    validator: "PolicyValidator", paths: Iterable[str | os.PathLike[str]], mode: str, jobs: int
+) -> Iterator[FileValidationResult]:
+    """
+    Validate files with a validator's settings, in parallel when jobs > 1.
+
+    See PolicyValidator.validate_many().
+    """
+    files = [str(path) for path in paths]
+    if jobs <= 1 or len(files) <= 1:
+        for path in files:
+            yield _validate_one(validator, path, mode)
+        return
+
+    # Workers validate files one at a time; model checking stays single-process
+    cache = validator.cache
+    options = {
+        "graph_backend": validator.graph_analyzer.backend,
+        "max_states": validator.max_states,
+        "max_depth": validator.max_depth,
+        "cache_directory": cache.directory if cache is not None else None,
+    }
+    shards = shard_by_size(files, jobs)
+    # Fork shares the imported package with the workers, as for model checking
+    with ProcessPoolExecutor(
+        max_workers=min(jobs, len(shards)),
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_worker,
+        initargs=(options,),
+    ) as pool:
+        pending: dict[Future, list[str]] = {
+            pool.submit(_validate_shard, shard, mode): shard for shard in shards
+        }
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    shard = pending.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        for path in shard:
+                            yield _failed(path, mode, error)
+                        continue
+                    yield from future.result()
+        finally:
+            # Stopped early by the caller: drop shards not yet started
+            pool.shutdown(cancel_futures=True)
+
+
+def expand_paths(patterns: Iterable[str]) -> list[str]:
+    """
+    Expand files, directories and glob patterns into policy files.
+
+    Directories contribute their *.yaml and *.yml files recursively; glob
+    patterns (with *, ? or [) are expanded relative to the working
+    directory. Other arguments are kept as given, so missing files are
+    reported by validation. Duplicates are removed, keeping first order.
+
+    Args:
+        patterns: Command-line arguments
+
+    Returns:
+        Policy file paths
+    """
+    files: dict[str, None] = {}
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            matches = sorted(p for p in path.rglob("*") if p.suffix in {".yaml", ".yml"})
+        elif any(char in pattern for char in "*?["):
+            root = Path(pattern).anchor or "."
+            relative = pattern[len(root) :] if Path(pattern).is_absolute() else pattern
+            matches = sorted(p for p in Path(root).glob(relative) if p.is_file())
+        else:
+            matches = [path]
+        files.update((str(match), None) for match in matches)
+    return list(files)
@@ -0,0 +1,162 @@
+"""Bounded model checking of goal conditions against temporal step bounds."""
+
+from collections import deque
+from typing import Any
+
+from noetic_policies.cel_evaluator import CELEvaluationError
+from noetic_policies.models import BoundedCheckResult, GoalState, TemporalBounds
+from noetic_policies.validator.model_checker import ConcreteState, ModelChecker
+
+__all__ = ["BoundedGoalChecker", "step_bound"]
+
+
+def step_bound(goal: GoalState, policy_bounds: TemporalBounds | None) -> int | None:
+    """
+    Return the number of steps a goal must be reached within.
+
+    Args:
+        goal: Goal state, possibly with its own temporal bounds
+        policy_bounds: Policy-level temporal bounds
+
+    Returns:
+        The smaller of the goal's and the policy's max_steps, or None if neither is set
+    """
+    bounds = [
+        b.max_steps
+        for b in (goal.temporal_bounds, policy_bounds)
+        if b is not None and b.max_steps is not None
+    ]
+    return min(bounds) if bounds else None
+
+
+class BoundedGoalChecker:
+    """
+    Decides whether a goal's conditions can hold within a number of transitions.
+
+    Concrete executions are unrolled by iterative deepening depth-first
+    search, so the first witness found is a shortest one. Within an
+    iteration a transposition table keeps, per concrete state, the largest
+    number of remaining steps it was expanded with; reaching it again with
+    no more steps left is pruned. A state is also pruned when the graph
+    distance (ignoring preconditions) from its graph state to the goal
+    exceeds the remaining steps. If an iteration ends without any branch
+    being cut off by the bound, deeper iterations cannot succeed either and
+    the goal is proven unsatisfiable within the bound.
+
+    As in ModelChecker, transitions are gated by preconditions and states
+    violating an invariant end their branch.
+    """
+
+    def __init__(self, checker: ModelChecker, max_states: int | None = None):
+        """
+        Initialize bounded checker.
+
+        Args:
+            checker: Compiled model checker providing the transition semantics
+            max_states: Budget of generated states over all iterations
+                (default: the checker's max_states)
+        """
+        self.checker = checker
+        self.max_states = max_states if max_states is not None else checker.max_states
+        self._predecessors: list[list[int]] = [[] for _ in checker.state_names]
+        for transition in checker.transitions:
+            self._predecessors[transition.target].append(transition.source)
+
+    def hop_distances(self, goal: str) -> list[int]:
+        """
+        Compute the minimum number of transitions from each graph state to a goal.
+
+        Args:
+            goal: Goal state name
+
+        Returns:
+            Distance per graph state id (-1 where the goal is unreachable)
+        """
+        target = self.checker.state_names.index(goal)
+        distances = [-1] * len(self.checker.state_names)
+        distances[target] = 0
+        queue = deque([target])
+        while queue:
+            v = queue.popleft()
+            for u in self._predecessors[v]:
+                if distances[u] < 0:
+                    distances[u] = distances[v] + 1
+                    queue.append(u)
+        return distances
+
+    def check(self, goal: str, bound: int) -> BoundedCheckResult:
+        """
+        Search for the shortest execution satisfying a goal within a bound.
+
+        Args:
+            goal: Goal state name (its conditions must hold at the end)
+            bound: Maximum number of transitions
+
+        Returns:
+            BoundedCheckResult with the shortest witness, a proof of
+            infeasibility (feasible=False), or feasible=None if the state
+            budget ran out or an expression could not be evaluated
+        """
+        checker = self.checker
+        distances = self.hop_distances(goal)
+        goal_state = checker.state_names.index(goal)
+        initial = checker.initial_state
+        explored = 1
+
+        def result(feasible: bool | None, path: list[int] | None = None, **kwargs: Any):
+            witness = checker.replay(path) if path is not None else None
+            return BoundedCheckResult(goal, bound, feasible, witness, explored, **kwargs)
+
+        def reaches_goal(state: ConcreteState) -> bool:
+            return state[0] == goal_state and checker.goal_satisfied(state)
+
+        try:
+            if checker.violated_invariant(initial[1]) is not None:
+                return result(False, message="Initial state violates an invariant")
+            if reaches_goal(initial):
+                return result(True, [])
+            if distances[initial[0]] < 0:
+                return result(False)
+
+            for limit in range(max(1, distances[initial[0]]), bound + 1):
+                best_remaining: dict[ConcreteState, int] = {initial: limit}
+                cut_off = False
+                path: list[int] = []
+                stack = [(limit, iter(checker.successors(initial)))]
+                while stack:
+                    remaining, successors = stack[-1]
+                    step = next(successors, None)
+                    if step is None:
+                        stack.pop()
+                        if path:
+                            path.pop()
+                        continue
+
+                    transition_id, successor = step
+                    explored += 1
+                    if explored > self.max_states:
+                        return result(None, message=f"State budget of {self.max_states} exhausted")
+                    if checker.violated_invariant(successor[1]) is not None:
+                        continue
+                    if reaches_goal(successor):
+                        return result(True, [*path, transition_id])
+
+                    left = remaining - 1
+                    distance = distances[successor[0]]
+                    if distance < 0:
+                        continue
+                    if distance > left or left == 0:
+                        cut_off = True
+                        continue
+                    if best_remaining.get(successor, -1) >= left:
+                        continue
+                    best_remaining[successor] = left
+                    path.append(transition_id)
+                    stack.append((left, iter(checker.successors(successor))))
+
+                if not cut_off:
+                    break
+        except CELEvaluationError as e:
+            return result(None, message=str(e))
+
+        return result(False)
@@ -0,0 +1,166 @@
+"""Compiled state graphs shared across graph analyses."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cached_property
+from typing import TYPE_CHECKING, NamedTuple
+
+from noetic_policies.models.state_graph import StateGraph
+from noetic_policies.validator.csr_graph import CSRGraph
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+__all__ = ["CompiledStateGraph", "GraphCache", "GraphCacheInfo", "graph_key"]
+
+
+def graph_key(state_graph: StateGraph) -> str:
+    """
+    Return a digest identifying a state graph's structure.
+
+    Two StateGraph objects with the same initial state, states and
+    transition targets/costs share a key, so re-parsed or copied policies
+    reuse one compiled graph. The digest is computed in one streaming pass
+    and is much cheaper than building the graph it stands for.
+
+    Args:
+        state_graph: State graph to key
+
+    Returns:
+        Hex digest of the graph content
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(state_graph.initial.encode())
+    for state in state_graph.states:
+        parts = [state.name]
+        for t in state.transitions:
+            parts.append(t.to)
+            parts.append(repr(t.cost))
+        digest.update(b"\x1e" + "\x1f".join(parts).encode())
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True, eq=False)
+class CompiledStateGraph:
+    """
+    A state graph converted once into the structures graph algorithms run on.
+
+    The CSR arrays are always built; the NetworkX graph is derived from them
+    on first use, with the same node and adjacency order.
+    """
+
+    key: str
+    initial: str
+    states: tuple[str, ...]
+    csr: CSRGraph
+
+    @classmethod
+    def from_state_graph(
+        cls, state_graph: StateGraph, key: str | None = None
+    ) -> "CompiledStateGraph":
+        """
+        Build the CSR arrays for a state graph.
+
+        Args:
+            state_graph: State graph to compile
+            key: Precomputed graph_key(state_graph)
+
+        Returns:
+            CompiledStateGraph for the state graph
+        """
+        csr = CSRGraph.from_state_graph(state_graph)
+        return cls(
+            key=key if key is not None else graph_key(state_graph),
+            initial=state_graph.initial,
+            states=tuple(csr.names[: csr.num_states]),
+            csr=csr,
+        )
+
+    @cached_property
+    def reversed_csr(self) -> CSRGraph:
+        """CSR arrays of the transpose graph, for searches toward a target."""
+        return self.csr.reversed()
+
+    @cached_property
+    def graph(self) -> "nx.DiGraph":
+        """NetworkX directed graph with transition costs as "weight" edge attributes."""
+        # Import here: NetworkX is only loaded by analyses that use its graphs
+        import networkx as nx
+
+        graph = nx.DiGraph()
+        graph.add_nodes_from(self.csr.names)
+        graph.add_weighted_edges_from(self.csr.edges())
+        return graph
+
+
+class GraphCacheInfo(NamedTuple):
+    """Graph cache statistics."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class GraphCache:
+    """
+    Thread-safe LRU cache of compiled state graphs keyed by graph content.
+
+    Compiled graphs are read-only; callers must not mutate their graphs.
+    """
+
+    def __init__(self, maxsize: int = 32):
+        """
+        Initialize graph cache.
+
+        Args:
+            maxsize: Maximum number of compiled graphs retained
+        """
+        if maxsize < 1:
+            raise ValueError(f"Graph cache size must be positive: {maxsize}")
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, CompiledStateGraph] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def compile(self, state_graph: StateGraph) -> CompiledStateGraph:
+        """
+        Return the compiled form of a state graph, building it on a miss.
+
+        Args:
+            state_graph: State graph to compile
+
+        Returns:
+            Cached or newly compiled graph
+        """
+        key = graph_key(state_graph)
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return compiled
+            self._misses += 1
+
+        compiled = CompiledStateGraph.from_state_graph(state_graph, key)
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return compiled
+
+    def clear(self) -> None:
+        """Remove all entries and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> GraphCacheInfo:
+        """Return cache statistics."""
+        with self._lock:
+            return GraphCacheInfo(self._hits, self._misses, self.maxsize, len(self._entries))
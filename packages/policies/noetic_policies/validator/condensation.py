@@ -0,0 +1,139 @@
+"""Condensation DAG of a state graph (one node per strongly connected component)."""
+
+from typing import Any
+
+import numpy as np
+
+__all__ = ["Condensation"]
+
+
+class Condensation:
+    """
+    The DAG obtained by contracting each strongly connected component to one node.
+
+    Component ids follow the order in which Tarjan's algorithm completes
+    components (the order of networkx.strongly_connected_components), so
+    every DAG edge goes from a higher id to a lower one: descending ids are
+    a topological order. Edges between components are stored as CSR arrays,
+    deduplicated and sorted by target within each row.
+    """
+
+    def __init__(
+        self,
+        names: list[str],
+        component: np.ndarray,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        index: dict[str, int] | None = None,
+    ):
+        """
+        Initialize condensation from its arrays.
+
+        Args:
+            names: Node (state) names by node id
+            component: int32 component id per node id
+            indptr: int32 row offsets into indices, one row per component
+            indices: int32 successor component ids
+            index: Name -> node id mapping (inverse of names)
+        """
+        self.names = names
+        self.index = index if index is not None else {name: i for i, name in enumerate(names)}
+        self.component = component
+        self.indptr = indptr
+        self.indices = indices
+        self.sizes = np.bincount(component, minlength=len(indptr) - 1).astype(np.int32)
+
+    @classmethod
+    def from_labels(
+        cls,
+        names: list[str],
+        component: np.ndarray,
+        num_components: int,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        index: dict[str, int] | None = None,
+    ) -> "Condensation":
+        """
+        Build the condensation from component labels and the graph's edges.
+
+        One vectorized pass over the edges keeps those crossing components.
+
+        Args:
+            names: Node names by node id
+            component: int32 component id per node id
+            num_components: Number of components
+            sources: Source node id per edge
+            targets: Target node id per edge
+            index: Name -> node id mapping (inverse of names)
+
+        Returns:
+            Condensation DAG
+        """
+        src = component[sources].astype(np.int64)
+        dst = component[targets].astype(np.int64)
+        crossing = src != dst
+        keys = np.unique(src[crossing] * num_components + dst[crossing])
+        dag_src = keys // num_components
+        counts = np.bincount(dag_src, minlength=num_components)
+        indptr = np.zeros(num_components + 1, dtype=np.int32)
+        np.cumsum(counts, out=indptr[1:])
+        return cls(names, component, indptr, (keys % num_components).astype(np.int32), index)
+
+    @property
+    def num_components(self) -> int:
+        """Number of strongly connected components."""
+        return len(self.indptr) - 1
+
+    def component_of(self, name: str) -> int:
+        """Return the component id of a state."""
+        return int(self.component[self.index[name]])
+
+    def successors(self, component: int) -> np.ndarray:
+        """Return the ids of components directly reachable from a component."""
+        return self.indices[self.indptr[component] : self.indptr[component + 1]]
+
+    def sinks(self) -> np.ndarray:
+        """Return the ids of components without transitions to another component."""
+        return np.flatnonzero(np.diff(self.indptr) == 0)
+
+    def topological_order(self) -> np.ndarray:
+        """Return component ids so that every DAG edge points forward."""
+        return np.arange(self.num_components - 1, -1, -1)
+
+    def members(self, components: np.ndarray) -> list[set[str]]:
+        """
+        Return the states of the given components.
+
+        Args:
+            components: Component ids
+
+        Returns:
+            One set of state names per requested component, in the same order
+        """
+        position = np.full(self.num_components, -1, dtype=np.int64)
+        position[components] = np.arange(len(components))
+        groups: list[set[str]] = [set() for _ in range(len(components))]
+        selected = position[self.component]
+        nodes = np.flatnonzero(selected >= 0)
+        names = self.names
+        for node, group in zip(nodes.tolist(), selected[nodes].tolist(), strict=True):
+            groups[group].add(names[node])
+        return groups
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Condensation):
+            return NotImplemented
+        return (
+            self.names == other.names
+            and np.array_equal(self.component, other.component)
+            and np.array_equal(self.indptr, other.indptr)
+            and np.array_equal(self.indices, other.indices)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"Condensation(components={self.num_components}, "
+            f"edges={len(self.indices)}, sinks={len(self.sinks())})"
+        )
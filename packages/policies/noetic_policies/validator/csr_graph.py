@@ -0,0 +1,318 @@
+"""Array-backed (CSR) state graph and graph algorithms over it."""
+
+import heapq
+from collections.abc import Collection, Iterator
+
+import numpy as np
+
+from noetic_policies.models.state_graph import StateGraph
+from noetic_policies.validator.condensation import Condensation
+
+__all__ = ["CSRGraph"]
+
+
+class CSRGraph:
+    """
+    State graph stored as compressed sparse rows.
+
+    State names are interned to int32 ids in declaration order; transition
+    targets that are not declared states are appended after them, exactly as
+    NetworkX adds them as nodes. The transitions of state ``v`` are
+    ``indices[indptr[v]:indptr[v + 1]]`` with costs in the same slice of
+    ``cost``. Repeated transitions between the same pair of states keep the
+    position of the first and the cost of the last, matching nx.DiGraph.
+
+    Storage is 12 bytes per transition plus 4 bytes per state.
+    """
+
+    def __init__(
+        self,
+        names: list[str],
+        num_states: int,
+        indptr: np.ndarray,
+        indices: np.ndarray,
+        cost: np.ndarray,
+        index: dict[str, int] | None = None,
+    ):
+        """
+        Initialize CSR graph from its arrays.
+
+        Args:
+            names: Node names by id
+            num_states: Number of declared states (ids below this are states)
+            indptr: int32 row offsets, length len(names) + 1
+            indices: int32 target ids, one per transition
+            cost: float64 transition costs, aligned with indices
+            index: Prebuilt name -> id mapping (inverse of names)
+        """
+        self.names = names
+        self.num_states = num_states
+        self.index = index if index is not None else {name: i for i, name in enumerate(names)}
+        self.indptr = indptr
+        self.indices = indices
+        self.cost = cost
+
+    @classmethod
+    def from_state_graph(cls, state_graph: StateGraph) -> "CSRGraph":
+        """
+        Intern state names and pack transitions into CSR arrays.
+
+        Args:
+            state_graph: State graph to convert
+
+        Returns:
+            CSRGraph with one row per node
+        """
+        names = [state.name for state in state_graph.states]
+        index = {name: i for i, name in enumerate(names)}
+        indptr = [0]
+        indices: list[int] = []
+        cost: list[float] = []
+        for state in state_graph.states:
+            # Duplicate targets: first position, last cost (as nx.DiGraph.add_edge)
+            targets: dict[str, float] = {}
+            for transition in state.transitions:
+                targets[transition.to] = transition.cost
+            for to, c in targets.items():
+                target = index.get(to)
+                if target is None:
+                    target = index[to] = len(names)
+                    names.append(to)
+                indices.append(target)
+                cost.append(c)
+            indptr.append(len(indices))
+        # Undeclared targets have no transitions
+        indptr.extend([len(indices)] * (len(names) - len(state_graph.states)))
+
+        return cls(
+            names,
+            len(state_graph.states),
+            np.asarray(indptr, dtype=np.int32),
+            np.asarray(indices, dtype=np.int32),
+            np.asarray(cost, dtype=np.float64),
+            index,
+        )
+
+    @property
+    def num_nodes(self) -> int:
+        """Number of nodes (declared states plus undeclared transition targets)."""
+        return len(self.names)
+
+    @property
+    def num_edges(self) -> int:
+        """Number of distinct transitions."""
+        return len(self.indices)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the CSR arrays."""
+        return self.indptr.nbytes + self.indices.nbytes + self.cost.nbytes
+
+    def edges(self) -> Iterator[tuple[str, str, float]]:
+        """Yield (source, target, cost) in adjacency order."""
+        names = self.names
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        cost = self.cost.tolist()
+        for v in range(self.num_nodes):
+            for k in range(indptr[v], indptr[v + 1]):
+                yield names[v], names[indices[k]], cost[k]
+
+    def reversed(self) -> "CSRGraph":
+        """
+        Return the transpose graph, with every transition pointing backwards.
+
+        Node ids and names are shared with this graph. The reversed
+        transitions into each node keep the order of their sources.
+
+        Returns:
+            CSRGraph whose row v holds the nodes with a transition to v
+        """
+        sources = np.repeat(np.arange(self.num_nodes, dtype=np.int32), np.diff(self.indptr))
+        order = np.argsort(self.indices, kind="stable")
+        counts = np.bincount(self.indices, minlength=self.num_nodes)
+        indptr = np.zeros(self.num_nodes + 1, dtype=np.int32)
+        np.cumsum(counts, out=indptr[1:])
+        return CSRGraph(
+            self.names,
+            self.num_states,
+            indptr,
+            sources[order],
+            self.cost[order],
+            self.index,
+        )
+
+    def bfs(
+        self, source: int | Collection[int], targets: Collection[int] | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Breadth-first search for the minimum number of transitions from source.
+
+        The frontier is expanded one level at a time with array operations,
+        visiting nodes in the same order as a FIFO queue would. The search
+        stops after the level on which the last target is found. Several
+        sources give the distance to the nearest of them.
+
+        Args:
+            source: Source node id, or ids (all at level 0)
+            targets: Node ids to stop at (default: search the whole graph)
+
+        Returns:
+            (levels, predecessors): int32 step counts (-1 where not reached)
+            and int32 BFS-tree parents (-1 for sources and unreached nodes)
+        """
+        indptr, indices = self.indptr, self.indices
+        levels = np.full(self.num_nodes, -1, dtype=np.int32)
+        predecessors = np.full(self.num_nodes, -1, dtype=np.int32)
+        sources = [source] if isinstance(source, int) else list(dict.fromkeys(source))
+        levels[sources] = 0
+        remaining = None if targets is None else set(targets) - set(sources)
+        frontier = np.array(sources, dtype=np.int32)
+        level = 0
+        while frontier.size and (remaining is None or remaining):
+            level += 1
+            starts = indptr[frontier]
+            counts = indptr[frontier + 1] - starts
+            total = int(counts.sum())
+            if total == 0:
+                break
+            # Concatenate the index ranges [starts[g], starts[g] + counts[g])
+            offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+            successors = indices[offsets + np.arange(total, dtype=np.int32)]
+            parents = np.repeat(frontier, counts)
+            new = levels[successors] < 0
+            successors, parents = successors[new], parents[new]
+            # First discovery wins, and discovery order is kept for the next level
+            _, first = np.unique(successors, return_index=True)
+            first.sort()
+            frontier = successors[first]
+            levels[frontier] = level
+            predecessors[frontier] = parents[first]
+            if remaining is not None:
+                remaining.difference_update(frontier.tolist())
+        return levels, predecessors
+
+    def reachable(self, source: int) -> np.ndarray:
+        """Return a boolean mask of nodes reachable from source (including source)."""
+        return self.bfs(source)[0] >= 0
+
+    def dijkstra(
+        self, source: int | Collection[int], targets: Collection[int] | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Compute the minimum total transition cost from source.
+
+        Ties are broken by discovery order. The search stops once every
+        target is settled; only settled nodes are reported. Several sources
+        give the cost from the nearest of them.
+
+        Args:
+            source: Source node id, or ids (all at cost 0)
+            targets: Node ids to stop at (default: search the whole graph)
+
+        Returns:
+            (costs, predecessors): float64 costs (inf where not settled) and
+            int32 shortest-path-tree parents (-1 for sources and unsettled nodes)
+        """
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        cost = self.cost.tolist()
+        inf = float("inf")
+        dist = [inf] * self.num_nodes
+        parent = [-1] * self.num_nodes
+        done = [False] * self.num_nodes
+        remaining = None if targets is None else set(targets)
+        sources = [source] if isinstance(source, int) else list(dict.fromkeys(source))
+        for v in sources:
+            dist[v] = 0.0
+        heap = [(0.0, i, v) for i, v in enumerate(sources)]
+        pushed = len(heap)
+        while heap:
+            d, _, v = heapq.heappop(heap)
+            if done[v]:
+                continue
+            done[v] = True
+            if remaining is not None:
+                remaining.discard(v)
+                if not remaining:
+                    break
+            for k in range(indptr[v], indptr[v + 1]):
+                w = indices[k]
+                candidate = d + cost[k]
+                if candidate < dist[w]:
+                    dist[w] = candidate
+                    parent[w] = v
+                    heapq.heappush(heap, (candidate, pushed, w))
+                    pushed += 1
+
+        settled = np.asarray(done, dtype=np.bool_)
+        costs = np.where(settled, np.asarray(dist, dtype=np.float64), inf)
+        predecessors = np.where(settled, np.asarray(parent, dtype=np.int32), -1)
+        return costs, predecessors.astype(np.int32)
+
+    def strongly_connected_components(self) -> tuple[np.ndarray, int]:
+        """
+        Label strongly connected components (iterative Tarjan/Nuutila).
+
+        Components are numbered in the order networkx.strongly_connected_components
+        yields them on the equivalent DiGraph (reverse topological order).
+        Runs in O(V + E) and allocates nothing per component.
+
+        Returns:
+            (component, count): int32 component id per node, and number of components
+        """
+        n = self.num_nodes
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        preorder = [0] * n  # 0 = not visited
+        lowlink = [0] * n
+        label = [-1] * n  # -1 = component not yet found
+        cursor = indptr[:-1]  # next transition to explore per node
+        scc_stack: list[int] = []
+        counter = 0
+        count = 0
+
+        for source in range(n):
+            if label[source] >= 0:
+                continue
+            stack = [source]
+            while stack:
+                v = stack[-1]
+                if not preorder[v]:
+                    counter += 1
+                    preorder[v] = counter
+                descended = False
+                end = indptr[v + 1]
+                while cursor[v] < end:
+                    w = indices[cursor[v]]
+                    cursor[v] += 1
+                    if not preorder[w]:
+                        stack.append(w)
+                        descended = True
+                        break
+                if descended:
+                    continue
+
+                low = preorder[v]
+                for k in range(indptr[v], end):
+                    w = indices[k]
+                    if label[w] < 0:
+                        low = min(low, lowlink[w] if preorder[w] > preorder[v] else preorder[w])
+                lowlink[v] = low
+                stack.pop()
+                if low == preorder[v]:
+                    label[v] = count
+                    while scc_stack and preorder[scc_stack[-1]] > preorder[v]:
+                        label[scc_stack.pop()] = count
+                    count += 1
+                else:
+                    scc_stack.append(v)
+        return np.asarray(label, dtype=np.int32), count
+
+    def condensation(self) -> Condensation:
+        """Contract strongly connected components into the condensation DAG."""
+        component, count = self.strongly_connected_components()
+        sources = np.repeat(np.arange(self.num_nodes, dtype=np.int32), np.diff(self.indptr))
+        return Condensation.from_labels(
+            self.names, component, count, sources, self.indices, self.index
+        )
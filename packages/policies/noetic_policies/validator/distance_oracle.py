@@ -0,0 +1,175 @@
+"""Precomputed distances from every state to the nearest goal."""
+
+import os
+from collections.abc import Collection
+from typing import BinaryIO
+
+import numpy as np
+
+from noetic_policies.validator.compiled_graph import CompiledStateGraph
+
+__all__ = ["DistanceOracle"]
+
+
+class DistanceOracle:
+    """
+    Minimum remaining cost and steps from every state to the nearest goal.
+
+    Built with one multi-source Dijkstra and one multi-source BFS from the
+    goals over the reversed graph, so each query is an array lookup instead
+    of a search. Arrays are indexed by the compiled graph's interned node
+    ids; lookups by name go through index. Unreachable nodes have cost inf
+    and steps -1.
+
+    The arrays take 16 bytes per node; single lookups read list copies of
+    costs and steps, which avoid creating NumPy scalars.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        names: list[str],
+        goals: tuple[str, ...],
+        costs: np.ndarray,
+        steps: np.ndarray,
+        next_state: np.ndarray,
+    ):
+        """
+        Initialize oracle from its arrays.
+
+        Args:
+            key: graph_key of the state graph the distances belong to
+            names: Node names by id
+            goals: Goal state names the distances lead to
+            costs: float64 minimum cost to a goal per node
+            steps: int32 minimum transitions to a goal per node
+            next_state: int32 successor on a minimum-cost path per node
+                (-1 at goals and unreachable nodes)
+        """
+        self.key = key
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.goals = goals
+        self.costs = costs
+        self.steps = steps
+        self.next_state = next_state
+        self._costs: list[float] = costs.tolist()
+        self._steps: list[int] = steps.tolist()
+
+    @classmethod
+    def build(cls, compiled: CompiledStateGraph, goals: Collection[str]) -> "DistanceOracle":
+        """
+        Compute the distance tables for a set of goals.
+
+        Args:
+            compiled: Compiled state graph
+            goals: Goal state names (names that are not nodes are ignored)
+
+        Returns:
+            DistanceOracle for the graph and goals
+        """
+        csr = compiled.csr
+        goal_names = tuple(sorted(set(goals)))
+        sources = [csr.index[goal] for goal in goal_names if goal in csr.index]
+        reverse = compiled.reversed_csr
+        costs, next_state = reverse.dijkstra(sources)
+        steps, _ = reverse.bfs(sources)
+        return cls(compiled.key, csr.names, goal_names, costs, steps, next_state)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the distance arrays."""
+        return self.costs.nbytes + self.steps.nbytes + self.next_state.nbytes
+
+    def distance_to_goal(self, state: str) -> float:
+        """
+        Return the minimum transition cost from a state to the nearest goal.
+
+        Args:
+            state: State name
+
+        Returns:
+            Minimum cost (0 at a goal, inf if no goal is reachable)
+
+        Raises:
+            KeyError: If state is not a node of the graph
+        """
+        return self._costs[self.index[state]]
+
+    def steps_to_goal(self, state: str) -> int | None:
+        """
+        Return the minimum number of transitions from a state to the nearest goal.
+
+        Args:
+            state: State name
+
+        Returns:
+            Minimum steps (0 at a goal), or None if no goal is reachable
+
+        Raises:
+            KeyError: If state is not a node of the graph
+        """
+        steps = self._steps[self.index[state]]
+        return None if steps < 0 else steps
+
+    def path_to_goal(self, state: str) -> list[str] | None:
+        """
+        Return a minimum-cost path from a state to the nearest goal.
+
+        Args:
+            state: State name
+
+        Returns:
+            State names from state to a goal, or None if no goal is reachable
+
+        Raises:
+            KeyError: If state is not a node of the graph
+        """
+        v = self.index[state]
+        if self._costs[v] == float("inf"):
+            return None
+        path = [state]
+        next_state = self.next_state
+        while next_state[v] >= 0:
+            v = int(next_state[v])
+            path.append(self.names[v])
+        return path
+
+    def save(self, file: str | os.PathLike[str] | BinaryIO) -> None:
+        """
+        Write the oracle in NumPy .npz format.
+
+        Args:
+            file: Path or binary file object
+        """
+        np.savez(
+            file,
+            key=np.array(self.key),
+            names=np.array(self.names, dtype=np.str_),
+            goals=np.array(self.goals, dtype=np.str_),
+            costs=self.costs,
+            steps=self.steps,
+            next_state=self.next_state,
+        )
+
+    @classmethod
+    def load(cls, file: str | os.PathLike[str] | BinaryIO) -> "DistanceOracle":
+        """
+        Read an oracle written by save().
+
+        Args:
+            file: Path or binary file object
+
+        Returns:
+            DistanceOracle with the saved tables (compare key with
+            graph_key() of the current graph before trusting it)
+        """
+        with np.load(file, allow_pickle=False) as data:
+            return cls(
+                str(data["key"]),
+                data["names"].tolist(),
+                tuple(data["goals"].tolist()),
+                data["costs"],
+                data["steps"],
+                data["next_state"],
+            )
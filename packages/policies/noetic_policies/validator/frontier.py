@@ -0,0 +1,281 @@
+"""Memory-bounded storage for explicit-state exploration: packed states and spilling FIFOs."""
+
+import mmap
+import os
+import pickle
+import struct
+import tempfile
+from array import array
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+from noetic_policies.cel_evaluator.vectorized import enum_values
+
+__all__ = ["SpillingFrontier", "StateCodec", "TracePointers"]
+
+T = TypeVar("T")
+
+_LENGTH = struct.Struct("<I")
+_POINTER = struct.Struct("<qi")
+
+# Slot tags: value packed in its slot, float reinterpreted in a number slot, or in the tail
+_PACKED, _FLOAT, _TAIL = 0, 1, 2
+_INT64_MIN, _INT64_MAX = -(1 << 63), (1 << 63) - 1
+
+
+class StateCodec:
+    """
+    Packs concrete states (graph state id, values) into compact byte strings.
+
+    Each variable gets a tag byte and a fixed-width slot: int64 (or float64)
+    for numbers, one byte for booleans, a member index for enums. Strings,
+    and values that do not fit their slot, are pickled into a variable-length
+    tail. A counter policy packs into 4 + 9 * variables bytes.
+    """
+
+    def __init__(self, state_schema: dict[str, str]):
+        """
+        Initialize codec for a state schema.
+
+        Args:
+            state_schema: Variable name -> type, in value order
+        """
+        formats = ["<i"]
+        self._kinds: list[tuple[str, list[str] | None]] = []
+        for field_type in state_schema.values():
+            members = enum_values(field_type)
+            if members is not None:
+                self._kinds.append(("enum", members))
+                formats.append("BH")
+            elif field_type == "number":
+                self._kinds.append(("number", None))
+                formats.append("Bq")
+            elif field_type == "boolean":
+                self._kinds.append(("boolean", None))
+                formats.append("B?")
+            else:
+                self._kinds.append(("tail", None))
+                formats.append("B")
+        self._struct = struct.Struct("".join(formats))
+        self._member_index = [
+            {member: i for i, member in enumerate(members)} if members else None
+            for _, members in self._kinds
+        ]
+
+    def encode(self, state: tuple[int, tuple[Any, ...]]) -> bytes:
+        """Pack a concrete state."""
+        graph_state, values = state
+        fields: list[Any] = [graph_state]
+        tail: list[Any] = []
+        for (kind, _), index, value in zip(self._kinds, self._member_index, values, strict=True):
+            if kind == "tail":
+                fields.append(_TAIL)
+                tail.append(value)
+            elif kind == "number" and type(value) is int and _INT64_MIN <= value <= _INT64_MAX:
+                fields.extend((_PACKED, value))
+            elif kind == "number" and type(value) is float:
+                fields.extend((_FLOAT, struct.unpack("<q", struct.pack("<d", value))[0]))
+            elif kind == "boolean" and type(value) is bool:
+                fields.extend((_PACKED, value))
+            elif index is not None and isinstance(value, str) and value in index:
+                fields.extend((_PACKED, index[value]))
+            else:
+                fields.extend((_TAIL, False if kind == "boolean" else 0))
+                tail.append(value)
+        packed = self._struct.pack(*fields)
+        return packed + pickle.dumps(tail, protocol=pickle.HIGHEST_PROTOCOL) if tail else packed
+
+    def decode(self, data: bytes | memoryview) -> tuple[int, tuple[Any, ...]]:
+        """Unpack a concrete state produced by encode()."""
+        fields = self._struct.unpack_from(data)
+        size = self._struct.size
+        tail = iter(pickle.loads(data[size:]) if len(data) > size else ())
+        values: list[Any] = []
+        position = 1
+        for kind, members in self._kinds:
+            tag = fields[position]
+            if kind == "tail":
+                position += 1
+                values.append(next(tail))
+                continue
+            slot = fields[position + 1]
+            position += 2
+            if tag == _TAIL:
+                values.append(next(tail))
+            elif tag == _FLOAT:
+                values.append(struct.unpack("<d", struct.pack("<q", slot))[0])
+            elif members is not None:
+                values.append(members[slot])
+            else:
+                values.append(slot)
+        return fields[0], tuple(values)
+
+
+class SpillingFrontier(Generic[T]):
+    """
+    FIFO queue that spills to memory-mapped segment files.
+
+    Items are buffered in memory; whenever segment_items are buffered they
+    are encoded and written, length-prefixed, to a new segment file. Draining
+    maps each segment in turn, yields its items and deletes it, then yields
+    the buffered items, so at most one buffer of items is held in memory.
+    Without a directory the queue never spills.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[T], bytes],
+        decode: Callable[[memoryview], T],
+        directory: str | os.PathLike[str] | None = None,
+        segment_items: int = 1 << 16,
+    ):
+        """
+        Initialize empty queue.
+
+        Args:
+            encode: Serializes an item
+            decode: Deserializes an encoded item
+            directory: Directory for segment files (None: keep everything in memory)
+            segment_items: Items buffered before a segment is written
+        """
+        self._encode = encode
+        self._decode = decode
+        self._directory = Path(directory) if directory is not None else None
+        self._segment_items = segment_items
+        self._buffer: list[T] = []
+        self._segments: list[Path] = []
+        self._count = 0
+        self.spilled_bytes = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, item: T) -> None:
+        """Add an item at the back of the queue."""
+        self._buffer.append(item)
+        self._count += 1
+        if self._directory is not None and len(self._buffer) >= self._segment_items:
+            self._spill()
+
+    def _spill(self) -> None:
+        assert self._directory is not None
+        encode, pack = self._encode, _LENGTH.pack
+        fd, name = tempfile.mkstemp(prefix="frontier-", suffix=".seg", dir=self._directory)
+        with os.fdopen(fd, "wb") as segment:
+            for item in self._buffer:
+                data = encode(item)
+                segment.write(pack(len(data)))
+                segment.write(data)
+            self.spilled_bytes += segment.tell()
+        self._segments.append(Path(name))
+        self._buffer = []
+
+    def drain(self) -> Iterator[T]:
+        """Remove and yield all items in FIFO order (including items appended meanwhile)."""
+        decode, unpack = self._decode, _LENGTH.unpack_from
+        while self._segments:
+            path = self._segments.pop(0)
+            with (
+                open(path, "rb") as segment,
+                mmap.mmap(segment.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            ):
+                view = memoryview(mapped)
+                try:
+                    offset, end = 0, len(mapped)
+                    while offset < end:
+                        (length,) = unpack(view, offset)
+                        offset += _LENGTH.size
+                        item = decode(view[offset : offset + length])
+                        offset += length
+                        self._count -= 1
+                        yield item
+                finally:
+                    # Also when the consumer stops early, so the mapping can close
+                    view.release()
+            path.unlink()
+        while self._buffer:
+            buffer, self._buffer = self._buffer, []
+            for item in buffer:
+                self._count -= 1
+                yield item
+
+    def close(self) -> None:
+        """Delete remaining segment files and items."""
+        for path in self._segments:
+            path.unlink(missing_ok=True)
+        self._segments = []
+        self._buffer = []
+        self._count = 0
+
+
+class TracePointers:
+    """
+    Parent state number and reaching transition id per visited state.
+
+    Kept in two arrays (12 bytes per state), or appended to a file in the
+    given directory and read back with positioned reads when a trace is
+    rebuilt, in which case memory holds only a write buffer.
+    """
+
+    def __init__(
+        self, directory: str | os.PathLike[str] | None = None, buffer_items: int = 1 << 16
+    ):
+        """
+        Initialize empty pointer store.
+
+        Args:
+            directory: Directory for the pointer file (None: keep in memory)
+            buffer_items: Pointers buffered before they are written to the file
+        """
+        self._parents = array("q")
+        self._via = array("i")
+        self._buffer_items = buffer_items
+        self._flushed = 0
+        self._fd: int | None = None
+        if directory is not None:
+            self._fd, name = tempfile.mkstemp(prefix="pointers-", suffix=".bin", dir=directory)
+            os.unlink(name)  # Removed from disk once closed
+
+    def __len__(self) -> int:
+        return self._flushed + len(self._parents)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of memory used by the pointers."""
+        return (self._parents.itemsize + self._via.itemsize) * len(self._parents)
+
+    def append(self, parent: int, transition: int) -> None:
+        """Record the pointers of the next visited state."""
+        self._parents.append(parent)
+        self._via.append(transition)
+        if self._fd is not None and len(self._parents) >= self._buffer_items:
+            self._flush()
+
+    def extend(self, parents: list[int], transitions: list[int]) -> None:
+        """Record the pointers of several visited states."""
+        self._parents.extend(parents)
+        self._via.extend(transitions)
+        if self._fd is not None and len(self._parents) >= self._buffer_items:
+            self._flush()
+
+    def _flush(self) -> None:
+        assert self._fd is not None
+        data = b"".join(map(_POINTER.pack, self._parents, self._via))
+        os.pwrite(self._fd, data, self._flushed * _POINTER.size)
+        self._flushed += len(self._parents)
+        self._parents = array("q")
+        self._via = array("i")
+
+    def __getitem__(self, number: int) -> tuple[int, int]:
+        """Return (parent number, transition id) of a visited state."""
+        if number >= self._flushed:
+            return self._parents[number - self._flushed], self._via[number - self._flushed]
+        assert self._fd is not None
+        return _POINTER.unpack(os.pread(self._fd, _POINTER.size, number * _POINTER.size))
+
+    def close(self) -> None:
+        """Release the pointer file."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
@@ -1,26 +1,81 @@
-"""State graph analysis using NetworkX (T068-T072)."""
+"""State graph analysis using NetworkX or CSR arrays (T068-T072)."""
 
-import networkx as nx
+import heapq
+import math
+from collections.abc import Collection
+from typing import TYPE_CHECKING
+
+import numpy as np
 
 from noetic_policies.models import GoalState, GraphAnalysisResult, TemporalBounds
 from noetic_policies.models.state_graph import StateGraph
+from noetic_policies.validator.compiled_graph import CompiledStateGraph, GraphCache
+from noetic_policies.validator.condensation import Condensation
+from noetic_policies.validator.distance_oracle import DistanceOracle
+
+if TYPE_CHECKING:
+    import networkx as nx
+
+# Shared by analyzers created without an explicit cache
+_DEFAULT_GRAPH_CACHE = GraphCache()
+
+# Graph algorithm implementations selectable per analyzer
+BACKENDS = ("networkx", "csr")
 
 
 class GraphAnalyzer:
     """
     Analyzes state graphs for reachability, deadlocks, and costs.
 
-    Uses NetworkX for graph algorithms (per research.md).
+    Uses NetworkX for graph algorithms (per research.md), or the "csr"
+    backend, which runs the same algorithms on int32/float64 arrays and
+    scales to graphs with millions of states. Both backends return
+    identical results.
     Implements FR-004, FR-005, FR-007.
+
+    Every method accepts either a StateGraph or a CompiledStateGraph. A
+    StateGraph is compiled once and cached by content, so analyze() and the
+    individual checks share one graph.
     """
 
-    def __init__(self):
-        """Initialize graph analyzer."""
-        pass
+    def __init__(self, cache: GraphCache | None = None, backend: str = "networkx"):
+        """
+        Initialize graph analyzer.
+
+        Args:
+            cache: Compiled graph cache (defaults to a process-wide cache)
+            backend: Graph algorithm implementation - "networkx" or "csr"
+
+        Raises:
+            ValueError: If backend is unknown
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown graph backend '{backend}'. Expected one of {BACKENDS}")
+        self.cache = cache if cache is not None else _DEFAULT_GRAPH_CACHE
+        self.backend = backend
+
+    def load_backend(self) -> None:
+        """Import the backend's libraries now rather than during the first analysis."""
+        if self.backend == "networkx":
+            import networkx  # noqa: F401
+
+    def compile(self, state_graph: StateGraph | CompiledStateGraph) -> CompiledStateGraph:
+        """
+        Return the compiled form of a state graph, reusing a cached one if present.
+
+        Args:
+            state_graph: State graph, or an already compiled graph
+
+        Returns:
+            CompiledStateGraph shared by all analyses of this graph
+        """
+        if isinstance(state_graph, CompiledStateGraph):
+            return state_graph
+        return self.cache.compile(state_graph)
 
     def analyze(
         self,
-        state_graph: StateGraph,
+        state_graph: StateGraph | CompiledStateGraph,
         initial: str,
         goals: list[GoalState],
         policy_temporal_bounds: TemporalBounds | None = None,
@@ -29,7 +84,7 @@ class GraphAnalyzer:
         Perform complete graph analysis.
 
         Args:
-            state_graph: State graph to analyze
+            state_graph: State graph (or compiled graph) to analyze
             initial: Initial state name
             goals: Goal states with scoring and temporal bounds
             policy_temporal_bounds: Global temporal bounds
@@ -37,24 +92,27 @@ class GraphAnalyzer:
         Returns:
             GraphAnalysisResult with analysis findings
         """
-        # Build NetworkX graph
-        G = self._build_networkx_graph(state_graph)
+        # Compile the graph once for every check below
+        compiled = self.compile(state_graph)
 
         # T069: Find unreachable states
-        unreachable = self.find_unreachable_states(state_graph, initial)
+        unreachable = self.find_unreachable_states(compiled, initial)
 
-        # T070: Detect deadlocks
-        deadlocks = self.detect_deadlocks(state_graph)
+        # T070: Detect deadlocks (sinks of the condensation DAG)
+        condensation = self.condensation(compiled)
+        deadlocks = self._sink_cycles(condensation)
 
         # T071: Verify goal reachability
         goal_names = {g.name for g in goals}
-        goal_reachable = self.verify_goal_reachable(state_graph, initial, goal_names)
+        goal_reachable = self.verify_goal_reachable(compiled, initial, goal_names)
 
-        # T071a: Compute goal costs (Dijkstra's)
-        goal_costs = self._compute_goal_costs(G, initial, goals)
+        # T071a: Compute goal costs (one Dijkstra for all goals)
+        costs, cost_predecessors = self.shortest_costs(compiled, initial, goal_names)
+        goal_costs = {g.name: costs[g.name] for g in goals if g.name in costs}
 
-        # T071b: Compute minimum steps (BFS)
-        goal_min_steps = self._compute_goal_min_steps(G, initial, goals)
+        # T071b: Compute minimum steps (one BFS for all goals)
+        steps, step_predecessors = self.shortest_steps(compiled, initial, goal_names)
+        goal_min_steps = {g.name: steps[g.name] for g in goals if g.name in steps}
 
         # T071c: Check temporal feasibility
         temporally_infeasible = self._check_temporal_feasibility(
@@ -68,102 +126,117 @@ class GraphAnalyzer:
             goal_costs=goal_costs,
             goal_min_steps=goal_min_steps,
             temporally_infeasible_goals=temporally_infeasible,
+            cost_predecessors=cost_predecessors,
+            step_predecessors=step_predecessors,
+            condensation=condensation,
         )
 
-    def _build_networkx_graph(self, state_graph: StateGraph) -> nx.DiGraph:
-        """Build NetworkX directed graph from state graph."""
-        G = nx.DiGraph()
-
-        # Add all states as nodes
-        for state in state_graph.states:
-            G.add_node(state.name)
-
-        # Add transitions as edges with cost weights
-        for state in state_graph.states:
-            for transition in state.transitions:
-                G.add_edge(
-                    state.name,
-                    transition.to,
-                    weight=transition.cost,  # For Dijkstra's
-                )
-
-        return G
+    def _build_networkx_graph(self, state_graph: StateGraph | CompiledStateGraph) -> "nx.DiGraph":
+        """Return the (cached, read-only) NetworkX directed graph for a state graph."""
+        return self.compile(state_graph).graph
 
     def find_unreachable_states(
-        self, state_graph: StateGraph, initial: str
+        self, state_graph: StateGraph | CompiledStateGraph, initial: str
     ) -> set[str]:
         """
         Find states not reachable from initial state.
 
         Args:
-            state_graph: State graph to analyze
+            state_graph: State graph (or compiled graph) to analyze
             initial: Initial state name
 
         Returns:
             Set of unreachable state names
         """
-        G = self._build_networkx_graph(state_graph)
+        compiled = self.compile(state_graph)
+        if self.backend == "csr":
+            return self._csr_unreachable(compiled, initial)
+
+        import networkx as nx
 
         # Get all reachable states from initial
         try:
-            reachable = {initial} | nx.descendants(G, initial)
+            reachable = {initial} | nx.descendants(compiled.graph, initial)
         except nx.NetworkXError:
             reachable = {initial}
 
         # All states minus reachable = unreachable
-        all_states = {state.name for state in state_graph.states}
+        all_states = set(compiled.states)
         return all_states - reachable
 
-    def detect_deadlocks(self, state_graph: StateGraph) -> list[set[str]]:
+    def detect_deadlocks(self, state_graph: StateGraph | CompiledStateGraph) -> list[set[str]]:
         """
         Detect deadlock cycles in state graph.
 
-        A deadlock is a strongly connected component (SCC) with no outgoing edges.
+        A deadlock is a strongly connected component (SCC) with no outgoing edges,
+        i.e. a sink of the condensation DAG. Runs in O(V + E).
 
         Args:
-            state_graph: State graph to analyze
+            state_graph: State graph (or compiled graph) to analyze
 
         Returns:
             List of deadlock SCCs (each is a set of state names)
         """
-        G = self._build_networkx_graph(state_graph)
+        return self._sink_cycles(self.condensation(state_graph))
+
+    def condensation(self, state_graph: StateGraph | CompiledStateGraph) -> Condensation:
+        """
+        Contract each strongly connected component into one node of a DAG.
+
+        Args:
+            state_graph: State graph (or compiled graph) to analyze
+
+        Returns:
+            Condensation with a component id per state and the DAG between components
+        """
+        compiled = self.compile(state_graph)
+        if self.backend == "csr":
+            return compiled.csr.condensation()
 
-        # Find all strongly connected components
-        sccs = list(nx.strongly_connected_components(G))
+        import networkx as nx
 
-        # A component is a deadlock if it has no outgoing edges
-        deadlocks = []
-        for scc in sccs:
-            # Check if this SCC has any edges leaving it
-            has_exit = False
+        G = compiled.graph
+        names = list(G)
+        index = {name: i for i, name in enumerate(names)}
+
+        # Label every node with its SCC id in one pass over the components
+        component = [0] * len(names)
+        count = 0
+        for count, scc in enumerate(nx.strongly_connected_components(G), start=1):
             for node in scc:
-                for successor in G.successors(node):
-                    if successor not in scc:
-                        has_exit = True
-                        break
-                if has_exit:
-                    break
+                component[index[node]] = count - 1
 
-            # If no exit and more than just initial state, it's a deadlock
-            if not has_exit and len(scc) > 1:
-                deadlocks.append(scc)
+        sources = np.fromiter((index[u] for u, _ in G.edges), dtype=np.int32)
+        targets = np.fromiter((index[v] for _, v in G.edges), dtype=np.int32)
+        return Condensation.from_labels(
+            names, np.asarray(component, dtype=np.int32), count, sources, targets, index
+        )
 
-        return deadlocks
+    def _sink_cycles(self, condensation: Condensation) -> list[set[str]]:
+        """Return the states of sink components with more than one state."""
+        sinks = condensation.sinks()
+        # A single state without exits is a terminal state, not a deadlock cycle
+        return condensation.members(sinks[condensation.sizes[sinks] > 1])
 
     def verify_goal_reachable(
-        self, state_graph: StateGraph, initial: str, goals: set[str]
+        self, state_graph: StateGraph | CompiledStateGraph, initial: str, goals: set[str]
     ) -> bool:
         """
         Check if any goal state is reachable from initial state.
 
         Args:
-            state_graph: State graph to analyze
+            state_graph: State graph (or compiled graph) to analyze
             initial: Initial state name
             goals: Goal state names
 
         Returns:
             True if at least one goal is reachable
         """
+        if self.backend == "csr":
+            return self._csr_goal_reachable(self.compile(state_graph), initial, goals)
+
+        import networkx as nx
+
         G = self._build_networkx_graph(state_graph)
 
         for goal in goals:
@@ -172,61 +245,196 @@ class GraphAnalyzer:
 
         return False
 
-    def _compute_goal_costs(
-        self, G: nx.DiGraph, initial: str, goals: list[GoalState]
-    ) -> dict[str, float]:
+    def shortest_costs(
+        self,
+        state_graph: StateGraph | CompiledStateGraph,
+        initial: str,
+        targets: Collection[str] | None = None,
+    ) -> tuple[dict[str, float], dict[str, str]]:
         """
-        Compute minimum cost to reach each goal using Dijkstra's algorithm.
+        Compute minimum transition cost from the initial state (single-source Dijkstra).
+
+        One search serves every target; it stops as soon as all targets are
+        settled. Ties between equal-cost paths are broken by discovery order,
+        so both backends return the same tree.
 
         Args:
-            G: NetworkX graph
+            state_graph: State graph (or compiled graph) to analyze
             initial: Initial state name
-            goals: Goal states
+            targets: State names to stop at (default: search the whole graph);
+                names that are not states are ignored
 
         Returns:
-            Dictionary mapping goal name to minimum cost
+            (costs, predecessors): minimum cost per settled state, and the
+            previous state on a minimum-cost path to each settled state
+            other than initial (follow it back to initial to extract a path)
         """
-        goal_costs = {}
+        compiled = self.compile(state_graph)
+        if self.backend == "csr":
+            return self._csr_search(compiled, initial, targets, weighted=True)
+        return self._nx_dijkstra(compiled.graph, initial, targets)
 
-        for goal in goals:
-            try:
-                # Use Dijkstra's algorithm with transition costs as weights
-                cost = nx.dijkstra_path_length(G, initial, goal.name, weight="weight")
-                goal_costs[goal.name] = cost
-            except (nx.NetworkXNoPath, nx.NodeNotFound):
-                # Goal is unreachable
-                pass
-
-        return goal_costs
-
-    def _compute_goal_min_steps(
-        self, G: nx.DiGraph, initial: str, goals: list[GoalState]
-    ) -> dict[str, int]:
+    def shortest_steps(
+        self,
+        state_graph: StateGraph | CompiledStateGraph,
+        initial: str,
+        targets: Collection[str] | None = None,
+    ) -> tuple[dict[str, int], dict[str, str]]:
         """
-        Compute minimum number of steps (transitions) to reach each goal.
+        Compute minimum number of transitions from the initial state (single-source BFS).
 
-        Uses BFS for unweighted shortest path.
+        One search serves every target; it stops after the level on which
+        the last target is found.
 
         Args:
-            G: NetworkX graph
+            state_graph: State graph (or compiled graph) to analyze
             initial: Initial state name
-            goals: Goal states
+            targets: State names to stop at (default: search the whole graph);
+                names that are not states are ignored
 
         Returns:
-            Dictionary mapping goal name to minimum steps
+            (steps, predecessors): minimum steps per reached state, and the
+            previous state on a shortest path to each reached state other
+            than initial
+        """
+        compiled = self.compile(state_graph)
+        if self.backend == "csr":
+            steps, predecessors = self._csr_search(compiled, initial, targets, weighted=False)
+            return {name: int(level) for name, level in steps.items()}, predecessors
+        return self._nx_bfs(compiled.graph, initial, targets)
+
+    def distance_oracle(
+        self, state_graph: StateGraph | CompiledStateGraph, goals: Collection[str]
+    ) -> DistanceOracle:
         """
-        goal_min_steps = {}
+        Precompute the minimum cost and steps from every state to the nearest goal.
 
-        for goal in goals:
-            try:
-                # BFS shortest path (unweighted)
-                steps = nx.shortest_path_length(G, initial, goal.name)
-                goal_min_steps[goal.name] = steps
-            except (nx.NetworkXNoPath, nx.NodeNotFound):
-                # Goal is unreachable
-                pass
-
-        return goal_min_steps
+        Both backends share the CSR implementation (multi-source searches
+        from the goals over the reversed graph).
+
+        Args:
+            state_graph: State graph (or compiled graph) to analyze
+            goals: Goal state names
+
+        Returns:
+            DistanceOracle answering cost-to-goal queries by lookup
+        """
+        return DistanceOracle.build(self.compile(state_graph), goals)
+
+    def _nx_dijkstra(
+        self, G: "nx.DiGraph", initial: str, targets: Collection[str] | None
+    ) -> tuple[dict[str, float], dict[str, str]]:
+        """Single-source Dijkstra over the NetworkX adjacency, stopping at targets."""
+        costs: dict[str, float] = {}
+        predecessors: dict[str, str] = {}
+        if initial not in G:
+            return costs, predecessors
+
+        succ = G.succ
+        tentative = {initial: 0.0}
+        parent: dict[str, str] = {}
+        remaining = None if targets is None else {t for t in targets if t in G}
+        heap: list[tuple[float, int, str]] = [(0.0, 0, initial)]
+        pushed = 1
+        while heap:
+            d, _, v = heapq.heappop(heap)
+            if v in costs:
+                continue
+            costs[v] = d
+            if v in parent:
+                predecessors[v] = parent[v]
+            if remaining is not None:
+                remaining.discard(v)
+                if not remaining:
+                    break
+            for w, attrs in succ[v].items():
+                candidate = d + attrs["weight"]
+                if candidate < tentative.get(w, math.inf):
+                    tentative[w] = candidate
+                    parent[w] = v
+                    heapq.heappush(heap, (candidate, pushed, w))
+                    pushed += 1
+        return costs, predecessors
+
+    def _nx_bfs(
+        self, G: "nx.DiGraph", initial: str, targets: Collection[str] | None
+    ) -> tuple[dict[str, int], dict[str, str]]:
+        """Level-synchronous BFS over the NetworkX adjacency, stopping at targets."""
+        steps: dict[str, int] = {}
+        predecessors: dict[str, str] = {}
+        if initial not in G:
+            return steps, predecessors
+
+        succ = G.succ
+        steps[initial] = 0
+        remaining = None if targets is None else {t for t in targets if t in G} - {initial}
+        frontier = [initial]
+        level = 0
+        while frontier and (remaining is None or remaining):
+            level += 1
+            next_frontier = []
+            for v in frontier:
+                for w in succ[v]:
+                    if w not in steps:
+                        steps[w] = level
+                        predecessors[w] = v
+                        next_frontier.append(w)
+            if remaining is not None:
+                remaining.difference_update(next_frontier)
+            frontier = next_frontier
+        return steps, predecessors
+
+    def _csr_search(
+        self,
+        compiled: CompiledStateGraph,
+        initial: str,
+        targets: Collection[str] | None,
+        weighted: bool,
+    ) -> tuple[dict[str, float], dict[str, str]]:
+        """Run Dijkstra or BFS on the CSR arrays and map results back to state names."""
+        csr = compiled.csr
+        source = csr.index.get(initial)
+        if source is None:
+            return {}, {}
+        target_ids = None
+        if targets is not None:
+            target_ids = {csr.index[t] for t in targets if t in csr.index}
+        if weighted:
+            distances, parents = csr.dijkstra(source, target_ids)
+            found = np.flatnonzero(np.isfinite(distances))
+        else:
+            distances, parents = csr.bfs(source, target_ids)
+            found = np.flatnonzero(distances >= 0)
+
+        names = csr.names
+        found_ids = found.tolist()
+        values = distances[found].tolist()
+        parent_ids = parents[found].tolist()
+        dist = {names[v]: value for v, value in zip(found_ids, values, strict=True)}
+        predecessors = {
+            names[v]: names[p] for v, p in zip(found_ids, parent_ids, strict=True) if p >= 0
+        }
+        return dist, predecessors
+
+    def _csr_unreachable(self, compiled: CompiledStateGraph, initial: str) -> set[str]:
+        """Find unreachable declared states with a BFS over the CSR arrays."""
+        csr = compiled.csr
+        source = csr.index.get(initial)
+        if source is None:
+            return set(compiled.states) - {initial}
+        reachable = csr.reachable(source)[: csr.num_states]
+        return {csr.names[i] for i in np.flatnonzero(~reachable).tolist()}
+
+    def _csr_goal_reachable(
+        self, compiled: CompiledStateGraph, initial: str, goals: set[str]
+    ) -> bool:
+        """Check goal reachability with one BFS over the CSR arrays."""
+        csr = compiled.csr
+        source = csr.index.get(initial)
+        if source is None:
+            return False
+        reachable = csr.reachable(source)
+        return any(goal in csr.index and reachable[csr.index[goal]] for goal in goals)
 
     def _check_temporal_feasibility(
         self,
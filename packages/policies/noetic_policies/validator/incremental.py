@@ -0,0 +1,233 @@
+"""Incremental re-validation of successive versions of a policy."""
+
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from noetic_policies.models import ValidationError, ValidationResult
+from noetic_policies.models.policy import Policy
+from noetic_policies.models.state_graph import StateGraph, Transition
+from noetic_policies.validator.compiled_graph import graph_key
+from noetic_policies.validator.incremental_graph import IncrementalGraphAnalysis
+from noetic_policies.validator.schema_validator import SchemaValidator
+
+if TYPE_CHECKING:
+    from noetic_policies.validator import PolicyValidator
+
+__all__ = ["IncrementalValidator", "diff_policies", "policy_sections"]
+
+# Every Policy field belongs to at least one section. "graph_structure" is
+# what graph analysis reads (initial state, states, transition targets and
+# costs); "state_graph" also covers its expressions.
+_SECTIONS: dict[str, Callable[[Policy], Any]] = {
+    "version": lambda p: p.version,
+    "cel_mode": lambda p: p.cel_mode,
+    "documentation": lambda p: (
+        p.name,
+        p.description,
+        p.metadata,
+        [g.description for g in p.goal_states],
+    ),
+    "state_schema": lambda p: p.state_schema,
+    "constraints": lambda p: p.constraints,
+    "invariants": lambda p: p.invariants,
+    "graph_structure": lambda p: graph_key(p.state_graph),
+    "state_graph": lambda p: p.state_graph,
+    "goal_names": lambda p: [g.name for g in p.goal_states],
+    "goal_conditions": lambda p: [g.conditions for g in p.goal_states],
+    "goal_scoring": lambda p: [(g.priority, g.reward) for g in p.goal_states],
+    "progress_conditions": lambda p: [g.progress_conditions for g in p.goal_states],
+    "goal_bounds": lambda p: [g.temporal_bounds for g in p.goal_states],
+    "temporal_bounds": lambda p: p.temporal_bounds,
+}
+
+# Sections that no check reads
+_DOCUMENTATION = frozenset({"documentation"})
+
+# The graph analysis is rebuilt rather than edited when more than this many
+# states, and more than a quarter of them, were added, removed or edited
+_REBUILD_MIN_STATES = 32
+
+
+def policy_sections(policy: Policy) -> dict[str, Any]:
+    """
+    Split a policy into the sections validation checks depend on.
+
+    Args:
+        policy: Policy to split
+
+    Returns:
+        Comparable value of each section, by section name
+    """
+    return {name: section(policy) for name, section in _SECTIONS.items()}
+
+
+def diff_policies(old: Policy, new: Policy) -> frozenset[str]:
+    """
+    Return the sections in which two versions of a policy differ.
+
+    Args:
+        old: Previous version
+        new: Current version
+
+    Returns:
+        Names of the changed sections (see policy_sections())
+    """
+    before, after = policy_sections(old), policy_sections(new)
+    return frozenset(name for name in after if before[name] != after[name])
+
+
+def _targets(transitions: list[Transition]) -> list[tuple[str, float]]:
+    """What graph analysis reads of a state's transitions."""
+    return [(t.to, t.cost) for t in transitions]
+
+
+class IncrementalValidator:
+    """
+    Validates successive versions of one policy, re-running only affected checks.
+
+    Each version is diffed against the previous one by section (see
+    policy_sections()). Schema checks run only when a section they read
+    changed (SchemaValidator.CHECKS). Graph analysis is kept in an
+    IncrementalGraphAnalysis, which is edited state by state when the graph
+    structure changed, so a small graph edit costs little and a goal edit
+    needs no graph pass. Editing a goal's progress conditions therefore
+    re-runs one schema check and nothing else. Model checking
+    ("thorough-plus") re-runs on any change but documentation.
+
+    Results equal those of PolicyValidator.validate(); metadata["rechecked"]
+    lists the checks and passes that ran. The result cache is not used.
+    """
+
+    def __init__(self, validator: "PolicyValidator | None" = None, mode: str = "fast"):
+        """
+        Initialize incremental validator.
+
+        Args:
+            validator: Validator whose checks, analyzer and settings are used
+            mode: Validation mode - "fast", "thorough" or "thorough-plus"
+        """
+        if validator is None:
+            # Import here to avoid circular dependency
+            from noetic_policies.validator import PolicyValidator
+
+            validator = PolicyValidator()
+        self.validator = validator
+        self.mode = mode
+        self._sections: dict[str, Any] | None = None
+        self._schema_errors: dict[str, list[ValidationError]] = {}
+        self._graph: IncrementalGraphAnalysis | None = None
+        self._model_check: tuple[list[ValidationError], list[ValidationError]] | None = None
+
+    def validate(self, policy: Policy) -> ValidationResult:
+        """
+        Validate the next version of the policy.
+
+        Args:
+            policy: Parsed policy (the first call validates it completely)
+
+        Returns:
+            ValidationResult with errors, warnings, and metadata
+        """
+        validator = self.validator
+        with validator.tracer.start_as_current_span("policy.validate.incremental") as span:
+            start_time = time.perf_counter()
+            sections = policy_sections(policy)
+            if self._sections is None:
+                changed = frozenset(sections)
+            else:
+                changed = frozenset(n for n in sections if sections[n] != self._sections[n])
+            self._sections = sections
+            rechecked: list[str] = []
+
+            for name, reads in SchemaValidator.CHECKS:
+                if name not in self._schema_errors or reads & changed:
+                    self._schema_errors[name] = validator.schema_validator.run_check(name, policy)
+                    rechecked.append(name)
+            errors = [e for name, _ in SchemaValidator.CHECKS for e in self._schema_errors[name]]
+            warnings: list[ValidationError] = []
+            schema_valid = not errors
+
+            if "graph_structure" in changed:
+                rechecked.append(self._update_graph(policy.state_graph))
+            graph = self._graph
+            graph.goals = policy.goal_states
+            graph.policy_temporal_bounds = policy.temporal_bounds
+            analysis = graph.result()
+
+            infeasible: list[str] = []
+            if self.mode == "fast":
+                errors.extend(validator._reachability_errors(analysis.unreachable_states))
+            else:
+                infeasible = analysis.temporally_infeasible_goals or []
+                errors.extend(validator._analysis_errors(policy, analysis))
+
+            if self.mode == "thorough-plus" and schema_valid:
+                if self._model_check is None or changed - _DOCUMENTATION:
+                    with validator.tracer.start_as_current_span(
+                        "policy.validate.model_check"
+                    ) as check_span:
+                        self._model_check = validator._model_check(
+                            policy, check_span, set(infeasible)
+                        )
+                    rechecked.append("model_check")
+                model_errors, model_warnings = self._model_check
+                errors.extend(model_errors)
+                warnings.extend(model_warnings)
+
+            duration_ms = (time.perf_counter() - start_time) * 1000
+            span.set_attribute("validation.duration_ms", duration_ms)
+            span.set_attribute("validation.rechecked", len(rechecked))
+
+            return ValidationResult(
+                is_valid=not errors,
+                errors=errors,
+                warnings=warnings,
+                metadata={
+                    "mode": self.mode,
+                    "duration_ms": duration_ms,
+                    "checks_performed": validator._get_checks_performed(self.mode),
+                    "changed_sections": sorted(changed),
+                    "rechecked": rechecked,
+                },
+            )
+
+    def _update_graph(self, state_graph: StateGraph) -> str:
+        """
+        Bring the graph analysis up to date with a changed graph structure.
+
+        Returns:
+            Name of the pass that ran: "graph:incremental" when the analysis
+            was edited, or "graph" when it was rebuilt (first version, new
+            initial state, or many states changed)
+        """
+        graph = self._graph
+        declared = set(graph.states) if graph is not None else set()
+        names = {state.name for state in state_graph.states}
+        removed = declared - names
+        edited = [
+            state
+            for state in state_graph.states
+            if state.name not in declared
+            or _targets(state.transitions) != _targets(graph.transitions(state.name))
+        ]
+        if (
+            graph is None
+            or graph.initial != state_graph.initial
+            or len(removed) + len(edited) > max(_REBUILD_MIN_STATES, len(names) // 4)
+        ):
+            self._graph = IncrementalGraphAnalysis(
+                state_graph, analyzer=self.validator.graph_analyzer
+            )
+            return "graph"
+
+        for name in removed:
+            graph.remove_state(name)
+        for state in edited:
+            if state.name not in declared:
+                graph.add_state(state.name)
+        # Removing states also removed the transitions into them
+        for state in state_graph.states:
+            if _targets(state.transitions) != _targets(graph.transitions(state.name)):
+                graph.set_transitions(state.name, state.transitions)
+        return "graph:incremental"
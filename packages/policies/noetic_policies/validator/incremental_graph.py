@@ -0,0 +1,718 @@
+"""Graph analysis kept up to date under state and transition insertions and deletions."""
+
+import heapq
+import math
+from collections.abc import Callable, Iterable
+
+import numpy as np
+
+from noetic_policies.models import GoalState, GraphAnalysisResult, TemporalBounds, Transition
+from noetic_policies.models.state_graph import State, StateGraph
+from noetic_policies.validator.condensation import Condensation
+from noetic_policies.validator.graph_analyzer import GraphAnalyzer
+
+__all__ = ["IncrementalGraphAnalysis"]
+
+
+class _ShortestPathTree:
+    """
+    Single-source shortest paths maintained under edge changes.
+
+    When an edge is added or gets cheaper, the distances it improves are
+    propagated Dijkstra-style from its target. When a tree edge is removed
+    or gets more expensive, only the subtree below it can change: those
+    distances are dropped and recomputed from the best edges entering the
+    subtree from the rest of the tree (a simplified Ramalingam-Reps update).
+    """
+
+    def __init__(
+        self, succ: dict[str, dict[str, float]], pred: dict[str, dict[str, float]], unit: bool
+    ):
+        """
+        Initialize an empty tree.
+
+        Args:
+            succ: Shared adjacency: node -> successor -> edge cost
+            pred: Shared reverse adjacency: node -> predecessor -> edge cost
+            unit: Count every edge as 1 (minimum steps) instead of its cost
+        """
+        self.succ = succ
+        self.pred = pred
+        self.unit = unit
+        self.dist: dict[str, float] = {}
+        self.parent: dict[str, str] = {}
+        self.children: dict[str, set[str]] = {}
+
+    def load(self, dist: dict[str, float], parent: dict[str, str]) -> None:
+        """Adopt the distances and predecessors of a complete search."""
+        self.dist = dist
+        self.parent = parent
+        self.children = {}
+        for node, via in parent.items():
+            self.children.setdefault(via, set()).add(node)
+
+    def reset(self, source: str) -> None:
+        """Recompute every distance from a source (nothing is reachable if it is no node)."""
+        self.dist, self.parent, self.children = {}, {}, {}
+        if source in self.succ:
+            self.dist[source] = 0
+            self._propagate([(0, source)])
+
+    def forget(self, node: str) -> None:
+        """Remove an isolated node."""
+        self.dist.pop(node, None)
+        via = self.parent.pop(node, None)
+        if via is not None:
+            self.children[via].discard(node)
+        self.children.pop(node, None)
+
+    def edge_improved(self, u: str, v: str) -> None:
+        """Update distances after edge u -> v was added or got cheaper."""
+        d = self.dist.get(u)
+        if d is None:
+            return
+        candidate = d + (1 if self.unit else self.succ[u][v])
+        if candidate < self.dist.get(v, math.inf):
+            self.dist[v] = candidate
+            self._attach(v, u)
+            self._propagate([(candidate, v)])
+
+    def edge_worsened(self, u: str, v: str) -> None:
+        """Update distances after edge u -> v was removed or got more expensive."""
+        if self.parent.get(v) != u:
+            return
+
+        # Drop the subtree below the edge; no other distance depended on it
+        affected = [v]
+        i = 0
+        while i < len(affected):
+            affected.extend(self.children.pop(affected[i], ()))
+            i += 1
+        self.children[u].discard(v)
+        for node in affected:
+            del self.dist[node]
+            del self.parent[node]
+
+        # Re-enter the subtree through its cheapest edges from the rest of the tree
+        heap = []
+        for node in affected:
+            best, via = math.inf, None
+            for p, cost in self.pred[node].items():
+                d = self.dist.get(p)
+                if d is not None:
+                    candidate = d + (1 if self.unit else cost)
+                    if candidate < best:
+                        best, via = candidate, p
+            if via is not None:
+                self.dist[node] = best
+                self._attach(node, via)
+                heap.append((best, node))
+        self._propagate(heap)
+
+    def _attach(self, node: str, via: str) -> None:
+        previous = self.parent.get(node)
+        if previous is not None:
+            self.children[previous].discard(node)
+        self.parent[node] = via
+        self.children.setdefault(via, set()).add(node)
+
+    def _propagate(self, heap: list[tuple[float, str]]) -> None:
+        heapq.heapify(heap)
+        dist = self.dist
+        while heap:
+            d, node = heapq.heappop(heap)
+            if d > dist.get(node, math.inf):
+                continue  # superseded entry
+            for target, cost in self.succ[node].items():
+                candidate = d + (1 if self.unit else cost)
+                if candidate < dist.get(target, math.inf):
+                    dist[target] = candidate
+                    self._attach(target, node)
+                    heapq.heappush(heap, (candidate, target))
+
+
+def _strongly_connected(nodes: set[str], succ: dict[str, dict[str, float]]) -> list[set[str]]:
+    """Tarjan's algorithm on the subgraph induced by nodes; sink components come first."""
+    index: dict[str, int] = {}
+    low: dict[str, int] = {}
+    stack: list[str] = []
+    on_stack: set[str] = set()
+    components: list[set[str]] = []
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(succ[root]))]
+        while work:
+            node, successors = work[-1]
+            for child in successors:
+                if child not in nodes:
+                    continue
+                if child not in index:
+                    index[child] = low[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(succ[child])))
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = set()
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.add(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+class IncrementalGraphAnalysis:
+    """
+    GraphAnalyzer.analyze() results kept up to date while a state graph is edited.
+
+    The graph is analyzed completely once; afterwards add_state(),
+    remove_state(), add_transition(), remove_transition() and
+    set_transitions() update only what an edit can affect:
+
+    - Reachability and minimum steps are a shortest-path tree with unit
+      weights, goal costs one with transition costs (see _ShortestPathTree).
+      An insertion searches only from the nodes it improves; a deletion
+      re-derives only the subtree below a removed tree edge.
+    - Strongly connected components form a DAG kept in topological order
+      (Pearce-Kelly): an edge consistent with the order costs O(1), others
+      search only the components ordered between its ends, and merge the
+      components on a new cycle. Deleting an edge inside a component
+      searches from both of its ends in turn and splits off only the states
+      that search shows to be disconnected (see _unlink()).
+    - Deadlocks (sink components with more than one state) are tracked as
+      components change.
+
+    result() then costs O(states) set operations instead of a full
+    analysis. Its unreachable states, deadlocks (as sets), goal
+    reachability, goal costs, minimum steps and temporally infeasible goals
+    equal those of GraphAnalyzer.analyze() on to_state_graph().
+    Predecessor maps cover every reachable state and may break ties
+    between equally short paths differently; deadlocks are listed in
+    topological order.
+
+    As in the analyzer, transitions to undeclared states create nodes
+    without transitions, and of several transitions between the same
+    states the last one's cost counts.
+    """
+
+    def __init__(
+        self,
+        state_graph: StateGraph,
+        goals: Iterable[GoalState] = (),
+        policy_temporal_bounds: TemporalBounds | None = None,
+        analyzer: GraphAnalyzer | None = None,
+    ):
+        """
+        Analyze a state graph completely.
+
+        Args:
+            state_graph: Graph to analyze (not modified; edits apply to a copy)
+            goals: Goal states with temporal bounds (may be reassigned later)
+            policy_temporal_bounds: Global temporal bounds (may be reassigned later)
+            analyzer: Analyzer for the initial analysis and temporal checks
+        """
+        self.analyzer = analyzer or GraphAnalyzer()
+        self.goals = list(goals)
+        self.policy_temporal_bounds = policy_temporal_bounds
+        self._initial = state_graph.initial
+        self._states: dict[str, State] = {state.name: state for state in state_graph.states}
+        self._transitions = {state.name: list(state.transitions) for state in state_graph.states}
+
+        # Effective edges, as in the compiled graph (the last duplicate's cost counts)
+        self._succ: dict[str, dict[str, float]] = {}
+        self._pred: dict[str, dict[str, float]] = {}
+        compiled = self.analyzer.compile(state_graph)
+        for name in compiled.csr.names:
+            self._succ[name] = {}
+            self._pred[name] = {}
+        for source, target, cost in compiled.csr.edges():
+            self._succ[source][target] = cost
+            self._pred[target][source] = cost
+
+        # Components; descending condensation ids are a topological order
+        condensation = self.analyzer.condensation(compiled)
+        count = condensation.num_components
+        self._component = dict(
+            zip(condensation.names, condensation.component.tolist(), strict=True)
+        )
+        self._members: dict[int, set[str]] = {c: set() for c in range(count)}
+        for name, c in self._component.items():
+            self._members[c].add(name)
+        self._order: dict[int, tuple[int, ...]] = {c: (count - 1 - c,) for c in range(count)}
+        self._dag_succ: dict[int, dict[int, int]] = {c: {} for c in range(count)}
+        self._dag_pred: dict[int, dict[int, int]] = {c: {} for c in range(count)}
+        for source, targets in self._succ.items():
+            for target in targets:
+                self._count(self._component[source], self._component[target])
+        self._next_component = count
+        self._next_order = count
+        self._deadlocks: set[int] = set()
+        for c in range(count):
+            self._refresh(c)
+
+        self._costs = _ShortestPathTree(self._succ, self._pred, unit=False)
+        self._steps = _ShortestPathTree(self._succ, self._pred, unit=True)
+        if self._initial in self._succ:
+            self._costs.load(*self.analyzer.shortest_costs(compiled, self._initial))
+            self._steps.load(*self.analyzer.shortest_steps(compiled, self._initial))
+
+    @property
+    def initial(self) -> str:
+        """Initial state name."""
+        return self._initial
+
+    @property
+    def states(self) -> list[str]:
+        """Declared state names."""
+        return list(self._states)
+
+    def transitions(self, name: str) -> list[Transition]:
+        """
+        Return a state's transitions.
+
+        Raises:
+            ValueError: If the state is not declared
+        """
+        self._require(name)
+        return list(self._transitions[name])
+
+    def add_state(self, name: str) -> None:
+        """
+        Declare a state without transitions.
+
+        Raises:
+            ValueError: If the state is already declared
+        """
+        if name in self._states:
+            raise ValueError(f"State '{name}' already exists")
+        self._states[name] = State(name=name)
+        self._transitions[name] = []
+        self._add_node(name)
+
+    def remove_state(self, name: str) -> None:
+        """
+        Remove a state with its transitions and the transitions into it.
+
+        Raises:
+            ValueError: If the state is not declared
+        """
+        self._require(name)
+        self.set_transitions(name, [])
+        for source in list(self._pred[name]):
+            self.set_transitions(source, [t for t in self._transitions[source] if t.to != name])
+        del self._states[name]
+        del self._transitions[name]
+        self._drop_node(name)
+
+    def add_transition(self, source: str, target: str, cost: float = 1.0) -> None:
+        """
+        Add a transition (to a new node if target is not declared).
+
+        Raises:
+            ValueError: If source is not declared
+        """
+        self._require(source)
+        self._transitions[source].append(Transition(to=target, cost=cost))
+        self._add_node(target)
+        self._update_edge(source, target)
+
+    def remove_transition(self, source: str, target: str) -> None:
+        """
+        Remove the last transition from source to target.
+
+        Raises:
+            ValueError: If source is not declared or has no such transition
+        """
+        self._require(source)
+        transitions = self._transitions[source]
+        for i in range(len(transitions) - 1, -1, -1):
+            if transitions[i].to == target:
+                del transitions[i]
+                break
+        else:
+            raise ValueError(f"No transition from '{source}' to '{target}'")
+        self._update_edge(source, target)
+        self._collect(target)
+
+    def set_transitions(self, name: str, transitions: Iterable[Transition]) -> None:
+        """
+        Replace all transitions of a state.
+
+        Raises:
+            ValueError: If the state is not declared
+        """
+        self._require(name)
+        old_targets = {t.to: None for t in self._transitions[name]}
+        self._transitions[name] = list(transitions)
+        new_targets = {t.to: None for t in self._transitions[name]}
+        for target in new_targets:
+            self._add_node(target)
+        for target in {**old_targets, **new_targets}:
+            self._update_edge(name, target)
+        for target in old_targets.keys() - new_targets.keys():
+            self._collect(target)
+
+    def result(self, condensation: bool = False) -> GraphAnalysisResult:
+        """
+        Return the analysis of the current graph.
+
+        Args:
+            condensation: Also build the condensation DAG (O(states + transitions))
+
+        Returns:
+            GraphAnalysisResult, as GraphAnalyzer.analyze() would compute it
+        """
+        reached = self._steps.dist
+        costs = self._costs.dist
+        goal_names = [goal.name for goal in self.goals]
+        goal_min_steps = {name: int(reached[name]) for name in goal_names if name in reached}
+        infeasible = self.analyzer._check_temporal_feasibility(
+            goal_min_steps, self.goals, self.policy_temporal_bounds
+        )
+        deadlocks = sorted(self._deadlocks, key=self._order.__getitem__)
+        return GraphAnalysisResult(
+            unreachable_states=self._states.keys() - reached.keys() - {self._initial},
+            deadlock_sccs=[set(self._members[c]) for c in deadlocks],
+            goal_reachable=any(name in reached for name in goal_names),
+            goal_costs={name: costs[name] for name in goal_names if name in costs},
+            goal_min_steps=goal_min_steps,
+            temporally_infeasible_goals=infeasible,
+            cost_predecessors=dict(self._costs.parent),
+            step_predecessors=dict(self._steps.parent),
+            condensation=self.condensation() if condensation else None,
+        )
+
+    def condensation(self) -> Condensation:
+        """Build the condensation DAG of the current graph."""
+        names = list(self._succ)
+        index = {name: i for i, name in enumerate(names)}
+        ranked = sorted(self._members, key=self._order.__getitem__, reverse=True)
+        ids = {c: i for i, c in enumerate(ranked)}
+        component = np.fromiter(
+            (ids[self._component[name]] for name in names), dtype=np.int32, count=len(names)
+        )
+        sources = np.fromiter(
+            (index[u] for u, targets in self._succ.items() for _ in targets), dtype=np.int32
+        )
+        targets = np.fromiter(
+            (index[v] for targets in self._succ.values() for v in targets), dtype=np.int32
+        )
+        return Condensation.from_labels(names, component, len(ranked), sources, targets, index)
+
+    def to_state_graph(self) -> StateGraph:
+        """Return the current graph as a StateGraph."""
+        states = [
+            state.model_copy(update={"transitions": list(self._transitions[name])})
+            for name, state in self._states.items()
+        ]
+        return StateGraph(initial=self._initial, states=states)
+
+    def _require(self, name: str) -> None:
+        if name not in self._states:
+            raise ValueError(f"Unknown state: {name}")
+
+    def _add_node(self, name: str) -> None:
+        """Add a node without edges in a component of its own, unless it exists."""
+        if name in self._succ:
+            return
+        self._succ[name] = {}
+        self._pred[name] = {}
+        self._new_component({name}, (self._next_order,))
+        self._next_order += 1
+        if name == self._initial:
+            self._costs.reset(name)
+            self._steps.reset(name)
+
+    def _drop_node(self, name: str) -> None:
+        """Remove a node that has no edges left."""
+        c = self._component.pop(name)
+        del self._members[c], self._order[c], self._dag_succ[c], self._dag_pred[c]
+        self._deadlocks.discard(c)
+        del self._succ[name], self._pred[name]
+        self._costs.forget(name)
+        self._steps.forget(name)
+
+    def _collect(self, name: str) -> None:
+        """Remove an undeclared node once no transition leads to it."""
+        if name not in self._states and name in self._succ and not self._pred[name]:
+            self._drop_node(name)
+
+    def _update_edge(self, u: str, v: str) -> None:
+        """Re-derive edge u -> v from u's transitions and propagate any change."""
+        new: float | None = None
+        for transition in self._transitions[u]:
+            if transition.to == v:
+                new = transition.cost
+        old = self._succ[u].get(v)
+        if new == old:
+            return
+        if new is None:
+            del self._succ[u][v], self._pred[v][u]
+        else:
+            self._succ[u][v] = self._pred[v][u] = new
+
+        if old is None:
+            self._link(u, v)
+            self._steps.edge_improved(u, v)
+            self._costs.edge_improved(u, v)
+        elif new is None:
+            self._unlink(u, v)
+            self._steps.edge_worsened(u, v)
+            self._costs.edge_worsened(u, v)
+        elif new < old:
+            self._costs.edge_improved(u, v)
+        else:
+            self._costs.edge_worsened(u, v)
+
+    def _new_component(self, members: set[str], order: tuple[int, ...]) -> int:
+        c = self._next_component
+        self._next_component += 1
+        self._members[c] = members
+        for node in members:
+            self._component[node] = c
+        self._order[c] = order
+        self._dag_succ[c] = {}
+        self._dag_pred[c] = {}
+        return c
+
+    def _count(self, a: int, b: int) -> None:
+        """Count one more edge from component a to component b."""
+        if a != b:
+            count = self._dag_succ[a].get(b, 0) + 1
+            self._dag_succ[a][b] = self._dag_pred[b][a] = count
+
+    def _refresh(self, c: int) -> None:
+        """Track whether a component is a deadlock."""
+        if not self._dag_succ[c] and len(self._members[c]) > 1:
+            self._deadlocks.add(c)
+        else:
+            self._deadlocks.discard(c)
+
+    def _link(self, u: str, v: str) -> None:
+        """Update the components for a new edge u -> v."""
+        cu, cv = self._component[u], self._component[v]
+        if cu == cv:
+            return
+        self._count(cu, cv)
+        if self._dag_succ[cu][cv] > 1:
+            return
+        self._refresh(cu)
+        if self._order[cu] > self._order[cv]:
+            self._reorder(cu, cv)
+
+    def _reorder(self, cu: int, cv: int) -> None:
+        """Restore the topological order after adding cu -> cv against it (Pearce-Kelly)."""
+        order = self._order
+        lower, upper = order[cv], order[cu]
+        forward = self._search(cv, self._dag_succ, lambda c: order[c] <= upper)
+        backward = self._search(cu, self._dag_pred, lambda c: order[c] >= lower)
+        # Components reachable from cv that reach cu now form a cycle with the new edge
+        cycle = forward & backward
+        positions = sorted(order[c] for c in forward | backward)
+        before = sorted(backward - cycle, key=order.__getitem__)
+        after = sorted(forward - cycle, key=order.__getitem__)
+        # Components only move towards the new edge's ends, so edges from
+        # components outside the search still respect the order
+        for c, position in zip(before, positions, strict=False):
+            order[c] = position
+        for c, position in zip(after, positions[len(positions) - len(after) :], strict=True):
+            order[c] = position
+        if cycle:
+            order[self._merge(cycle)] = positions[len(before)]
+
+    def _search(
+        self, start: int, edges: dict[int, dict[int, int]], within: Callable[[int], bool]
+    ) -> set[int]:
+        seen = {start}
+        stack = [start]
+        while stack:
+            for c in edges[stack.pop()]:
+                if c not in seen and within(c):
+                    seen.add(c)
+                    stack.append(c)
+        return seen
+
+    def _merge(self, components: set[int]) -> int:
+        """Merge components into the largest of them and return its id."""
+        survivor = max(components, key=lambda c: len(self._members[c]))
+        out: dict[int, int] = {}
+        into: dict[int, int] = {}
+        for c in components:
+            for d, count in self._dag_succ.pop(c).items():
+                if d not in components:
+                    out[d] = out.get(d, 0) + count
+                    del self._dag_pred[d][c]
+            for d, count in self._dag_pred.pop(c).items():
+                if d not in components:
+                    into[d] = into.get(d, 0) + count
+                    del self._dag_succ[d][c]
+        self._dag_succ[survivor] = out
+        self._dag_pred[survivor] = into
+        for d, count in out.items():
+            self._dag_pred[d][survivor] = count
+        for d, count in into.items():
+            self._dag_succ[d][survivor] = count
+
+        members = self._members[survivor]
+        for c in components - {survivor}:
+            for node in self._members.pop(c):
+                self._component[node] = survivor
+                members.add(node)
+            del self._order[c]
+            self._deadlocks.discard(c)
+        self._refresh(survivor)
+        return survivor
+
+    def _unlink(self, u: str, v: str) -> None:
+        """Update the components after edge u -> v was removed."""
+        cu, cv = self._component[u], self._component[v]
+        if cu != cv:
+            self._uncount(cu, cv)
+            self._refresh(cu)
+            return
+        if u == v:
+            return
+
+        # Within the old component everything still reaches u and v still
+        # reaches everything (no shortest path to u or from v used the edge),
+        # so it stays strongly connected iff u still reaches v. Search forward
+        # from u and backward from v in turn: meeting settles it; a search that
+        # runs out first has explored a closed set of states that is no longer
+        # connected to the other end, and only that set is split off.
+        members = self._members[cu]
+        forward = _Search(u, self._succ, members)
+        backward = _Search(v, self._pred, members)
+        closed = _race(forward, backward)
+        if closed is None:
+            return
+        if closed is forward:
+            # States that must still reach v, searching along transitions
+            root, out, into, downstream = backward, self._succ, self._pred, True
+        else:
+            # The same with transitions reversed: states u must still reach
+            root, out, into, downstream = forward, self._pred, self._succ, False
+
+        # Paths into a split-off set used to leave it only towards the root,
+        # so the states entering it must be shown to reach the root otherwise
+        pending = self._peel(cu, closed.seen, into, downstream)
+        while pending:
+            start = pending.pop()
+            if start not in members or start in root.seen:
+                continue
+            search = _Search(start, out, members)
+            closed = _race(search, root)
+            if closed is search:
+                pending.extend(self._peel(cu, search.seen, into, downstream))
+            elif closed is root:
+                # The root's search is complete: the states it missed cannot reach it
+                self._peel(cu, members - root.seen, into, downstream)
+                return
+
+    def _uncount(self, a: int, b: int) -> None:
+        """Count one edge less from component a to component b."""
+        count = self._dag_succ[a][b] - 1
+        if count:
+            self._dag_succ[a][b] = self._dag_pred[b][a] = count
+        else:
+            del self._dag_succ[a][b], self._dag_pred[b][a]
+
+    def _peel(
+        self, c: int, closed: set[str], into: dict[str, dict[str, float]], downstream: bool
+    ) -> list[str]:
+        """
+        Split a set of states closed under one edge direction off component c.
+
+        Args:
+            c: Component losing the states
+            closed: States no edge (in the search direction) leaves
+            into: Adjacency against the search direction
+            downstream: Whether the states follow c in topological order
+
+        Returns:
+            States of c with an edge (in the search direction) into closed
+        """
+        members = self._members[c]
+        entries = [w for x in closed for w in into[x] if w in members and w not in closed]
+        for x in closed:
+            for y in self._succ[x]:
+                if self._component[y] != c:
+                    self._uncount(c, self._component[y])
+            for w in self._pred[x]:
+                if self._component[w] != c:
+                    self._uncount(self._component[w], c)
+        members -= closed
+
+        # Tarjan finds sinks first; number c and the parts within c's position
+        parts = list(reversed(_strongly_connected(closed, self._succ)))
+        order = self._order[c]
+        sequence: list[int | None] = [None, *parts] if downstream else [*parts, None]
+        created = []
+        for i, part in enumerate(sequence):
+            if part is None:
+                self._order[c] = (*order, i)
+            else:
+                created.append(self._new_component(part, (*order, i)))
+        for x in closed:
+            own = self._component[x]
+            for y in self._succ[x]:
+                self._count(own, self._component[y])
+            for w in self._pred[x]:
+                if w not in closed:
+                    self._count(self._component[w], own)
+        self._refresh(c)
+        for part in created:
+            self._refresh(part)
+        return entries
+
+
+class _Search:
+    """A depth-first search within a set of states, advanced one state at a time."""
+
+    def __init__(self, start: str, edges: dict[str, dict[str, float]], within: set[str]):
+        self.edges = edges
+        self.within = within
+        self.seen = {start}
+        self.stack = [start]
+
+    def step(self, other: set[str]) -> bool:
+        """Expand one state; return whether a state in other was found."""
+        met = False
+        for node in self.edges[self.stack.pop()]:
+            if node not in self.seen and node in self.within:
+                # Expanded completely: the search may go on after meeting
+                met = met or node in other
+                self.seen.add(node)
+                self.stack.append(node)
+        return met
+
+
+def _race(a: _Search, b: _Search) -> _Search | None:
+    """
+    Advance two searches in turn until they meet or one runs out of states.
+
+    Returns:
+        None if they met, otherwise the search that ran out
+    """
+    while True:
+        if not a.stack:
+            return a
+        if a.step(b.seen):
+            return None
+        if not b.stack:
+            return b
+        if b.step(a.seen):
+            return None
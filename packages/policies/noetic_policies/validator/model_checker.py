@@ -0,0 +1,522 @@
+"""Explicit-state model checking over concrete variable valuations."""
+
+import contextlib
+import struct
+import tempfile
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from noetic_policies.cel_evaluator import CELEvaluationError, CELEvaluator, CompiledExpression
+from noetic_policies.cel_evaluator.compiler import compile_node
+from noetic_policies.cel_evaluator.parser import Node, substitute
+from noetic_policies.cel_evaluator.vectorized import enum_values
+from noetic_policies.models import Counterexample, ModelCheckResult, TraceStep
+from noetic_policies.models.policy import Policy
+from noetic_policies.validator.frontier import SpillingFrontier, StateCodec, TracePointers
+from noetic_policies.validator.visited import BitstateSet, HashedStateSet, state_hash
+
+__all__ = ["ModelChecker", "initial_valuation"]
+
+# Value of each schema type when a policy does not specify one
+_TYPE_DEFAULTS: dict[str, Any] = {"number": 0, "boolean": False, "string": "", "address": ""}
+
+# A concrete state: (graph state id, values in state_schema order)
+ConcreteState = tuple[int, tuple[Any, ...]]
+
+VISITED_SETS = ("exact", "bitstate")
+
+# Record headers of queued states: frontier (number) and candidate (parent, transition)
+_FRONTIER = struct.Struct("<q")
+_CANDIDATE = struct.Struct("<qi")
+
+# Candidates deduplicated per visited-set batch
+_BATCH = 1 << 16
+
+
+def _batches(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Yield consecutive lists of up to size items."""
+    batch: list[Any] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def initial_valuation(
+    policy: Policy, initial_values: Mapping[str, Any] | None = None
+) -> dict[str, Any]:
+    """
+    Build the initial concrete valuation of a policy's state variables.
+
+    Values come from initial_values, then policy.metadata["initial_values"],
+    then a per-type default (0, False, "", or the first enum member).
+
+    Args:
+        policy: Policy whose state_schema is valued
+        initial_values: Explicit values, overriding the policy's
+
+    Returns:
+        Value for every state_schema variable, in schema order
+
+    Raises:
+        ValueError: If a given value names a variable missing from state_schema
+    """
+    given = {**policy.metadata.get("initial_values", {}), **(initial_values or {})}
+    unknown = set(given) - set(policy.state_schema)
+    if unknown:
+        raise ValueError(f"Initial values for undefined variables: {sorted(unknown)}")
+
+    values: dict[str, Any] = {}
+    for name, field_type in policy.state_schema.items():
+        if name in given:
+            values[name] = given[name]
+        else:
+            members = enum_values(field_type)
+            values[name] = members[0] if members else _TYPE_DEFAULTS.get(field_type)
+    return values
+
+
+@dataclass(frozen=True)
+class _Transition:
+    """A transition compiled for execution on concrete valuations."""
+
+    id: int
+    label: str  # "source->target"
+    source: int
+    target: int
+    guards: tuple[CompiledExpression, ...]
+    effects: tuple[tuple[str, CompiledExpression], ...]
+
+
+class ModelChecker:
+    """
+    Explores the product of graph states and concrete state_schema valuations.
+
+    Starting from the initial state and valuation, every transition whose
+    preconditions (and the target state's preconditions) hold is taken, its
+    effects are applied in order (each effect sees the previous ones), and
+    every invariant is checked on each newly reached concrete state. The
+    search is breadth-first, so counterexample traces are shortest.
+
+    Visited states are kept as 64-bit fingerprints (see HashedStateSet) or,
+    for state spaces beyond memory, in a fixed-size bitstate set (see
+    BitstateSet). Each state additionally costs 12 bytes for its parent
+    pointer and the transition that reached it, from which traces are
+    replayed. The frontier holds the current BFS level only and can spill
+    packed states to disk (see SpillingFrontier), as can the pointers.
+    """
+
+    def __init__(
+        self,
+        policy: Policy,
+        initial_values: Mapping[str, Any] | None = None,
+        max_depth: int | None = None,
+        max_states: int = 1_000_000,
+        max_counterexamples: int = 1,
+        workers: int = 1,
+        visited: str = "exact",
+        bits_per_state: int = 16,
+        spill_directory: str | None = None,
+        segment_items: int = 1 << 16,
+    ):
+        """
+        Initialize model checker and compile the policy's expressions.
+
+        Args:
+            policy: Policy to check
+            initial_values: Initial variable values (see initial_valuation)
+            max_depth: Maximum number of transitions from the initial state
+            max_states: Maximum number of distinct concrete states to visit
+            max_counterexamples: Stop after this many property violations
+            workers: Number of processes exploring the state space (see explore_parallel)
+            visited: Visited-state set - "exact" (64-bit fingerprints) or "bitstate"
+                (Bloom filter of bits_per_state * max_states bits)
+            bits_per_state: Bitstate memory per state in max_states
+            spill_directory: Directory for frontier segments and trace pointers
+                (None: keep them in memory)
+            segment_items: Queued states per frontier segment file
+
+        Raises:
+            CELSyntaxError: If an expression or effect cannot be compiled
+            ValueError: If an effect assigns, or an initial value names, an undefined variable,
+                or the visited set is unknown
+        """
+        if visited not in VISITED_SETS:
+            raise ValueError(f"Unknown visited set '{visited}', expected one of {VISITED_SETS}")
+        self.policy = policy
+        self.max_depth = max_depth
+        self.max_states = max_states
+        self.max_counterexamples = max_counterexamples
+        self.workers = workers
+        self.visited = visited
+        self.bits_per_state = bits_per_state
+        self.spill_directory = spill_directory
+        self.segment_items = segment_items
+        self.variables = tuple(policy.state_schema)
+        self.initial_values = initial_valuation(policy, initial_values)
+        self._codec = StateCodec(policy.state_schema)
+
+        self._evaluator = CELEvaluator(mode=policy.cel_mode)
+        # Constraint names used in predicates stand for the constraint's expression
+        self._bindings: dict[str, Node] = {}
+        for constraint in policy.constraints:
+            if constraint.name not in policy.state_schema:
+                ast = self._evaluator.compile(constraint.expr).ast
+                assert ast is not None
+                self._bindings[constraint.name] = ast
+
+        graph = policy.state_graph
+        self.state_names = [state.name for state in graph.states]
+        index = {name: i for i, name in enumerate(self.state_names)}
+        entry_guards = {state.name: state.preconditions for state in graph.states}
+        for state in graph.states:
+            for transition in state.transitions:
+                if transition.to not in index:
+                    # Undeclared targets behave as terminal states (as in graph analysis)
+                    index[transition.to] = len(self.state_names)
+                    self.state_names.append(transition.to)
+        self._index = index
+
+        self.transitions: list[_Transition] = []
+        self._outgoing: list[list[_Transition]] = [[] for _ in self.state_names]
+        for state in graph.states:
+            for transition in state.transitions:
+                guards = [
+                    self.compile_predicate(expr)
+                    for expr in [*transition.preconditions, *entry_guards.get(transition.to, [])]
+                ]
+                effects = []
+                for effect in transition.effects:
+                    target, rhs = self._evaluator.compile_effect(effect)
+                    if target not in policy.state_schema:
+                        raise ValueError(
+                            f"Effect '{effect}' assigns '{target}', which is not in state_schema"
+                        )
+                    effects.append((target, rhs))
+                compiled = _Transition(
+                    id=len(self.transitions),
+                    label=f"{state.name}->{transition.to}",
+                    source=index[state.name],
+                    target=index[transition.to],
+                    guards=tuple(guards),
+                    effects=tuple(effects),
+                )
+                self.transitions.append(compiled)
+                self._outgoing[index[state.name]].append(compiled)
+
+        self._invariants = [
+            (invariant.name or f"invariant[{i}]", self.compile_predicate(invariant.expr))
+            for i, invariant in enumerate(policy.invariants)
+        ]
+        self._goal_conditions: dict[int, list[CompiledExpression]] = {}
+        for goal in policy.goal_states:
+            if goal.name in index:
+                conditions = [self.compile_predicate(expr) for expr in goal.conditions]
+                self._goal_conditions[index[goal.name]] = conditions
+
+    def compile_predicate(self, expr: str) -> CompiledExpression:
+        """Compile a predicate with constraint names replaced by their expressions."""
+        compiled = self._evaluator.compile(expr)
+        assert compiled.ast is not None
+        if not self._bindings or not compiled.variables & self._bindings.keys():
+            return compiled
+        ast = substitute(compiled.ast, self._bindings)
+        return CompiledExpression(
+            source=expr, mode=compiled.mode, program=compile_node(ast), ast=ast
+        )
+
+    @property
+    def initial_state(self) -> ConcreteState:
+        """Initial graph state id and valuation."""
+        values = tuple(self.initial_values[name] for name in self.variables)
+        return self._index[self.policy.state_graph.initial], values
+
+    def fingerprint(self, state: ConcreteState) -> int:
+        """Return the 64-bit fingerprint of a concrete state (see state_hash())."""
+        return state_hash(self._codec.encode(state))
+
+    def context(self, values: tuple[Any, ...]) -> dict[str, Any]:
+        """Return the evaluation context for a valuation."""
+        return dict(zip(self.variables, values, strict=True))
+
+    def successors(self, state: ConcreteState) -> list[tuple[int, ConcreteState]]:
+        """
+        Compute the enabled transitions of a concrete state and their results.
+
+        Args:
+            state: Graph state id and valuation
+
+        Returns:
+            (transition id, successor state) per enabled transition
+
+        Raises:
+            CELEvaluationError: If a precondition or effect cannot be evaluated
+        """
+        graph_state, values = state
+        context = self.context(values)
+        result = []
+        for transition in self._outgoing[graph_state]:
+            try:
+                if not all(guard.evaluate(context) is True for guard in transition.guards):
+                    continue
+                if transition.effects:
+                    updated = dict(context)
+                    for target, rhs in transition.effects:
+                        updated[target] = rhs.evaluate(updated)
+                    next_values = tuple(updated[name] for name in self.variables)
+                else:
+                    next_values = values
+            except CELEvaluationError as e:
+                raise CELEvaluationError(f"Transition '{transition.label}': {e}") from e
+            result.append((transition.id, (transition.target, next_values)))
+        return result
+
+    def violated_invariant(self, values: tuple[Any, ...]) -> str | None:
+        """
+        Return the name of the first invariant a valuation violates.
+
+        Raises:
+            CELEvaluationError: If an invariant cannot be evaluated
+        """
+        if not self._invariants:
+            return None
+        context = self.context(values)
+        for name, invariant in self._invariants:
+            if invariant.evaluate(context) is not True:
+                return name
+        return None
+
+    def is_deadlock(self, state: ConcreteState) -> bool:
+        """
+        Check whether a state without enabled transitions is a deadlock.
+
+        States without outgoing transitions in the graph, and goal states whose
+        conditions hold, are legitimate ends of an execution.
+
+        Raises:
+            CELEvaluationError: If a goal condition cannot be evaluated
+        """
+        return bool(self._outgoing[state[0]]) and not self.goal_satisfied(state)
+
+    def visited_set(self, partitions: int = 1) -> HashedStateSet | BitstateSet:
+        """
+        Create the visited-state set selected by the visited option.
+
+        Args:
+            partitions: Number of sets the states are split across
+
+        Returns:
+            Exact fingerprint set, or a bitstate set sized for max_states / partitions
+        """
+        if self.visited == "bitstate":
+            return BitstateSet(-(-self.max_states // partitions), self.bits_per_state)
+        return HashedStateSet()
+
+    def goal_satisfied(self, state: ConcreteState) -> bool:
+        """
+        Check whether a concrete state is a goal state whose conditions hold.
+
+        Raises:
+            CELEvaluationError: If a goal condition cannot be evaluated
+        """
+        graph_state, values = state
+        conditions = self._goal_conditions.get(graph_state)
+        if conditions is None:
+            return False
+        context = self.context(values)
+        return all(condition.evaluate(context) is True for condition in conditions)
+
+    def check(self) -> ModelCheckResult:
+        """
+        Explore reachable concrete states breadth-first within the budgets.
+
+        Each level is streamed through two FIFO queues: the frontier is
+        expanded into a queue of candidate successors, which is then
+        deduplicated in batches into the next frontier. With spill_directory
+        set, both queues and the trace pointers live on disk, so memory is
+        bounded by the visited set plus one segment per queue.
+
+        Returns:
+            ModelCheckResult with exploration statistics and counterexamples
+        """
+        with contextlib.ExitStack() as stack:
+            directory = None
+            if self.spill_directory is not None:
+                directory = stack.enter_context(
+                    tempfile.TemporaryDirectory(prefix="noetic-mc-", dir=self.spill_directory)
+                )
+            if self.workers > 1:
+                # Import here to avoid circular dependency
+                from noetic_policies.validator.parallel import explore_parallel
+
+                return explore_parallel(self, self.workers, directory)
+
+            pointers = TracePointers(directory)
+            stack.callback(pointers.close)
+            return self._explore(pointers, directory)
+
+    def _queue(self, directory: str | None, with_transition: bool) -> SpillingFrontier:
+        """Create a frontier (number, state) or candidate (parent, transition, state) queue."""
+        codec = self._codec
+        if with_transition:
+            header = _CANDIDATE
+
+            def encode(item: tuple) -> bytes:
+                return header.pack(item[0], item[1]) + codec.encode(item[2])
+
+            def decode(data: memoryview) -> tuple:
+                return (*header.unpack_from(data), codec.decode(data[header.size :]))
+
+        else:
+            header = _FRONTIER
+
+            def encode(item: tuple) -> bytes:
+                return header.pack(item[0]) + codec.encode(item[1])
+
+            def decode(data: memoryview) -> tuple:
+                return header.unpack_from(data)[0], codec.decode(data[header.size :])
+
+        return SpillingFrontier(encode, decode, directory, self.segment_items)
+
+    def _explore(self, pointers: TracePointers, directory: str | None) -> ModelCheckResult:
+        """Breadth-first exploration recording parent pointers in pointers."""
+        visited = self.visited_set()
+        counterexamples: list[Counterexample] = []
+        spilled = 0
+
+        def report(number: int, kind: str, message: str, name: str | None = None) -> bool:
+            trace = self.trace(number, pointers)
+            counterexamples.append(Counterexample(kind, message, trace, name))
+            return len(counterexamples) >= self.max_counterexamples
+
+        def result(depth: int, complete: bool) -> ModelCheckResult:
+            return ModelCheckResult(
+                states_explored=len(pointers),
+                transitions_explored=transitions,
+                max_depth=depth,
+                complete=complete and not counterexamples,
+                counterexamples=counterexamples,
+                visited_bytes=visited.nbytes + pointers.nbytes,
+                omission_probability=visited.omission_probability,
+                spilled_bytes=spilled,
+            )
+
+        transitions = 0
+        initial = self.initial_state
+        visited.add_many(np.array([self.fingerprint(initial)], dtype=np.uint64))
+        pointers.append(-1, -1)
+        frontier = self._queue(directory, with_transition=False)
+        try:
+            name = self.violated_invariant(initial[1])
+        except CELEvaluationError as e:
+            if report(0, "error", str(e)):
+                return result(0, False)
+        else:
+            if name is not None:
+                if report(0, "invariant", f"Invariant '{name}' violated", name):
+                    return result(0, False)
+            else:
+                frontier.append((0, initial))
+
+        depth = 0
+        while len(frontier):
+            if self.max_depth is not None and depth >= self.max_depth:
+                return result(depth, False)
+
+            candidates = self._queue(directory, with_transition=True)
+            for number, state in frontier.drain():
+                try:
+                    successors = self.successors(state)
+                    if not successors and self.is_deadlock(state):
+                        message = f"No enabled transitions in state '{self.state_names[state[0]]}'"
+                        if report(number, "deadlock", message):
+                            return result(depth, False)
+                        continue
+                except CELEvaluationError as e:
+                    if report(number, "error", str(e)):
+                        return result(depth, False)
+                    continue
+                transitions += len(successors)
+                for transition_id, successor in successors:
+                    candidates.append((number, transition_id, successor))
+            spilled += frontier.spilled_bytes
+
+            if not len(candidates):
+                break
+            depth += 1
+            frontier = self._queue(directory, with_transition=False)
+            for batch in _batches(candidates.drain(), _BATCH):
+                fingerprints = np.fromiter(
+                    (self.fingerprint(successor) for _, _, successor in batch),
+                    dtype=np.uint64,
+                    count=len(batch),
+                )
+                new = visited.add_many(fingerprints).tolist()
+                for (parent, transition_id, successor), is_new in zip(batch, new, strict=True):
+                    if not is_new:
+                        continue
+                    if len(pointers) >= self.max_states:
+                        return result(depth, False)
+                    number = len(pointers)
+                    pointers.append(parent, transition_id)
+                    try:
+                        name = self.violated_invariant(successor[1])
+                    except CELEvaluationError as e:
+                        if report(number, "error", str(e)):
+                            return result(depth, False)
+                        continue
+                    if name is not None:
+                        if report(number, "invariant", f"Invariant '{name}' violated", name):
+                            return result(depth, False)
+                        continue
+                    frontier.append((number, successor))
+            spilled += candidates.spilled_bytes
+
+        return result(depth, True)
+
+    def trace(self, number: int, pointers: TracePointers) -> list[TraceStep]:
+        """
+        Rebuild the concrete trace to a visited state by replaying its transitions.
+
+        Args:
+            number: Visited state number
+            pointers: Parent number and reaching transition per visited state
+
+        Returns:
+            Steps from the initial state to the visited state
+        """
+        path: list[int] = []
+        while number > 0:
+            number, transition_id = pointers[number]
+            path.append(transition_id)
+        path.reverse()
+        return self.replay(path)
+
+    def replay(self, path: list[int]) -> list[TraceStep]:
+        """
+        Replay transitions from the initial state, recording each concrete state.
+
+        Args:
+            path: Transition ids, in execution order
+
+        Returns:
+            Steps from the initial state through each transition
+        """
+        graph_state, values = self.initial_state
+        steps = [TraceStep(self.state_names[graph_state], self.context(values))]
+        for transition_id in path:
+            transition = self.transitions[transition_id]
+            context = self.context(values)
+            for target, rhs in transition.effects:
+                context[target] = rhs.evaluate(context)
+            values = tuple(context[name] for name in self.variables)
+            steps.append(
+                TraceStep(self.state_names[transition.target], dict(context), transition.label)
+            )
+        return steps
@@ -0,0 +1,324 @@
+"""Multi-process explicit-state exploration over hash-partitioned states."""
+
+import contextlib
+import multiprocessing
+import pickle
+from multiprocessing.connection import Connection
+from multiprocessing.queues import Queue
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from noetic_policies.cel_evaluator import CELEvaluationError
+from noetic_policies.models import Counterexample, ModelCheckResult
+from noetic_policies.validator.frontier import TracePointers
+
+if TYPE_CHECKING:
+    from noetic_policies.validator.model_checker import ConcreteState, ModelChecker
+
+__all__ = ["explore_parallel"]
+
+# A successor on its way to its owner: (parent number, transition id, fingerprint, state)
+_Candidate = tuple[int, int, int, "ConcreteState"]
+
+
+class _Partition:
+    """
+    The states owned by one worker: those whose fingerprint is the worker id modulo the pool size.
+
+    Each BFS level runs in two phases. "expand" computes the successors of
+    the partition's frontier and puts each successor into the inbox queue of
+    its owning partition. "insert" drains the partition's inbox, keeps the
+    first occurrence (by parent number, then transition id) of each unseen
+    state and checks its invariants; the coordinator then assigns global
+    numbers to the new states, which form the next frontier.
+    """
+
+    def __init__(self, checker: "ModelChecker", worker: int, inboxes: list[Queue]):
+        self.checker = checker
+        self.workers = len(inboxes)
+        self.inbox = inboxes[worker]
+        self.inboxes = inboxes
+        self.visited = checker.visited_set(self.workers)
+        self.pending: list[ConcreteState] = []
+
+    def insert(
+        self, payload: tuple[list[bytes], int]
+    ) -> tuple[np.ndarray, np.ndarray, list[tuple], int, float]:
+        """
+        Deduplicate incoming candidates and check invariants on the new ones.
+
+        Args:
+            payload: (pickled candidate lists from the coordinator, number of
+                candidate lists to take from the inbox)
+
+        Returns:
+            (parents, transitions, violations, visited_bytes, omission_probability) for
+            the new states in local order; violations are (local index, kind, message,
+            invariant name)
+        """
+        blobs, expected = payload
+        blobs = blobs + [self.inbox.get() for _ in range(expected)]
+        candidates: list[_Candidate] = [c for blob in blobs for c in pickle.loads(blob)]
+        candidates.sort(key=lambda c: (c[0], c[1]))
+        fingerprints = np.fromiter(
+            (c[2] for c in candidates), dtype=np.uint64, count=len(candidates)
+        )
+        new = self.visited.add_many(fingerprints).tolist()
+
+        self.pending = []
+        parents: list[int] = []
+        transitions: list[int] = []
+        violations: list[tuple] = []
+        for (parent, transition_id, _, state), is_new in zip(candidates, new, strict=True):
+            if not is_new:
+                continue
+            local = len(self.pending)
+            self.pending.append(state)
+            parents.append(parent)
+            transitions.append(transition_id)
+            try:
+                name = self.checker.violated_invariant(state[1])
+            except CELEvaluationError as e:
+                violations.append((local, "error", str(e), None))
+                continue
+            if name is not None:
+                violations.append((local, "invariant", f"Invariant '{name}' violated", name))
+        return (
+            np.asarray(parents, dtype=np.int64),
+            np.asarray(transitions, dtype=np.int32),
+            violations,
+            self.visited.nbytes,
+            self.visited.omission_probability,
+        )
+
+    def expand(self, numbers: np.ndarray) -> tuple[list[tuple], np.ndarray, int]:
+        """
+        Compute successors of the new states that were kept on the frontier.
+
+        Every partition's inbox receives exactly one candidate list.
+
+        Args:
+            numbers: Global state number per pending state (-1 if not expanded)
+
+        Returns:
+            (reports, counts, total): deadlock/error reports as (number, kind, message),
+            (number, successor count) rows, and the total number of successors
+        """
+        checker = self.checker
+        workers = self.workers
+        buckets: list[list[_Candidate]] = [[] for _ in range(workers)]
+        reports: list[tuple] = []
+        counts: list[tuple[int, int]] = []
+        for number, state in zip(numbers.tolist(), self.pending, strict=True):
+            if number < 0:
+                continue
+            try:
+                successors = checker.successors(state)
+                if not successors and checker.is_deadlock(state):
+                    name = checker.state_names[state[0]]
+                    reports.append(
+                        (number, "deadlock", f"No enabled transitions in state '{name}'")
+                    )
+                    continue
+            except CELEvaluationError as e:
+                reports.append((number, "error", str(e)))
+                continue
+            counts.append((number, len(successors)))
+            for transition_id, successor in successors:
+                fingerprint = checker.fingerprint(successor)
+                buckets[fingerprint % workers].append(
+                    (number, transition_id, fingerprint, successor)
+                )
+        self.pending = []
+        for inbox, bucket in zip(self.inboxes, buckets, strict=True):
+            inbox.put(pickle.dumps(bucket, protocol=pickle.HIGHEST_PROTOCOL))
+        total = sum(count for _, count in counts)
+        return reports, np.asarray(counts, dtype=np.int64).reshape(-1, 2), total
+
+
+def _serve(
+    checker: "ModelChecker", worker: int, inboxes: list[Queue], connection: Connection
+) -> None:
+    """Worker process loop: answer insert/expand requests until told to stop."""
+    partition = _Partition(checker, worker, inboxes)
+    while True:
+        command, payload = connection.recv()
+        if command == "stop":
+            # Candidates left in inboxes after an early stop are discarded
+            for inbox in inboxes:
+                inbox.cancel_join_thread()
+            break
+        try:
+            reply = getattr(partition, command)(payload)
+        except Exception as e:  # pragma: no cover - surfaced in the coordinator
+            connection.send(("failed", repr(e)))
+        else:
+            connection.send(("ok", reply))
+    connection.close()
+
+
+class _Pool:
+    """Worker processes, each owning one partition of the state space."""
+
+    def __init__(self, checker: "ModelChecker", workers: int):
+        # Fork shares the compiled checker and the hash seed that fingerprints depend on
+        context = multiprocessing.get_context("fork")
+        inboxes = [context.Queue() for _ in range(workers)]
+        self.connections: list[Connection] = []
+        self.processes = []
+        for worker in range(workers):
+            parent, child = context.Pipe()
+            process = context.Process(
+                target=_serve, args=(checker, worker, inboxes, child), daemon=True
+            )
+            process.start()
+            child.close()
+            self.connections.append(parent)
+            self.processes.append(process)
+
+    def map(self, command: str, payloads: list[Any]) -> list[Any]:
+        """Send one request to every worker and gather the replies in worker order."""
+        for connection, payload in zip(self.connections, payloads, strict=True):
+            connection.send((command, payload))
+        replies = []
+        for connection in self.connections:
+            status, reply = connection.recv()
+            if status != "ok":
+                raise RuntimeError(f"Model checking worker failed: {reply}")
+            replies.append(reply)
+        return replies
+
+    def close(self) -> None:
+        for connection in self.connections:
+            with contextlib.suppress(OSError):
+                connection.send(("stop", None))
+            connection.close()
+        for process in self.processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+
+def explore_parallel(
+    checker: "ModelChecker", workers: int, directory: str | None = None
+) -> ModelCheckResult:
+    """
+    Explore a checker's state space with a pool of worker processes.
+
+    States are partitioned across workers by fingerprint
+    (ModelChecker.fingerprint(), so every process agrees). Each level, every
+    worker expands the frontier states it owns and puts each successor into
+    the inbox queue of its owner, which deduplicates it and checks invariants.
+    The coordinator only sees the parent and transition of each new state and
+    assigns state numbers. New states are numbered
+    by (parent number, transition id), i.e. in the order a single process
+    discovers them, so statistics and counterexample traces are identical to
+    ModelChecker.check() with one worker. Levels end with a barrier, so
+    exploration terminates when a level produces no new states.
+
+    Args:
+        checker: Compiled model checker (its budgets apply)
+        workers: Number of worker processes
+        directory: Directory for the trace pointer file (None: keep in memory)
+
+    Returns:
+        ModelCheckResult equal to the single-process result
+
+    Raises:
+        ValueError: If the platform does not support the fork start method
+        RuntimeError: If a worker fails
+    """
+    pointers = TracePointers(directory)
+    counterexamples: list[Counterexample] = []
+    transitions = 0
+    visited_bytes = 0
+    omission_probability = 0.0
+
+    def report(number: int, kind: str, message: str, name: str | None = None) -> bool:
+        trace = checker.trace(number, pointers)
+        counterexamples.append(Counterexample(kind, message, trace, name))
+        return len(counterexamples) >= checker.max_counterexamples
+
+    def result(depth: int, complete: bool) -> ModelCheckResult:
+        return ModelCheckResult(
+            states_explored=len(pointers),
+            transitions_explored=transitions,
+            max_depth=depth,
+            complete=complete and not counterexamples,
+            counterexamples=counterexamples,
+            visited_bytes=visited_bytes + pointers.nbytes,
+            omission_probability=omission_probability,
+        )
+
+    initial = checker.initial_state
+    fingerprint = checker.fingerprint(initial)
+    inbox: list[tuple[list[bytes], int]] = [([], 0) for _ in range(workers)]
+    inbox[fingerprint % workers] = ([pickle.dumps([(-1, -1, fingerprint, initial)])], 0)
+
+    pool = _Pool(checker, workers)
+    try:
+        depth = 0
+        while True:
+            # Insert phase: number the new states exactly as one process would
+            replies = pool.map("insert", inbox)
+            visited_bytes = sum(reply[3] for reply in replies)
+            omission_probability = max(reply[4] for reply in replies)
+            new_parents = np.concatenate([reply[0] for reply in replies])
+            new_via = np.concatenate([reply[1] for reply in replies])
+            order = np.lexsort((new_via, new_parents))
+            rank = np.empty(len(order), dtype=np.int64)
+            rank[order] = np.arange(len(order))
+            offsets = np.cumsum([0] + [len(reply[0]) for reply in replies])
+
+            base = len(pointers)
+            keep = min(len(order), max(checker.max_states - base, 0))
+            violations = sorted(
+                (int(rank[offsets[w] + local]), kind, message, name)
+                for w, reply in enumerate(replies)
+                for local, kind, message, name in reply[2]
+            )
+            added = 0
+            for position, kind, message, name in violations:
+                if position >= keep:
+                    break
+                pointers.extend(
+                    new_parents[order[added : position + 1]].tolist(),
+                    new_via[order[added : position + 1]].tolist(),
+                )
+                added = position + 1
+                if report(base + position, kind, message, name):
+                    return result(depth, False)
+            pointers.extend(
+                new_parents[order[added:keep]].tolist(), new_via[order[added:keep]].tolist()
+            )
+            if keep < len(order):
+                return result(depth, False)
+
+            numbers = base + rank
+            for position, *_ in violations:
+                numbers[order[position]] = -1
+            frontier = [numbers[offsets[w] : offsets[w + 1]] for w in range(workers)]
+            if not any((part >= 0).any() for part in frontier):
+                return result(depth, True)
+            if checker.max_depth is not None and depth >= checker.max_depth:
+                return result(depth, False)
+
+            # Expand phase: deadlock and error reports in state-number order
+            replies = pool.map("expand", frontier)
+            counts = np.concatenate([reply[1] for reply in replies])
+            reports = sorted(entry for reply in replies for entry in reply[0])
+            for number, kind, message in reports:
+                transitions += int(counts[counts[:, 0] < number, 1].sum())
+                counts = counts[counts[:, 0] > number]
+                if report(number, kind, message):
+                    return result(depth, False)
+            transitions += int(counts[:, 1].sum())
+            if not sum(reply[2] for reply in replies):
+                return result(depth, True)
+
+            depth += 1
+            inbox = [([], workers)] * workers
+    finally:
+        pool.close()
+        pointers.close()
@@ -0,0 +1,160 @@
+"""Cache of validation results keyed by policy fingerprint, mode and package version."""
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import asdict
+from pathlib import Path
+from typing import NamedTuple
+
+from noetic_policies import __version__
+from noetic_policies.models import ValidationError, ValidationResult
+
+__all__ = ["ValidationCache", "ValidationCacheInfo"]
+
+
+class ValidationCacheInfo(NamedTuple):
+    """Validation cache statistics."""
+
+    hits: int
+    disk_hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ValidationCache:
+    """
+    Thread-safe LRU cache of validation results, optionally backed by a directory.
+
+    Results are keyed by a policy digest (Policy.fingerprint(), or a digest
+    of the source text for file validation), the validation settings and
+    the package version, so any change to the policy, the mode or the
+    installed validator misses the cache. With a directory, each result is
+    also written there as one JSON file, shared between processes and
+    kept across restarts.
+
+    Results are copied in and out, so callers may modify what they get.
+    """
+
+    def __init__(self, maxsize: int = 256, directory: str | os.PathLike[str] | None = None):
+        """
+        Initialize validation cache.
+
+        Args:
+            maxsize: Maximum number of results kept in memory
+            directory: Directory for persistent results (created if missing)
+        """
+        if maxsize < 1:
+            raise ValueError(f"Validation cache size must be positive: {maxsize}")
+        self.maxsize = maxsize
+        self.directory = Path(directory) if directory is not None else None
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self._entries: OrderedDict[str, ValidationResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def key(digest: str, settings: str) -> str:
+        """
+        Build the cache key for a policy digest and validation settings.
+
+        Args:
+            digest: Policy fingerprint or source digest
+            settings: Mode and any options that change results
+
+        Returns:
+            Key combining the digest, settings and package version
+        """
+        return f"{digest}:{settings}:{__version__}"
+
+    def get(self, key: str) -> ValidationResult | None:
+        """Return a copy of the cached result for a key, or None on a miss."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return copy.deepcopy(result)
+            result = self._load(key)
+            if result is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+            self._remember(key, result)
+            return copy.deepcopy(result)
+
+    def put(self, key: str, result: ValidationResult) -> None:
+        """Store a copy of a result, evicting the least recently used if full."""
+        result = copy.deepcopy(result)
+        with self._lock:
+            self._remember(key, result)
+            self._store(key, result)
+
+    def _remember(self, key: str, result: ValidationResult) -> None:
+        """Insert into the in-memory LRU (lock held)."""
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        """File holding a key's result."""
+        assert self.directory is not None
+        name = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+        return self.directory / f"{name}.json"
+
+    def _load(self, key: str) -> ValidationResult | None:
+        """Read a result from the directory; unreadable files count as misses."""
+        if self.directory is None:
+            return None
+        try:
+            data = json.loads(self._path(key).read_text())
+            if data.pop("key") != key:
+                return None
+            data["errors"] = [ValidationError(**error) for error in data["errors"]]
+            data["warnings"] = [ValidationError(**warning) for warning in data["warnings"]]
+            return ValidationResult(**data)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _store(self, key: str, result: ValidationResult) -> None:
+        """Write a result to the directory atomically; failures leave it memory-only."""
+        if self.directory is None:
+            return
+        content = json.dumps({"key": key, **asdict(result)}, default=str)
+        try:
+            fd, temporary = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w") as file:
+                file.write(content)
+            os.replace(temporary, self._path(key))
+        except OSError:
+            Path(temporary).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove all entries, in memory and on disk, and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._disk_hits = 0
+            self._misses = 0
+            if self.directory is not None:
+                for path in self.directory.glob("*.json"):
+                    path.unlink(missing_ok=True)
+
+    def info(self) -> ValidationCacheInfo:
+        """Return cache statistics."""
+        with self._lock:
+            return ValidationCacheInfo(
+                self._hits, self._disk_hits, self._misses, self.maxsize, len(self._entries)
+            )
@@ -0,0 +1,273 @@
+"""Cache of shortest routes between abstract states, optionally persisted in SQLite."""
+
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Collection
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from noetic_policies.models.state_graph import StateGraph
+from noetic_policies.validator.compiled_graph import CompiledStateGraph, graph_key
+from noetic_policies.validator.graph_analyzer import GraphAnalyzer
+
+__all__ = ["RouteCache", "RouteCacheInfo", "Routes"]
+
+# Bumped whenever the stored payload changes; older stores are discarded on open
+_SCHEMA_VERSION = 1
+
+RouteKey = tuple[str, str, tuple[str, ...]]
+
+
+@dataclass(frozen=True, eq=False)
+class Routes:
+    """
+    Shortest routes from one abstract state to each reachable goal of a goal set.
+
+    Routes are shared between callers and must not be mutated.
+    """
+
+    key: str  # graph_key of the state graph the routes were computed on
+    start: str
+    goals: tuple[str, ...]
+    costs: dict[str, float]  # minimum transition cost per reachable goal
+    steps: dict[str, int]  # minimum number of transitions per reachable goal
+    cost_paths: dict[str, list[str]]  # a minimum-cost path per reachable goal
+    step_paths: dict[str, list[str]]  # a minimum-step path per reachable goal
+
+    def path(self, goal: str, weighted: bool = True) -> list[str] | None:
+        """
+        Return a shortest path to a goal.
+
+        Args:
+            goal: Goal state name
+            weighted: Minimum-cost path (True) or minimum-step path (False)
+
+        Returns:
+            State names from start to goal, or None if goal is unreachable
+        """
+        return (self.cost_paths if weighted else self.step_paths).get(goal)
+
+    def cheapest(self) -> str | None:
+        """Return the reachable goal with the lowest cost (ties: first by name)."""
+        return min(self.costs, key=lambda goal: (self.costs[goal], goal), default=None)
+
+
+class RouteCacheInfo(NamedTuple):
+    """Route cache statistics."""
+
+    hits: int
+    disk_hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class RouteCache:
+    """
+    Thread-safe LRU cache of shortest routes keyed by graph content, start and goals.
+
+    Entries are keyed by graph_key() of the state graph, so editing a
+    policy's states, transitions or costs changes the key: routes computed
+    for the old graph are never returned for the new one and simply age
+    out. With a path, entries are also written to a SQLite database that
+    outlives the process; memory misses fall back to it before computing,
+    so a warm restart skips the graph searches. The database keeps at most
+    disk_maxsize entries, evicting the least recently used.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        path: str | os.PathLike[str] | None = None,
+        disk_maxsize: int = 100_000,
+        analyzer: GraphAnalyzer | None = None,
+    ):
+        """
+        Initialize route cache.
+
+        Args:
+            maxsize: Maximum number of route sets kept in memory
+            path: SQLite database file for persistent entries (default: memory only)
+            disk_maxsize: Maximum number of route sets kept in the database
+            analyzer: Graph analyzer computing the routes (default: networkx backend)
+
+        Raises:
+            ValueError: If a size is not positive
+            sqlite3.Error: If the database cannot be opened
+        """
+        if maxsize < 1 or disk_maxsize < 1:
+            raise ValueError(f"Route cache size must be positive: {maxsize}, {disk_maxsize}")
+        self.maxsize = maxsize
+        self.disk_maxsize = disk_maxsize
+        self.analyzer = analyzer if analyzer is not None else GraphAnalyzer()
+        self._entries: OrderedDict[RouteKey, Routes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            self._db = self._open(path)
+            row = self._db.execute("SELECT COALESCE(MAX(used), 0) FROM routes").fetchone()
+            self._clock: int = row[0]
+
+    @staticmethod
+    def _open(path: str | os.PathLike[str]) -> sqlite3.Connection:
+        """Open (or create) the route database, discarding an incompatible one."""
+        db = sqlite3.connect(path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        with db:
+            if db.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                db.execute("DROP TABLE IF EXISTS routes")
+                db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS routes (graph TEXT, start TEXT, goals TEXT,"
+                " payload TEXT NOT NULL, used INTEGER NOT NULL, PRIMARY KEY (graph, start, goals))"
+            )
+            db.execute("CREATE INDEX IF NOT EXISTS routes_used ON routes (used)")
+        return db
+
+    def routes(
+        self,
+        state_graph: StateGraph | CompiledStateGraph,
+        start: str,
+        goals: Collection[str],
+    ) -> Routes:
+        """
+        Return shortest routes from start to every reachable goal, computing them on a miss.
+
+        Args:
+            state_graph: State graph to route in, or its compiled form
+                (whose precomputed key makes hits constant-time)
+            start: Abstract start state name
+            goals: Goal state names (order and duplicates are ignored)
+
+        Returns:
+            Cached or newly computed routes
+        """
+        graph = state_graph.key if isinstance(state_graph, CompiledStateGraph) else None
+        if graph is None:
+            graph = graph_key(state_graph)
+        key: RouteKey = (graph, start, tuple(sorted(set(goals))))
+
+        with self._lock:
+            routes = self._entries.get(key)
+            if routes is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return routes
+            routes = self._load(key)
+            if routes is not None:
+                self._disk_hits += 1
+                self._remember(key, routes)
+                return routes
+            self._misses += 1
+
+        routes = self._compute(state_graph, key)
+        with self._lock:
+            self._remember(key, routes)
+            self._store(key, routes)
+        return routes
+
+    def _compute(self, state_graph: StateGraph | CompiledStateGraph, key: RouteKey) -> Routes:
+        """Run one Dijkstra and one BFS from start for all goals."""
+        graph, start, goals = key
+        compiled = self.analyzer.compile(state_graph)
+        costs, cost_predecessors = self.analyzer.shortest_costs(compiled, start, goals)
+        steps, step_predecessors = self.analyzer.shortest_steps(compiled, start, goals)
+        return Routes(
+            key=graph,
+            start=start,
+            goals=goals,
+            costs={goal: costs[goal] for goal in goals if goal in costs},
+            steps={goal: steps[goal] for goal in goals if goal in steps},
+            cost_paths={g: _walk(cost_predecessors, g) for g in goals if g in costs},
+            step_paths={g: _walk(step_predecessors, g) for g in goals if g in steps},
+        )
+
+    def _remember(self, key: RouteKey, routes: Routes) -> None:
+        """Insert into the in-memory LRU (lock held)."""
+        self._entries[key] = routes
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def _load(self, key: RouteKey) -> Routes | None:
+        """Read an entry from the database and mark it used (lock held)."""
+        if self._db is None:
+            return None
+        graph, start, goals = key
+        row_key = (graph, start, "\x1f".join(goals))
+        row = self._db.execute(
+            "SELECT payload FROM routes WHERE graph = ? AND start = ? AND goals = ?", row_key
+        ).fetchone()
+        if row is None:
+            return None
+        self._clock += 1
+        with self._db:
+            self._db.execute(
+                "UPDATE routes SET used = ? WHERE graph = ? AND start = ? AND goals = ?",
+                (self._clock, *row_key),
+            )
+        payload = json.loads(row[0])
+        return Routes(key=graph, start=start, goals=goals, **payload)
+
+    def _store(self, key: RouteKey, routes: Routes) -> None:
+        """Write an entry to the database, evicting the least recently used (lock held)."""
+        if self._db is None:
+            return
+        graph, start, goals = key
+        payload = json.dumps(
+            {
+                "costs": routes.costs,
+                "steps": routes.steps,
+                "cost_paths": routes.cost_paths,
+                "step_paths": routes.step_paths,
+            }
+        )
+        self._clock += 1
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO routes VALUES (?, ?, ?, ?, ?)",
+                (graph, start, "\x1f".join(goals), payload, self._clock),
+            )
+            self._db.execute(
+                "DELETE FROM routes WHERE used <= ?", (self._clock - self.disk_maxsize,)
+            )
+
+    def clear(self) -> None:
+        """Remove all entries, in memory and on disk, and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._disk_hits = 0
+            self._misses = 0
+            if self._db is not None:
+                with self._db:
+                    self._db.execute("DELETE FROM routes")
+
+    def info(self) -> RouteCacheInfo:
+        """Return cache statistics."""
+        with self._lock:
+            return RouteCacheInfo(
+                self._hits, self._disk_hits, self._misses, self.maxsize, len(self._entries)
+            )
+
+    def close(self) -> None:
+        """Close the database; later misses are computed and kept in memory only."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+
+def _walk(predecessors: dict[str, str], goal: str) -> list[str]:
+    """Follow predecessor links back from goal and return the path in order."""
+    path = [goal]
+    while path[-1] in predecessors:
+        path.append(predecessors[path[-1]])
+    path.reverse()
+    return path
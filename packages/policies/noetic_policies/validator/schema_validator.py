@@ -1,6 +1,6 @@
 """Schema validation for policy structure (T060-T063i)."""
 
-from noetic_policies.cel_evaluator import CELEvaluator
+from noetic_policies.cel_evaluator import CELEvaluator, DependencyIndex
 from noetic_policies.models import ValidationError, ValidationResult
 from noetic_policies.models.policy import Policy
 
@@ -12,6 +12,48 @@ class SchemaValidator:
     Implements FR-002, FR-006, FR-008a-h.
     """
 
+    # Checks in reporting order, with the policy sections each one reads (see
+    # noetic_policies.validator.incremental.policy_sections)
+    CHECKS: tuple[tuple[str, frozenset[str]], ...] = (
+        # T061: Required sections validation (FR-002)
+        ("required_sections", frozenset({"constraints", "graph_structure"})),
+        # T062: Version validation (FR-020)
+        ("version", frozenset({"version"})),
+        # T063: Goal state existence check (FR-007)
+        ("goal_states_exist", frozenset({"goal_names", "graph_structure"})),
+        # T063a: State schema type validation
+        ("state_schema_types", frozenset({"state_schema"})),
+        # T063b: State schema coverage check (FR-008a)
+        (
+            "state_schema_coverage",
+            frozenset(
+                {
+                    "cel_mode",
+                    "state_schema",
+                    "constraints",
+                    "invariants",
+                    "state_graph",
+                    "goal_names",
+                    "goal_conditions",
+                }
+            ),
+        ),
+        # T063c: Goal condition validation (FR-008b)
+        ("goal_conditions", frozenset({"goal_names", "goal_conditions"})),
+        # T063d: Goal condition satisfiability (FR-008c)
+        ("goal_satisfiability", frozenset({"state_schema", "goal_names", "goal_conditions"})),
+        # T063e: Transition cost validation (FR-008d)
+        ("transition_costs", frozenset({"state_graph"})),
+        # T063f: Goal scoring validation (FR-008e)
+        ("goal_scoring", frozenset({"goal_names", "goal_scoring"})),
+        # T063g: Progress condition validation (FR-008f)
+        ("progress_conditions", frozenset({"goal_names", "progress_conditions"})),
+        # T063h: Temporal bounds validation (FR-008g)
+        ("temporal_bounds", frozenset({"temporal_bounds", "goal_bounds"})),
+        # T063i: Temporal bounds hierarchy (FR-008h)
+        ("temporal_hierarchy", frozenset({"temporal_bounds", "goal_names", "goal_bounds"})),
+    )
+
     def __init__(self):
         """Initialize schema validator."""
         self.cel_evaluator = CELEvaluator()
@@ -27,44 +69,23 @@ class SchemaValidator:
             List of validation errors (empty if valid)
         """
         errors: list[ValidationError] = []
+        for name, _ in self.CHECKS:
+            errors.extend(self.run_check(name, policy))
+        return errors
 
-        # T061: Required sections validation (FR-002)
-        errors.extend(self._validate_required_sections(policy))
-
-        # T062: Version validation (FR-020)
-        errors.extend(self._validate_version(policy))
-
-        # T063: Goal state existence check (FR-007)
-        errors.extend(self._validate_goal_states_exist(policy))
-
-        # T063a: State schema type validation
-        errors.extend(self._validate_state_schema_types(policy))
-
-        # T063b: State schema coverage check (FR-008a)
-        errors.extend(self._validate_state_schema_coverage(policy))
-
-        # T063c: Goal condition validation (FR-008b)
-        errors.extend(self._validate_goal_conditions(policy))
-
-        # T063d: Goal condition satisfiability (FR-008c)
-        errors.extend(self._validate_goal_satisfiability(policy))
-
-        # T063e: Transition cost validation (FR-008d)
-        errors.extend(self._validate_transition_costs(policy))
-
-        # T063f: Goal scoring validation (FR-008e)
-        errors.extend(self._validate_goal_scoring(policy))
-
-        # T063g: Progress condition validation (FR-008f)
-        errors.extend(self._validate_progress_conditions(policy))
-
-        # T063h: Temporal bounds validation (FR-008g)
-        errors.extend(self._validate_temporal_bounds(policy))
+    def run_check(self, name: str, policy: Policy) -> list[ValidationError]:
+        """
+        Run one check of CHECKS.
 
-        # T063i: Temporal bounds hierarchy (FR-008h)
-        errors.extend(self._validate_temporal_hierarchy(policy))
+        Args:
+            name: Check name
+            policy: Policy to validate
 
-        return errors
+        Returns:
+            List of validation errors found by the check
+        """
+        check = getattr(self, f"_validate_{name}")
+        return check(policy)
 
     def _validate_required_sections(self, policy: Policy) -> list[ValidationError]:
         """Validate that all required sections are present."""
@@ -144,14 +165,19 @@ class SchemaValidator:
     def _validate_state_schema_coverage(self, policy: Policy) -> list[ValidationError]:
         """Validate that all referenced variables are defined in state schema."""
         errors = []
-        schema_vars = set(policy.state_schema.keys())
-
-        # Check constraint expressions (simplified for MVP)
-        for constraint in policy.constraints:
-            # Extract variable references (simplified)
-            # Full implementation would use CEL AST
-            for var in schema_vars:
-                pass  # Check if var is used
+
+        # One pass over the dependency index (linear in total expression size);
+        # expressions with syntax errors are reported by their own checks
+        for site, name in DependencyIndex(policy).undefined_references():
+            where = site.kind.replace("_", " ")
+            errors.append(
+                ValidationError(
+                    code="E007",
+                    message=f"Undefined variable '{name}' in {where} '{site.owner}': {site.expr}",
+                    severity="error",
+                    fix_suggestion=f"Add '{name}' to state_schema or correct the expression",
+                )
+            )
 
         return errors
 
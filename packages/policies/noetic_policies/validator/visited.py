@@ -0,0 +1,240 @@
+"""Compact visited-state sets for explicit-state model checking."""
+
+import hashlib
+import math
+
+import numpy as np
+
+__all__ = ["BitstateSet", "HashedStateSet", "state_hash"]
+
+_SCALAR_BATCH = 32  # Batches up to this size are inserted key by key
+
+
+def state_hash(data: bytes) -> int:
+    """
+    Return the 64-bit fingerprint of a packed state.
+
+    The fingerprint is a BLAKE2b digest, so it is the same in every process
+    and distinct states collide only with probability 2^-64 (Python's hash()
+    collides by design, e.g. hash(-1) == hash(-2)). Zero is reserved for
+    empty table slots and is mapped to one.
+
+    Args:
+        data: State packed by StateCodec.encode()
+
+    Returns:
+        Non-zero unsigned 64-bit integer
+    """
+    digest = hashlib.blake2b(data, digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+class HashedStateSet:
+    """
+    Set of state fingerprints in an open-addressing uint64 table.
+
+    Only the 64-bit fingerprint of each state is stored (hash compaction),
+    i.e. 8 bytes per slot at a load factor of at most 1/2. Two distinct
+    states with equal fingerprints are treated as one: with n states stored,
+    a new state is mistaken for one of them with probability n / 2^64
+    (omission_probability), so over a whole search of n states the chance
+    of any omission is about n^2 / 2^65 (below 3e-6 for ten million states).
+
+    Insertion is batched: a whole BFS level is probed with array operations.
+    Small batches (narrow levels) are probed one key at a time, which avoids
+    the fixed cost of the array operations.
+    """
+
+    def __init__(self, capacity: int = 1 << 16):
+        """
+        Initialize empty set.
+
+        Args:
+            capacity: Initial number of slots (rounded up to a power of two)
+        """
+        size = 1 << max(4, (capacity - 1).bit_length())
+        self._table = np.zeros(size, dtype=np.uint64)
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the fingerprint table."""
+        return self._table.nbytes
+
+    @property
+    def omission_probability(self) -> float:
+        """Probability that a new state matches the fingerprint of a stored one (n / 2^64)."""
+        return min(1.0, self._count / 2.0**64)
+
+    def __contains__(self, fingerprint: int) -> bool:
+        table = self._table
+        mask = len(table) - 1
+        slot = fingerprint & mask
+        while True:
+            value = int(table[slot])
+            if value == fingerprint:
+                return True
+            if value == 0:
+                return False
+            slot = (slot + 1) & mask
+
+    def add_many(self, fingerprints: np.ndarray) -> np.ndarray:
+        """
+        Insert fingerprints, reporting which were not present before.
+
+        Args:
+            fingerprints: Non-zero uint64 fingerprints
+
+        Returns:
+            Boolean array, True for the first occurrence of each new fingerprint
+        """
+        keys = np.asarray(fingerprints, dtype=np.uint64)
+        new = np.zeros(len(keys), dtype=np.bool_)
+        if not len(keys):
+            return new
+        if len(keys) <= _SCALAR_BATCH:
+            if 2 * (self._count + len(keys)) > len(self._table):
+                self._grow(self._count + len(keys))
+            for i, key in enumerate(keys.tolist()):
+                new[i] = self._add(key)
+            return new
+        # Only the first occurrence of a fingerprint within the batch can be new
+        unique, first = np.unique(keys, return_index=True)
+        if 2 * (self._count + len(unique)) > len(self._table):
+            self._grow(self._count + len(unique))
+        inserted = self._insert(unique)
+        new[first[inserted]] = True
+        self._count += int(inserted.sum())
+        return new
+
+    def _add(self, key: int) -> bool:
+        """Insert one key; return whether it was new."""
+        table = self._table
+        mask = len(table) - 1
+        slot = key & mask
+        while True:
+            value = int(table[slot])
+            if value == key:
+                return False
+            if value == 0:
+                table[slot] = key
+                self._count += 1
+                return True
+            slot = (slot + 1) & mask
+
+    def _insert(self, keys: np.ndarray) -> np.ndarray:
+        """Linear-probe distinct keys into the table; return which were inserted."""
+        table = self._table
+        mask = np.uint64(len(table) - 1)
+        slots = keys & mask
+        inserted = np.zeros(len(keys), dtype=np.bool_)
+        pending = np.arange(len(keys))
+        while pending.size:
+            current = table[slots[pending]]
+            empty = current == 0
+            # Claim empty slots; when several keys race for one slot, one write wins
+            claim = pending[empty]
+            table[slots[claim]] = keys[claim]
+            won = table[slots[claim]] == keys[claim]
+            inserted[claim[won]] = True
+            # Keys already present are done; the rest probe the next slot
+            present = current == keys[pending]
+            lost = claim[~won]
+            moving = pending[~empty & ~present]
+            slots[moving] = (slots[moving] + np.uint64(1)) & mask
+            pending = np.concatenate([moving, lost])
+        return inserted
+
+    def _grow(self, count: int) -> None:
+        size = len(self._table)
+        while 2 * count > size:
+            size *= 2
+        old = self._table[self._table != 0]
+        self._table = np.zeros(size, dtype=np.uint64)
+        self._insert(old)
+
+
+class BitstateSet:
+    """
+    Bitstate (Bloom filter) set of state fingerprints.
+
+    Each state sets k bits of an m-bit array, derived from its fingerprint
+    by double hashing; a state is considered visited when all of its bits
+    are set. Memory is fixed at m / 8 bytes regardless of how many states
+    are added, at the price of possibly skipping new states whose bits were
+    all set by others (never of revisiting a state).
+    """
+
+    def __init__(self, expected_states: int, bits_per_state: int = 16):
+        """
+        Initialize empty set.
+
+        Args:
+            expected_states: Number of states the set is sized for
+            bits_per_state: Bits of memory per expected state
+
+        Raises:
+            ValueError: If bits_per_state or expected_states is not positive
+        """
+        if bits_per_state < 1 or expected_states < 1:
+            raise ValueError("Bitstate size must be positive")
+        size = 1 << max(6, (expected_states * bits_per_state - 1).bit_length())
+        self._words = np.zeros(size // 64, dtype=np.uint64)
+        self._bits = size
+        # k = m/n ln 2 minimizes the omission probability
+        self.hashes = max(1, round(bits_per_state * math.log(2)))
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the bit array."""
+        return self._words.nbytes
+
+    @property
+    def omission_probability(self) -> float:
+        """Probability that a new state is wrongly considered visited at the current fill."""
+        return (1.0 - math.exp(-self.hashes * self._count / self._bits)) ** self.hashes
+
+    def _positions(self, keys: np.ndarray) -> np.ndarray:
+        """Bit positions per key, shape (len(keys), hashes)."""
+        first = keys & np.uint64(0xFFFFFFFF)
+        step = (keys >> np.uint64(32)) | np.uint64(1)
+        rounds = np.arange(self.hashes, dtype=np.uint64)
+        return (first[:, None] + rounds[None, :] * step[:, None]) & np.uint64(self._bits - 1)
+
+    def __contains__(self, fingerprint: int) -> bool:
+        positions = self._positions(np.array([fingerprint], dtype=np.uint64))[0]
+        words = self._words[positions >> np.uint64(6)]
+        return bool(((words >> (positions & np.uint64(63))) & np.uint64(1)).all())
+
+    def add_many(self, fingerprints: np.ndarray) -> np.ndarray:
+        """
+        Insert fingerprints, reporting which were not present before.
+
+        Membership is tested against the set as it was before the batch.
+
+        Args:
+            fingerprints: uint64 fingerprints
+
+        Returns:
+            Boolean array, True for the first occurrence of each new fingerprint
+        """
+        keys = np.asarray(fingerprints, dtype=np.uint64)
+        new = np.zeros(len(keys), dtype=np.bool_)
+        if not len(keys):
+            return new
+        unique, first = np.unique(keys, return_index=True)
+        positions = self._positions(unique)
+        word = positions >> np.uint64(6)
+        bit = np.uint64(1) << (positions & np.uint64(63))
+        present = ((self._words[word] & bit) != 0).all(axis=1)
+        np.bitwise_or.at(self._words, word[~present].ravel(), bit[~present].ravel())
+        new[first[~present]] = True
+        self._count += int((~present).sum())
+        return new
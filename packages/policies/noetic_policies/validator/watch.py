@@ -0,0 +1,257 @@
+"""Watching policy files and re-validating them as they change."""
+
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import sys
+import time
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from noetic_policies.models import FileValidationResult, ValidationResult
+from noetic_policies.validator.batch import expand_paths
+from noetic_policies.validator.incremental import IncrementalValidator
+
+if TYPE_CHECKING:
+    from noetic_policies.validator import PolicyValidator
+
+__all__ = ["PolicyWatcher"]
+
+# inotify(7) events that can change a watched directory's policy files
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+# Stat of a file that does not exist
+_MISSING = (-1, -1)
+
+# Editors save in bursts of events (write, rename, chmod); wait for the burst to end
+_SETTLE_SECONDS = 0.05
+
+
+class _Inotify:
+    """Change notifications for directories from Linux inotify, through libc."""
+
+    def __init__(self) -> None:
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify is only available on Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._watched: set[str] = set()
+
+    def watch(self, directories: Iterable[str]) -> None:
+        """Add directories not watched yet (missing ones are skipped)."""
+        for directory in directories:
+            if directory in self._watched:
+                continue
+            if self._add_watch(self.fd, os.fsencode(directory), _IN_MASK) >= 0:
+                self._watched.add(directory)
+
+    def wait(self, timeout: float) -> bool:
+        """Wait until an event arrives or the timeout expires; drain the events."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        # The files are re-examined afterwards, so the events themselves are not decoded
+        while select.select([self.fd], [], [], _SETTLE_SECONDS)[0]:
+            try:
+                os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+        return True
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PolicyWatcher:
+    """
+    Re-validates policy files as they change.
+
+    Files are named as for the validate command: files, directories
+    (searched recursively) and glob patterns, expanded again on every scan
+    so new files are picked up. A scan re-parses only files whose size,
+    modification time and then content changed, and validates each with
+    its own IncrementalValidator, so only the checks affected by the edit
+    re-run. Changes are detected with inotify on Linux and by polling
+    elsewhere (or with backend="poll").
+    """
+
+    def __init__(
+        self,
+        patterns: Iterable[str],
+        validator: "PolicyValidator | None" = None,
+        mode: str = "fast",
+        backend: str = "auto",
+        poll_interval: float = 0.5,
+    ):
+        """
+        Initialize watcher.
+
+        Args:
+            patterns: Files, directories and glob patterns to watch
+            validator: Validator whose settings are used (default: a new one)
+            mode: Validation mode
+            backend: "inotify", "poll", or "auto" (inotify where available)
+            poll_interval: Seconds between scans when polling, and the longest
+                wait for an event otherwise
+
+        Raises:
+            ValueError: If backend is unknown
+            OSError: If backend is "inotify" and inotify is unavailable
+        """
+        if backend not in ("auto", "inotify", "poll"):
+            raise ValueError(f"Unknown watch backend: {backend}")
+        if validator is None:
+            # Import here to avoid circular dependency
+            from noetic_policies.validator import PolicyValidator
+
+            validator = PolicyValidator()
+        self.patterns = list(patterns)
+        self.validator = validator
+        self.mode = mode
+        self.poll_interval = poll_interval
+        self._inotify: _Inotify | None = None
+        if backend != "poll":
+            try:
+                self._inotify = _Inotify()
+            except (OSError, AttributeError):
+                if backend == "inotify":
+                    raise
+        self._stats: dict[str, tuple[int, int]] = {}
+        self._digests: dict[str, str] = {}
+        self._validators: dict[str, IncrementalValidator] = {}
+
+    @property
+    def backend(self) -> str:
+        """The change detection in use: "inotify" or "poll"."""
+        return "inotify" if self._inotify is not None else "poll"
+
+    def __enter__(self) -> "PolicyWatcher":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop receiving change notifications."""
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def scan(self) -> list[FileValidationResult]:
+        """
+        Validate the files that changed since the last scan.
+
+        The first scan validates every file. Files that disappeared from a
+        directory or glob are forgotten; files named explicitly are reported
+        as missing.
+
+        Returns:
+            Results for the changed files, in path order
+        """
+        files = expand_paths(self.patterns)
+        for path in set(self._stats) - set(files):
+            del self._stats[path]
+            self._digests.pop(path, None)
+            self._validators.pop(path, None)
+
+        results = []
+        for path in files:
+            start = time.perf_counter()
+            try:
+                info = os.stat(path)
+                stat = (info.st_mtime_ns, info.st_size)
+                if self._stats.get(path) == stat:
+                    continue
+                content = Path(path).read_text()
+            except OSError:
+                # Reported once, until the file reappears
+                if self._stats.get(path) == _MISSING:
+                    continue
+                stat, content = _MISSING, None
+            self._stats[path] = stat
+
+            if content is None:
+                self._digests.pop(path, None)
+                result = self.validator.validate_file(path, mode=self.mode)
+            else:
+                digest = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+                if self._digests.get(path) == digest:
+                    continue
+                self._digests[path] = digest
+                result = self._validate(path, content)
+            results.append(FileValidationResult(path, result, (time.perf_counter() - start) * 1000))
+
+        if self._inotify is not None:
+            self._inotify.watch(self._directories(files))
+        return results
+
+    def watch(self) -> Iterator[list[FileValidationResult]]:
+        """
+        Scan, then wait for changes and scan again, indefinitely.
+
+        Returns:
+            Iterator of the results of each scan that found changes (the
+            first scan is always yielded)
+        """
+        yield self.scan()
+        while True:
+            if self._inotify is not None:
+                if not self._inotify.wait(self.poll_interval):
+                    continue
+            else:
+                time.sleep(self.poll_interval)
+            results = self.scan()
+            if results:
+                yield results
+
+    def _validate(self, path: str, content: str) -> ValidationResult:
+        """Validate a file's new content against its previous version."""
+        # Import here to avoid circular dependency
+        from noetic_policies.parser import PolicyParser
+
+        try:
+            policy = PolicyParser().parse_yaml(content)
+        except Exception:
+            # Reported like any parse error; the last parsed version stays the baseline
+            return self.validator.validate_yaml(content, mode=self.mode)
+        incremental = self._validators.get(path)
+        if incremental is None:
+            incremental = IncrementalValidator(self.validator, self.mode)
+            self._validators[path] = incremental
+        return incremental.validate(policy)
+
+    def _directories(self, files: list[str]) -> set[str]:
+        """Directories whose changes can add, remove or modify watched files."""
+        directories = {os.path.dirname(os.path.abspath(path)) for path in files}
+        for pattern in self.patterns:
+            path = Path(pattern)
+            if path.is_dir():
+                directories.add(str(path.absolute()))
+                directories.update(str(p.absolute()) for p in path.rglob("*") if p.is_dir())
+            elif any(char in pattern for char in "*?["):
+                # The deepest directory without wildcards, and below it for "**"
+                parts = []
+                for part in path.parts:
+                    if any(char in part for char in "*?["):
+                        break
+                    parts.append(part)
+                base = Path(*parts) if parts else Path(".")
+                if base.is_dir():
+                    directories.add(str(base.absolute()))
+                    if "**" in pattern:
+                        directories.update(str(p.absolute()) for p in base.rglob("*") if p.is_dir())
+        return directories
@@ -0,0 +1,43 @@
+"""Performance tests for vectorized constraint evaluation."""
+
+import time
+
+import numpy as np
+import pytest
+
+from noetic_policies.cel_evaluator import CELEvaluator
+
+
+@pytest.mark.performance
+class TestBatchEvaluationPerformance:
+    """Batch evaluation must scale to large candidate-state populations."""
+
+    def test_100k_states_50_constraints_under_one_second(self):
+        """100k states x 50 constraints completes well under a second."""
+        rng = np.random.default_rng(0)
+        size = 100_000
+        schema = {
+            "count": "number",
+            "max_limit": "number",
+            "active": "boolean",
+            "status": "enum[open,closed,pending]",
+        }
+        columns = {
+            "count": rng.integers(0, 10, size).astype(np.float64),
+            "max_limit": np.full(size, 10.0),
+            "active": rng.random(size) < 0.5,
+            "status": rng.integers(0, 3, size).astype(np.int32),
+        }
+        constraints = [
+            f"count >= {i % 5} && count <= max_limit - {i % 3} || status == 'open' && !active"
+            for i in range(50)
+        ]
+        evaluator = CELEvaluator()
+
+        start = time.perf_counter()
+        for expr in constraints:
+            result = evaluator.evaluate_batch(expr, columns, schema)
+            assert result.shape == (size,)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 1.0
@@ -0,0 +1,90 @@
+"""Performance tests for package import time."""
+
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative import time of the CLI module (interpreter startup excluded). Importing
+# the models or the validator alone exceeds it, so it catches eager heavy imports.
+CLI_IMPORT_BUDGET_MS = 100
+
+HEAVY_MODULES = ("networkx", "numpy", "opentelemetry", "pydantic")
+
+MINIMAL_POLICY = """
+version: "1.0"
+state_schema:
+  count: number
+constraints:
+  - name: positive_count
+    expr: "count >= 0"
+state_graph:
+  initial: ready
+  states:
+    - name: ready
+"""
+
+
+def _import_profile(module: str) -> tuple[dict[str, int], set[str]]:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+
+    Returns:
+        Cumulative microseconds of each top-level import, and all modules loaded
+    """
+    code = f"import sys, {module}; print(' '.join(sys.modules))"
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, total, name = line.split("|")
+        if not name.startswith("  "):
+            cumulative[name.strip()] = int(total)
+    return cumulative, set(completed.stdout.split())
+
+
+@pytest.mark.performance
+class TestImportTime:
+    """Cold imports must not load dependencies the caller does not use."""
+
+    def test_cli_import_budget(self):
+        """The CLI imports within budget and without heavy dependencies."""
+        cumulative, modules = _import_profile("noetic_policies.cli")
+
+        elapsed_ms = cumulative["noetic_policies.cli"] / 1000
+        assert elapsed_ms < CLI_IMPORT_BUDGET_MS, f"CLI import took {elapsed_ms:.0f} ms"
+        assert not {name.split(".")[0] for name in modules} & set(HEAVY_MODULES)
+
+    def test_validator_defers_analysis_and_tracing(self):
+        """NetworkX and OpenTelemetry load only when analysis or tracing runs."""
+        _, modules = _import_profile("noetic_policies.validator")
+
+        assert "networkx" not in modules
+        assert "opentelemetry" not in modules
+
+    def test_first_validation_excludes_networkx_import(self):
+        """Loading NetworkX on first use is not counted in duration_ms."""
+        code = "\n".join(
+            [
+                "import time",
+                "from noetic_policies.parser import PolicyParser",
+                "from noetic_policies.validator import PolicyValidator",
+                f"policy = PolicyParser().parse_yaml({MINIMAL_POLICY!r})",
+                "validator = PolicyValidator()",
+                "start = time.perf_counter()",
+                "result = validator.validate(policy)",
+                "print(result.metadata['duration_ms'], (time.perf_counter() - start) * 1000)",
+            ]
+        )
+        completed = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        duration_ms, elapsed_ms = map(float, completed.stdout.split())
+
+        assert duration_ms < elapsed_ms / 2, f"{duration_ms:.0f} of {elapsed_ms:.0f} ms"
@@ -0,0 +1,55 @@
+"""Performance tests for graph analysis maintained under graph edits."""
+
+import random
+import time
+
+import pytest
+
+from noetic_policies.models import GoalState
+from noetic_policies.models.state_graph import State, StateGraph, Transition
+from noetic_policies.validator.compiled_graph import GraphCache
+from noetic_policies.validator.graph_analyzer import GraphAnalyzer
+from noetic_policies.validator.incremental_graph import IncrementalGraphAnalysis
+
+
+@pytest.mark.performance
+class TestIncrementalGraphPerformance:
+    """Edits of a large graph must cost a small fraction of a full analysis."""
+
+    def test_20k_states_edit_and_result_under_tenth_of_full_analysis(self):
+        """An edit plus result() on 20k states takes under 10% of analyze()."""
+        rng = random.Random(0)
+        names = [f"s{i}" for i in range(20_000)]
+        # A chain with random shortcuts and back edges: one large component
+        states = [
+            State(
+                name=name,
+                transitions=[
+                    Transition(to=names[min(i + 1, len(names) - 1)]),
+                    Transition(to=rng.choice(names), cost=rng.choice([0.5, 1.0, 3.0])),
+                ],
+            )
+            for i, name in enumerate(names)
+        ]
+        graph = StateGraph(initial="s0", states=states)
+        goals = [GoalState(name=names[-1]), GoalState(name=names[len(names) // 2])]
+        analyzer = GraphAnalyzer(GraphCache(), backend="csr")
+
+        start = time.perf_counter()
+        analyzer.analyze(graph, graph.initial, goals)
+        full = time.perf_counter() - start
+
+        incremental = IncrementalGraphAnalysis(graph, goals, analyzer=analyzer)
+        edits = 500
+        start = time.perf_counter()
+        for _ in range(edits):
+            source = rng.choice(names)
+            transitions = incremental.transitions(source)
+            if transitions and rng.random() < 0.5:
+                incremental.remove_transition(source, rng.choice(transitions).to)
+            else:
+                incremental.add_transition(source, rng.choice(names), rng.choice([0.5, 1.0]))
+            incremental.result()
+        per_edit = (time.perf_counter() - start) / edits
+
+        assert per_edit < full / 10
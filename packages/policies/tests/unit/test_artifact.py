@@ -0,0 +1,200 @@
+"""Unit tests for expression bytecode and compiled policy artifacts."""
+
+import pytest
+
+from noetic_policies.artifact import ArtifactError, CompiledPolicy, compile_policy
+from noetic_policies.cel_evaluator import CELEvaluator
+from noetic_policies.cel_evaluator.bytecode import Assembler, disassemble
+from noetic_policies.cel_evaluator.cache import ProgramCache
+from noetic_policies.cel_evaluator.parser import parse
+from noetic_policies.parser import PolicyParser
+from noetic_policies.validator import PolicyValidator
+from noetic_policies.validator.graph_analyzer import GraphAnalyzer
+
+POLICY = """
+version: "1.0"
+name: counter
+state_schema:
+  count: number
+  max_limit: number
+constraints:
+  - name: positive_count
+    expr: "count >= 0"
+  - name: below_limit
+    expr: "count < max_limit"
+state_graph:
+  initial: ready
+  states:
+    - name: ready
+      transitions:
+        - to: counting
+          cost: 2
+          preconditions: ["count < max_limit"]
+        - to: done
+          cost_expr: "max_limit - count"
+    - name: counting
+      transitions:
+        - to: ready
+          effects: ["count = count + 1"]
+    - name: done
+    - name: orphan
+goal_states:
+  - name: done
+    conditions: ["count == max_limit"]
+"""
+
+
+@pytest.fixture
+def policy():
+    return PolicyParser().parse_yaml(POLICY)
+
+
+@pytest.fixture
+def artifact(policy, tmp_path):
+    path = tmp_path / "counter.npol"
+    compile_policy(policy, path, validation=PolicyValidator().validate(policy, mode="thorough"))
+    with CompiledPolicy(path) as compiled:
+        yield compiled
+
+
+class TestBytecode:
+    """Test the postfix encoding of syntax trees."""
+
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "count >= 0 && !(name in ['a', \"b\"])",
+            "a.b.c[0] + size(items) * -2.5",
+            "x ? {'k': 1, 'v': true} : null",
+            "items.exists(i, i > 1) || name.startsWith('n')",
+            "1 == 1.0 && true != false",
+        ],
+    )
+    def test_round_trip(self, source):
+        """Disassembling reproduces the parsed tree."""
+        strings: dict[str, int] = {}
+        assembler = Assembler(lambda s: strings.setdefault(s, len(strings)))
+        assembler.assemble(parse("other + 1"))
+        start, end = assembler.assemble(parse(source))
+        table = list(strings)
+
+        node = disassemble(assembler.code[start:end], table.__getitem__, assembler.constants)
+
+        assert node == parse(source)
+
+    def test_long_operator_chain(self):
+        """Chains far deeper than the recursion limit assemble and round-trip."""
+        source = " - ".join(["x"] * 3000) + " < 1"
+        strings: dict[str, int] = {}
+        assembler = Assembler(lambda s: strings.setdefault(s, len(strings)))
+        start, end = assembler.assemble(parse(source))
+        table = list(strings)
+
+        node = disassemble(assembler.code[start:end], table.__getitem__, assembler.constants)
+
+        assert assembler.assemble(node) == (end, 2 * end - start)
+        assert assembler.code[start:end] == assembler.code[end:]
+
+    def test_malformed_code(self):
+        """Code that does not encode one expression is rejected."""
+        with pytest.raises(ValueError, match="underflow"):
+            disassemble([(7, 0, 0)], str, [])
+        with pytest.raises(ValueError, match="one expression"):
+            disassemble([(1, 0, 0), (1, 0, 0)], str, [])
+
+
+class TestCompiledPolicy:
+    """Test writing and memory-mapping compiled artifacts."""
+
+    def test_header(self, artifact, policy):
+        """The header identifies the policy and graph."""
+        assert artifact.fingerprint == policy.fingerprint()
+        assert artifact.graph_key == GraphAnalyzer().compile(policy.state_graph).key
+        assert artifact.policy == policy
+
+    def test_graph_and_tables_match_fresh_computation(self, artifact, policy):
+        """Stored CSR arrays, analysis and distances equal recomputed ones."""
+        analyzer = GraphAnalyzer()
+        compiled = analyzer.compile(policy.state_graph)
+        loaded = artifact.compiled_graph
+
+        assert loaded.states == compiled.states
+        assert loaded.csr.names == compiled.csr.names
+        assert loaded.csr.indptr.tolist() == compiled.csr.indptr.tolist()
+        assert loaded.csr.indices.tolist() == compiled.csr.indices.tolist()
+        assert loaded.csr.cost.tolist() == compiled.csr.cost.tolist()
+        assert not loaded.csr.indptr.flags.writeable
+
+        fresh = analyzer.analyze(compiled, "ready", policy.goal_states)
+        stored = artifact.analysis
+        assert stored.unreachable_states == fresh.unreachable_states == {"orphan"}
+        assert stored.goal_costs == fresh.goal_costs
+        assert stored.shortest_path("done") == fresh.shortest_path("done")
+
+        assert artifact.oracle.distance_to_goal("counting") == 2.0
+        assert artifact.oracle.path_to_goal("counting") == ["counting", "ready", "done"]
+
+    def test_validation_result(self, artifact):
+        """The validation result is stored with the artifact."""
+        assert not artifact.validation.is_valid
+        assert artifact.validation.errors[0].code == "E004"
+        assert artifact.validation.metadata["mode"] == "thorough"
+
+    def test_expressions(self, artifact):
+        """Every policy expression is stored and evaluates like a fresh compile."""
+        assert set(artifact.expression_sources()) == {
+            "count >= 0",
+            "count < max_limit",
+            "count + 1",
+            "max_limit - count",
+            "count == max_limit",
+        }
+        expression = artifact.expression("max_limit - count")
+
+        assert expression.evaluate({"count": 2, "max_limit": 5}) == 3
+        assert expression.ast == parse("max_limit - count")
+        with pytest.raises(KeyError):
+            artifact.expression("unknown")
+
+    def test_preload_fills_program_cache(self, artifact):
+        """Preloaded expressions are cache hits for the evaluator."""
+        cache = ProgramCache()
+        assert artifact.preload(cache) == 5
+
+        evaluator = CELEvaluator(cache=cache)
+        evaluator.compile("count < max_limit")
+
+        assert cache.info().hits == 1
+        assert cache.info().misses == 0
+
+    def test_rejects_other_files(self, tmp_path):
+        """Files without the artifact magic are rejected."""
+        path = tmp_path / "policy.npol"
+        path.write_bytes(b"version: 1.0\n" * 4)
+        with pytest.raises(ArtifactError, match="Not a compiled policy"):
+            CompiledPolicy(path)
+
+        path.write_bytes(b"")
+        with pytest.raises(ArtifactError, match="Not a compiled policy"):
+            CompiledPolicy(path)
+
+    def test_rejects_other_format_version(self, policy, tmp_path):
+        """Artifacts from another format version must be recompiled."""
+        path = tmp_path / "policy.npol"
+        compile_policy(policy, path)
+        data = bytearray(path.read_bytes())
+        data[8] += 1
+        path.write_bytes(bytes(data))
+
+        with pytest.raises(ArtifactError, match="recompile"):
+            CompiledPolicy(path)
+
+    def test_without_validation(self, policy, tmp_path):
+        """Artifacts may be written without a validation result."""
+        path = tmp_path / "policy.npol"
+        size = compile_policy(policy, path)
+
+        with CompiledPolicy(path) as compiled:
+            assert compiled.validation is None
+        assert path.stat().st_size == size
+        assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,130 @@
+"""Unit tests for batch validation of many policy files."""
+
+import pytest
+
+from noetic_policies.validator import PolicyValidator
+from noetic_policies.validator.batch import expand_paths, shard_by_size
+from noetic_policies.validator.result_cache import ValidationCache
+
+POLICY = """
+version: "1.0"
+name: {name}
+state_schema:
+  count: number
+constraints:
+  - name: positive_count
+    expr: "count >= 0"
+state_graph:
+  initial: ready
+  states:
+    - name: ready
+      transitions:
+        - to: done
+          effects: ["count = count + 1"]
+    - name: done
+goal_states:
+  - name: done
+    conditions: ["count > 0"]
+"""
+
+
+@pytest.fixture
+def policy_dir(tmp_path):
+    for i in range(6):
+        (tmp_path / f"p{i}.yaml").write_text(POLICY.format(name=f"p{i}"))
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "q.yml").write_text(POLICY.format(name="q"))
+    (tmp_path / "broken.yaml").write_text("version: [")
+    (tmp_path / "README.md").write_text("not a policy")
+    return tmp_path
+
+
+class TestShardBySize:
+    """Test grouping files into shards."""
+
+    def test_large_files_get_own_shard_first(self, tmp_path):
+        """A file larger than the target shard size is alone in the first shard."""
+        (tmp_path / "huge.yaml").write_text("x" * 10_000)
+        for i in range(20):
+            (tmp_path / f"small{i}.yaml").write_text("x" * 100)
+        paths = [str(path) for path in sorted(tmp_path.iterdir())]
+
+        shards = shard_by_size(paths, jobs=2)
+
+        assert shards[0] == [str(tmp_path / "huge.yaml")]
+        assert sorted(path for shard in shards for path in shard) == sorted(paths)
+        assert len(shards) < len(paths)
+
+    def test_missing_files_are_kept(self, tmp_path):
+        """Missing files count as empty and still get a shard."""
+        assert shard_by_size([str(tmp_path / "missing.yaml")], jobs=4) == [
+            [str(tmp_path / "missing.yaml")]
+        ]
+
+
+class TestExpandPaths:
+    """Test expansion of command-line arguments."""
+
+    def test_directories_and_globs(self, policy_dir, monkeypatch):
+        """Directories are searched recursively; globs and plain files are expanded once."""
+        monkeypatch.chdir(policy_dir)
+
+        files = expand_paths(["nested", "p*.yaml", "p0.yaml", "missing.yaml"])
+
+        assert files == [
+            "nested/q.yml",
+            *[f"p{i}.yaml" for i in range(6)],
+            "missing.yaml",
+        ]
+        assert len(expand_paths([str(policy_dir)])) == 8
+
+
+class TestValidateMany:
+    """Test PolicyValidator.validate_many()."""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_results_for_every_file(self, policy_dir, jobs):
+        """Every file gets one result, in any order, with its timing."""
+        files = expand_paths([str(policy_dir)])
+
+        results = list(PolicyValidator().validate_many(files, mode="thorough", jobs=jobs))
+
+        assert sorted(item.path for item in results) == sorted(files)
+        failed = {item.path for item in results if not item.result.is_valid}
+        assert failed == {str(policy_dir / "broken.yaml")}
+        assert all(item.duration_ms >= 0 for item in results)
+
+    def test_matches_single_file_validation(self, policy_dir):
+        """Workers validate with the parent validator's settings."""
+        validator = PolicyValidator(graph_backend="csr", max_states=1)
+        path = str(policy_dir / "p0.yaml")
+
+        results = {
+            item.path: item.result
+            for item in validator.validate_many([path, path + ".missing"], "thorough-plus", 2)
+        }
+        expected = validator.validate_file(path, mode="thorough-plus")
+
+        assert results[path].warnings == expected.warnings
+        assert expected.warnings[0].code == "W003"
+        assert results[path + ".missing"].errors[0].code == "E101"
+
+    def test_disk_cache_shared_with_workers(self, policy_dir):
+        """Workers store results in the validator's cache directory."""
+        cache = ValidationCache(directory=policy_dir / "cache")
+        files = [str(policy_dir / f"p{i}.yaml") for i in range(4)]
+        validator = PolicyValidator(cache=cache)
+
+        list(validator.validate_many(files, jobs=2))
+
+        assert all(validator.validate_file(path).metadata.get("cached") for path in files)
+
+    def test_stopping_early(self, policy_dir):
+        """Closing the iterator early shuts the pool down."""
+        files = expand_paths([str(policy_dir)])
+        results = PolicyValidator().validate_many(files, jobs=2)
+
+        first = next(results)
+        results.close()
+
+        assert first.path in files
@@ -0,0 +1,111 @@
+"""Unit tests for bounded goal checking against temporal step bounds."""
+
+from noetic_policies.models import GoalState, Invariant, TemporalBounds, Transition
+from noetic_policies.models.constraint import Constraint
+from noetic_policies.models.policy import Policy
+from noetic_policies.models.state_graph import State, StateGraph
+from noetic_policies.validator import PolicyValidator
+from noetic_policies.validator.bounded import BoundedGoalChecker, step_bound
+from noetic_policies.validator.model_checker import ModelChecker
+
+
+def _counter_policy(max_steps: int | None = None) -> Policy:
+    """Counter that must reach count == 3; 'ready' -> 'counting' -> 'ready' adds one."""
+    return Policy(
+        version="1.0",
+        metadata={"initial_values": {"max_limit": 3}},
+        state_schema={"count": "number", "max_limit": "number"},
+        constraints=[Constraint(name="below_limit", expr="count < max_limit")],
+        state_graph=StateGraph(
+            initial="ready",
+            states=[
+                State(
+                    name="ready",
+                    transitions=[
+                        Transition(to="counting", preconditions=["below_limit"]),
+                        Transition(to="ready", effects=["count = 0"]),
+                    ],
+                ),
+                State(
+                    name="counting",
+                    transitions=[Transition(to="ready", effects=["count = count + 1"])],
+                ),
+            ],
+        ),
+        invariants=[Invariant(name="in_range", expr="count >= 0 && count <= max_limit")],
+        goal_states=[
+            GoalState(
+                name="ready",
+                conditions=["count == max_limit"],
+                temporal_bounds=TemporalBounds(max_steps=max_steps) if max_steps else None,
+            )
+        ],
+    )
+
+
+class TestStepBound:
+    """Test the effective step bound of a goal."""
+
+    def test_smaller_of_goal_and_policy_bound(self):
+        """The goal's and the policy's max_steps both apply."""
+        goal = _counter_policy(max_steps=8).goal_states[0]
+
+        assert step_bound(goal, TemporalBounds(max_steps=5)) == 5
+        assert step_bound(goal, TemporalBounds(timeout_seconds=1.0)) == 8
+        assert step_bound(_counter_policy().goal_states[0], None) is None
+
+
+class TestBoundedGoalChecker:
+    """Test iterative deepening search for goal witnesses."""
+
+    def test_shortest_witness(self):
+        """The witness is a shortest execution satisfying the goal conditions."""
+        result = BoundedGoalChecker(ModelChecker(_counter_policy())).check("ready", 10)
+
+        assert result.feasible is True
+        assert result.steps == 6
+        assert [step.state for step in result.witness] == ["ready", "counting"] * 3 + ["ready"]
+        assert result.witness[-1].values["count"] == 3
+
+    def test_infeasible_within_bound(self):
+        """Conditions that need more steps than allowed are proven unsatisfiable."""
+        result = BoundedGoalChecker(ModelChecker(_counter_policy())).check("ready", 5)
+
+        assert result.feasible is False
+        assert result.witness is None
+
+    def test_exhausted_state_space_ends_early(self):
+        """Once no branch is cut off by the bound, larger bounds are not tried."""
+        policy = _counter_policy()
+        policy.goal_states[0].conditions = ["count == 7"]
+
+        result = BoundedGoalChecker(ModelChecker(policy)).check("ready", 10_000)
+
+        assert result.feasible is False
+        assert result.states_explored < 200
+
+    def test_state_budget(self):
+        """Running out of the state budget is inconclusive."""
+        result = BoundedGoalChecker(ModelChecker(_counter_policy()), max_states=5).check(
+            "ready", 10
+        )
+
+        assert result.feasible is None
+        assert "budget" in result.message
+
+
+class TestThoroughPlusBoundedGoals:
+    """Test bounded goal checking through PolicyValidator."""
+
+    def test_goal_unsatisfiable_in_time_warns(self):
+        """A goal reachable in the graph but not with its conditions in time is W004."""
+        result = PolicyValidator().validate(_counter_policy(max_steps=5), mode="thorough-plus")
+
+        assert [warning.code for warning in result.warnings] == ["W004"]
+        assert "bounded_goal_checking" in result.metadata["checks_performed"]
+
+    def test_goal_satisfiable_in_time(self):
+        """No warning when a witness exists within the bound."""
+        result = PolicyValidator().validate(_counter_policy(max_steps=6), mode="thorough-plus")
+
+        assert result.warnings == []
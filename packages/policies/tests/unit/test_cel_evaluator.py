@@ -0,0 +1,262 @@
+"""Unit tests for CEL expression compilation and evaluation."""
+
+import numpy as np
+import pytest
+
+from noetic_policies.cel_evaluator import (
+    CELEvaluationError,
+    CELEvaluator,
+    CELMode,
+    CELSyntaxError,
+    CompiledExpression,
+    ProgramCache,
+    columns_from_states,
+)
+
+
+class TestCELEvaluation:
+    """Test evaluation semantics of compiled expressions."""
+
+    def test_comparison_and_logic(self):
+        """Constraints evaluate against the variable context."""
+        evaluator = CELEvaluator()
+        context = {"count": 3, "max_limit": 5}
+
+        assert evaluator.evaluate("count >= 0 && count <= max_limit", context) is True
+        assert evaluator.evaluate("count > max_limit || count < 0", context) is False
+        assert evaluator.evaluate("!(count == 3)", context) is False
+
+    def test_arithmetic_follows_cel_integer_semantics(self):
+        """Integer division and modulus truncate toward zero."""
+        evaluator = CELEvaluator()
+
+        assert evaluator.evaluate("-7 / 2", {}) == -3
+        assert evaluator.evaluate("-7 % 2", {}) == -1
+        assert evaluator.evaluate("(count + 1) * 2", {"count": 4}) == 10
+        assert evaluator.evaluate("7.0 / 2", {}) == 3.5
+
+    def test_strings_lists_and_maps(self):
+        """String methods, membership, and member selection are supported."""
+        evaluator = CELEvaluator()
+        context = {"name": "escrow", "owners": ["a", "b"], "limits": {"daily": 10}}
+
+        assert evaluator.evaluate("name.startsWith('esc') && name.endsWith('row')", context)
+        assert evaluator.evaluate("'b' in owners && size(owners) == 2", context)
+        assert evaluator.evaluate("limits.daily == 10 && limits['daily'] > 5", context)
+        assert evaluator.evaluate("size(name) > 3 ? 'long' : 'short'", context) == "long"
+
+    def test_undefined_variable_raises_evaluation_error(self):
+        """Missing variables surface as CELEvaluationError."""
+        evaluator = CELEvaluator()
+
+        with pytest.raises(CELEvaluationError, match="Undefined variable 'balance'"):
+            evaluator.evaluate("balance > 0", {})
+
+    def test_division_by_zero_raises_evaluation_error(self):
+        """Division by zero is an evaluation error, not a Python exception."""
+        evaluator = CELEvaluator()
+
+        with pytest.raises(CELEvaluationError, match="Division by zero"):
+            evaluator.evaluate("count / 0", {"count": 1})
+
+    def test_syntax_errors_raise_syntax_error(self):
+        """Malformed expressions raise CELSyntaxError from evaluate()."""
+        evaluator = CELEvaluator()
+
+        with pytest.raises(CELSyntaxError):
+            evaluator.evaluate("count >", {"count": 1})
+
+
+class TestCELCompilation:
+    """Test compile() and the program cache."""
+
+    def test_compile_returns_reusable_program(self):
+        """A compiled expression evaluates against many contexts."""
+        compiled = CELEvaluator().compile("count < max_limit")
+
+        assert isinstance(compiled, CompiledExpression)
+        assert compiled.mode == CELMode.SAFE
+        assert compiled.evaluate({"count": 1, "max_limit": 2}) is True
+        assert compiled.evaluate({"count": 2, "max_limit": 2}) is False
+
+    def test_cache_counts_hits_and_misses(self):
+        """Repeated evaluation reuses the cached program."""
+        evaluator = CELEvaluator(cache=ProgramCache(maxsize=8))
+
+        for count in range(5):
+            evaluator.evaluate("count >= 0", {"count": count})
+
+        info = evaluator.cache_info()
+        assert info.misses == 1
+        assert info.hits == 4
+        assert info.currsize == 1
+
+    def test_cache_is_keyed_by_mode(self):
+        """The same expression compiles separately per CEL mode."""
+        cache = ProgramCache(maxsize=8)
+        safe = CELEvaluator(mode=CELMode.SAFE, cache=cache).compile("count > 0")
+        full = CELEvaluator(mode=CELMode.FULL, cache=cache).compile("count > 0")
+
+        assert safe is not full
+        assert cache.info().currsize == 2
+
+    def test_cache_evicts_least_recently_used(self):
+        """The cache is bounded and evicts in LRU order."""
+        evaluator = CELEvaluator(cache=ProgramCache(maxsize=2))
+        first = evaluator.compile("a > 0")
+        evaluator.compile("b > 0")
+        evaluator.compile("a > 0")  # refresh "a"
+        evaluator.compile("c > 0")  # evicts "b"
+
+        assert evaluator.compile("a > 0") is first
+        assert evaluator.cache_info().currsize == 2
+        misses = evaluator.cache_info().misses
+        evaluator.compile("b > 0")
+        assert evaluator.cache_info().misses == misses + 1
+
+    def test_invalid_expressions_are_not_cached(self):
+        """Syntax errors are raised on every compile and never cached."""
+        evaluator = CELEvaluator(cache=ProgramCache(maxsize=8))
+
+        for _ in range(2):
+            with pytest.raises(CELSyntaxError):
+                evaluator.compile("(count > 0")
+        assert evaluator.cache_info().currsize == 0
+
+
+class TestSafeModeChecker:
+    """Test AST-based safe-mode enforcement."""
+
+    def test_identifiers_resembling_unsafe_operations_are_allowed(self):
+        """Variable names are not mistaken for unsafe operations."""
+        evaluator = CELEvaluator(mode=CELMode.SAFE)
+
+        assert evaluator.validate_syntax("threads > 0 && recall <= 1.0")
+        assert evaluator.validate_syntax("reader_count < max_writes")
+        assert evaluator.validate_syntax("'print' == label")
+
+    def test_unsafe_calls_rejected_anywhere_in_tree(self):
+        """Unsafe functions are found in nested and receiver-style calls."""
+        evaluator = CELEvaluator(mode=CELMode.SAFE)
+
+        with pytest.raises(CELSyntaxError, match="'now' not allowed in safe mode"):
+            evaluator.validate_syntax("count > 0 && (deadline > now())")
+        with pytest.raises(CELSyntaxError, match="'invoke' not allowed in safe mode"):
+            evaluator.validate_syntax("handler.invoke(1) == 2")
+
+    def test_functions_outside_allowlist_rejected(self):
+        """Safe mode is an allowlist: unknown functions are rejected too."""
+        evaluator = CELEvaluator(mode=CELMode.SAFE)
+
+        with pytest.raises(CELSyntaxError, match="'sha256' not allowed in safe mode"):
+            evaluator.validate_syntax("sha256(data) == digest")
+        assert evaluator.validate_syntax("size(name) > 0 && name.matches('^a')")
+
+    def test_parse_errors_report_position(self):
+        """Parser errors identify the offending delimiter and position."""
+        evaluator = CELEvaluator()
+
+        with pytest.raises(CELSyntaxError, match="Unbalanced parentheses.*position 5"):
+            evaluator.validate_syntax("a > b)")
+        with pytest.raises(CELSyntaxError, match="Unbalanced braces"):
+            evaluator.validate_syntax("{'a': 1")
+        with pytest.raises(CELSyntaxError, match="Unexpected character"):
+            evaluator.validate_syntax("count = 1")
+
+    def test_deep_nesting_is_a_syntax_error(self):
+        """Pathologically nested expressions are rejected instead of overflowing the stack."""
+        evaluator = CELEvaluator()
+
+        assert evaluator.evaluate("(" * 32 + "1" + ")" * 32, {}) == 1
+        with pytest.raises(CELSyntaxError, match="nested more than"):
+            evaluator.validate_syntax("(" * 5000 + "1" + ")" * 5000)
+        with pytest.raises(CELSyntaxError, match="nested more than"):
+            evaluator.validate_syntax("!" * 5000 + "true")
+
+    def test_long_operator_chains(self):
+        """Chains of hundreds of same-precedence operators compile and run without recursing."""
+        evaluator = CELEvaluator()
+        terms = ["x"] * 600
+
+        assert evaluator.validate_syntax(" + ".join(terms))
+        assert evaluator.evaluate(" + ".join(terms), {"x": 2}) == 1200
+        assert evaluator.evaluate(" - ".join(terms) + " * 3 == -1200", {"x": 2}) is True
+        assert evaluator.evaluate("x - x + x * x / x % 3", {"x": 4}) == 1
+
+    def test_validation_parse_is_reused_for_evaluation(self):
+        """validate_syntax() and evaluate() share one cached parse."""
+        evaluator = CELEvaluator(cache=ProgramCache(maxsize=8))
+
+        evaluator.validate_syntax("count >= 0")
+        assert evaluator.evaluate("count >= 0", {"count": 1}) is True
+        compiled = evaluator.compile("count >= 0")
+
+        assert compiled.ast is not None
+        assert evaluator.cache_info().misses == 1
+
+
+class TestBatchEvaluation:
+    """Test vectorized evaluation over columnar state arrays."""
+
+    SCHEMA = {
+        "count": "number",
+        "max_limit": "number",
+        "active": "boolean",
+        "status": "enum[open,closed,pending]",
+        "owner": "string",
+    }
+
+    STATES = [
+        {"count": 0, "max_limit": 5, "active": True, "status": "open", "owner": "alice"},
+        {"count": 6, "max_limit": 5, "active": False, "status": "closed", "owner": "bob"},
+        {"count": 3, "max_limit": 0, "active": True, "status": "pending", "owner": "bob"},
+        {"count": -1, "max_limit": 5, "active": False, "status": "open", "owner": "carol"},
+    ]
+
+    def _expected(self, expr):
+        evaluator = CELEvaluator()
+        return [evaluator.evaluate(expr, state) for state in self.STATES]
+
+    def test_columns_typed_from_state_schema(self):
+        """number -> float64, boolean -> bool, enum -> int codes."""
+        columns = columns_from_states(self.STATES, self.SCHEMA)
+
+        assert columns["count"].dtype == np.float64
+        assert columns["active"].dtype == np.bool_
+        assert columns["status"].tolist() == [0, 1, 2, 0]
+        assert columns["owner"].dtype == object
+
+    @pytest.mark.parametrize(
+        "expr",
+        [
+            "count >= 0 && count <= max_limit",
+            "status == 'open' || !active",
+            "status in ['open', 'pending'] && count < 5",
+            "active ? count * 2 : -count",
+            "max_limit > 0 && count / max_limit > 0.5",
+            "owner.startsWith('b') && size(owner) == 3",
+        ],
+    )
+    def test_batch_matches_scalar_evaluation(self, expr):
+        """Vectorized results equal per-state evaluation, including fallbacks."""
+        evaluator = CELEvaluator()
+        columns = columns_from_states(self.STATES, self.SCHEMA)
+
+        result = evaluator.evaluate_batch(expr, columns, self.SCHEMA)
+
+        assert result.tolist() == self._expected(expr)
+
+    def test_batch_raises_where_scalar_evaluation_raises(self):
+        """Errors not masked by short-circuiting are reported with the row."""
+        evaluator = CELEvaluator()
+        columns = columns_from_states(self.STATES, self.SCHEMA)
+
+        with pytest.raises(CELEvaluationError, match="row 2: Division by zero"):
+            evaluator.evaluate_batch("count / max_limit > 0.5", columns, self.SCHEMA)
+
+    def test_mismatched_column_lengths_rejected(self):
+        """All columns must describe the same population."""
+        evaluator = CELEvaluator()
+
+        with pytest.raises(ValueError, match="rows"):
+            evaluator.evaluate_batch("a < b", {"a": np.zeros(3), "b": np.zeros(2)})
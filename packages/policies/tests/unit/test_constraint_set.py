@@ -0,0 +1,135 @@
+"""Unit tests for fused constraint-set checking."""
+
+import pytest
+
+from noetic_policies.cel_evaluator import CELEvaluationError, ConstraintSet
+from noetic_policies.models import Invariant
+from noetic_policies.models.constraint import Constraint
+
+
+class TestConstraintSet:
+    """Test the fused constraint checker."""
+
+    CONSTRAINTS = [
+        Constraint(name="positive_count", expr="count >= 0"),
+        Constraint(name="below_limit", expr="count < max_limit"),
+        Constraint(name="near_limit", expr="count < max_limit - 1", severity="warning"),
+    ]
+
+    def test_check_returns_first_failing_constraint(self):
+        """check() reports a failing error-severity constraint or None."""
+        checker = ConstraintSet.from_constraints(self.CONSTRAINTS)
+
+        assert checker.check({"count": 1, "max_limit": 5}) is None
+        assert checker.check({"count": -1, "max_limit": 5}) == "positive_count"
+        assert checker.check({"count": 5, "max_limit": 5}) == "below_limit"
+
+    def test_warnings_never_block_check(self):
+        """Warning-severity constraints are skipped by check()."""
+        checker = ConstraintSet.from_constraints(self.CONSTRAINTS)
+
+        assert checker.check({"count": 4, "max_limit": 5}) is None
+        assert "near_limit" not in checker.order
+
+    def test_check_all_reports_every_failure(self):
+        """check_all() evaluates everything, optionally excluding warnings."""
+        checker = ConstraintSet.from_constraints(self.CONSTRAINTS)
+        context = {"count": 7, "max_limit": 5}
+
+        assert checker.check_all(context) == ["below_limit", "near_limit"]
+        assert checker.check_all(context, include_warnings=False) == ["below_limit"]
+        assert checker.check_all({"count": 1, "max_limit": 5}) == []
+
+    def test_shared_subexpressions_evaluated_once(self):
+        """Structurally identical subexpressions share one result slot."""
+        checker = ConstraintSet(
+            [
+                ("a", "balance - amount >= 0", "error"),
+                ("b", "balance - amount <= limit", "error"),
+            ]
+        )
+        calls = []
+
+        class CountingContext(dict):
+            def __getitem__(self, key):
+                calls.append(key)
+                return super().__getitem__(key)
+
+        context = CountingContext(balance=10, amount=3, limit=100)
+        assert checker.check_all(context) == []
+        assert calls.count("balance") == 1
+        assert calls.count("amount") == 1
+
+    def test_long_chains_are_shared(self):
+        """Identical long operator chains share one slot without deep comparisons."""
+        chain = " + ".join(["count"] * 2000)
+        checker = ConstraintSet(
+            [("low", f"{chain} >= 0", "error"), ("high", f"{chain} < 5000", "error")]
+        )
+
+        assert checker.check({"count": 1}) is None
+        assert checker.check_all({"count": 3}) == ["high"]
+
+    def test_frequently_failing_conjuncts_move_first(self):
+        """Measured failure rates reorder the conjuncts."""
+        checker = ConstraintSet(
+            [
+                ("rarely_fails", "count >= 0", "error"),
+                ("often_fails", "flag == true", "error"),
+            ],
+            reorder_interval=10,
+        )
+
+        for _ in range(50):
+            assert checker.check({"count": 1, "flag": False}) == "often_fails"
+
+        assert checker.order[0] == "often_fails"
+        stats = {s.name: s for s in checker.stats()}
+        assert stats["often_fails"].failures == 50
+
+    def test_top_level_conjunctions_are_split(self):
+        """Each operand of a top-level && gets its own statistics."""
+        checker = ConstraintSet([("range", "count >= 0 && count <= 10", "error")])
+
+        assert checker.order == ["range", "range"]
+        assert checker.check({"count": 11}) == "range"
+        assert [(s.evaluations, s.failures) for s in checker.stats()] == [(1, 0), (1, 1)]
+
+    def test_guards_keep_protecting_later_conjuncts(self):
+        """Reordering never moves a conjunct ahead of the guard before it."""
+        checker = ConstraintSet(
+            [("guard", 'size(items) > 0 && items[0] == "a"', "error")],
+            reorder_interval=4,
+            timing_interval=1,
+        )
+
+        for _ in range(10):
+            assert checker.check({"items": ["a"]}) is None
+
+        assert checker.check({"items": []}) == "guard"
+
+    def test_invariants_are_blocking(self):
+        """Invariants are checked like error-severity constraints."""
+        checker = ConstraintSet.from_invariants(
+            [Invariant(name="in_range", expr="count <= max_limit"), Invariant(expr="count >= 0")]
+        )
+
+        assert checker.check({"count": -1, "max_limit": 5}) == "invariant[1]"
+        assert checker.check({"count": 6, "max_limit": 5}) == "in_range"
+
+    def test_evaluation_errors_propagate(self):
+        """Undefined variables are reported rather than treated as passing."""
+        checker = ConstraintSet.from_constraints(self.CONSTRAINTS)
+
+        with pytest.raises(CELEvaluationError, match="Undefined variable"):
+            checker.check({"count": 1})
+
+    def test_type_errors_become_evaluation_errors(self):
+        """Runtime type mismatches raise CELEvaluationError and leave statistics untouched."""
+        checker = ConstraintSet([("ok", "true", "error"), ("a", "name < 1", "error")])
+
+        with pytest.raises(CELEvaluationError, match="'a'.*not supported"):
+            checker.check({"name": "x"})
+        with pytest.raises(CELEvaluationError, match="'a'.*not supported"):
+            checker.check_all({"name": "x"})
+        assert [(s.evaluations, s.failures) for s in checker.stats()] == [(2, 0), (0, 0)]
@@ -0,0 +1,164 @@
+"""Unit tests for the validation daemon and its client."""
+
+import json
+import os
+import socket
+import sys
+import threading
+
+import pytest
+
+from noetic_policies.cli import main
+from noetic_policies.daemon import DaemonClient, DaemonError
+from noetic_policies.daemon.server import ValidationDaemon
+
+POLICY = """
+version: "1.0"
+name: counter
+state_schema:
+  count: number
+constraints:
+  - name: positive_count
+    expr: "count >= 0"
+state_graph:
+  initial: ready
+  states:
+    - name: ready
+"""
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    server = ValidationDaemon(tmp_path / "daemon.sock")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+@pytest.fixture
+def policy_file(tmp_path):
+    path = tmp_path / "policy.yaml"
+    path.write_text(POLICY)
+    return path
+
+
+class TestValidationDaemon:
+    """Test the JSON-lines protocol."""
+
+    def test_validate_file_is_cached(self, daemon, policy_file):
+        """Repeated validations of an unchanged file hit the warm cache."""
+        with DaemonClient(daemon.path) as client:
+            first = client.validate_file(policy_file, mode="thorough")
+            second = client.validate_file(policy_file, mode="thorough")
+            stats = client.request("stats")
+
+        assert first["result"]["is_valid"]
+        assert first["report"].startswith("✓ Policy validation successful")
+        assert second["result"]["metadata"]["cached"] is True
+        assert stats["hits"] == 1
+
+    def test_validate_yaml(self, daemon):
+        """Policy text can be sent directly, e.g. unsaved editor buffers."""
+        with DaemonClient(daemon.path) as client:
+            response = client.request("validate_yaml", content="version: [", mode="fast")
+
+        assert response["result"]["errors"][0]["code"] == "E100"
+        assert response["report"].startswith("✗ Policy validation failed")
+
+    def test_errors_keep_connection_usable(self, daemon):
+        """Bad requests get error responses; later requests still succeed."""
+        with DaemonClient(daemon.path) as client:
+            with pytest.raises(DaemonError, match="Unknown method"):
+                client.request("explode")
+            with pytest.raises(DaemonError, match="Invalid mode"):
+                client.request("validate", path="/nonexistent", mode="slow")
+            with pytest.raises(DaemonError, match="client 0.0.0"):
+                client.request("ping", version="0.0.0")
+            assert client.request("ping")["pid"] > 0
+
+    def test_raw_protocol(self, daemon):
+        """Requests are JSON lines; ids are echoed and malformed lines answered."""
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.connect(str(daemon.path))
+            connection.sendall(b'{"id": "a", "method": "ping"}\nnot json\n')
+            with connection.makefile("rb") as reader:
+                ping = json.loads(reader.readline())
+                malformed = json.loads(reader.readline())
+
+        assert ping["id"] == "a" and ping["ok"] is True
+        assert malformed["ok"] is False
+
+    def test_refuses_second_daemon(self, daemon):
+        """Only one daemon can serve a socket."""
+        with pytest.raises(DaemonError, match="already running"):
+            ValidationDaemon(daemon.path)
+
+    def test_replaces_stale_socket(self, tmp_path):
+        """A socket file without a daemon behind it is replaced."""
+        path = tmp_path / "stale.sock"
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(path))
+        stale.close()
+
+        server = ValidationDaemon(path)
+        server.server_close()
+
+        assert not path.exists()
+
+    def test_keeps_files_that_are_not_own_sockets(self, tmp_path, monkeypatch):
+        """Only the current user's sockets are replaced."""
+        path = tmp_path / "file.sock"
+        path.write_text("not a socket")
+
+        with pytest.raises(DaemonError, match="not a socket"):
+            ValidationDaemon(path)
+        assert path.read_text() == "not a socket"
+
+        path.unlink()
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(str(path))
+        stale.close()
+        monkeypatch.setattr(os, "getuid", lambda: path.lstat().st_uid + 1)
+        with pytest.raises(DaemonError, match="another user"):
+            ValidationDaemon(path)
+        assert path.exists()
+
+
+class TestClient:
+    """Test the client without a daemon."""
+
+    def test_unavailable(self, tmp_path):
+        """A missing daemon is reported as DaemonError."""
+        client = DaemonClient(tmp_path / "missing.sock")
+
+        assert not client.available()
+        with pytest.raises(DaemonError, match="unavailable"):
+            client.validate_file(tmp_path / "policy.yaml")
+
+    def test_refuses_foreign_socket(self, daemon, monkeypatch):
+        """The client does not connect to a socket owned by another user."""
+        monkeypatch.setattr(os, "getuid", lambda: daemon.path.lstat().st_uid + 1)
+        client = DaemonClient(daemon.path)
+
+        assert not client.available()
+        with pytest.raises(DaemonError, match="another user"):
+            client.request("ping")
+
+    def test_cli_uses_daemon(self, daemon, policy_file, monkeypatch, capsys):
+        """validate answers from a running daemon and falls back without one."""
+        monkeypatch.setenv("NOETIC_POLICIES_SOCKET", str(daemon.path))
+        monkeypatch.setattr(sys, "argv", ["noetic-policies", "validate", str(policy_file)])
+        for _ in range(2):
+            with pytest.raises(SystemExit) as exit_info:
+                main()
+            assert exit_info.value.code == 0
+        assert daemon.validator.cache.info().hits == 1
+
+        monkeypatch.setenv("NOETIC_POLICIES_SOCKET", str(policy_file.parent / "none.sock"))
+        with pytest.raises(SystemExit) as exit_info:
+            main()
+        assert exit_info.value.code == 0
+        assert capsys.readouterr().out.count("✓ Policy validation successful") == 3
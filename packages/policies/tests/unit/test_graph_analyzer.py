@@ -1,9 +1,17 @@
 """Unit tests for graph analysis (T037-T041e)."""
 
+import math
+import random
+
+import numpy as np
 import pytest
 
 from noetic_policies.models import GoalState, TemporalBounds
 from noetic_policies.models.state_graph import State, StateGraph, Transition
+from noetic_policies.validator.compiled_graph import GraphCache
+from noetic_policies.validator.distance_oracle import DistanceOracle
+from noetic_policies.validator.graph_analyzer import GraphAnalyzer
+from noetic_policies.validator.route_cache import RouteCache
 
 
 class TestGraphAnalyzer:
@@ -179,3 +187,413 @@ class TestGraphAnalyzer:
         assert sorted_goals[1].name == "same_priority_high_reward"  # Priority 5, reward 50
         assert sorted_goals[2].name == "same_priority_low_reward"  # Priority 5, reward 5
         assert sorted_goals[3].name == "low_priority"  # Priority 1
+
+
+class TestCompiledStateGraph:
+    """Test sharing one compiled graph across analyses."""
+
+    @staticmethod
+    def _graph() -> StateGraph:
+        return StateGraph(
+            initial="start",
+            states=[
+                State(name="start", transitions=[Transition(to="loop1"), Transition(to="goal")]),
+                State(name="loop1", transitions=[Transition(to="loop2")]),
+                State(name="loop2", transitions=[Transition(to="loop1")]),
+                State(name="goal"),
+                State(name="orphan"),
+            ],
+        )
+
+    def test_analyze_builds_graph_once(self):
+        """analyze() compiles the state graph once for every check."""
+        cache = GraphCache()
+        analyzer = GraphAnalyzer(cache=cache)
+
+        result = analyzer.analyze(self._graph(), "start", [GoalState(name="goal")])
+
+        assert result.unreachable_states == {"orphan"}
+        assert result.deadlock_sccs == [{"loop1", "loop2"}]
+        assert result.goal_reachable
+        assert cache.info().misses == 1
+
+    def test_equal_graphs_share_compiled_form(self):
+        """Graphs with identical content hit the cache, changed graphs miss it."""
+        cache = GraphCache()
+        analyzer = GraphAnalyzer(cache=cache)
+
+        first = analyzer.compile(self._graph())
+        assert analyzer.compile(self._graph()) is first
+
+        changed = self._graph()
+        changed.states[0].transitions[1].cost = 5.0
+        assert analyzer.compile(changed) is not first
+        assert cache.info().hits == 1
+        assert cache.info().misses == 2
+
+    def test_public_methods_accept_either_form(self):
+        """Each check works standalone on a StateGraph or a compiled graph."""
+        analyzer = GraphAnalyzer(cache=GraphCache())
+        graph = self._graph()
+        compiled = analyzer.compile(graph)
+
+        for form in (graph, compiled):
+            assert analyzer.find_unreachable_states(form, "start") == {"orphan"}
+            assert analyzer.detect_deadlocks(form) == [{"loop1", "loop2"}]
+            assert analyzer.verify_goal_reachable(form, "start", {"goal"})
+            assert not analyzer.verify_goal_reachable(form, "start", {"orphan"})
+
+    def test_cache_is_bounded(self):
+        """Least recently used graphs are evicted."""
+        cache = GraphCache(maxsize=1)
+        analyzer = GraphAnalyzer(cache=cache)
+        analyzer.compile(self._graph())
+        analyzer.compile(StateGraph(initial="a", states=[State(name="a")]))
+
+        assert cache.info().currsize == 1
+        with pytest.raises(ValueError, match="positive"):
+            GraphCache(maxsize=0)
+
+
+class TestCSRBackend:
+    """Test the array-backed graph backend against NetworkX."""
+
+    @staticmethod
+    def _random_graph(seed: int) -> StateGraph:
+        rng = random.Random(seed)
+        names = [f"s{i}" for i in range(rng.randint(1, 30))]
+        states = []
+        for name in names:
+            transitions = [
+                # Includes self loops, repeated targets and an undeclared state
+                Transition(to=rng.choice([*names, "ghost"]), cost=rng.choice([0.0, 0.5, 1.0, 3.0]))
+                for _ in range(rng.choice([0, 1, 1, 2, 3]))
+            ]
+            states.append(State(name=name, transitions=transitions))
+        return StateGraph(initial=names[0], states=states)
+
+    @pytest.mark.parametrize("seed", range(50))
+    def test_results_match_networkx(self, seed):
+        """Both backends produce identical analysis results."""
+        graph = self._random_graph(seed)
+        goals = [GoalState(name=s.name) for s in graph.states[-3:]]
+        goals[0].temporal_bounds = TemporalBounds(max_steps=2)
+
+        expected = GraphAnalyzer(GraphCache()).analyze(graph, graph.initial, goals)
+        actual = GraphAnalyzer(GraphCache(), backend="csr").analyze(graph, graph.initial, goals)
+
+        assert actual == expected
+
+    def test_repeated_transitions_keep_last_cost(self):
+        """Repeated transitions collapse to one edge, as in nx.DiGraph."""
+        graph = StateGraph(
+            initial="start",
+            states=[
+                State(
+                    name="start",
+                    transitions=[Transition(to="goal", cost=1.0), Transition(to="goal", cost=4.0)],
+                ),
+                State(name="goal"),
+            ],
+        )
+        analyzer = GraphAnalyzer(GraphCache(), backend="csr")
+
+        result = analyzer.analyze(graph, "start", [GoalState(name="goal")])
+
+        assert analyzer.compile(graph).csr.num_edges == 1
+        assert result.goal_costs == {"goal": 4.0}
+        assert result.goal_min_steps == {"goal": 1}
+
+    def test_memory_per_transition(self):
+        """CSR storage stays below 40 bytes per transition."""
+        names = [f"s{i}" for i in range(2000)]
+        graph = StateGraph(
+            initial="s0",
+            states=[
+                State(
+                    name=name,
+                    transitions=[Transition(to=names[(i + k) % len(names)]) for k in (1, 7, 31)],
+                )
+                for i, name in enumerate(names)
+            ],
+        )
+        csr = GraphAnalyzer(GraphCache(), backend="csr").compile(graph).csr
+
+        assert csr.indptr.dtype == np.int32
+        assert csr.indices.dtype == np.int32
+        assert csr.cost.dtype == np.float64
+        assert csr.nbytes / csr.num_edges < 40
+
+    def test_unknown_backend_rejected(self):
+        """Only the supported backends can be selected."""
+        with pytest.raises(ValueError, match="Unknown graph backend"):
+            GraphAnalyzer(backend="igraph")
+
+
+class TestSingleSourceSearch:
+    """Test single-source goal cost/step searches and their predecessor trees."""
+
+    @staticmethod
+    def _graph() -> StateGraph:
+        return StateGraph(
+            initial="start",
+            states=[
+                State(
+                    name="start",
+                    transitions=[
+                        Transition(to="expensive", cost=10.0),
+                        Transition(to="cheap", cost=1.0),
+                        Transition(to="detour", cost=1.0),
+                    ],
+                ),
+                State(name="expensive", transitions=[Transition(to="goal", cost=1.0)]),
+                State(name="cheap", transitions=[Transition(to="middle", cost=1.0)]),
+                State(name="middle", transitions=[Transition(to="goal", cost=1.0)]),
+                State(name="detour", transitions=[Transition(to="far", cost=50.0)]),
+                State(name="goal"),
+                State(name="far"),
+            ],
+        )
+
+    @pytest.mark.parametrize("backend", ["networkx", "csr"])
+    def test_paths_extracted_from_predecessor_tree(self, backend):
+        """Minimum-cost and minimum-step paths come from one search each."""
+        analyzer = GraphAnalyzer(GraphCache(), backend=backend)
+
+        result = analyzer.analyze(self._graph(), "start", [GoalState(name="goal")])
+
+        assert result.goal_costs == {"goal": 3.0}
+        assert result.goal_min_steps == {"goal": 2}
+        assert result.shortest_path("goal") == ["start", "cheap", "middle", "goal"]
+        assert result.shortest_path("goal", weighted=False) == ["start", "expensive", "goal"]
+        assert result.shortest_path("far") is None
+
+    @pytest.mark.parametrize("backend", ["networkx", "csr"])
+    def test_search_stops_once_targets_are_settled(self, backend):
+        """States costlier than every target are not settled."""
+        analyzer = GraphAnalyzer(GraphCache(), backend=backend)
+
+        costs, predecessors = analyzer.shortest_costs(self._graph(), "start", {"goal"})
+        all_costs, _ = analyzer.shortest_costs(self._graph(), "start")
+
+        assert costs["goal"] == 3.0
+        assert "far" not in costs
+        assert all_costs["far"] == 51.0
+        assert predecessors["goal"] == "middle"
+
+    @pytest.mark.parametrize("backend", ["networkx", "csr"])
+    def test_unknown_states_are_unreached(self, backend):
+        """Unknown initial or target states yield no distances."""
+        analyzer = GraphAnalyzer(GraphCache(), backend=backend)
+
+        assert analyzer.shortest_steps(self._graph(), "missing") == ({}, {})
+        assert analyzer.shortest_steps(self._graph(), "start", {"missing"}) == ({"start": 0}, {})
+
+
+class TestCondensation:
+    """Test deadlock detection on the condensation DAG."""
+
+    @staticmethod
+    def _graph() -> StateGraph:
+        return StateGraph(
+            initial="start",
+            states=[
+                State(name="start", transitions=[Transition(to="a"), Transition(to="x")]),
+                State(name="a", transitions=[Transition(to="b")]),
+                State(name="b", transitions=[Transition(to="a"), Transition(to="end")]),
+                State(name="x", transitions=[Transition(to="y")]),
+                State(name="y", transitions=[Transition(to="x"), Transition(to="y")]),
+                State(name="end"),
+            ],
+        )
+
+    @pytest.mark.parametrize("backend", ["networkx", "csr"])
+    def test_deadlocks_are_sink_components(self, backend):
+        """Cycles with an exit are not deadlocks; single terminal states are not cycles."""
+        analyzer = GraphAnalyzer(GraphCache(), backend=backend)
+
+        assert analyzer.detect_deadlocks(self._graph()) == [{"x", "y"}]
+
+    @pytest.mark.parametrize("backend", ["networkx", "csr"])
+    def test_condensation_is_topologically_numbered(self, backend):
+        """Every DAG edge goes from a higher component id to a lower one."""
+        analyzer = GraphAnalyzer(GraphCache(), backend=backend)
+
+        result = analyzer.analyze(self._graph(), "start", [GoalState(name="end")])
+        dag = result.condensation
+
+        assert dag.num_components == 4
+        assert dag.component_of("a") == dag.component_of("b")
+        start = dag.component_of("start")
+        assert sorted(dag.successors(start).tolist()) == sorted(
+            [dag.component_of("a"), dag.component_of("x")]
+        )
+        for c in range(dag.num_components):
+            assert all(s < c for s in dag.successors(c).tolist())
+        sinks = dag.members(dag.sinks())
+        assert sorted(map(sorted, sinks)) == [["end"], ["x", "y"]]
+        assert dag.topological_order()[0] == start
+
+
+class TestRouteCache:
+    """Test caching shortest routes per graph content, start state and goal set."""
+
+    @staticmethod
+    def _graph() -> StateGraph:
+        return StateGraph(
+            initial="start",
+            states=[
+                State(
+                    name="start",
+                    transitions=[Transition(to="mid"), Transition(to="goal", cost=5.0)],
+                ),
+                State(name="mid", transitions=[Transition(to="goal"), Transition(to="start")]),
+                State(name="goal"),
+                State(name="orphan", transitions=[Transition(to="goal")]),
+            ],
+        )
+
+    def test_routes_per_goal(self):
+        """Cheapest and shortest routes are reported for each reachable goal."""
+        routes = RouteCache().routes(self._graph(), "start", ["goal", "orphan"])
+
+        assert routes.costs == {"goal": 2.0}
+        assert routes.steps == {"goal": 1}
+        assert routes.path("goal") == ["start", "mid", "goal"]
+        assert routes.path("goal", weighted=False) == ["start", "goal"]
+        assert routes.path("orphan") is None
+        assert routes.cheapest() == "goal"
+
+    def test_hits_ignore_goal_order(self):
+        """Equal graphs, start states and goal sets share one entry."""
+        cache = RouteCache(analyzer=GraphAnalyzer(GraphCache()))
+
+        first = cache.routes(self._graph(), "start", ["goal", "mid"])
+        assert cache.routes(self._graph(), "start", ["mid", "goal", "mid"]) is first
+        assert cache.routes(self._graph(), "mid", ["goal", "mid"]) is not first
+        assert cache.info().hits == 1
+        assert cache.info().misses == 2
+
+    def test_changed_graph_is_recomputed(self):
+        """Editing a transition cost changes the key, so stale routes are never served."""
+        cache = RouteCache()
+        cache.routes(self._graph(), "start", ["goal"])
+
+        changed = self._graph()
+        changed.states[0].transitions[1].cost = 1.0
+        routes = cache.routes(changed, "start", ["goal"])
+
+        assert routes.costs == {"goal": 1.0}
+        assert cache.info().misses == 2
+
+    def test_lru_eviction(self):
+        """Least recently used route sets are evicted."""
+        cache = RouteCache(maxsize=1)
+        cache.routes(self._graph(), "start", ["goal"])
+        cache.routes(self._graph(), "mid", ["goal"])
+        cache.routes(self._graph(), "start", ["goal"])
+
+        assert cache.info().misses == 3
+        assert cache.info().currsize == 1
+        with pytest.raises(ValueError, match="positive"):
+            RouteCache(maxsize=0)
+
+    def test_warm_restart_from_disk(self, tmp_path):
+        """Entries persisted in SQLite are reused by a new cache instance."""
+        path = tmp_path / "routes.db"
+        cold = RouteCache(path=path)
+        computed = cold.routes(self._graph(), "start", ["goal"])
+        cold.close()
+
+        warm = RouteCache(path=path)
+        loaded = warm.routes(self._graph(), "start", ["goal"])
+        warm.routes(self._graph(), "start", ["goal"])
+
+        assert loaded.costs == computed.costs
+        assert loaded.cost_paths == computed.cost_paths
+        assert loaded.step_paths == computed.step_paths
+        assert warm.info().disk_hits == 1
+        assert warm.info().hits == 1
+        assert warm.info().misses == 0
+        warm.close()
+
+    def test_disk_store_is_bounded(self, tmp_path):
+        """The database evicts entries not used within its last disk_maxsize writes."""
+        path = tmp_path / "routes.db"
+        cache = RouteCache(maxsize=1, path=path, disk_maxsize=2)
+        for start in ("start", "mid", "orphan"):
+            cache.routes(self._graph(), start, ["goal"])
+        cache.close()
+
+        warm = RouteCache(path=path)
+        warm.routes(self._graph(), "start", ["goal"])
+        warm.routes(self._graph(), "orphan", ["goal"])
+
+        assert warm.info().disk_hits == 1
+        assert warm.info().misses == 1
+        warm.close()
+
+
+class TestDistanceOracle:
+    """Test precomputed distances to the nearest goal."""
+
+    @pytest.mark.parametrize("seed", range(30))
+    def test_matches_forward_searches(self, seed):
+        """Every lookup equals the nearest goal found by a forward search from that state."""
+        graph = TestCSRBackend._random_graph(seed)
+        goals = [s.name for s in graph.states[-2:]] + ["ghost"]
+        analyzer = GraphAnalyzer(GraphCache())
+
+        oracle = analyzer.distance_oracle(graph, goals)
+
+        for name in analyzer.compile(graph).csr.names:
+            costs, _ = analyzer.shortest_costs(graph, name)
+            steps, _ = analyzer.shortest_steps(graph, name)
+            reached = [g for g in goals if g in costs]
+            expected_cost = min((costs[g] for g in reached), default=math.inf)
+            expected_steps = min((steps[g] for g in reached), default=None)
+            assert oracle.distance_to_goal(name) == expected_cost
+            assert oracle.steps_to_goal(name) == expected_steps
+
+            path = oracle.path_to_goal(name)
+            if expected_steps is None:
+                assert path is None
+            else:
+                assert path[0] == name and path[-1] in goals
+                weights = analyzer.compile(graph).graph
+                edges = zip(path, path[1:], strict=False)
+                assert sum(weights[u][v]["weight"] for u, v in edges) == expected_cost
+
+    def test_lookups(self):
+        """Lookups by name; goals are at distance 0 and unknown states raise KeyError."""
+        oracle = GraphAnalyzer(GraphCache()).distance_oracle(
+            TestSingleSourceSearch._graph(), ["goal"]
+        )
+
+        assert oracle.distance_to_goal("start") == 3.0
+        assert oracle.steps_to_goal("start") == 2
+        assert oracle.path_to_goal("start") == ["start", "cheap", "middle", "goal"]
+        assert oracle.distance_to_goal("goal") == 0.0
+        assert oracle.path_to_goal("goal") == ["goal"]
+        assert oracle.distance_to_goal("far") == math.inf
+        assert oracle.steps_to_goal("far") is None
+        assert oracle.path_to_goal("far") is None
+        with pytest.raises(KeyError):
+            oracle.distance_to_goal("nowhere")
+
+    def test_save_and_load(self, tmp_path):
+        """Saved tables load back with the graph key they were computed for."""
+        graph = TestCSRBackend._random_graph(7)
+        analyzer = GraphAnalyzer(GraphCache())
+        oracle = analyzer.distance_oracle(graph, [graph.states[-1].name])
+
+        oracle.save(tmp_path / "oracle.npz")
+        loaded = DistanceOracle.load(tmp_path / "oracle.npz")
+
+        assert loaded.key == analyzer.compile(graph).key
+        assert loaded.names == oracle.names
+        assert loaded.goals == oracle.goals
+        for name in oracle.names:
+            assert loaded.distance_to_goal(name) == oracle.distance_to_goal(name)
+            assert loaded.steps_to_goal(name) == oracle.steps_to_goal(name)
+            assert loaded.path_to_goal(name) == oracle.path_to_goal(name)
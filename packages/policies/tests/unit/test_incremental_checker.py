@@ -0,0 +1,120 @@
+"""Unit tests for the dependency index and incremental predicate checking."""
+
+from noetic_policies.cel_evaluator import DependencyIndex, IncrementalChecker
+from noetic_policies.models import GoalState, Invariant, Transition
+from noetic_policies.models.constraint import Constraint
+from noetic_policies.models.policy import Policy
+from noetic_policies.models.state_graph import State, StateGraph
+
+
+def _counter_policy() -> Policy:
+    return Policy(
+        version="1.0",
+        state_schema={"count": "number", "max_limit": "number", "owner": "string"},
+        constraints=[
+            Constraint(name="positive_count", expr="count >= 0"),
+            Constraint(name="below_limit", expr="count < max_limit"),
+            Constraint(name="has_owner", expr="size(owner) > 0"),
+        ],
+        state_graph=StateGraph(
+            initial="ready",
+            states=[
+                State(
+                    name="ready",
+                    transitions=[Transition(to="counting", preconditions=["below_limit"])],
+                ),
+                State(
+                    name="counting",
+                    transitions=[Transition(to="ready", effects=["count = count + 1"])],
+                ),
+            ],
+        ),
+        invariants=[Invariant(name="in_range", expr="count >= 0 && count <= max_limit")],
+        goal_states=[GoalState(name="ready", conditions=["count == max_limit"])],
+    )
+
+
+class TestDependencyIndex:
+    """Test the variable -> expression index."""
+
+    def test_readers_per_variable(self):
+        """Each variable maps to the expressions that read it."""
+        index = DependencyIndex(_counter_policy())
+
+        owners = {(site.kind, site.owner) for site in index.readers("owner")}
+        assert owners == {("constraint", "has_owner")}
+        kinds = {site.kind for site in index.readers("max_limit")}
+        assert kinds == {"constraint", "invariant", "precondition", "goal_condition"}
+
+    def test_constraint_name_references_expand_to_their_variables(self):
+        """A precondition naming a constraint depends on that constraint's variables."""
+        index = DependencyIndex(_counter_policy())
+        precondition = next(site for site in index.sites if site.kind == "precondition")
+
+        assert index.variables[precondition] == {"count", "max_limit"}
+        assert index.undefined_references() == []
+
+    def test_effects_record_assigned_variable(self):
+        """Effects are indexed with their target and read variables."""
+        index = DependencyIndex(_counter_policy())
+        effect = next(site for site in index.sites if site.kind == "effect")
+
+        assert effect.target == "count"
+        assert effect.owner == "counting->ready"
+
+    def test_affected_sites_in_policy_order(self):
+        """affected() lists each dependent site once, in policy order."""
+        index = DependencyIndex(_counter_policy())
+
+        affected = index.affected(["max_limit", "count", "max_limit"])
+        predicates = index.affected(["max_limit"], kinds=["invariant", "goal_condition"])
+
+        assert affected == [s for s in index.sites if s.owner != "has_owner"]
+        assert [(s.kind, s.owner) for s in predicates] == [
+            ("invariant", "in_range"),
+            ("goal_condition", "ready"),
+        ]
+
+
+class TestIncrementalChecker:
+    """Test re-evaluation of only the affected predicates."""
+
+    def test_apply_delta_reevaluates_only_affected_predicates(self):
+        """Changing count leaves predicates over other variables untouched."""
+        checker = IncrementalChecker(
+            _counter_policy(), {"count": 0, "max_limit": 2, "owner": "alice"}
+        )
+
+        changed = checker.apply_delta({"count": 2})
+
+        owners = {site.owner for site in changed}
+        assert "has_owner" not in owners
+        assert owners == {"positive_count", "below_limit", "in_range", "ready->counting", "ready"}
+
+    def test_results_track_state_changes(self):
+        """Cached and re-evaluated results reflect the current state."""
+        checker = IncrementalChecker(
+            _counter_policy(), {"count": 0, "max_limit": 2, "owner": "alice"}
+        )
+        results = {site.owner: holds for site, holds in checker.results.items()}
+        assert results["below_limit"] and results["ready->counting"]
+        assert not results["ready"]
+
+        checker.apply_delta({"count": 2})
+        results = {site.owner: holds for site, holds in checker.results.items()}
+
+        assert not results["below_limit"]
+        assert not results["ready->counting"]
+        assert results["ready"]
+        assert [site.owner for site in checker.violations()] == ["below_limit"]
+
+    def test_apply_delta_accepts_variable_names(self):
+        """Callers that mutate state directly pass the changed names."""
+        checker = IncrementalChecker(
+            _counter_policy(), {"count": 0, "max_limit": 2, "owner": "alice"}
+        )
+        checker.state["owner"] = ""
+
+        changed = checker.apply_delta(["owner"])
+
+        assert [(site.owner, holds) for site, holds in changed.items()] == [("has_owner", False)]
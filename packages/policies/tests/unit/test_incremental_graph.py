@@ -0,0 +1,177 @@
+"""Unit tests for graph analysis maintained under graph edits."""
+
+import random
+
+import pytest
+
+from noetic_policies.models import GoalState, TemporalBounds
+from noetic_policies.models.state_graph import State, StateGraph, Transition
+from noetic_policies.validator.compiled_graph import GraphCache
+from noetic_policies.validator.graph_analyzer import GraphAnalyzer
+from noetic_policies.validator.incremental_graph import IncrementalGraphAnalysis
+
+
+def random_graph(rng: random.Random, size: int) -> StateGraph:
+    names = [f"s{i}" for i in range(size)]
+    states = [
+        State(
+            name=name,
+            transitions=[
+                Transition(to=rng.choice([*names, "ghost"]), cost=rng.choice([0.0, 0.5, 1.0, 3.0]))
+                for _ in range(rng.choice([0, 1, 1, 2]))
+            ],
+        )
+        for name in names
+    ]
+    return StateGraph(initial=names[0], states=states)
+
+
+def mutate(
+    rng: random.Random, graph: IncrementalGraphAnalysis, fresh: list[int], keep: set[str]
+) -> None:
+    """Apply one random edit, favouring transition changes; states in keep stay declared."""
+    states = graph.states
+    nodes = [*states, "ghost", graph.initial]
+    action = rng.random()
+    if action < 0.45 and states:
+        target = rng.choice(nodes)
+        graph.add_transition(rng.choice(states), target, rng.choice([0.0, 0.5, 1.0, 3.0]))
+    elif action < 0.85:
+        edges = [(s, t.to) for s in states for t in graph.transitions(s)]
+        if edges:
+            graph.remove_transition(*rng.choice(edges))
+    elif action < 0.93:
+        fresh[0] += 1
+        name = rng.choice([f"n{fresh[0]}", graph.initial, "ghost"])
+        if name not in states:
+            graph.add_state(name)
+    else:
+        removable = [s for s in states if s not in keep]
+        if removable:
+            graph.remove_state(rng.choice(removable))
+
+
+def comparable(result):
+    return (
+        result.unreachable_states,
+        {frozenset(scc) for scc in result.deadlock_sccs},
+        result.goal_reachable,
+        result.goal_costs,
+        result.goal_min_steps,
+        result.temporally_infeasible_goals,
+    )
+
+
+class TestIncrementalGraphAnalysis:
+    """Test IncrementalGraphAnalysis against full analysis."""
+
+    @pytest.mark.parametrize("backend", ["networkx", "csr"])
+    @pytest.mark.parametrize("seed", range(12))
+    def test_matches_full_analysis(self, seed, backend):
+        """After every edit the result equals a full analysis of the edited graph."""
+        rng = random.Random(seed)
+        state_graph = random_graph(rng, rng.randint(1, 25))
+        names = [s.name for s in state_graph.states]
+        goals = [GoalState(name=name) for name in rng.sample(names, min(3, len(names)))]
+        goals[0].temporal_bounds = TemporalBounds(max_steps=2)
+        analyzer = GraphAnalyzer(GraphCache(), backend=backend)
+        graph = IncrementalGraphAnalysis(state_graph, goals, analyzer=analyzer)
+        fresh = [0]
+
+        for _ in range(60):
+            # The NetworkX backend requires the initial state and goals to be graph nodes
+            mutate(rng, graph, fresh, {graph.initial, *(goal.name for goal in goals)})
+            current = graph.to_state_graph()
+            expected = analyzer.analyze(current, current.initial, goals)
+            actual = graph.result(condensation=True)
+
+            assert comparable(actual) == comparable(expected)
+            assert actual.condensation.num_components == expected.condensation.num_components
+            for c in range(actual.condensation.num_components):
+                assert all(s < c for s in actual.condensation.successors(c).tolist())
+
+    def test_cycles_merge_and_split(self):
+        """Closing a cycle creates a deadlock; breaking it removes the deadlock."""
+        graph = IncrementalGraphAnalysis(
+            StateGraph(
+                initial="a",
+                states=[
+                    State(name="a", transitions=[Transition(to="b")]),
+                    State(name="b", transitions=[Transition(to="c")]),
+                    State(name="c"),
+                ],
+            ),
+            [GoalState(name="c")],
+        )
+
+        graph.add_transition("c", "a")
+        closed = graph.result()
+        graph.add_transition("b", "exit")
+        escaped = graph.result()
+        graph.remove_transition("b", "exit")
+        graph.remove_transition("b", "c")
+        broken = graph.result()
+
+        assert closed.deadlock_sccs == [{"a", "b", "c"}]
+        assert escaped.deadlock_sccs == []
+        assert broken.deadlock_sccs == []
+        assert broken.goal_reachable is False
+        assert broken.unreachable_states == {"c"}
+
+    def test_costs_follow_cheaper_and_dearer_paths(self):
+        """Goal costs drop with a cheaper route and recover when it is removed."""
+        graph = IncrementalGraphAnalysis(
+            StateGraph(
+                initial="start",
+                states=[
+                    State(name="start", transitions=[Transition(to="mid", cost=1.0)]),
+                    State(name="mid", transitions=[Transition(to="goal", cost=5.0)]),
+                    State(name="goal"),
+                ],
+            ),
+            [GoalState(name="goal")],
+        )
+
+        graph.add_transition("start", "goal", cost=2.0)
+        direct = graph.result()
+        # A repeated transition's last cost counts
+        graph.add_transition("start", "goal", cost=9.0)
+        repeated = graph.result()
+        graph.remove_transition("start", "goal")
+        graph.remove_transition("start", "goal")
+        restored = graph.result()
+
+        assert (direct.goal_costs, direct.goal_min_steps) == ({"goal": 2.0}, {"goal": 1})
+        assert repeated.goal_costs == {"goal": 6.0}
+        assert (restored.goal_costs, restored.goal_min_steps) == ({"goal": 6.0}, {"goal": 2})
+        assert restored.cost_predecessors["goal"] == "mid"
+
+    def test_remove_state_drops_its_transitions(self):
+        """Removing a state removes the transitions into it."""
+        graph = IncrementalGraphAnalysis(
+            StateGraph(
+                initial="start",
+                states=[
+                    State(name="start", transitions=[Transition(to="mid"), Transition(to="end")]),
+                    State(name="mid", transitions=[Transition(to="end")]),
+                    State(name="end"),
+                ],
+            )
+        )
+
+        graph.remove_state("mid")
+
+        assert graph.states == ["start", "end"]
+        assert [t.to for t in graph.transitions("start")] == ["end"]
+        assert graph.result().unreachable_states == set()
+
+    def test_unknown_states_rejected(self):
+        """Edits must name declared states."""
+        graph = IncrementalGraphAnalysis(StateGraph(initial="a", states=[State(name="a")]))
+
+        with pytest.raises(ValueError, match="Unknown state"):
+            graph.add_transition("b", "a")
+        with pytest.raises(ValueError, match="No transition"):
+            graph.remove_transition("a", "a")
+        with pytest.raises(ValueError, match="already exists"):
+            graph.add_state("a")
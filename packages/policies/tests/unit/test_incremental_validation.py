@@ -0,0 +1,161 @@
+"""Unit tests for incremental re-validation of edited policies."""
+
+import pytest
+
+from noetic_policies.parser import PolicyParser
+from noetic_policies.validator import PolicyValidator
+from noetic_policies.validator.incremental import IncrementalValidator, diff_policies
+
+POLICY = """
+version: "1.0"
+name: counter
+state_schema:
+  count: number
+constraints:
+  - name: positive_count
+    expr: "count >= 0"
+state_graph:
+  initial: ready
+  states:
+    - name: ready
+      transitions:
+        - to: working
+          effects: ["count = count + 1"]
+    - name: working
+      transitions:
+        - to: done
+    - name: done
+    - name: orphan
+      transitions:
+        - to: done
+goal_states:
+  - name: done
+    conditions: ["count > 0"]
+    progress_conditions:
+      - expr: "count"
+"""
+
+
+# Edits of POLICY
+PROGRESS_EDIT = POLICY.replace('expr: "count"', 'expr: "count +"')
+ADD_TRANSITION = POLICY.replace(
+    "        - to: working\n", "        - to: working\n        - to: orphan\n"
+)
+REMOVE_TRANSITION = POLICY.replace(
+    "    - name: working\n      transitions:\n        - to: done\n", "    - name: working\n"
+)
+COST_EDIT = POLICY.replace(
+    "        - to: done\n    - name: done",
+    "        - to: done\n          cost: 2\n    - name: done",
+)
+
+
+def parse(text: str):
+    return PolicyParser().parse_yaml(text)
+
+
+def codes(result):
+    return sorted(error.code for error in result.errors + result.warnings)
+
+
+class TestDiffPolicies:
+    """Test section-level policy diffs."""
+
+    def test_progress_condition_edit(self):
+        """Editing a progress condition changes only that section."""
+        edited = POLICY.replace('expr: "count"', 'expr: "count + 1"')
+
+        assert diff_policies(parse(POLICY), parse(edited)) == {"progress_conditions"}
+
+    def test_transition_cost_edit(self):
+        """A transition cost is part of the graph structure."""
+        assert diff_policies(parse(POLICY), parse(COST_EDIT)) == {"graph_structure", "state_graph"}
+
+    def test_identical_policies(self):
+        """Re-parsing the same text changes nothing."""
+        assert diff_policies(parse(POLICY), parse(POLICY)) == frozenset()
+
+
+class TestIncrementalValidator:
+    """Test IncrementalValidator."""
+
+    @pytest.mark.parametrize("mode", ["fast", "thorough"])
+    def test_progress_edit_skips_graph_passes(self, mode):
+        """A progress condition edit re-runs its schema check and no graph pass."""
+        incremental = IncrementalValidator(mode=mode)
+        incremental.validate(parse(POLICY))
+
+        result = incremental.validate(parse(PROGRESS_EDIT))
+
+        assert result.metadata["rechecked"] == ["progress_conditions"]
+        assert codes(result) == ["E004", "E013"]
+
+    def test_added_transition_edits_graph_analysis(self):
+        """Adding a transition updates the graph analysis without a full analysis."""
+        incremental = IncrementalValidator(mode="thorough")
+        first = incremental.validate(parse(POLICY))
+
+        second = incremental.validate(parse(ADD_TRANSITION))
+
+        assert codes(first) == ["E004"]
+        assert "graph:incremental" in second.metadata["rechecked"]
+        assert second.is_valid
+
+    def test_removed_transition_edits_graph_analysis(self):
+        """Removing a transition updates the graph analysis too."""
+        incremental = IncrementalValidator(mode="thorough")
+        incremental.validate(parse(POLICY))
+
+        result = incremental.validate(parse(REMOVE_TRANSITION))
+
+        assert "graph:incremental" in result.metadata["rechecked"]
+        assert codes(result) == ["E004", "E006"]
+
+    def test_new_initial_state_rebuilds_graph_analysis(self):
+        """Changing the initial state analyzes the graph from scratch."""
+        incremental = IncrementalValidator(mode="thorough")
+        incremental.validate(parse(POLICY))
+
+        result = incremental.validate(parse(POLICY.replace("initial: ready", "initial: orphan")))
+
+        assert result.metadata["rechecked"][-1] == "graph"
+        assert codes(result) == ["E004"]
+
+    @pytest.mark.parametrize("mode", ["fast", "thorough", "thorough-plus"])
+    @pytest.mark.parametrize("backend", ["networkx", "csr"])
+    def test_matches_full_validation(self, mode, backend):
+        """A sequence of edits gives the same findings as validating each version."""
+        versions = [
+            POLICY,
+            PROGRESS_EDIT,
+            ADD_TRANSITION,
+            COST_EDIT,
+            REMOVE_TRANSITION,
+            ADD_TRANSITION.replace(
+                "  - name: done\n    conditions", "  - name: orphan\n    conditions"
+            ),
+            POLICY.replace("count >= 0", "total >= 0").replace('"1.0"', '"0.5"'),
+            POLICY.replace("    - name: orphan\n      transitions:\n        - to: done\n", ""),
+            POLICY,
+        ]
+        validator = PolicyValidator(graph_backend=backend)
+        incremental = IncrementalValidator(validator, mode=mode)
+
+        for text in versions:
+            policy = parse(text)
+            result = incremental.validate(policy)
+            expected = validator.validate(policy, mode=mode)
+
+            assert result.is_valid == expected.is_valid
+            assert codes(result) == codes(expected)
+            # Unreachable states and deadlocks are sets, printed in any order
+            assert [e.message for e in result.errors if e.code not in ("E004", "E005")] == [
+                e.message for e in expected.errors if e.code not in ("E004", "E005")
+            ]
+
+    def test_unchanged_policy_reruns_nothing(self):
+        """Validating the same version again re-runs no check."""
+        incremental = IncrementalValidator(mode="thorough-plus")
+        incremental.validate(parse(POLICY))
+
+        assert incremental.validate(parse(POLICY)).metadata["rechecked"] == []
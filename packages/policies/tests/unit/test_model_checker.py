@@ -0,0 +1,376 @@
+"""Unit tests for explicit-state model checking (thorough-plus mode)."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from noetic_policies.models import GoalState, Invariant, Transition
+from noetic_policies.models.constraint import Constraint
+from noetic_policies.models.policy import Policy
+from noetic_policies.models.state_graph import State, StateGraph
+from noetic_policies.validator import PolicyValidator
+from noetic_policies.validator.frontier import SpillingFrontier, StateCodec, TracePointers
+from noetic_policies.validator.model_checker import ModelChecker, initial_valuation
+from noetic_policies.validator.visited import BitstateSet, HashedStateSet, state_hash
+
+
+def _counter_policy(
+    max_limit: int = 3, effect: str = "count = count + 1", invariant: str | None = None
+) -> Policy:
+    return Policy(
+        version="1.0",
+        metadata={"initial_values": {"max_limit": max_limit}},
+        state_schema={"count": "number", "max_limit": "number"},
+        constraints=[Constraint(name="below_limit", expr="count < max_limit")],
+        state_graph=StateGraph(
+            initial="ready",
+            states=[
+                State(
+                    name="ready",
+                    transitions=[Transition(to="counting", preconditions=["below_limit"])],
+                ),
+                State(name="counting", transitions=[Transition(to="ready", effects=[effect])]),
+            ],
+        ),
+        invariants=[
+            Invariant(name="in_range", expr=invariant or "count >= 0 && count <= max_limit")
+        ],
+        goal_states=[GoalState(name="ready", conditions=["count == max_limit"])],
+    )
+
+
+class TestInitialValuation:
+    """Test initial concrete values."""
+
+    def test_defaults_metadata_and_overrides(self):
+        """Explicit values override metadata, which overrides per-type defaults."""
+        policy = _counter_policy()
+        policy.state_schema["mode"] = "enum[idle,busy]"
+        policy.state_schema["active"] = "boolean"
+
+        values = initial_valuation(policy, {"count": 2})
+
+        assert values == {"count": 2, "max_limit": 3, "mode": "idle", "active": False}
+
+    def test_unknown_variable_rejected(self):
+        """Initial values must name state_schema variables."""
+        with pytest.raises(ValueError, match="undefined variables"):
+            initial_valuation(_counter_policy(), {"missing": 1})
+
+
+class TestModelChecker:
+    """Test exploration of concrete executions."""
+
+    def test_counter_explores_all_states(self):
+        """A correct counter is explored completely without counterexamples."""
+        result = ModelChecker(_counter_policy()).check()
+
+        assert result.complete
+        assert result.counterexamples == []
+        assert result.states_explored == 7  # ready x {0..3} + counting x {0..2}
+        assert result.max_depth == 6
+
+    def test_invariant_violation_has_shortest_trace(self):
+        """The counterexample is the shortest execution reaching the violation."""
+        policy = _counter_policy(effect="count = count + 2")
+
+        result = ModelChecker(policy).check()
+
+        assert not result.complete
+        (counterexample,) = result.counterexamples
+        assert counterexample.kind == "invariant"
+        assert counterexample.name == "in_range"
+        assert [step.state for step in counterexample.trace] == [
+            "ready",
+            "counting",
+            "ready",
+            "counting",
+            "ready",
+        ]
+        assert counterexample.trace[-1].values == {"count": 4, "max_limit": 3}
+        assert counterexample.trace[-1].transition == "counting->ready"
+        assert counterexample.format().startswith("ready{count=0, max_limit=3} -> counting")
+
+    def test_concrete_deadlock(self):
+        """A non-goal valuation without enabled transitions is a deadlock."""
+        policy = _counter_policy(invariant="count >= 0")
+        policy.goal_states[0].conditions = ["count == 10"]
+
+        result = ModelChecker(policy).check()
+
+        (counterexample,) = result.counterexamples
+        assert counterexample.kind == "deadlock"
+        assert counterexample.trace[-1].values["count"] == 3
+
+    def test_evaluation_error_reported(self):
+        """Expressions failing on a reachable valuation yield an error counterexample."""
+        policy = _counter_policy(invariant="count / (max_limit - count) >= 0")
+
+        result = ModelChecker(policy).check()
+
+        assert [c.kind for c in result.counterexamples] == ["error"]
+
+    def test_budgets_mark_result_incomplete(self):
+        """Exhausting the depth or state budget stops exploration."""
+        by_depth = ModelChecker(_counter_policy(), max_depth=2).check()
+        by_states = ModelChecker(_counter_policy(), max_states=4).check()
+
+        assert not by_depth.complete and by_depth.max_depth == 2
+        assert not by_states.complete and by_states.states_explored == 4
+
+    @pytest.mark.parametrize("visited", ["exact", "bitstate"])
+    def test_states_with_equal_python_hashes_are_distinct(self, visited):
+        """hash(-1) == hash(-2) in Python; fingerprints must still tell the states apart."""
+        policy = _counter_policy(effect="count = count - 1", invariant="count > -2")
+
+        result = ModelChecker(policy, visited=visited).check()
+
+        assert [c.kind for c in result.counterexamples] == ["invariant"]
+        assert result.counterexamples[0].trace[-1].values["count"] == -2
+        assert not result.complete
+
+    def test_effect_on_undefined_variable_rejected(self):
+        """Effects must assign state_schema variables."""
+        with pytest.raises(ValueError, match="not in state_schema"):
+            ModelChecker(_counter_policy(effect="total = count + 1"))
+
+
+class TestParallelExploration:
+    """Test hash-partitioned multi-process exploration."""
+
+    @pytest.mark.parametrize("workers", [2, 3])
+    def test_matches_single_worker(self, workers):
+        """Statistics and counterexamples equal those of a single-process run."""
+        policy = _counter_policy(max_limit=40, effect="count = count + 3")
+        policy.state_schema["parity"] = "number"
+        policy.state_graph.states[0].transitions.append(
+            Transition(to="ready", effects=["parity = (parity + count) % 7"])
+        )
+
+        for kwargs in ({}, {"max_counterexamples": 3}, {"max_states": 50}, {"max_depth": 5}):
+            expected = ModelChecker(policy, **kwargs).check()
+            result = ModelChecker(policy, workers=workers, **kwargs).check()
+
+            assert result.states_explored == expected.states_explored
+            assert result.transitions_explored == expected.transitions_explored
+            assert result.max_depth == expected.max_depth
+            assert result.complete == expected.complete
+            assert result.counterexamples == expected.counterexamples
+
+    def test_states_with_equal_python_hashes_are_distinct(self):
+        """States partitioned to one worker are not merged by a colliding fingerprint."""
+        policy = _counter_policy(effect="count = count - 1", invariant="count > -2")
+
+        result = ModelChecker(policy, workers=2).check()
+
+        assert [c.kind for c in result.counterexamples] == ["invariant"]
+        assert result.counterexamples[0].trace[-1].values["count"] == -2
+        assert result.states_explored == ModelChecker(policy).check().states_explored
+
+
+class TestMemoryBoundedExploration:
+    """Test bitstate visited sets and disk-spilling frontiers."""
+
+    def test_spilled_exploration_matches_in_memory(self, tmp_path):
+        """Spilling frontiers and pointers to disk does not change the result."""
+        policy = _counter_policy(max_limit=30, effect="count = count + 2")
+        policy.state_schema["parity"] = "number"
+        policy.state_graph.states[0].transitions.append(
+            Transition(to="ready", effects=["parity = (parity + count) % 7"])
+        )
+
+        expected = ModelChecker(policy, max_counterexamples=2).check()
+        result = ModelChecker(
+            policy, max_counterexamples=2, spill_directory=str(tmp_path), segment_items=4
+        ).check()
+
+        assert result.states_explored == expected.states_explored
+        assert result.counterexamples == expected.counterexamples
+        assert result.spilled_bytes > 0
+        assert list(tmp_path.iterdir()) == []
+
+    def test_parallel_exploration_spills_trace_pointers(self, tmp_path, monkeypatch):
+        """Parallel exploration keeps its trace pointers in the spill directory."""
+        directories = []
+
+        class RecordingPointers(TracePointers):
+            def __init__(self, directory=None, buffer_items=1 << 16):
+                directories.append(directory)
+                super().__init__(directory, buffer_items=2)
+
+        monkeypatch.setattr("noetic_policies.validator.parallel.TracePointers", RecordingPointers)
+        policy = _counter_policy(max_limit=30, effect="count = count + 2")
+
+        expected = ModelChecker(policy, max_counterexamples=2).check()
+        result = ModelChecker(
+            policy, max_counterexamples=2, workers=2, spill_directory=str(tmp_path)
+        ).check()
+
+        assert result.states_explored == expected.states_explored
+        assert result.counterexamples == expected.counterexamples
+        assert len(directories) == 1 and Path(directories[0]).parent == tmp_path
+        assert list(tmp_path.iterdir()) == []
+
+    def test_bitstate_exploration(self):
+        """A roomy bitstate set explores the same states and reports its omission risk."""
+        result = ModelChecker(_counter_policy(), visited="bitstate", max_states=1000).check()
+
+        assert result.complete and result.states_explored == 7
+        assert 0 < result.omission_probability < 1e-6
+
+    def test_unknown_visited_set_rejected(self):
+        """Only exact and bitstate visited sets exist."""
+        with pytest.raises(ValueError, match="Unknown visited set"):
+            ModelChecker(_counter_policy(), visited="bloom")
+
+
+class TestFrontierStorage:
+    """Test packed states, spilling queues and trace pointers."""
+
+    def test_codec_round_trip(self):
+        """Values keep their type, including values that do not fit their slot."""
+        codec = StateCodec(
+            {"n": "number", "flag": "boolean", "mode": "enum[idle,busy]", "owner": "string"}
+        )
+
+        for state in [
+            (3, (7, True, "busy", "alice")),
+            (0, (2.5, False, "idle", "")),
+            (1, (1 << 80, None, "unknown", "é")),
+        ]:
+            decoded = codec.decode(memoryview(codec.encode(state)))
+            assert decoded == state
+            assert [type(v) for v in decoded[1]] == [type(v) for v in state[1]]
+
+    def test_spilling_frontier_is_fifo(self, tmp_path):
+        """Items come back in order across segment files, which are then removed."""
+        queue = SpillingFrontier(
+            lambda item: item.to_bytes(4, "little"),
+            lambda data: int.from_bytes(data, "little"),
+            tmp_path,
+            segment_items=3,
+        )
+        for item in range(10):
+            queue.append(item)
+
+        assert len(list(tmp_path.iterdir())) == 3
+        assert list(queue.drain()) == list(range(10))
+        assert len(queue) == 0 and list(tmp_path.iterdir()) == []
+
+    def test_trace_pointers_on_disk(self, tmp_path):
+        """Flushed pointers are read back from the pointer file."""
+        pointers = TracePointers(tmp_path, buffer_items=2)
+        for number in range(5):
+            pointers.append(number - 1, number * 10)
+
+        assert len(pointers) == 5 and pointers.nbytes == 12
+        assert [pointers[number] for number in range(5)] == [
+            (-1, 0),
+            (0, 10),
+            (1, 20),
+            (2, 30),
+            (3, 40),
+        ]
+        pointers.close()
+
+
+class TestBitstateSet:
+    """Test the Bloom filter visited set."""
+
+    def test_add_many_reports_first_occurrences(self):
+        """Added fingerprints are members; duplicates are never new."""
+        visited = BitstateSet(expected_states=100)
+
+        first = visited.add_many(np.array([5, 7, 5], dtype=np.uint64))
+        second = visited.add_many(np.array([7, 9], dtype=np.uint64))
+
+        assert first.tolist() == [True, True, False]
+        assert second.tolist() == [False, True]
+        assert 9 in visited and len(visited) == 3
+
+    def test_size_and_omission_probability(self):
+        """Memory follows bits per state; the omission probability grows with fill."""
+        visited = BitstateSet(expected_states=1 << 12, bits_per_state=8)
+        empty = visited.omission_probability
+        visited.add_many(np.arange(1, 1 << 12, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15))
+
+        assert visited.nbytes == (1 << 12)
+        assert empty == 0.0 < visited.omission_probability < 0.05
+
+
+class TestHashedStateSet:
+    """Test the fingerprint set used for visited states."""
+
+    def test_add_many_reports_first_occurrences(self):
+        """Only the first occurrence of an unseen fingerprint is new."""
+        visited = HashedStateSet(capacity=16)
+
+        first = visited.add_many(np.array([5, 7, 5], dtype=np.uint64))
+        second = visited.add_many(np.array([7, 9], dtype=np.uint64))
+
+        assert first.tolist() == [True, True, False]
+        assert second.tolist() == [False, True]
+        assert len(visited) == 3 and 9 in visited and 11 not in visited
+
+    def test_fingerprint_is_stable_digest_of_packed_state(self):
+        """Fingerprints are BLAKE2b digests of the packed state, never zero."""
+        codec = StateCodec({"count": "number"})
+
+        minus_one = state_hash(codec.encode((0, (-1,))))
+        minus_two = state_hash(codec.encode((0, (-2,))))
+
+        assert minus_one != minus_two
+        assert minus_one == state_hash(codec.encode((0, (-1,)))) > 0
+
+    def test_omission_probability_per_new_state(self):
+        """The omission probability is the stored count over 2^64."""
+        visited = HashedStateSet()
+        visited.add_many(np.arange(1, 1025, dtype=np.uint64))
+
+        assert visited.omission_probability == 1024 / 2.0**64
+
+    def test_grows_with_colliding_slots(self):
+        """Keys sharing a home slot are all kept across table growth."""
+        visited = HashedStateSet(capacity=16)
+        keys = np.arange(1, 1000, dtype=np.uint64) * np.uint64(1 << 20)
+
+        assert visited.add_many(keys).all()
+        assert not visited.add_many(keys).any()
+        assert len(visited) == len(keys)
+
+
+class TestThoroughPlusMode:
+    """Test model checking through PolicyValidator."""
+
+    def test_valid_policy(self):
+        """A correct policy yields no model checking errors."""
+        result = PolicyValidator().validate(_counter_policy(), mode="thorough-plus")
+
+        assert [error.code for error in result.errors] == ["E005"]  # abstract cycle only
+        assert "model_checking" in result.metadata["checks_performed"]
+
+    def test_violations_become_errors(self):
+        """Invariant violations are reported as E008."""
+        policy = _counter_policy(effect="count = count + 2")
+
+        result = PolicyValidator().validate(policy, mode="thorough-plus")
+
+        assert [error.code for error in result.errors] == ["E005", "E008"]
+
+    @pytest.mark.parametrize("mode", ["fast", "thorough", "thorough-plus"])
+    def test_long_operator_chains(self, mode):
+        """Constraints with several hundred chained terms validate like short ones."""
+        chain = " + ".join(["count"] * 450)
+        policy = _counter_policy(invariant=f"{chain} >= 0")
+        policy.constraints[0].expr = f"{chain} < max_limit * 450"
+
+        result = PolicyValidator().validate(policy, mode=mode)
+
+        assert [error.code for error in result.errors] == ([] if mode == "fast" else ["E005"])
+
+    def test_incomplete_exploration_warns(self):
+        """Budget exhaustion is reported as a W003 warning."""
+        result = PolicyValidator(max_states=2).validate(_counter_policy(), mode="thorough-plus")
+
+        assert [warning.code for warning in result.warnings] == ["W003"]
@@ -0,0 +1,127 @@
+"""Unit tests for the YAML policy parser."""
+
+import pytest
+import yaml
+
+from noetic_policies import parser as parser_module
+from noetic_policies.parser import PolicyParseError, PolicyParser
+
+POLICY = """
+version: "1.0"
+name: {name}
+state_schema:
+  count: number
+constraints:
+  - name: positive_count
+    expr: "count >= 0"
+state_graph:
+  initial: ready
+  states:
+    - name: ready
+"""
+
+
+def _policy(name: str) -> str:
+    return POLICY.format(name=name)
+
+
+class TestParseYaml:
+    """Test single-document parsing."""
+
+    def test_uses_libyaml_when_available(self):
+        """The C loader is used when PyYAML was built with libyaml."""
+        expected = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+        assert parser_module._Loader is expected
+
+    @pytest.mark.parametrize("loader", [yaml.SafeLoader, getattr(yaml, "CSafeLoader", None)])
+    def test_loaders_agree(self, loader, monkeypatch):
+        """Both loaders give the same policies and the same errors."""
+        if loader is None:
+            pytest.skip("PyYAML built without libyaml")
+        monkeypatch.setattr(parser_module, "_Loader", loader)
+        parser = PolicyParser()
+
+        assert parser.parse_yaml(_policy("a")).name == "a"
+        with pytest.raises(PolicyParseError, match="YAML syntax error"):
+            parser.parse_yaml("version: [")
+        with pytest.raises(PolicyParseError, match="YAML dictionary"):
+            parser.parse_yaml("- a\n- b")
+        # Safe loading: no arbitrary Python objects
+        with pytest.raises(PolicyParseError, match="YAML syntax error"):
+            parser.parse_yaml("!!python/object/apply:os.getcwd []")
+
+
+class TestParseStream:
+    """Test streaming multi-document files and directories."""
+
+    def test_multi_document_file(self, tmp_path):
+        """Each document is one policy; empty documents are skipped."""
+        path = tmp_path / "bundle.yaml"
+        path.write_text("---".join([_policy("a"), "\n", _policy("b"), _policy("c")]))
+
+        names = [policy.name for policy in PolicyParser().parse_stream(path)]
+
+        assert names == ["a", "b", "c"]
+
+    def test_yields_before_reading_further(self, tmp_path):
+        """Policies are yielded as they are read, before later errors."""
+        path = tmp_path / "bundle.yaml"
+        path.write_text(_policy("a") + "---\nversion: [\n")
+        stream = PolicyParser().parse_stream(path)
+
+        assert next(stream).name == "a"
+        with pytest.raises(PolicyParseError, match="YAML syntax error in .*bundle.yaml"):
+            next(stream)
+
+    def test_directory(self, tmp_path):
+        """Directories yield the policies of their YAML files in path order."""
+        (tmp_path / "b.yml").write_text(_policy("b"))
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "nested" / "c.yaml").write_text(_policy("c") + "---" + _policy("d"))
+        (tmp_path / "a.yaml").write_text(_policy("a"))
+        (tmp_path / "notes.txt").write_text("not a policy")
+
+        names = [policy.name for policy in PolicyParser().parse_stream(tmp_path)]
+
+        assert names == ["a", "b", "c", "d"]
+
+    def test_errors_name_the_document(self, tmp_path):
+        """Invalid documents are reported with their file and number."""
+        path = tmp_path / "bundle.yaml"
+        path.write_text(_policy("a") + "---\n- a list\n")
+
+        with pytest.raises(PolicyParseError, match=r"bundle.yaml \(document 2\)"):
+            list(PolicyParser().parse_stream(path))
+
+    def test_missing_path(self, tmp_path):
+        """Missing paths raise FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            list(PolicyParser().parse_stream(tmp_path / "missing.yaml"))
+
+
+class TestTrustedParse:
+    """Test construction of pre-validated policies."""
+
+    def test_matches_validated_policy(self):
+        """Trusted parsing of dumped policies gives an equal policy."""
+        validated = PolicyParser().parse_yaml(_policy("a"))
+
+        trusted = PolicyParser().parse_dict(validated.model_dump(), trusted=True)
+
+        assert trusted == validated
+        assert trusted.fingerprint() == validated.fingerprint()
+
+    def test_skips_consistency_checks(self):
+        """Model-level checks do not run on trusted input."""
+        content = _policy("a") + "    - name: ready\n"
+        with pytest.raises(PolicyParseError, match="Duplicate state names: {'ready'}"):
+            PolicyParser().parse_yaml(content)
+
+        policy = PolicyParser().parse_yaml(content, trusted=True)
+
+        assert len(policy.state_graph.states) == 2
+
+    def test_field_types_still_checked(self):
+        """Structurally invalid trusted data is still a parse error."""
+        with pytest.raises(PolicyParseError, match="state_graph: Field required"):
+            PolicyParser().parse_dict({"version": "1.0"}, trusted=True)
@@ -0,0 +1,203 @@
+"""Unit tests for the cost-optimal goal planner."""
+
+import pytest
+
+from noetic_policies.models import GoalState, Invariant, ProgressCondition, Transition
+from noetic_policies.models.constraint import Constraint
+from noetic_policies.models.policy import Policy
+from noetic_policies.models.state_graph import State, StateGraph
+from noetic_policies.planner import Planner, PlanningError
+
+
+def _route_policy(goal_states: list[GoalState] | None = None) -> Policy:
+    """Two routes from 'start' to 'done': a cheap hop chain and an expensive shortcut."""
+    return Policy(
+        version="1.0",
+        state_schema={"fuel": "number", "visited": "number"},
+        constraints=[Constraint(name="has_fuel", expr="fuel >= 0")],
+        metadata={"initial_values": {"fuel": 5}},
+        state_graph=StateGraph(
+            initial="start",
+            states=[
+                State(
+                    name="start",
+                    transitions=[
+                        Transition(to="done", cost=10.0),
+                        Transition(to="hop", cost=1.0, effects=["visited = visited + 1"]),
+                        Transition(to="alt", cost=4.0),
+                    ],
+                ),
+                State(name="hop", transitions=[Transition(to="done", cost_expr="fuel - 3")]),
+                State(name="alt", transitions=[Transition(to="alt_done", cost=1.0)]),
+                State(name="done"),
+                State(name="alt_done"),
+            ],
+        ),
+        goal_states=goal_states or [GoalState(name="done")],
+    )
+
+
+def _counter_policy(progress: bool) -> Policy:
+    """Counter incremented one by one (or reset) until it reaches 6, next to a distraction."""
+    return Policy(
+        version="1.0",
+        state_schema={"count": "number", "noise": "number"},
+        constraints=[Constraint(name="counted", expr="count >= 6")],
+        state_graph=StateGraph(
+            initial="work",
+            states=[
+                State(
+                    name="work",
+                    transitions=[
+                        Transition(to="work", cost=1.0, effects=["count = count + 1"]),
+                        Transition(to="work", cost=1.0, effects=["count = 0"]),
+                        Transition(to="work", cost=1.0, effects=["noise = noise + 1"]),
+                        Transition(to="check", cost=1.0, preconditions=["counted"]),
+                    ],
+                ),
+                State(name="check"),
+            ],
+        ),
+        invariants=[Invariant(name="bounded", expr="count <= 8 && noise <= 8")],
+        goal_states=[
+            GoalState(
+                name="check",
+                conditions=["count == 6"],
+                progress_conditions=[ProgressCondition(expr="count / 6.0")] if progress else [],
+            )
+        ],
+    )
+
+
+class TestPlanner:
+    """Test cost-optimal search to the best goal."""
+
+    def test_cheapest_plan_uses_cost_expr(self):
+        """Dynamic costs are evaluated on the state the transition leaves."""
+        plan = Planner(_route_policy()).plan()
+
+        assert plan.goal == "done"
+        assert plan.cost == 3.0
+        assert plan.transitions == ["start->hop", "hop->done"]
+        assert plan.steps[-1].values["visited"] == 1
+        assert plan.optimal is True
+
+    def test_start_values_change_the_plan(self):
+        """With more fuel the dynamic edge becomes dearer than the shortcut."""
+        plan = Planner(_route_policy()).plan(values={"fuel": 20})
+
+        assert plan.cost == 10.0
+        assert plan.transitions == ["start->done"]
+
+    def test_priority_outranks_cost(self):
+        """A higher-priority goal is pursued even when a lower one is cheaper."""
+        goals = [GoalState(name="done"), GoalState(name="alt_done", priority=1)]
+
+        plan = Planner(_route_policy(goals)).plan()
+
+        assert plan.goal == "alt_done"
+        assert plan.cost == 5.0
+
+    def test_reward_breaks_priority_ties(self):
+        """Among goals of equal priority the higher reward is pursued."""
+        goals = [GoalState(name="done", reward=1.0), GoalState(name="alt_done", reward=2.0)]
+
+        assert Planner(_route_policy(goals)).plan().goal == "alt_done"
+
+    def test_equal_rank_goals_compete_on_cost(self):
+        """Among goals of equal rank the cheapest plan wins."""
+        goals = [GoalState(name="alt_done"), GoalState(name="done")]
+
+        assert Planner(_route_policy(goals)).plan().goal == "done"
+
+    def test_unreachable_ranked_goal_falls_back(self):
+        """Goals whose conditions cannot hold give way to the next rank."""
+        goals = [
+            GoalState(name="alt_done", priority=1, conditions=["visited == 1"]),
+            GoalState(name="done"),
+        ]
+
+        plan = Planner(_route_policy(goals)).plan()
+
+        assert plan.goal == "done"
+
+    def test_start_state_and_values(self):
+        """Planning can start from any graph state and valuation."""
+        plan = Planner(_route_policy()).plan(values={"fuel": 4}, state="hop")
+
+        assert plan.cost == 1.0
+        assert [step.state for step in plan.steps] == ["hop", "done"]
+
+    def test_goal_already_satisfied(self):
+        """A start state satisfying the goal is an empty plan."""
+        plan = Planner(_route_policy()).plan(state="done")
+
+        assert plan.cost == 0.0
+        assert plan.transitions == []
+
+    def test_no_reachable_goal(self):
+        """None is returned when no goal can be reached."""
+        assert Planner(_route_policy()).plan(state="alt_done") is None
+
+    def test_invalid_requests(self):
+        """Unknown start states, variables and negative costs are rejected."""
+        planner = Planner(_route_policy())
+
+        with pytest.raises(PlanningError, match="Unknown state"):
+            planner.plan(state="nowhere")
+        with pytest.raises(PlanningError, match="undefined"):
+            planner.plan(values={"altitude": 1})
+        with pytest.raises(PlanningError, match="non-negative"):
+            planner.plan(values={"fuel": 0})
+        with pytest.raises(PlanningError, match="weight"):
+            Planner(_route_policy(), weight=0.5)
+
+
+class TestProgressHeuristic:
+    """Test progress_conditions guiding the search."""
+
+    @pytest.mark.parametrize("progress", [False, True])
+    def test_optimal_with_and_without_progress(self, progress):
+        """Progress guidance changes the search order but not the optimal plan."""
+        plan = Planner(_counter_policy(progress)).plan(values={"count": 0})
+
+        assert plan.cost == 7.0
+        assert plan.optimal is True
+        assert plan.steps[-1].values == {"count": 6, "noise": 0}
+
+    def test_progress_reduces_expansions(self):
+        """States closer to the goal by progress are expanded first."""
+        guided = Planner(_counter_policy(True), progress_scale=7.0).plan(values={"count": 0})
+        blind = Planner(_counter_policy(False)).plan(values={"count": 0})
+
+        assert guided.cost == blind.cost == 7.0
+        assert guided.optimal is blind.optimal is True
+        assert guided.expanded < blind.expanded
+
+
+class TestAnytimePlanning:
+    """Test progressively improving plans."""
+
+    def test_plans_improve(self):
+        """Each plan yielded is cheaper than the previous one; the last is proven optimal."""
+        # Without progress every non-goal state looks far away, so the direct edge comes first
+        planner = Planner(_route_policy(), weight=2.0, progress_scale=20.0)
+
+        costs = [plan.cost for plan in planner.iter_plans()]
+
+        assert costs == [10.0, 3.0]
+        assert planner.plan().optimal is True
+
+    def test_expansion_budget(self):
+        """Running out of expansions returns the best plan so far, unproven."""
+        planner = Planner(_route_policy(), weight=2.0, progress_scale=20.0, max_expansions=1)
+
+        plan = planner.plan()
+
+        assert plan.cost == 10.0
+        assert plan.optimal is False
+        assert Planner(_counter_policy(False), max_expansions=3).plan() is None
+
+    def test_time_limit(self):
+        """An exhausted time limit stops the search."""
+        assert Planner(_counter_policy(False)).plan(time_limit=0.0) is None
@@ -0,0 +1,210 @@
+"""Unit tests for policy fingerprints and the validation result cache."""
+
+import pytest
+
+from noetic_policies.models import ValidationError, ValidationResult
+from noetic_policies.parser import PolicyParser
+from noetic_policies.validator import PolicyValidator
+from noetic_policies.validator.result_cache import ValidationCache
+
+POLICY = """
+version: "1.0"
+name: counter
+description: Counts up to a limit
+state_schema:
+  count: number
+  max_limit: number
+constraints:
+  - name: positive_count
+    expr: "count >= 0"
+  - name: below_limit
+    expr: "count < max_limit"
+    description: Count must be below maximum
+state_graph:
+  initial: ready
+  states:
+    - name: ready
+      transitions:
+        - to: counting
+          preconditions: [below_limit, positive_count]
+    - name: counting
+      transitions:
+        - to: ready
+          effects: ["count = count + 1"]
+goal_states:
+  - name: ready
+    conditions: ["count == max_limit", "count > 0"]
+"""
+
+# The same policy: reordered sets, other descriptions, other formatting
+REORDERED = """
+version: "1.0"
+name: counter
+state_schema: {max_limit: number, count: number}
+constraints:
+  - {name: below_limit, expr: "count < max_limit"}
+  - {name: positive_count, expr: "count >= 0", description: Never negative}
+state_graph:
+  initial: ready
+  states:
+    - name: counting
+      description: Incrementing
+      transitions:
+        - {to: ready, effects: ["count = count + 1"]}
+    - name: ready
+      transitions:
+        - {to: counting, preconditions: [positive_count, below_limit]}
+goal_states:
+  - {name: ready, conditions: ["count > 0", "count == max_limit"]}
+"""
+
+
+def _parse(content: str):
+    return PolicyParser().parse_yaml(content)
+
+
+class TestFingerprint:
+    """Test the normalized policy digest."""
+
+    def test_ignores_descriptions_and_set_order(self):
+        """Descriptions and the order of unordered entries do not change the fingerprint."""
+        assert _parse(POLICY).fingerprint() == _parse(REORDERED).fingerprint()
+
+    @pytest.mark.parametrize(
+        "old, new",
+        [
+            ("count < max_limit", "count <= max_limit"),
+            ('"count = count + 1"', '"count = count + 2"'),
+            ("name: counter", "name: counter2"),
+            ('version: "1.0"', 'version: "1.1"'),
+        ],
+    )
+    def test_semantic_changes_change_fingerprint(self, old, new):
+        """Expressions, effects, names and versions are part of the fingerprint."""
+        assert _parse(POLICY.replace(old, new)).fingerprint() != _parse(POLICY).fingerprint()
+
+    def test_effect_order_is_significant(self):
+        """Effects apply in sequence, so their order matters."""
+        policy = _parse(POLICY)
+        policy.state_graph.states[1].transitions[0].effects = ["count = count + 1", "count = 0"]
+        swapped = _parse(POLICY)
+        swapped.state_graph.states[1].transitions[0].effects = ["count = 0", "count = count + 1"]
+
+        assert policy.fingerprint() != swapped.fingerprint()
+
+
+class TestValidationCache:
+    """Test the LRU and on-disk result store."""
+
+    @staticmethod
+    def _result() -> ValidationResult:
+        return ValidationResult(
+            is_valid=False,
+            errors=[ValidationError(code="E004", message="Unreachable states: {'x'}")],
+            warnings=[],
+            metadata={"mode": "fast", "checks_performed": ["schema"]},
+        )
+
+    def test_results_are_copied(self):
+        """Callers cannot modify cached results."""
+        cache = ValidationCache()
+        result = self._result()
+        cache.put("k", result)
+        result.errors.clear()
+
+        first = cache.get("k")
+        first.metadata["cached"] = True
+
+        assert cache.get("k") == self._result()
+        assert cache.get("missing") is None
+        assert cache.info()[:3] == (2, 0, 1)
+
+    def test_lru_eviction(self):
+        """Least recently used results are evicted."""
+        cache = ValidationCache(maxsize=1)
+        cache.put("a", self._result())
+        cache.put("b", self._result())
+
+        assert cache.get("a") is None
+        assert cache.info().currsize == 1
+        with pytest.raises(ValueError, match="positive"):
+            ValidationCache(maxsize=0)
+
+    def test_directory_survives_restart(self, tmp_path):
+        """Results written to the directory are read by a new cache."""
+        ValidationCache(directory=tmp_path).put("k", self._result())
+
+        warm = ValidationCache(directory=tmp_path)
+
+        assert warm.get("k") == self._result()
+        assert warm.info().disk_hits == 1
+
+    def test_corrupt_file_is_a_miss(self, tmp_path):
+        """Unreadable entries are ignored."""
+        cache = ValidationCache(directory=tmp_path)
+        cache.put("k", self._result())
+        for path in tmp_path.glob("*.json"):
+            path.write_text("{not json")
+
+        assert ValidationCache(directory=tmp_path).get("k") is None
+
+    def test_key_includes_package_version(self, monkeypatch):
+        """Upgrading the package misses entries from the previous version."""
+        key = ValidationCache.key("digest", "fast")
+        monkeypatch.setattr("noetic_policies.validator.result_cache.__version__", "9.9.9")
+
+        assert ValidationCache.key("digest", "fast") != key
+
+
+class TestCachedValidation:
+    """Test PolicyValidator with a result cache."""
+
+    def test_unchanged_policy_hits(self):
+        """Equal policies are validated once per mode."""
+        cache = ValidationCache()
+        validator = PolicyValidator(cache=cache)
+
+        first = validator.validate(_parse(POLICY), mode="thorough")
+        second = validator.validate(_parse(REORDERED), mode="thorough")
+        other_mode = validator.validate(_parse(POLICY), mode="fast")
+
+        assert second.metadata["cached"] is True
+        assert second.errors == first.errors
+        assert "cached" not in other_mode.metadata
+        assert cache.info().hits == 1
+
+    def test_settings_are_part_of_the_key(self):
+        """Different model checking budgets do not share results."""
+        cache = ValidationCache()
+        PolicyValidator(cache=cache).validate(_parse(POLICY), mode="thorough-plus")
+        result = PolicyValidator(cache=cache, max_states=10).validate(
+            _parse(POLICY), mode="thorough-plus"
+        )
+
+        assert "cached" not in result.metadata
+
+    def test_unchanged_file_skips_parsing(self, tmp_path, monkeypatch):
+        """A file with unchanged text is answered from the cache without parsing."""
+        path = tmp_path / "policy.yaml"
+        path.write_text(POLICY)
+        validator = PolicyValidator(cache=ValidationCache())
+        first = validator.validate_file(str(path))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("parsed")
+
+        monkeypatch.setattr(PolicyParser, "parse_yaml", fail)
+        second = validator.validate_file(str(path))
+
+        assert second.metadata["cached"] is True
+        assert second.is_valid == first.is_valid
+
+    def test_file_errors_are_not_cached(self, tmp_path):
+        """Missing files and parse errors are reported as without a cache."""
+        validator = PolicyValidator(cache=ValidationCache())
+        path = tmp_path / "broken.yaml"
+        path.write_text("version: [")
+
+        assert validator.validate_file(str(tmp_path / "missing.yaml")).errors[0].code == "E101"
+        assert validator.validate_file(str(path)).errors[0].code == "E100"
+        assert validator.cache.info().currsize == 0
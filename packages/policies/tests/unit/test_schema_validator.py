@@ -111,6 +111,41 @@ class TestSchemaValidator:
         assert "count" in policy.state_schema
         assert "balance" in policy.state_schema
 
+    # T031b: Test undefined variables are reported by the schema validator (FR-008a)
+    def test_state_schema_coverage_reports_undefined_variables(self):
+        """Variables missing from state_schema are reported with error E007."""
+        from noetic_policies.models import Transition
+        from noetic_policies.validator.schema_validator import SchemaValidator
+
+        policy = Policy(
+            version="1.0",
+            state_schema={"count": "number"},
+            constraints=[
+                Constraint(name="positive", expr="count > 0"),
+                Constraint(name="funded", expr="balance >= amount"),
+            ],
+            state_graph=StateGraph(
+                initial="start",
+                states=[
+                    State(
+                        name="start",
+                        transitions=[
+                            Transition(
+                                to="start",
+                                preconditions=["positive"],
+                                effects=["total = count + 1"],
+                            )
+                        ],
+                    )
+                ],
+            ),
+        )
+
+        errors = SchemaValidator()._validate_state_schema_coverage(policy)
+
+        assert all(e.code == "E007" for e in errors)
+        assert [e.message.split("'")[1] for e in errors] == ["amount", "balance", "total"]
+
     # T031c: Test state schema uses valid types
     def test_state_schema_valid_types(self):
         """State schema should only use valid types."""
@@ -0,0 +1,86 @@
+"""Unit tests for watching policy files."""
+
+import os
+import sys
+
+import pytest
+
+from noetic_policies.validator.watch import PolicyWatcher
+
+POLICY = """
+version: "1.0"
+name: {name}
+state_schema:
+  count: number
+constraints:
+  - name: positive_count
+    expr: "count >= 0"
+state_graph:
+  initial: ready
+  states:
+    - name: ready
+"""
+
+
+@pytest.fixture
+def policy_dir(tmp_path):
+    for name in ("a", "b"):
+        (tmp_path / f"{name}.yaml").write_text(POLICY.format(name=name))
+    return tmp_path
+
+
+class TestPolicyWatcher:
+    """Test change detection and re-validation."""
+
+    def test_scan_validates_only_changed_files(self, policy_dir):
+        """Unchanged and merely touched files are skipped; edits are re-validated."""
+        with PolicyWatcher([str(policy_dir)], backend="poll") as watcher:
+            first = watcher.scan()
+            unchanged = watcher.scan()
+            os.utime(policy_dir / "a.yaml", ns=(1, 1))
+            touched = watcher.scan()
+            (policy_dir / "b.yaml").write_text(POLICY.format(name="b") + "    - name: extra\n")
+            edited = watcher.scan()
+
+        assert [item.path for item in first] == [str(policy_dir / f"{n}.yaml") for n in "ab"]
+        assert all(item.result.is_valid for item in first)
+        assert unchanged == touched == []
+        assert [item.path for item in edited] == [str(policy_dir / "b.yaml")]
+        assert edited[0].result.errors[0].code == "E004"
+        assert edited[0].result.metadata["rechecked"][-1] == "graph:incremental"
+
+    def test_new_broken_and_removed_files(self, policy_dir):
+        """New files are picked up, parse errors reported and deleted files forgotten."""
+        named = policy_dir / "named.yaml"
+        named.write_text(POLICY.format(name="named"))
+        with PolicyWatcher([str(policy_dir / "*.yaml"), str(named)], backend="poll") as watcher:
+            watcher.scan()
+            (policy_dir / "c.yaml").write_text("version: [")
+            (policy_dir / "a.yaml").unlink()
+            named.unlink()
+            changed = {item.path: item.result for item in watcher.scan()}
+            again = watcher.scan()
+
+        assert changed[str(policy_dir / "c.yaml")].errors[0].code == "E100"
+        assert changed[str(named)].errors[0].code == "E101"
+        assert str(policy_dir / "a.yaml") not in changed
+        assert again == []
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_inotify_wakes_on_change(self, policy_dir):
+        """Writes in a watched directory end the wait; the next scan finds them."""
+        with PolicyWatcher([str(policy_dir)], backend="inotify", poll_interval=0.05) as watcher:
+            watcher.scan()
+            assert not watcher._inotify.wait(0.05)
+
+            (policy_dir / "a.yaml").write_text(POLICY.format(name="renamed"))
+            assert watcher._inotify.wait(5.0)
+            changed = watcher.scan()
+
+        assert watcher.backend == "poll"
+        assert [item.path for item in changed] == [str(policy_dir / "a.yaml")]
+
+    def test_unknown_backend(self):
+        """Unknown backends are rejected."""
+        with pytest.raises(ValueError, match="Unknown watch backend"):
+            PolicyWatcher(["."], backend="fsevents")